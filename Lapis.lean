@@ -1,4 +1,5 @@
 import Lapis.Protocol.JsonRpc
+import Lapis.Protocol.Envelope
 import Lapis.Protocol.Types
 import Lapis.Protocol.Capabilities
 import Lapis.Protocol.Messages
@@ -1,5 +1,6 @@
 import Lapis.Concurrent.Channel
 import Lapis.Concurrent.Actor
+import Lapis.Concurrent.Stats
 import Lapis.Concurrent.VfsActor
 import Lapis.Concurrent.LspActor
 import Lapis.Concurrent.Dispatcher
@@ -10,6 +11,9 @@ namespace Lapis.Concurrent
 export Channel (Unbounded Bounded Oneshot)
 export Actor (ActorRef Actor ActorStatus ActorConfig HandleResult spawn)
 
+-- Runtime statistics
+export Stats (ServerStats LatencyHistogram statsMethod)
+
 -- VFS actor
 export VfsActor (VfsRef DocumentSnapshot VfsMsg spawnVfsActor)
 
@@ -17,6 +21,6 @@ export VfsActor (VfsRef DocumentSnapshot VfsMsg spawnVfsActor)
 export LspActor (LspConfig LspRef RequestContext HandlerResult spawnLspActor)
 
 -- Server runtime and entry point
-export Dispatcher (ServerRuntime runStdio runServer)
+export Dispatcher (ServerRuntime runStdio runServer runHost)
 
 end Lapis.Concurrent
@@ -12,9 +12,11 @@
 import Lapis.Concurrent.Actor
 import Lapis.Concurrent.VfsActor
 import Lapis.Concurrent.LspActor
+import Lapis.Concurrent.Stats
 import Lapis.Protocol.JsonRpc
 import Lapis.Protocol.Types
 import Lapis.Protocol.Messages
+import Lapis.Protocol.Generated
 import Lapis.Transport.Base
 import Lapis.Transport.Stdio
 import Lapis.Server.Receiver
@@ -25,9 +27,11 @@ open Lean Json
 open Lapis.Concurrent.Actor
 open Lapis.Concurrent.VfsActor
 open Lapis.Concurrent.LspActor
+open Lapis.Concurrent.Stats
 open Lapis.Protocol.JsonRpc
 open Lapis.Protocol.Types
 open Lapis.Protocol.Messages
+open Lapis.Protocol.Generated (MethodId)
 open Lapis.Transport
 open Lapis.Server.Receiver
 
@@ -49,6 +53,8 @@ structure ServerRuntime (UserState : Type) where
   pendingResponses : PendingResponses
   /-- User state reference (for notifications that need to update it) -/
   userStateRef : IO.Ref UserState
+  /-- Runtime statistics reported by `$/lapis/stats` -/
+  stats : ServerStats
 
 namespace ServerRuntime
 
@@ -77,29 +83,30 @@ end ServerRuntime
 
 private def routeNotification
   (rt : ServerRuntime UserState)
-  (msg : NotificationMessage) : IO Unit := do
+  (msg : IncomingNotification)
+  (methodId : Option MethodId) : IO Unit := do
 
-  match msg.method with
-  | "textDocument/didOpen" =>
-    if let some params := msg.params then
+  match methodId with
+  | some .didOpenTextDocumentNotification =>
+    if let .ok (some params) := msg.params.get then
       if let .ok p :=
         FromJson.fromJson? (α := DidOpenTextDocumentParams) params then
         rt.vfs.openDocument p
 
-  | "textDocument/didChange" =>
-    if let some params := msg.params then
+  | some .didChangeTextDocumentNotification =>
+    if let .ok (some params) := msg.params.get then
       if let .ok p :=
         FromJson.fromJson? (α := DidChangeTextDocumentParams) params then
         rt.vfs.changeDocument p
 
-  | "textDocument/didClose" =>
-    if let some params := msg.params then
+  | some .didCloseTextDocumentNotification =>
+    if let .ok (some params) := msg.params.get then
       if let .ok p :=
         FromJson.fromJson? (α := DidCloseTextDocumentParams) params then
         rt.vfs.closeDocument p
 
-  | "$/cancelRequest" =>
-    if let some params := msg.params then
+  | some .cancelNotification =>
+    if let .ok (some params) := msg.params.get then
       if let .ok idJson := params.getObjVal? "id" then
         if let .ok reqId :=
           FromJson.fromJson? (α := RequestId) idJson then
@@ -109,11 +116,11 @@ private def routeNotification
     pure ()
 
   -- Everything goes to LSP actor
-  rt.lsp.handleNotification msg
+  rt.lsp.handleNotification msg methodId
 
 /-- Route a request to the LSP actor -/
-private def routeRequest (rt : ServerRuntime UserState) (msg : RequestMessage) : IO Unit := do
-  rt.lsp.handleRequest msg
+private def routeRequest (rt : ServerRuntime UserState) (msg : IncomingRequest) : IO Unit := do
+  rt.lsp.handleRequest msg (MethodId.ofString? msg.method)
 
 /-- Route a response to the LSP actor -/
 private def routeResponse (rt : ServerRuntime UserState) (id : RequestId) (result : Json) : IO Unit := do
@@ -128,7 +135,7 @@ private def routeErrorResponse (rt : ServerRuntime UserState) (id : RequestId) (
 /-- The main message loop - reads from transport and routes to actors -/
 partial def runMainLoop [Transport T] (transport : T) (rt : ServerRuntime UserState) : IO Unit := do
   let rec loop : IO Unit := do
-    match ← Transport.readMessage transport with
+    match ← Transport.readIncoming transport with
     | none =>
       -- EOF, shutdown
       rt.shutdown
@@ -137,13 +144,15 @@ partial def runMainLoop [Transport T] (transport : T) (rt : ServerRuntime UserSt
     | some msg =>
       match msg with
       | .notification notif =>
-        if notif.method == "exit" then
+        -- Resolve the method once; the LSP actor reuses the ID
+        let methodId := MethodId.ofString? notif.method
+        if methodId == some MethodId.exitNotification then
           -- Check if shutdown was requested
           -- For now, we'll just exit
           rt.shutdown
           return
         else
-          routeNotification rt notif
+          routeNotification rt notif methodId
 
       | .request req =>
         routeRequest rt req
@@ -167,8 +176,9 @@ partial def runMainLoop [Transport T] (transport : T) (rt : ServerRuntime UserSt
 /-- Create and start the server runtime -/
 def createRuntime [Transport T] (transport : T) (config : LspConfig UserState)
     (initialState : UserState) : IO (ServerRuntime UserState) := do
-  -- Create output channel
-  let outputChannel ← OutputChannel.new (Transport.writeMessage transport)
+  -- Create output channel; each batch it drains is written and flushed once
+  let outputChannel ←
+    OutputChannel.newBatched (Transport.writeMessages transport) config.outputQueueCapacity
 
   -- Create pending responses
   let pendingResponses ← PendingResponses.new
@@ -176,11 +186,15 @@ def createRuntime [Transport T] (transport : T) (config : LspConfig UserState)
   -- Create user state ref
   let userStateRef ← IO.mkRef initialState
 
+  -- Create stats registry
+  let stats ← ServerStats.new
+
   -- Spawn VFS actor
   let (vfsActor, vfs) ← spawnVfsActor
+  stats.watchMailbox "vfs" vfs.ref
 
   -- Spawn LSP actor
-  let (lspActor, lsp) ← spawnLspActor config vfs outputChannel pendingResponses userStateRef
+  let (lspActor, lsp) ← spawnLspActor config vfs outputChannel pendingResponses userStateRef stats
 
   return {
     vfsActor, vfs
@@ -188,6 +202,7 @@ def createRuntime [Transport T] (transport : T) (config : LspConfig UserState)
     outputChannel
     pendingResponses
     userStateRef
+    stats
   }
 
 /-- Run the server with the given configuration -/
@@ -201,4 +216,32 @@ def runStdio (config : LspConfig UserState) (initialState : UserState) : IO Unit
   let transport ← Stdio.create
   runServer transport config initialState
 
+/-! ## Multi-Session Host -/
+
+/-- Serve one connection of a host; the session ends at `exit`, EOF or a transport error -/
+private def runSession [Transport T] (transport : T) (config : LspConfig UserState)
+    (initialState : UserState) : IO Unit := do
+  let runtime ← createRuntime transport config initialState
+  try
+    runMainLoop transport runtime
+  catch e =>
+    -- A broken connection ends its own session, not the host
+    IO.eprintln s!"lapis: session ended: {e}"
+    runtime.shutdown
+  runtime.outputChannel.shutdown
+  Transport.close transport
+
+/-- Serve every connection `accept` returns, each as its own session.
+
+    Each session gets its own runtime: VFS, actors, output channel, stats and
+    a user state from `newState`. `config` is shared, so caches its handlers
+    close over are built once and shared by all sessions. -/
+partial def runHost [Transport T] (accept : IO T) (config : LspConfig UserState)
+    (newState : IO UserState) : IO Unit := do
+  let transport ← accept
+  let initialState ← newState
+  -- Sessions block on their reads, so each gets its own thread
+  let _ ← IO.asTask (prio := .dedicated) (runSession transport config initialState)
+  runHost accept config newState
+
 end Lapis.Concurrent.Dispatcher
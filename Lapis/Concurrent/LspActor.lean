@@ -9,10 +9,12 @@
 
 import Lapis.Concurrent.Actor
 import Lapis.Concurrent.VfsActor
+import Lapis.Concurrent.Stats
 import Lapis.Protocol.JsonRpc
 import Lapis.Protocol.Types
 import Lapis.Protocol.Messages
 import Lapis.Protocol.Capabilities
+import Lapis.Protocol.Generated
 import Lapis.Transport.Base
 import Lapis.Server.Receiver
 import Lapis.Server.Progress
@@ -24,10 +26,12 @@ open Lean Json
 open Lapis.Concurrent.Actor
 open Lapis.Concurrent.Channel
 open Lapis.Concurrent.VfsActor
+open Lapis.Concurrent.Stats
 open Lapis.Protocol.JsonRpc
 open Lapis.Protocol.Types
 open Lapis.Protocol.Messages
 open Lapis.Protocol.Capabilities
+open Lapis.Protocol.Generated (MethodId)
 open Lapis.Transport
 open Lapis.Server.Receiver
 open Lapis.Server.Progress
@@ -53,6 +57,8 @@ structure RequestContext (UserState : Type) where
   progressManager : ProgressManager
   /-- Cancellation token for this request -/
   cancelToken : IO.CancelToken
+  /-- Runtime statistics, for registering gauges -/
+  stats : ServerStats
 
 namespace RequestContext
 
@@ -172,10 +178,10 @@ def NotificationHandler (UserState : Type) := RequestContext UserState → Json
 
 /-- Messages for the LSP actor -/
 inductive LspMsg (UserState : Type) where
-  /-- Handle an incoming request -/
-  | request (msg : RequestMessage)
-  /-- Handle an incoming notification (non-document) -/
-  | notification (msg : NotificationMessage)
+  /-- Handle an incoming request, with its method already resolved -/
+  | request (msg : IncomingRequest) (methodId : Option MethodId)
+  /-- Handle an incoming notification (non-document), with its method already resolved -/
+  | notification (msg : IncomingNotification) (methodId : Option MethodId)
   /-- Cancel a pending request -/
   | cancelRequest (id : RequestId)
   /-- Handle a response from the client -/
@@ -191,7 +197,12 @@ inductive LspMsg (UserState : Type) where
 structure PendingRequest where
   id : RequestId
   cancelToken : IO.CancelToken
-  task : Task (Except IO.Error Unit)
+  /-- Set by whichever of the handler or a cancellation answers first -/
+  responded : IO.Ref Bool
+
+/-- Claim the right to answer a request; succeeds for exactly one caller -/
+def PendingRequest.claimResponse (responded : IO.Ref Bool) : IO Bool :=
+  responded.modifyGet fun done => (!done, true)
 
 /-- LSP Actor configuration -/
 structure LspConfig (UserState : Type) where
@@ -201,15 +212,35 @@ structure LspConfig (UserState : Type) where
   version : Option String := none
   /-- Server capabilities -/
   capabilities : ServerCapabilities := {}
-  /-- Request handlers by method -/
+  /-- Request handlers for methods outside the LSP metamodel -/
   requestHandlers : HashMap String (RequestHandler UserState) := {}
-  /-- Notification handlers by method -/
+  /-- Notification handlers for methods outside the LSP metamodel -/
   notificationHandlers : HashMap String (NotificationHandler UserState) := {}
+  /-- Request handlers for LSP methods, indexed by `MethodId.toNat` -/
+  requestTable : Array (Option (RequestHandler UserState)) := Array.replicate MethodId.count none
+  /-- Notification handlers for LSP methods, indexed by `MethodId.toNat` -/
+  notificationTable : Array (Option (NotificationHandler UserState)) := Array.replicate MethodId.count none
   /-- Maximum concurrent requests -/
   maxConcurrentRequests : Nat := 8
+  /-- Unsent messages to the client before senders wait for it to catch up -/
+  outputQueueCapacity : Nat := defaultOutputCapacity
   /-- Hook called on initialize -/
   initializeHook : Option (RequestContext UserState → InitializeParams → IO Unit) := none
 
+/-- Find the request handler for a method, by ID when it is an LSP method.
+    Falls back to `requestHandlers`, so handlers inserted there directly are still found. -/
+def LspConfig.findRequestHandler? (config : LspConfig UserState) (methodId : Option MethodId)
+    (method : String) : Option (RequestHandler UserState) :=
+  let fromTable := methodId.bind fun id => (config.requestTable[id.toNat]?).join
+  fromTable <|> config.requestHandlers.get? method
+
+/-- Find the notification handler for a method, by ID when it is an LSP method.
+    Falls back to `notificationHandlers`, so handlers inserted there directly are still found. -/
+def LspConfig.findNotificationHandler? (config : LspConfig UserState) (methodId : Option MethodId)
+    (method : String) : Option (NotificationHandler UserState) :=
+  let fromTable := methodId.bind fun id => (config.notificationTable[id.toNat]?).join
+  fromTable <|> config.notificationHandlers.get? method
+
 /-- LSP Actor state -/
 structure LspState (UserState : Type) where
   /-- Server initialized -/
@@ -228,12 +259,14 @@ structure LspRef (UserState : Type) where
 namespace LspRef
 
 /-- Send a request to be handled -/
-def handleRequest (lsp : LspRef UserState) (msg : RequestMessage) : IO Unit :=
-  lsp.ref.send (.request msg)
+def handleRequest (lsp : LspRef UserState) (msg : IncomingRequest)
+    (methodId : Option MethodId := MethodId.ofString? msg.method) : IO Unit :=
+  lsp.ref.send (.request msg methodId)
 
 /-- Send a notification to be handled -/
-def handleNotification (lsp : LspRef UserState) (msg : NotificationMessage) : IO Unit :=
-  lsp.ref.send (.notification msg)
+def handleNotification (lsp : LspRef UserState) (msg : IncomingNotification)
+    (methodId : Option MethodId := MethodId.ofString? msg.method) : IO Unit :=
+  lsp.ref.send (.notification msg methodId)
 
 /-- Cancel a request -/
 def cancelRequest (lsp : LspRef UserState) (id : RequestId) : IO Unit :=
@@ -266,6 +299,8 @@ structure LspRuntime (UserState : Type) where
   progressManager : ProgressManager
   /-- Shared ref for pending requests (for async cleanup) -/
   pendingRequestsRef : IO.Ref (HashMap String PendingRequest)
+  /-- Runtime statistics reported by `$/lapis/stats` -/
+  stats : ServerStats
 
 /-- Handle initialize request -/
 private def handleInitialize (rt : LspRuntime UserState) (params : InitializeParams) : IO InitializeResult := do
@@ -279,6 +314,7 @@ private def handleInitialize (rt : LspRuntime UserState) (params : InitializePar
       serverInfo := { name := rt.config.name, version := rt.config.version }
       progressManager := rt.progressManager
       cancelToken := (← IO.CancelToken.new) -- not cancellable during initialize
+      stats := rt.stats
     }
     hook ctx params
 
@@ -291,9 +327,14 @@ private def handleInitialize (rt : LspRuntime UserState) (params : InitializePar
 
 /-- Process a request asynchronously -/
 private def processRequest (rt : LspRuntime UserState) (state : LspState UserState)
-    (msg : RequestMessage) : IO (LspState UserState) := do
+    (msg : IncomingRequest) (methodId : Option MethodId) : IO (LspState UserState) := do
   let idStr := toString msg.id
+  let started ← IO.monoNanosNow
   let cancelToken ← IO.CancelToken.new
+  let responded ← IO.mkRef false
+  let respond (response : Message) : IO Unit := do
+    if ← PendingRequest.claimResponse responded then
+      rt.outputChannel.send response
 
   let ctx : RequestContext UserState := {
     vfs := rt.vfs
@@ -304,56 +345,64 @@ private def processRequest (rt : LspRuntime UserState) (state : LspState UserSta
     serverInfo := { name := rt.config.name, version := rt.config.version }
     progressManager := rt.progressManager
     cancelToken := cancelToken
+    stats := rt.stats
   }
 
-  let task ← IO.asTask (prio := .default) do
+  -- Registered before the handler starts, so its own `erase` always comes after
+  let pending : PendingRequest := { id := msg.id, cancelToken, responded }
+  rt.pendingRequestsRef.modify fun m => m.insert idStr pending
+
+  let _ ← IO.asTask (prio := .default) do
     try
       -- Check cancellation before starting
       if ← cancelToken.isSet then
-        rt.outputChannel.send (mkErrorResponse (some msg.id) requestCancelled "Request cancelled")
+        respond (mkErrorResponse (some msg.id) requestCancelled "Request cancelled")
         return
 
-      let response ← match msg.method with
-        | "initialize" =>
-          match msg.params with
-          | none => pure (mkInvalidParams msg.id "Missing params")
-          | some params =>
+      let response ← match methodId with
+        | some .initializeRequest =>
+          match msg.params.get with
+          | .error e => pure (mkErrorResponse (some msg.id) parseError s!"Invalid params JSON: {e}")
+          | .ok none => pure (mkInvalidParams msg.id "Missing params")
+          | .ok (some params) =>
             match FromJson.fromJson? params with
             | .error e => pure (mkInvalidParams msg.id s!"Invalid params: {e}")
             | .ok initParams =>
               let result ← handleInitialize rt initParams
               pure (mkResponse msg.id (toJson result))
 
-        | "shutdown" =>
+        | some .shutdownRequest =>
           pure (mkResponse msg.id Json.null)
 
-        | method =>
-          match rt.config.requestHandlers.get? method with
-          | none => pure (mkMethodNotFound msg.id method)
+        | _ =>
+          match rt.config.findRequestHandler? methodId msg.method with
+          | none => pure (mkMethodNotFound msg.id msg.method)
           | some handler =>
-            let params := msg.params.getD (Json.mkObj [])
-            match ← handler ctx params with
-            | .ok result => pure (mkResponse msg.id result)
-            | .error code message => pure (mkErrorResponse (some msg.id) code message)
+            -- Params are decoded only here, once a handler will use them
+            match msg.params.get with
+            | .error e => pure (mkErrorResponse (some msg.id) parseError s!"Invalid params JSON: {e}")
+            | .ok params =>
+              match ← handler ctx (params.getD (Json.mkObj [])) with
+              | .ok result => pure (mkResponse msg.id result)
+              | .error code message => pure (mkErrorResponse (some msg.id) code message)
 
       -- Check cancellation before sending response
       if ← cancelToken.isSet then
-        rt.outputChannel.send (mkErrorResponse (some msg.id) requestCancelled "Request cancelled")
+        respond (mkErrorResponse (some msg.id) requestCancelled "Request cancelled")
       else
-        rt.outputChannel.send response
+        respond response
 
     catch e =>
-      rt.outputChannel.send (mkInternalError (some msg.id) s!"Handler error: {e}")
+      respond (mkInternalError (some msg.id) s!"Handler error: {e}")
     finally
       rt.pendingRequestsRef.modify fun m => m.erase idStr
+      rt.stats.recordLatency msg.method (((← IO.monoNanosNow) - started) / 1000)
 
-  let pending : PendingRequest := { id := msg.id, cancelToken, task }
-  rt.pendingRequestsRef.modify fun m => m.insert idStr pending
   return { state with activeRequests := state.activeRequests + 1 }
 
 /-- Process a notification -/
 private def processNotification (rt : LspRuntime UserState) (state : LspState UserState)
-    (msg : NotificationMessage) : IO (LspState UserState) := do
+    (msg : IncomingNotification) (methodId : Option MethodId) : IO (LspState UserState) := do
   -- Create context for handler
   let cancelToken ← IO.CancelToken.new
   let ctx : RequestContext UserState := {
@@ -365,52 +414,74 @@ private def processNotification (rt : LspRuntime UserState) (state : LspState Us
     serverInfo := { name := rt.config.name, version := rt.config.version }
     progressManager := rt.progressManager
     cancelToken := cancelToken
+    stats := rt.stats
   }
 
   -- Handle built-in notifications
-  match msg.method with
-  | "initialized" =>
+  match methodId with
+  | some .initializedNotification =>
     return { state with initialized := true }
 
-  | "window/workDoneProgress/cancel" =>
-    if let some params := msg.params then
+  | some .workDoneProgressCancelNotification =>
+    if let .ok (some params) := msg.params.get then
       if let .ok token := FromJson.fromJson? (α := ProgressToken) (params.getObjValD "token") then
         rt.progressManager.markCancelled token
     return state
 
   | _ =>
     -- Try user handler
-    if let some handler := rt.config.notificationHandlers.get? msg.method then
-      let params := msg.params.getD (Json.mkObj [])
+    if let some handler := rt.config.findNotificationHandler? methodId msg.method then
+      -- Notifications with malformed params are dropped, as with a failed decode
+      let .ok params := msg.params.get | return state
+      let params := params.getD (Json.mkObj [])
       -- Run notification handlers async (fire and forget)
+      rt.stats.notificationTasks.modify (· + 1)
       let _ ← IO.asTask (prio := .default) do
         try
           handler ctx params
         catch _ =>
           pure ()
+        finally
+          rt.stats.notificationTasks.modify (· - 1)
     return state
 
+/-- Build the `$/lapis/stats` response -/
+private def collectStats (rt : LspRuntime UserState) : IO Json := do
+  let pending ← rt.pendingRequestsRef.get
+  rt.stats.snapshot [
+    ("pid", toJson (← IO.Process.getPID).toNat),
+    ("outputQueue", toJson (← rt.outputChannel.queueSize)),
+    ("outputQueuePeak", toJson (← rt.outputChannel.peakQueueSize)),
+    ("outputCoalesced", toJson (← rt.outputChannel.coalescedCount)),
+    ("pendingRequests", toJson pending.size)
+  ]
+
 /-- Handle the LSP actor message -/
 private def handleLspMsg (rt : LspRuntime UserState) (state : LspState UserState)
     (msg : LspMsg UserState) : IO (HandleResult (LspState UserState)) := do
   match msg with
-  | .request reqMsg =>
+  | .request reqMsg methodId =>
+    -- Answered here rather than on a handler task, so it responds even when they are saturated
+    if methodId.isNone && reqMsg.method == statsMethod then
+      rt.outputChannel.send (mkResponse reqMsg.id (← collectStats rt))
+      return .continue state
+
     -- Check if initialized (except for initialize)
-    if reqMsg.method != "initialize" && !state.initialized then
+    if methodId != some MethodId.initializeRequest && !state.initialized then
       rt.outputChannel.send (mkErrorResponse (some reqMsg.id) serverNotInitialized "Server not initialized")
       return .continue state
 
     -- Track shutdown
-    let state := if reqMsg.method == "shutdown" then
+    let state := if methodId == some MethodId.shutdownRequest then
       { state with shutdownRequested := true }
     else
       state
 
-    let newState ← processRequest rt state reqMsg
+    let newState ← processRequest rt state reqMsg methodId
     return .continue newState
 
-  | .notification notifMsg =>
-    let newState ← processNotification rt state notifMsg
+  | .notification notifMsg methodId =>
+    let newState ← processNotification rt state notifMsg methodId
     return .continue newState
 
   | .cancelRequest id =>
@@ -419,6 +490,9 @@ private def handleLspMsg (rt : LspRuntime UserState) (state : LspState UserState
     match pending.get? idStr with
     | some req =>
       req.cancelToken.set
+      -- Answer now rather than when the handler returns; its response is dropped
+      if ← PendingRequest.claimResponse req.responded then
+        rt.outputChannel.send (mkErrorResponse (some req.id) requestCancelled "Request cancelled")
       return .continue state
     | none =>
       return .continue state
@@ -442,7 +516,7 @@ private def handleLspMsg (rt : LspRuntime UserState) (state : LspState UserState
 /-- Spawn the LSP actor -/
 def spawnLspActor (config : LspConfig UserState) (vfs : VfsRef)
     (outputChannel : OutputChannel) (pendingResponses : PendingResponses)
-    (userStateRef : IO.Ref UserState)
+    (userStateRef : IO.Ref UserState) (stats : ServerStats)
     : IO (Actor (LspMsg UserState) (LspState UserState) × LspRef UserState) := do
 
   -- Create shared ref for pending requests (enables async cleanup)
@@ -459,12 +533,14 @@ def spawnLspActor (config : LspConfig UserState) (vfs : VfsRef)
     userStateRef := userStateRef
     progressManager := progressManager
     pendingRequestsRef := pendingRequestsRef
+    stats := stats
   }
 
   let initialState : LspState UserState := {}
 
   let actor ← spawn initialState (handleLspMsg rt) { name := "lsp" }
   let lspRef : LspRef UserState := { ref := actor.ref }
+  stats.watchMailbox "lsp" actor.ref
 
   return (actor, lspRef)
 
@@ -484,6 +560,20 @@ def withVersion (config : LspConfig UserState) (version : String) : LspConfig Us
 def withCapabilities (config : LspConfig UserState) (caps : ServerCapabilities) : LspConfig UserState :=
   { config with capabilities := caps }
 
+/-- Register a request handler, in the method table when it is an LSP method -/
+private def insertRequestHandler (config : LspConfig UserState) (method : String)
+    (handler : RequestHandler UserState) : LspConfig UserState :=
+  match MethodId.ofString? method with
+  | some id => { config with requestTable := config.requestTable.set! id.toNat (some handler) }
+  | none => { config with requestHandlers := config.requestHandlers.insert method handler }
+
+/-- Register a notification handler, in the method table when it is an LSP method -/
+private def insertNotificationHandler (config : LspConfig UserState) (method : String)
+    (handler : NotificationHandler UserState) : LspConfig UserState :=
+  match MethodId.ofString? method with
+  | some id => { config with notificationTable := config.notificationTable.set! id.toNat (some handler) }
+  | none => { config with notificationHandlers := config.notificationHandlers.insert method handler }
+
 /-- Add a request handler -/
 def onRequest [FromJson Params] [ToJson Result]
     (config : LspConfig UserState)
@@ -495,7 +585,7 @@ def onRequest [FromJson Params] [ToJson Result]
     | .ok params =>
       let result ← handler ctx params
       return .ok (toJson result)
-  { config with requestHandlers := config.requestHandlers.insert method wrappedHandler }
+  config.insertRequestHandler method wrappedHandler
 
 /-- Add a request handler that can return null -/
 def onRequestOpt [FromJson Params] [ToJson Result]
@@ -509,7 +599,7 @@ def onRequestOpt [FromJson Params] [ToJson Result]
       match ← handler ctx params with
       | none => return .ok Json.null
       | some result => return .ok (toJson result)
-  { config with requestHandlers := config.requestHandlers.insert method wrappedHandler }
+  config.insertRequestHandler method wrappedHandler
 
 /-- Add a notification handler -/
 def onNotification [FromJson Params]
@@ -520,11 +610,15 @@ def onNotification [FromJson Params]
     match FromJson.fromJson? json with
     | .error _ => pure ()
     | .ok params => handler ctx params
-  { config with notificationHandlers := config.notificationHandlers.insert method wrappedHandler }
+  config.insertNotificationHandler method wrappedHandler
 
 /-- Set max concurrent requests -/
 def withMaxConcurrentRequests (config : LspConfig UserState) (n : Nat) : LspConfig UserState :=
   { config with maxConcurrentRequests := n }
+
+/-- Set how many messages may wait for the client before senders block (at least 1) -/
+def withOutputQueueCapacity (config : LspConfig UserState) (n : Nat) : LspConfig UserState :=
+  { config with outputQueueCapacity := max 1 n }
   
 def onInitialize
     (config : LspConfig UserState)
@@ -0,0 +1,136 @@
+/-
+  Runtime Statistics
+
+  Counters and gauges describing the server's internal queues, reported
+  to clients through the `$/lapis/stats` request:
+  - Mailbox depth of each actor
+  - In-flight requests and notification handlers
+  - Registered gauges, such as pending diagnostic jobs
+  - Per-method request latency histograms
+-/
+
+import Lean.Data.Json
+import Lapis.Concurrent.Actor
+import Lapis.Server.Diagnostics
+import Std.Data.HashMap
+
+namespace Lapis.Concurrent.Stats
+
+open Lean Json
+open Lapis.Concurrent.Actor
+open Lapis.Server.Diagnostics
+open Std (HashMap)
+
+/-- Method of the built-in statistics request -/
+def statsMethod : String := "$/lapis/stats"
+
+/-! ## Latency Histogram -/
+
+/-- Upper bounds of the latency buckets in microseconds; one more bucket holds the rest -/
+def latencyBucketsUs : Array Nat :=
+  #[100, 250, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000, 250000, 500000, 1000000, 2500000]
+
+/-- Latency distribution of the requests for one method -/
+structure LatencyHistogram where
+  /-- Observations per bucket of `latencyBucketsUs`, plus the overflow bucket -/
+  counts : Array Nat := Array.replicate (latencyBucketsUs.size + 1) 0
+  /-- Total observations -/
+  count : Nat := 0
+  /-- Sum of all observations in microseconds -/
+  sumUs : Nat := 0
+  /-- Largest observation in microseconds -/
+  maxUs : Nat := 0
+  deriving Inhabited
+
+namespace LatencyHistogram
+
+/-- Add one observation -/
+def record (h : LatencyHistogram) (us : Nat) : LatencyHistogram :=
+  let bucket := (latencyBucketsUs.findIdx? (us ≤ ·)).getD latencyBucketsUs.size
+  { counts := h.counts.modify bucket (· + 1)
+    count := h.count + 1
+    sumUs := h.sumUs + us
+    maxUs := max h.maxUs us }
+
+/-- Buckets as `{leUs, count}` objects; `leUs` is null for the overflow bucket -/
+def bucketsToJson (h : LatencyHistogram) : Json := Id.run do
+  let mut buckets : Array Json := #[]
+  for h' : i in [:h.counts.size] do
+    buckets := buckets.push (Json.mkObj [
+      ("leUs", toJson latencyBucketsUs[i]?),
+      ("count", toJson h.counts[i])
+    ])
+  return Json.arr buckets
+
+/-- The histogram as a JSON object, labelled with its method -/
+def toJsonFor (h : LatencyHistogram) (method : String) : Json :=
+  Json.mkObj [
+    ("method", toJson method),
+    ("count", toJson h.count),
+    ("sumUs", toJson h.sumUs),
+    ("maxUs", toJson h.maxUs),
+    ("buckets", h.bucketsToJson)
+  ]
+
+end LatencyHistogram
+
+/-! ## Server Stats -/
+
+/-- Shared statistics of a running server.
+    Safe to update from any task; all fields are atomic refs. -/
+structure ServerStats where
+  /-- Named actor mailboxes, read on demand -/
+  mailboxes : IO.Ref (Array (String × IO Nat))
+  /-- Named gauges registered by the runtime or by handlers -/
+  gauges : IO.Ref (Array (String × IO Nat))
+  /-- Notification handlers still running -/
+  notificationTasks : IO.Ref Nat
+  /-- Request latency per method -/
+  latencies : IO.Ref (HashMap String LatencyHistogram)
+
+namespace ServerStats
+
+/-- Create an empty stats registry -/
+def new : IO ServerStats := do
+  let mailboxes ← IO.mkRef (#[] : Array (String × IO Nat))
+  let gauges ← IO.mkRef (#[] : Array (String × IO Nat))
+  let notificationTasks ← IO.mkRef 0
+  let latencies ← IO.mkRef ({} : HashMap String LatencyHistogram)
+  return { mailboxes, gauges, notificationTasks, latencies }
+
+/-- Report the mailbox depth of an actor under `name` -/
+def watchMailbox (stats : ServerStats) (name : String) (ref : ActorRef Msg) : IO Unit :=
+  stats.mailboxes.modify (·.push (name, ref.mailbox.size))
+
+/-- Report the value of `read` under `name`, replacing any gauge of that name -/
+def registerGauge (stats : ServerStats) (name : String) (read : IO Nat) : IO Unit :=
+  stats.gauges.modify fun gs => (gs.filter (·.1 != name)).push (name, read)
+
+/-- Report the unfinished jobs of a diagnostics manager as `pendingDiagnostics` -/
+def watchDiagnostics (stats : ServerStats) (dm : DiagnosticsManager) : IO Unit :=
+  stats.registerGauge "pendingDiagnostics" dm.pendingCount
+
+/-- Record the latency of a request -/
+def recordLatency (stats : ServerStats) (method : String) (us : Nat) : IO Unit :=
+  stats.latencies.modify fun m => m.insert method ((m.getD method {}).record us)
+
+/-- Read every counter into the `$/lapis/stats` response.
+    `extra` holds fields known only to the caller, such as queue sizes.
+    Latency is an array labelled by method, since method names are not identifiers. -/
+def snapshot (stats : ServerStats) (extra : List (String × Json) := []) : IO Json := do
+  let readAll (entries : Array (String × IO Nat)) : IO Json := do
+    let mut fields : List (String × Json) := []
+    for (name, read) in entries do
+      fields := (name, toJson (← read)) :: fields
+    return Json.mkObj fields.reverse
+  let latencies ← stats.latencies.get
+  return Json.mkObj ([
+    ("mailboxes", ← readAll (← stats.mailboxes.get)),
+    ("notificationTasks", toJson (← stats.notificationTasks.get)),
+    ("gauges", ← readAll (← stats.gauges.get)),
+    ("latency", Json.arr (latencies.toArray.map fun (method, h) => h.toJsonFor method))
+  ] ++ extra)
+
+end ServerStats
+
+end Lapis.Concurrent.Stats
@@ -0,0 +1,31 @@
+/-
+  TCP Entry Point
+
+  Serves `Dispatcher.runHost` sessions over `Socket` connections. It belongs
+  to the `LapisTcp` library rather than `Lapis`, like the socket transport it
+  uses.
+-/
+
+import Lapis.Concurrent.Dispatcher
+import Lapis.Transport.Socket
+
+namespace Lapis.Concurrent.Dispatcher
+
+open Lapis.Concurrent.LspActor
+open Lapis.Transport
+
+/-- Serve LSP sessions on a TCP port. With port 0 the system picks a free one;
+    `onListening` is told the port once connections can be made. -/
+def runTcp (config : LspConfig UserState) (newState : IO UserState) (port : UInt16)
+    (onListening : UInt16 → IO Unit := fun _ => pure ()) : IO Unit := do
+  let listener ← Socket.listenTcp port
+  onListening listener.port
+  runHost listener.accept config newState
+
+end Lapis.Concurrent.Dispatcher
+
+namespace Lapis.Concurrent
+
+export Dispatcher (runTcp)
+
+end Lapis.Concurrent
@@ -0,0 +1,136 @@
+/-
+  JSON-RPC Envelope Parsing
+
+  Reads the top-level members of a message body without building a JSON
+  tree for all of it. `jsonrpc`, `id` and `method` are decoded eagerly,
+  while `params` stays a slice of the body until a handler asks for it.
+  So a large `didOpen` text is not copied or unescaped by the transport, and
+  requests that are cancelled or have no handler never decode their params.
+-/
+
+import Lapis.Protocol.JsonRpc
+
+namespace Lapis.Protocol.Envelope
+
+open Lean Json
+open Lapis.Protocol.JsonRpc
+
+/-- Byte range `[start, stop)` of a member's value in the message body -/
+structure Span where
+  start : Nat
+  stop : Nat
+
+/-! ## Scanning -/
+
+private def isSpace (b : UInt8) : Bool :=
+  b == 0x20 || b == 0x09 || b == 0x0A || b == 0x0D
+
+private partial def skipSpace (s : ByteArray) (i : Nat) : Nat :=
+  if i < s.size && isSpace s[i]! then skipSpace s (i + 1) else i
+
+/-- Position just past the closing quote of a string, scanning its contents from `j` -/
+private partial def skipStringFrom (s : ByteArray) (j : Nat) : Except String Nat :=
+  if j ≥ s.size then .error "unterminated string"
+  else if s[j]! == 0x5C then skipStringFrom s (j + 2)  -- a backslash escapes the next byte
+  else if s[j]! == 0x22 then .ok (j + 1)
+  else skipStringFrom s (j + 1)
+
+/-- Position just past the closing quote of the string whose opening quote is at `i` -/
+private def skipString (s : ByteArray) (i : Nat) : Except String Nat :=
+  skipStringFrom s (i + 1)
+
+/-- Position just past a number, `true`, `false` or `null` starting at `i` -/
+private partial def skipScalar (s : ByteArray) (i : Nat) : Nat :=
+  if i < s.size then
+    let b := s[i]!
+    if isSpace b || b == 0x2C || b == 0x7D || b == 0x5D then i else skipScalar s (i + 1)
+  else i
+
+/-- Position just past the closing bracket, from inside `depth` nested objects or arrays -/
+private partial def skipNested (s : ByteArray) (i depth : Nat) : Except String Nat :=
+  if depth == 0 then .ok i
+  else if i ≥ s.size then .error "unterminated object or array"
+  else
+    let b := s[i]!
+    if b == 0x22 then do skipNested s (← skipString s i) depth
+    else if b == 0x7B || b == 0x5B then skipNested s (i + 1) (depth + 1)
+    else if b == 0x7D || b == 0x5D then skipNested s (i + 1) (depth - 1)
+    else skipNested s (i + 1) depth
+
+/-- Position just past the JSON value starting at `i` -/
+private def skipValue (s : ByteArray) (i : Nat) : Except String Nat :=
+  if i ≥ s.size then .error "unexpected end of message"
+  else
+    let b := s[i]!
+    if b == 0x22 then skipString s i
+    else if b == 0x7B || b == 0x5B then skipNested s (i + 1) 1
+    else .ok (skipScalar s i)
+
+private partial def scanMembers (s : ByteArray) (i : Nat) (acc : List (String × Span)) :
+    Except String (List (String × Span)) := do
+  unless i < s.size && s[i]! == 0x22 do throw "expected a member name"
+  let keyEnd ← skipString s i
+  let some key := String.fromUTF8? (s.extract (i + 1) (keyEnd - 1))
+    | throw "member name is not valid UTF-8"
+  let i := skipSpace s keyEnd
+  unless i < s.size && s[i]! == 0x3A do throw "expected ':' after a member name"
+  let start := skipSpace s (i + 1)
+  let stop ← skipValue s start
+  -- Later members shadow earlier ones with the same name, as in `Json.parse`
+  let acc := (key, { start, stop }) :: acc
+  let i := skipSpace s stop
+  if i < s.size && s[i]! == 0x2C then
+    scanMembers s (skipSpace s (i + 1)) acc
+  else if i < s.size && s[i]! == 0x7D then
+    return acc
+  else
+    throw "expected ',' or '}' after a member"
+
+/-- Spans of the top-level members of the object in `s`, last member first.
+    Values are delimited but not validated. -/
+def scanObject (s : ByteArray) : Except String (List (String × Span)) := do
+  let i := skipSpace s 0
+  unless i < s.size && s[i]! == 0x7B do throw "message is not a JSON object"
+  let i := skipSpace s (i + 1)
+  if i < s.size && s[i]! == 0x7D then return []
+  scanMembers s i []
+
+/-! ## Decoding -/
+
+private def decodeSpan (s : ByteArray) (span : Span) : Except String Json := do
+  let some text := String.fromUTF8? (s.extract span.start span.stop)
+    | throw "message is not valid UTF-8"
+  Json.parse text
+
+/-- Parse a message body, leaving request and notification params undecoded -/
+def parseIncoming (body : ByteArray) : Except String Incoming := do
+  let members ← scanObject body
+  let decode (key : String) : Except String (Option Json) :=
+    match members.lookup key with
+    | none => pure none
+    | some span => some <$> decodeSpan body span
+
+  if (members.lookup "error").isSome || (members.lookup "result").isSome then
+    -- Responses to our own requests are rare; decode them in full
+    let json := Json.mkObj (← members.reverse.mapM fun (key, span) => do
+      return (key, ← decodeSpan body span))
+    if (members.lookup "error").isSome then
+      return .errorResponse (← fromJson? json)
+    else
+      return .response (← fromJson? json)
+
+  let some (.str _) ← decode "jsonrpc" | throw "missing jsonrpc version"
+  let some methodJson ← decode "method" | throw "missing method"
+  let method ← fromJson? (α := String) methodJson
+  let params := match members.lookup "params" with
+    | some span => LazyParams.ofSlice body span.start span.stop
+    | none => LazyParams.ofJson none
+  match ← decode "id" with
+  | some idJson =>
+    if idJson.isNull then
+      return .notification { method, params }
+    return .request { id := ← fromJson? idJson, method, params }
+  | none =>
+    return .notification { method, params }
+
+end Lapis.Protocol.Envelope
@@ -3,6 +3,7 @@
   Generated from metamodel.json - DO NOT EDIT MANUALLY
 -/
 import Lean.Data.Json
+import Std.Data.HashMap
 
 namespace Lapis.Protocol.Generated
 
@@ -65,35 +66,40 @@ instance : ToJson SemanticTokenTypes where
     | .decorator => "decorator"
     | .label => "label"
 
+private def SemanticTokenTypes.decodeTable : Std.HashMap String SemanticTokenTypes :=
+  Std.HashMap.ofList [
+    ("namespace", SemanticTokenTypes.«namespace»),
+    ("type", SemanticTokenTypes.«type»),
+    ("class", SemanticTokenTypes.«class»),
+    ("enum", SemanticTokenTypes.enum),
+    ("interface", SemanticTokenTypes.interface),
+    ("struct", SemanticTokenTypes.struct),
+    ("typeParameter", SemanticTokenTypes.typeParameter),
+    ("parameter", SemanticTokenTypes.parameter),
+    ("variable", SemanticTokenTypes.«variable»),
+    ("property", SemanticTokenTypes.property),
+    ("enumMember", SemanticTokenTypes.enumMember),
+    ("event", SemanticTokenTypes.event),
+    ("function", SemanticTokenTypes.function),
+    ("method", SemanticTokenTypes.method),
+    ("macro", SemanticTokenTypes.macro),
+    ("keyword", SemanticTokenTypes.keyword),
+    ("modifier", SemanticTokenTypes.modifier),
+    ("comment", SemanticTokenTypes.comment),
+    ("string", SemanticTokenTypes.string),
+    ("number", SemanticTokenTypes.number),
+    ("regexp", SemanticTokenTypes.regexp),
+    ("operator", SemanticTokenTypes.operator),
+    ("decorator", SemanticTokenTypes.decorator),
+    ("label", SemanticTokenTypes.label)
+  ]
+
 instance : FromJson SemanticTokenTypes where
   fromJson? json := do
     let s ← json.getStr?
-    match s with
-    | "namespace" => return .«namespace»
-    | "type" => return .«type»
-    | "class" => return .«class»
-    | "enum" => return .enum
-    | "interface" => return .interface
-    | "struct" => return .struct
-    | "typeParameter" => return .typeParameter
-    | "parameter" => return .parameter
-    | "variable" => return .«variable»
-    | "property" => return .property
-    | "enumMember" => return .enumMember
-    | "event" => return .event
-    | "function" => return .function
-    | "method" => return .method
-    | "macro" => return .macro
-    | "keyword" => return .keyword
-    | "modifier" => return .modifier
-    | "comment" => return .comment
-    | "string" => return .string
-    | "number" => return .number
-    | "regexp" => return .regexp
-    | "operator" => return .operator
-    | "decorator" => return .decorator
-    | "label" => return .label
-    | s => throw s!"Invalid SemanticTokenTypes: {s}"
+    let some v := SemanticTokenTypes.decodeTable[s]?
+      | throw s!"Invalid SemanticTokenTypes: {s}"
+    return v
 
 /-- A set of predefined token modifiers. This set is not fixed an clients can specify additional token types via the corresponding client capabilities.  @since 3.16.0 -/
 inductive SemanticTokenModifiers where
@@ -122,21 +128,26 @@ instance : ToJson SemanticTokenModifiers where
     | .documentation => "documentation"
     | .defaultLibrary => "defaultLibrary"
 
+private def SemanticTokenModifiers.decodeTable : Std.HashMap String SemanticTokenModifiers :=
+  Std.HashMap.ofList [
+    ("declaration", SemanticTokenModifiers.declaration),
+    ("definition", SemanticTokenModifiers.definition),
+    ("readonly", SemanticTokenModifiers.readonly),
+    ("static", SemanticTokenModifiers.static),
+    ("deprecated", SemanticTokenModifiers.deprecated),
+    ("abstract", SemanticTokenModifiers.abstract),
+    ("async", SemanticTokenModifiers.async),
+    ("modification", SemanticTokenModifiers.modification),
+    ("documentation", SemanticTokenModifiers.documentation),
+    ("defaultLibrary", SemanticTokenModifiers.defaultLibrary)
+  ]
+
 instance : FromJson SemanticTokenModifiers where
   fromJson? json := do
     let s ← json.getStr?
-    match s with
-    | "declaration" => return .declaration
-    | "definition" => return .definition
-    | "readonly" => return .readonly
-    | "static" => return .static
-    | "deprecated" => return .deprecated
-    | "abstract" => return .abstract
-    | "async" => return .async
-    | "modification" => return .modification
-    | "documentation" => return .documentation
-    | "defaultLibrary" => return .defaultLibrary
-    | s => throw s!"Invalid SemanticTokenModifiers: {s}"
+    let some v := SemanticTokenModifiers.decodeTable[s]?
+      | throw s!"Invalid SemanticTokenModifiers: {s}"
+    return v
 
 /-- The document diagnostic report kinds.  @since 3.17.0 -/
 inductive DocumentDiagnosticReportKind where
@@ -296,37 +307,42 @@ instance : ToJson SymbolKind where
     | .operator => 25
     | .typeParameter => 26
 
+private def SymbolKind.decodeTable : Array SymbolKind :=
+  #[
+    SymbolKind.file,
+    SymbolKind.module,
+    SymbolKind.«namespace»,
+    SymbolKind.package,
+    SymbolKind.«class»,
+    SymbolKind.method,
+    SymbolKind.property,
+    SymbolKind.field,
+    SymbolKind.constructor,
+    SymbolKind.enum,
+    SymbolKind.interface,
+    SymbolKind.function,
+    SymbolKind.«variable»,
+    SymbolKind.«constant»,
+    SymbolKind.string,
+    SymbolKind.number,
+    SymbolKind.boolean,
+    SymbolKind.array,
+    SymbolKind.object,
+    SymbolKind.key,
+    SymbolKind.null,
+    SymbolKind.enumMember,
+    SymbolKind.struct,
+    SymbolKind.event,
+    SymbolKind.operator,
+    SymbolKind.typeParameter
+  ]
+
 instance : FromJson SymbolKind where
   fromJson? json := do
     let n ← json.getInt?
-    match n with
-    | 1 => return .file
-    | 2 => return .module
-    | 3 => return .«namespace»
-    | 4 => return .package
-    | 5 => return .«class»
-    | 6 => return .method
-    | 7 => return .property
-    | 8 => return .field
-    | 9 => return .constructor
-    | 10 => return .enum
-    | 11 => return .interface
-    | 12 => return .function
-    | 13 => return .«variable»
-    | 14 => return .«constant»
-    | 15 => return .string
-    | 16 => return .number
-    | 17 => return .boolean
-    | 18 => return .array
-    | 19 => return .object
-    | 20 => return .key
-    | 21 => return .null
-    | 22 => return .enumMember
-    | 23 => return .struct
-    | 24 => return .event
-    | 25 => return .operator
-    | 26 => return .typeParameter
-    | n => throw s!"Invalid SymbolKind: {n}"
+    let some v := if n < 1 then none else SymbolKind.decodeTable[(n - 1).toNat]?
+      | throw s!"Invalid SymbolKind: {n}"
+    return v
 
 /-- Symbol tags are extra annotations that tweak the rendering of a symbol.  @since 3.16 -/
 inductive SymbolTag where
@@ -542,36 +558,41 @@ instance : ToJson CompletionItemKind where
     | .operator => 24
     | .typeParameter => 25
 
+private def CompletionItemKind.decodeTable : Array CompletionItemKind :=
+  #[
+    CompletionItemKind.text,
+    CompletionItemKind.method,
+    CompletionItemKind.function,
+    CompletionItemKind.constructor,
+    CompletionItemKind.field,
+    CompletionItemKind.«variable»,
+    CompletionItemKind.«class»,
+    CompletionItemKind.interface,
+    CompletionItemKind.module,
+    CompletionItemKind.property,
+    CompletionItemKind.unit,
+    CompletionItemKind.value,
+    CompletionItemKind.enum,
+    CompletionItemKind.keyword,
+    CompletionItemKind.snippet,
+    CompletionItemKind.color,
+    CompletionItemKind.file,
+    CompletionItemKind.reference,
+    CompletionItemKind.folder,
+    CompletionItemKind.enumMember,
+    CompletionItemKind.«constant»,
+    CompletionItemKind.struct,
+    CompletionItemKind.event,
+    CompletionItemKind.operator,
+    CompletionItemKind.typeParameter
+  ]
+
 instance : FromJson CompletionItemKind where
   fromJson? json := do
     let n ← json.getInt?
-    match n with
-    | 1 => return .text
-    | 2 => return .method
-    | 3 => return .function
-    | 4 => return .constructor
-    | 5 => return .field
-    | 6 => return .«variable»
-    | 7 => return .«class»
-    | 8 => return .interface
-    | 9 => return .module
-    | 10 => return .property
-    | 11 => return .unit
-    | 12 => return .value
-    | 13 => return .enum
-    | 14 => return .keyword
-    | 15 => return .snippet
-    | 16 => return .color
-    | 17 => return .file
-    | 18 => return .reference
-    | 19 => return .folder
-    | 20 => return .enumMember
-    | 21 => return .«constant»
-    | 22 => return .struct
-    | 23 => return .event
-    | 24 => return .operator
-    | 25 => return .typeParameter
-    | n => throw s!"Invalid CompletionItemKind: {n}"
+    let some v := if n < 1 then none else CompletionItemKind.decodeTable[(n - 1).toNat]?
+      | throw s!"Invalid CompletionItemKind: {n}"
+    return v
 
 /-- Completion item tags are extra annotations that tweak the rendering of a completion item.  @since 3.15.0 -/
 inductive CompletionItemTag where
@@ -678,22 +699,27 @@ instance : ToJson CodeActionKind where
     | .sourceFixAll => "source.fixAll"
     | .notebook => "notebook"
 
+private def CodeActionKind.decodeTable : Std.HashMap String CodeActionKind :=
+  Std.HashMap.ofList [
+    ("", CodeActionKind.empty),
+    ("quickfix", CodeActionKind.quickFix),
+    ("refactor", CodeActionKind.refactor),
+    ("refactor.extract", CodeActionKind.refactorExtract),
+    ("refactor.inline", CodeActionKind.refactorInline),
+    ("refactor.move", CodeActionKind.refactorMove),
+    ("refactor.rewrite", CodeActionKind.refactorRewrite),
+    ("source", CodeActionKind.source),
+    ("source.organizeImports", CodeActionKind.sourceOrganizeImports),
+    ("source.fixAll", CodeActionKind.sourceFixAll),
+    ("notebook", CodeActionKind.notebook)
+  ]
+
 instance : FromJson CodeActionKind where
   fromJson? json := do
     let s ← json.getStr?
-    match s with
-    | "" => return .empty
-    | "quickfix" => return .quickFix
-    | "refactor" => return .refactor
-    | "refactor.extract" => return .refactorExtract
-    | "refactor.inline" => return .refactorInline
-    | "refactor.move" => return .refactorMove
-    | "refactor.rewrite" => return .refactorRewrite
-    | "source" => return .source
-    | "source.organizeImports" => return .sourceOrganizeImports
-    | "source.fixAll" => return .sourceFixAll
-    | "notebook" => return .notebook
-    | s => throw s!"Invalid CodeActionKind: {s}"
+    let some v := CodeActionKind.decodeTable[s]?
+      | throw s!"Invalid CodeActionKind: {s}"
+    return v
 
 /-- Code action tags are extra annotations that tweak the behavior of a code action.  @since 3.18.0 - proposed -/
 inductive CodeActionTag where
@@ -880,71 +906,76 @@ instance : ToJson LanguageKind where
     | .xSL => "xsl"
     | .yAML => "yaml"
 
+private def LanguageKind.decodeTable : Std.HashMap String LanguageKind :=
+  Std.HashMap.ofList [
+    ("abap", LanguageKind.aBAP),
+    ("bat", LanguageKind.windowsBat),
+    ("bibtex", LanguageKind.bibTeX),
+    ("clojure", LanguageKind.clojure),
+    ("coffeescript", LanguageKind.coffeescript),
+    ("c", LanguageKind.c),
+    ("cpp", LanguageKind.cPP),
+    ("csharp", LanguageKind.cSharp),
+    ("css", LanguageKind.cSS),
+    ("d", LanguageKind.d),
+    ("pascal", LanguageKind.delphi),
+    ("diff", LanguageKind.diff),
+    ("dart", LanguageKind.dart),
+    ("dockerfile", LanguageKind.dockerfile),
+    ("elixir", LanguageKind.elixir),
+    ("erlang", LanguageKind.erlang),
+    ("fsharp", LanguageKind.fSharp),
+    ("git-commit", LanguageKind.gitCommit),
+    ("rebase", LanguageKind.gitRebase),
+    ("go", LanguageKind.go),
+    ("groovy", LanguageKind.groovy),
+    ("handlebars", LanguageKind.handlebars),
+    ("haskell", LanguageKind.haskell),
+    ("html", LanguageKind.hTML),
+    ("ini", LanguageKind.ini),
+    ("java", LanguageKind.java),
+    ("javascript", LanguageKind.javaScript),
+    ("javascriptreact", LanguageKind.javaScriptReact),
+    ("json", LanguageKind.jSON),
+    ("latex", LanguageKind.laTeX),
+    ("less", LanguageKind.less),
+    ("lua", LanguageKind.lua),
+    ("makefile", LanguageKind.makefile),
+    ("markdown", LanguageKind.markdown),
+    ("objective-c", LanguageKind.objectiveC),
+    ("objective-cpp", LanguageKind.objectiveCPP),
+    ("perl", LanguageKind.perl),
+    ("perl6", LanguageKind.perl6),
+    ("php", LanguageKind.pHP),
+    ("powershell", LanguageKind.powershell),
+    ("jade", LanguageKind.pug),
+    ("python", LanguageKind.python),
+    ("r", LanguageKind.r),
+    ("razor", LanguageKind.razor),
+    ("ruby", LanguageKind.ruby),
+    ("rust", LanguageKind.rust),
+    ("scss", LanguageKind.sCSS),
+    ("sass", LanguageKind.sASS),
+    ("scala", LanguageKind.scala),
+    ("shaderlab", LanguageKind.shaderLab),
+    ("shellscript", LanguageKind.shellScript),
+    ("sql", LanguageKind.sQL),
+    ("swift", LanguageKind.swift),
+    ("typescript", LanguageKind.typeScript),
+    ("typescriptreact", LanguageKind.typeScriptReact),
+    ("tex", LanguageKind.teX),
+    ("vb", LanguageKind.visualBasic),
+    ("xml", LanguageKind.xML),
+    ("xsl", LanguageKind.xSL),
+    ("yaml", LanguageKind.yAML)
+  ]
+
 instance : FromJson LanguageKind where
   fromJson? json := do
     let s ← json.getStr?
-    match s with
-    | "abap" => return .aBAP
-    | "bat" => return .windowsBat
-    | "bibtex" => return .bibTeX
-    | "clojure" => return .clojure
-    | "coffeescript" => return .coffeescript
-    | "c" => return .c
-    | "cpp" => return .cPP
-    | "csharp" => return .cSharp
-    | "css" => return .cSS
-    | "d" => return .d
-    | "pascal" => return .delphi
-    | "diff" => return .diff
-    | "dart" => return .dart
-    | "dockerfile" => return .dockerfile
-    | "elixir" => return .elixir
-    | "erlang" => return .erlang
-    | "fsharp" => return .fSharp
-    | "git-commit" => return .gitCommit
-    | "rebase" => return .gitRebase
-    | "go" => return .go
-    | "groovy" => return .groovy
-    | "handlebars" => return .handlebars
-    | "haskell" => return .haskell
-    | "html" => return .hTML
-    | "ini" => return .ini
-    | "java" => return .java
-    | "javascript" => return .javaScript
-    | "javascriptreact" => return .javaScriptReact
-    | "json" => return .jSON
-    | "latex" => return .laTeX
-    | "less" => return .less
-    | "lua" => return .lua
-    | "makefile" => return .makefile
-    | "markdown" => return .markdown
-    | "objective-c" => return .objectiveC
-    | "objective-cpp" => return .objectiveCPP
-    | "perl" => return .perl
-    | "perl6" => return .perl6
-    | "php" => return .pHP
-    | "powershell" => return .powershell
-    | "jade" => return .pug
-    | "python" => return .python
-    | "r" => return .r
-    | "razor" => return .razor
-    | "ruby" => return .ruby
-    | "rust" => return .rust
-    | "scss" => return .sCSS
-    | "sass" => return .sASS
-    | "scala" => return .scala
-    | "shaderlab" => return .shaderLab
-    | "shellscript" => return .shellScript
-    | "sql" => return .sQL
-    | "swift" => return .swift
-    | "typescript" => return .typeScript
-    | "typescriptreact" => return .typeScriptReact
-    | "tex" => return .teX
-    | "vb" => return .visualBasic
-    | "xml" => return .xML
-    | "xsl" => return .xSL
-    | "yaml" => return .yAML
-    | s => throw s!"Invalid LanguageKind: {s}"
+    let some v := LanguageKind.decodeTable[s]?
+      | throw s!"Invalid LanguageKind: {s}"
+    return v
 
 /-- A set of predefined position encoding kinds.  @since 3.17.0 -/
 inductive PositionEncodingKind where
@@ -1317,2906 +1348,3928 @@ abbrev RegularExpressionEngineKind := String
 
 /-! ## Structures -/
 
-/-- A workspace folder inside a client. -/
-structure WorkspaceFolder where
-  uri : String
-  name : String
+/-- Position in a text document expressed as zero-based line and character offset. Prior to 3.17 the offsets were always based on a UTF-16 string representation. So a string of the form `a𐐀b` the character offset of the character `a` is 0, the character offset of `𐐀` is 1 and the character offset of b i... -/
+structure Position where
+  line : Nat
+  character : Nat
   deriving Inhabited
 
-instance : ToJson WorkspaceFolder where
-  toJson s := Json.mkObj <|
-    [("uri", toJson s.uri)] ++
-    [("name", toJson s.name)]
+instance : ToJson Position where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("line", toJson s.line) :: ("character", toJson s.character) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson WorkspaceFolder where
+instance : FromJson Position where
   fromJson? json := do
-    let uri ← json.getObjValAs? String "uri"
-    let name ← json.getObjValAs? String "name"
-    return { uri, name }
+    let _obj ← json.getObj?
+    let line : Nat ← match _obj.find compare "line" with | some v => fromJson? v | none => throw "property not found: line"
+    let character : Nat ← match _obj.find compare "character" with | some v => fromJson? v | none => throw "property not found: character"
+    return { line, character }
 
-structure WorkDoneProgressOptions where
-  workDoneProgress : (Option Bool) := none
+/-- A literal to identify a text document in the client. -/
+structure TextDocumentIdentifier where
+  uri : String
   deriving Inhabited
 
-instance : ToJson WorkDoneProgressOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => [])
+instance : ToJson TextDocumentIdentifier where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("uri", toJson s.uri) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson WorkDoneProgressOptions where
+instance : FromJson TextDocumentIdentifier where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    return { workDoneProgress }
+    let _obj ← json.getObj?
+    let uri : String ← match _obj.find compare "uri" with | some v => fromJson? v | none => throw "property not found: uri"
+    return { uri }
 
-/-- General text document registration options. -/
-structure TextDocumentRegistrationOptions where
-  documentSelector : (Option Json)
+structure ImplementationParams where
+  textDocument : TextDocumentIdentifier
+  position : Position
+  workDoneToken : (Option ProgressToken) := none
+  partialResultToken : (Option ProgressToken) := none
   deriving Inhabited
 
-instance : ToJson TextDocumentRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)]
+instance : ToJson ImplementationParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.partialResultToken with | some v => ("partialResultToken", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    let kvs := ("textDocument", toJson s.textDocument) :: ("position", toJson s.position) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson TextDocumentRegistrationOptions where
+instance : FromJson ImplementationParams where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    return { documentSelector }
+    let _obj ← json.getObj?
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let position : Position ← match _obj.find compare "position" with | some v => fromJson? v | none => throw "property not found: position"
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let partialResultToken : Option ProgressToken := (_obj.find compare "partialResultToken").bind fun v => (fromJson? v).toOption
+    return { textDocument, position, workDoneToken, partialResultToken }
 
-/-- Represents a folding range. To be valid, start and end line must be bigger than zero and smaller than the number of lines in the document. Clients are free to ignore invalid ranges. -/
-structure FoldingRange where
-  startLine : Nat
-  startCharacter : (Option Nat) := none
-  endLine : Nat
-  endCharacter : (Option Nat) := none
-  kind : (Option FoldingRangeKind) := none
-  collapsedText : (Option String) := none
+/-- A range in a text document expressed as (zero-based) start and end positions.  If you want to specify a range that contains a line including the line ending character(s) then use an end position denoting the start of the next line. For example: ```ts {     start: { line: 5, character: 23 }     end :... -/
+structure Range where
+  start : Position
+  «end» : Position
   deriving Inhabited
 
-instance : ToJson FoldingRange where
-  toJson s := Json.mkObj <|
-    [("startLine", toJson s.startLine)] ++
-    (match s.startCharacter with | some v => [("startCharacter", toJson v)] | none => []) ++
-    [("endLine", toJson s.endLine)] ++
-    (match s.endCharacter with | some v => [("endCharacter", toJson v)] | none => []) ++
-    (match s.kind with | some v => [("kind", toJson v)] | none => []) ++
-    (match s.collapsedText with | some v => [("collapsedText", toJson v)] | none => [])
+instance : ToJson Range where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("start", toJson s.start) :: ("end", toJson s.«end») :: kvs
+    Json.mkObj kvs
 
-instance : FromJson FoldingRange where
+instance : FromJson Range where
   fromJson? json := do
-    let startLine ← json.getObjValAs? Nat "startLine"
-    let startCharacter := (json.getObjValAs? Nat "startCharacter").toOption
-    let endLine ← json.getObjValAs? Nat "endLine"
-    let endCharacter := (json.getObjValAs? Nat "endCharacter").toOption
-    let kind := (json.getObjValAs? FoldingRangeKind "kind").toOption
-    let collapsedText := (json.getObjValAs? String "collapsedText").toOption
-    return { startLine, startCharacter, endLine, endCharacter, kind, collapsedText }
+    let _obj ← json.getObj?
+    let start : Position ← match _obj.find compare "start" with | some v => fromJson? v | none => throw "property not found: start"
+    let «end» : Position ← match _obj.find compare "end" with | some v => fromJson? v | none => throw "property not found: end"
+    return { start, «end» }
 
-structure WorkDoneProgressCreateParams where
-  token : ProgressToken
+/-- Represents a location inside a resource, such as a line inside a text file. -/
+structure Location where
+  uri : String
+  range : Range
   deriving Inhabited
 
-instance : ToJson WorkDoneProgressCreateParams where
-  toJson s := Json.mkObj <|
-    [("token", toJson s.token)]
+instance : ToJson Location where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("uri", toJson s.uri) :: ("range", toJson s.range) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson WorkDoneProgressCreateParams where
+instance : FromJson Location where
   fromJson? json := do
-    let token ← json.getObjValAs? ProgressToken "token"
-    return { token }
+    let _obj ← json.getObj?
+    let uri : String ← match _obj.find compare "uri" with | some v => fromJson? v | none => throw "property not found: uri"
+    let range : Range ← match _obj.find compare "range" with | some v => fromJson? v | none => throw "property not found: range"
+    return { uri, range }
 
-structure WorkDoneProgressCancelParams where
-  token : ProgressToken
+structure ImplementationRegistrationOptions where
+  documentSelector : (Option Json)
+  id : (Option String) := none
   deriving Inhabited
 
-instance : ToJson WorkDoneProgressCancelParams where
-  toJson s := Json.mkObj <|
-    [("token", toJson s.token)]
+instance : ToJson ImplementationRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.id with | some v => ("id", toJson v) :: kvs | none => kvs)
+    let kvs := ("documentSelector", toJson s.documentSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson WorkDoneProgressCancelParams where
+instance : FromJson ImplementationRegistrationOptions where
   fromJson? json := do
-    let token ← json.getObjValAs? ProgressToken "token"
-    return { token }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    let id : Option String := (_obj.find compare "id").bind fun v => (fromJson? v).toOption
+    return { documentSelector, id }
 
-/-- @since 3.16.0 -/
-structure SemanticTokens where
-  resultId : (Option String) := none
-  data : (Array Nat)
+structure TypeDefinitionParams where
+  textDocument : TextDocumentIdentifier
+  position : Position
+  workDoneToken : (Option ProgressToken) := none
+  partialResultToken : (Option ProgressToken) := none
   deriving Inhabited
 
-instance : ToJson SemanticTokens where
-  toJson s := Json.mkObj <|
-    (match s.resultId with | some v => [("resultId", toJson v)] | none => []) ++
-    [("data", toJson s.data)]
+instance : ToJson TypeDefinitionParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.partialResultToken with | some v => ("partialResultToken", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    let kvs := ("textDocument", toJson s.textDocument) :: ("position", toJson s.position) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson SemanticTokens where
+instance : FromJson TypeDefinitionParams where
   fromJson? json := do
-    let resultId := (json.getObjValAs? String "resultId").toOption
-    let data ← json.getObjValAs? (Array Nat) "data"
-    return { resultId, data }
+    let _obj ← json.getObj?
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let position : Position ← match _obj.find compare "position" with | some v => fromJson? v | none => throw "property not found: position"
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let partialResultToken : Option ProgressToken := (_obj.find compare "partialResultToken").bind fun v => (fromJson? v).toOption
+    return { textDocument, position, workDoneToken, partialResultToken }
 
-/-- @since 3.16.0 -/
-structure SemanticTokensPartialResult where
-  data : (Array Nat)
+structure TypeDefinitionRegistrationOptions where
+  documentSelector : (Option Json)
+  id : (Option String) := none
   deriving Inhabited
 
-instance : ToJson SemanticTokensPartialResult where
-  toJson s := Json.mkObj <|
-    [("data", toJson s.data)]
+instance : ToJson TypeDefinitionRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.id with | some v => ("id", toJson v) :: kvs | none => kvs)
+    let kvs := ("documentSelector", toJson s.documentSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson SemanticTokensPartialResult where
+instance : FromJson TypeDefinitionRegistrationOptions where
   fromJson? json := do
-    let data ← json.getObjValAs? (Array Nat) "data"
-    return { data }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    let id : Option String := (_obj.find compare "id").bind fun v => (fromJson? v).toOption
+    return { documentSelector, id }
 
-/-- The result of a showDocument request.  @since 3.16.0 -/
-structure ShowDocumentResult where
-  success : Bool
+/-- A workspace folder inside a client. -/
+structure WorkspaceFolder where
+  uri : String
+  name : String
   deriving Inhabited
 
-instance : ToJson ShowDocumentResult where
-  toJson s := Json.mkObj <|
-    [("success", toJson s.success)]
+instance : ToJson WorkspaceFolder where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("uri", toJson s.uri) :: ("name", toJson s.name) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ShowDocumentResult where
+instance : FromJson WorkspaceFolder where
   fromJson? json := do
-    let success ← json.getObjValAs? Bool "success"
-    return { success }
+    let _obj ← json.getObj?
+    let uri : String ← match _obj.find compare "uri" with | some v => fromJson? v | none => throw "property not found: uri"
+    let name : String ← match _obj.find compare "name" with | some v => fromJson? v | none => throw "property not found: name"
+    return { uri, name }
 
-/-- Moniker definition to match LSIF 0.5 moniker definition.  @since 3.16.0 -/
-structure Moniker where
-  scheme : String
-  identifier : String
-  unique : UniquenessLevel
-  kind : (Option MonikerKind) := none
+/-- The workspace folder change event. -/
+structure WorkspaceFoldersChangeEvent where
+  added : (Array WorkspaceFolder)
+  removed : (Array WorkspaceFolder)
   deriving Inhabited
 
-instance : ToJson Moniker where
-  toJson s := Json.mkObj <|
-    [("scheme", toJson s.scheme)] ++
-    [("identifier", toJson s.identifier)] ++
-    [("unique", toJson s.unique)] ++
-    (match s.kind with | some v => [("kind", toJson v)] | none => [])
+instance : ToJson WorkspaceFoldersChangeEvent where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("added", toJson s.added) :: ("removed", toJson s.removed) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson Moniker where
+instance : FromJson WorkspaceFoldersChangeEvent where
   fromJson? json := do
-    let scheme ← json.getObjValAs? String "scheme"
-    let identifier ← json.getObjValAs? String "identifier"
-    let unique ← json.getObjValAs? UniquenessLevel "unique"
-    let kind := (json.getObjValAs? MonikerKind "kind").toOption
-    return { scheme, identifier, unique, kind }
+    let _obj ← json.getObj?
+    let added : (Array WorkspaceFolder) ← match _obj.find compare "added" with | some v => fromJson? v | none => throw "property not found: added"
+    let removed : (Array WorkspaceFolder) ← match _obj.find compare "removed" with | some v => fromJson? v | none => throw "property not found: removed"
+    return { added, removed }
 
-/-- Cancellation data returned from a diagnostic request.  @since 3.17.0 -/
-structure DiagnosticServerCancellationData where
-  retriggerRequest : Bool
+/-- The parameters of a `workspace/didChangeWorkspaceFolders` notification. -/
+structure DidChangeWorkspaceFoldersParams where
+  event : WorkspaceFoldersChangeEvent
   deriving Inhabited
 
-instance : ToJson DiagnosticServerCancellationData where
-  toJson s := Json.mkObj <|
-    [("retriggerRequest", toJson s.retriggerRequest)]
+instance : ToJson DidChangeWorkspaceFoldersParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("event", toJson s.event) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DiagnosticServerCancellationData where
+instance : FromJson DidChangeWorkspaceFoldersParams where
   fromJson? json := do
-    let retriggerRequest ← json.getObjValAs? Bool "retriggerRequest"
-    return { retriggerRequest }
+    let _obj ← json.getObj?
+    let event : WorkspaceFoldersChangeEvent ← match _obj.find compare "event" with | some v => fromJson? v | none => throw "property not found: event"
+    return { event }
 
-/-- A workspace diagnostic report.  @since 3.17.0 -/
-structure WorkspaceDiagnosticReport where
-  items : (Array WorkspaceDocumentDiagnosticReport)
+structure ConfigurationItem where
+  scopeUri : (Option String) := none
+  «section» : (Option String) := none
   deriving Inhabited
 
-instance : ToJson WorkspaceDiagnosticReport where
-  toJson s := Json.mkObj <|
-    [("items", toJson s.items)]
+instance : ToJson ConfigurationItem where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.«section» with | some v => ("section", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.scopeUri with | some v => ("scopeUri", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson WorkspaceDiagnosticReport where
+instance : FromJson ConfigurationItem where
   fromJson? json := do
-    let items ← json.getObjValAs? (Array WorkspaceDocumentDiagnosticReport) "items"
-    return { items }
+    let _obj ← json.getObj?
+    let scopeUri : Option String := (_obj.find compare "scopeUri").bind fun v => (fromJson? v).toOption
+    let «section» : Option String := (_obj.find compare "section").bind fun v => (fromJson? v).toOption
+    return { scopeUri, «section» }
 
-/-- A partial result for a workspace diagnostic report.  @since 3.17.0 -/
-structure WorkspaceDiagnosticReportPartialResult where
-  items : (Array WorkspaceDocumentDiagnosticReport)
+/-- The parameters of a configuration request. -/
+structure ConfigurationParams where
+  items : (Array ConfigurationItem)
   deriving Inhabited
 
-instance : ToJson WorkspaceDiagnosticReportPartialResult where
-  toJson s := Json.mkObj <|
-    [("items", toJson s.items)]
+instance : ToJson ConfigurationParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("items", toJson s.items) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson WorkspaceDiagnosticReportPartialResult where
+instance : FromJson ConfigurationParams where
   fromJson? json := do
-    let items ← json.getObjValAs? (Array WorkspaceDocumentDiagnosticReport) "items"
+    let _obj ← json.getObj?
+    let items : (Array ConfigurationItem) ← match _obj.find compare "items" with | some v => fromJson? v | none => throw "property not found: items"
     return { items }
 
-/-- The data type of the ResponseError if the initialize request fails. -/
-structure InitializeError where
-  retry : Bool
+/-- Parameters for a {@link DocumentColorRequest}. -/
+structure DocumentColorParams where
+  workDoneToken : (Option ProgressToken) := none
+  partialResultToken : (Option ProgressToken) := none
+  textDocument : TextDocumentIdentifier
   deriving Inhabited
 
-instance : ToJson InitializeError where
-  toJson s := Json.mkObj <|
-    [("retry", toJson s.retry)]
+instance : ToJson DocumentColorParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("textDocument", toJson s.textDocument) :: kvs
+    let kvs := (match s.partialResultToken with | some v => ("partialResultToken", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson InitializeError where
+instance : FromJson DocumentColorParams where
   fromJson? json := do
-    let retry ← json.getObjValAs? Bool "retry"
-    return { retry }
+    let _obj ← json.getObj?
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let partialResultToken : Option ProgressToken := (_obj.find compare "partialResultToken").bind fun v => (fromJson? v).toOption
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    return { workDoneToken, partialResultToken, textDocument }
 
-structure InitializedParams where
-  dummy : Unit := ()
+/-- Represents a color in RGBA space. -/
+structure Color where
+  red : Float
+  green : Float
+  blue : Float
+  alpha : Float
   deriving Inhabited
 
-instance : ToJson InitializedParams where
-  toJson _ := Json.mkObj []
+instance : ToJson Color where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("red", toJson s.red) :: ("green", toJson s.green) :: ("blue", toJson s.blue) :: ("alpha", toJson s.alpha) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson InitializedParams where
-  fromJson? _ := return { dummy := () }
+instance : FromJson Color where
+  fromJson? json := do
+    let _obj ← json.getObj?
+    let red : Float ← match _obj.find compare "red" with | some v => fromJson? v | none => throw "property not found: red"
+    let green : Float ← match _obj.find compare "green" with | some v => fromJson? v | none => throw "property not found: green"
+    let blue : Float ← match _obj.find compare "blue" with | some v => fromJson? v | none => throw "property not found: blue"
+    let alpha : Float ← match _obj.find compare "alpha" with | some v => fromJson? v | none => throw "property not found: alpha"
+    return { red, green, blue, alpha }
 
-/-- The parameters of a change configuration notification. -/
-structure DidChangeConfigurationParams where
-  settings : Json
+/-- Represents a color range from a document. -/
+structure ColorInformation where
+  range : Range
+  color : Color
   deriving Inhabited
 
-instance : ToJson DidChangeConfigurationParams where
-  toJson s := Json.mkObj <|
-    [("settings", toJson s.settings)]
+instance : ToJson ColorInformation where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("range", toJson s.range) :: ("color", toJson s.color) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DidChangeConfigurationParams where
+instance : FromJson ColorInformation where
   fromJson? json := do
-    let settings := json.getObjVal? "settings" |>.toOption |>.getD Json.null
-    return { settings }
+    let _obj ← json.getObj?
+    let range : Range ← match _obj.find compare "range" with | some v => fromJson? v | none => throw "property not found: range"
+    let color : Color ← match _obj.find compare "color" with | some v => fromJson? v | none => throw "property not found: color"
+    return { range, color }
 
-structure DidChangeConfigurationRegistrationOptions where
-  «section» : Json := Json.null
+structure DocumentColorRegistrationOptions where
+  documentSelector : (Option Json)
+  id : (Option String) := none
   deriving Inhabited
 
-instance : ToJson DidChangeConfigurationRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("section", toJson s.«section»)]
+instance : ToJson DocumentColorRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.id with | some v => ("id", toJson v) :: kvs | none => kvs)
+    let kvs := ("documentSelector", toJson s.documentSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DidChangeConfigurationRegistrationOptions where
+instance : FromJson DocumentColorRegistrationOptions where
   fromJson? json := do
-    let «section» := json.getObjVal? "section" |>.toOption |>.getD Json.null
-    return { «section» }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    let id : Option String := (_obj.find compare "id").bind fun v => (fromJson? v).toOption
+    return { documentSelector, id }
 
-/-- The parameters of a notification message. -/
-structure ShowMessageParams where
-  «type» : MessageType
-  message : String
+/-- Parameters for a {@link ColorPresentationRequest}. -/
+structure ColorPresentationParams where
+  workDoneToken : (Option ProgressToken) := none
+  partialResultToken : (Option ProgressToken) := none
+  textDocument : TextDocumentIdentifier
+  color : Color
+  range : Range
   deriving Inhabited
 
-instance : ToJson ShowMessageParams where
-  toJson s := Json.mkObj <|
-    [("type", toJson s.«type»)] ++
-    [("message", toJson s.message)]
+instance : ToJson ColorPresentationParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("textDocument", toJson s.textDocument) :: ("color", toJson s.color) :: ("range", toJson s.range) :: kvs
+    let kvs := (match s.partialResultToken with | some v => ("partialResultToken", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson ShowMessageParams where
+instance : FromJson ColorPresentationParams where
   fromJson? json := do
-    let «type» ← json.getObjValAs? MessageType "type"
-    let message ← json.getObjValAs? String "message"
-    return { «type», message }
+    let _obj ← json.getObj?
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let partialResultToken : Option ProgressToken := (_obj.find compare "partialResultToken").bind fun v => (fromJson? v).toOption
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let color : Color ← match _obj.find compare "color" with | some v => fromJson? v | none => throw "property not found: color"
+    let range : Range ← match _obj.find compare "range" with | some v => fromJson? v | none => throw "property not found: range"
+    return { workDoneToken, partialResultToken, textDocument, color, range }
 
-structure MessageActionItem where
-  title : String
+/-- A text edit applicable to a text document. -/
+structure TextEdit where
+  range : Range
+  newText : String
   deriving Inhabited
 
-instance : ToJson MessageActionItem where
-  toJson s := Json.mkObj <|
-    [("title", toJson s.title)]
+instance : ToJson TextEdit where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("range", toJson s.range) :: ("newText", toJson s.newText) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson MessageActionItem where
+instance : FromJson TextEdit where
   fromJson? json := do
-    let title ← json.getObjValAs? String "title"
-    return { title }
+    let _obj ← json.getObj?
+    let range : Range ← match _obj.find compare "range" with | some v => fromJson? v | none => throw "property not found: range"
+    let newText : String ← match _obj.find compare "newText" with | some v => fromJson? v | none => throw "property not found: newText"
+    return { range, newText }
 
-/-- The log message parameters. -/
-structure LogMessageParams where
-  «type» : MessageType
-  message : String
+structure ColorPresentation where
+  label : String
+  textEdit : (Option TextEdit) := none
+  additionalTextEdits : (Option (Array TextEdit)) := none
   deriving Inhabited
 
-instance : ToJson LogMessageParams where
-  toJson s := Json.mkObj <|
-    [("type", toJson s.«type»)] ++
-    [("message", toJson s.message)]
+instance : ToJson ColorPresentation where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.additionalTextEdits with | some v => ("additionalTextEdits", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.textEdit with | some v => ("textEdit", toJson v) :: kvs | none => kvs)
+    let kvs := ("label", toJson s.label) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson LogMessageParams where
+instance : FromJson ColorPresentation where
   fromJson? json := do
-    let «type» ← json.getObjValAs? MessageType "type"
-    let message ← json.getObjValAs? String "message"
-    return { «type», message }
+    let _obj ← json.getObj?
+    let label : String ← match _obj.find compare "label" with | some v => fromJson? v | none => throw "property not found: label"
+    let textEdit : Option TextEdit := (_obj.find compare "textEdit").bind fun v => (fromJson? v).toOption
+    let additionalTextEdits : Option (Array TextEdit) := (_obj.find compare "additionalTextEdits").bind fun v => (fromJson? v).toOption
+    return { label, textEdit, additionalTextEdits }
 
-/-- The publish diagnostic notification's parameters. -/
-structure PublishDiagnosticsParams where
-  uri : String
-  version : (Option Int) := none
-  diagnostics : Json
+structure WorkDoneProgressOptions where
+  workDoneProgress : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson PublishDiagnosticsParams where
-  toJson s := Json.mkObj <|
-    [("uri", toJson s.uri)] ++
-    (match s.version with | some v => [("version", toJson v)] | none => []) ++
-    [("diagnostics", toJson s.diagnostics)]
+instance : ToJson WorkDoneProgressOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson PublishDiagnosticsParams where
+instance : FromJson WorkDoneProgressOptions where
   fromJson? json := do
-    let uri ← json.getObjValAs? String "uri"
-    let version := (json.getObjValAs? Int "version").toOption
-    let diagnostics := json.getObjVal? "diagnostics" |>.toOption |>.getD Json.null
-    return { uri, version, diagnostics }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    return { workDoneProgress }
 
-/-- Represents a reference to a command. Provides a title which will be used to represent a command in the UI and, optionally, an array of arguments which will be passed to the command handler function when invoked. -/
-structure Command where
-  title : String
-  tooltip : (Option String) := none
-  command : String
-  arguments : Json := Json.null
+/-- General text document registration options. -/
+structure TextDocumentRegistrationOptions where
+  documentSelector : (Option Json)
   deriving Inhabited
 
-instance : ToJson Command where
-  toJson s := Json.mkObj <|
-    [("title", toJson s.title)] ++
-    (match s.tooltip with | some v => [("tooltip", toJson v)] | none => []) ++
-    [("command", toJson s.command)] ++
-    [("arguments", toJson s.arguments)]
+instance : ToJson TextDocumentRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("documentSelector", toJson s.documentSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson Command where
+instance : FromJson TextDocumentRegistrationOptions where
   fromJson? json := do
-    let title ← json.getObjValAs? String "title"
-    let tooltip := (json.getObjValAs? String "tooltip").toOption
-    let command ← json.getObjValAs? String "command"
-    let arguments := json.getObjVal? "arguments" |>.toOption |>.getD Json.null
-    return { title, tooltip, command, arguments }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    return { documentSelector }
 
-/-- The result returned from the apply workspace edit request.  @since 3.17 renamed from ApplyWorkspaceEditResponse -/
-structure ApplyWorkspaceEditResult where
-  applied : Bool
-  failureReason : (Option String) := none
-  failedChange : (Option Nat) := none
+/-- Parameters for a {@link FoldingRangeRequest}. -/
+structure FoldingRangeParams where
+  workDoneToken : (Option ProgressToken) := none
+  partialResultToken : (Option ProgressToken) := none
+  textDocument : TextDocumentIdentifier
   deriving Inhabited
 
-instance : ToJson ApplyWorkspaceEditResult where
-  toJson s := Json.mkObj <|
-    [("applied", toJson s.applied)] ++
-    (match s.failureReason with | some v => [("failureReason", toJson v)] | none => []) ++
-    (match s.failedChange with | some v => [("failedChange", toJson v)] | none => [])
+instance : ToJson FoldingRangeParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("textDocument", toJson s.textDocument) :: kvs
+    let kvs := (match s.partialResultToken with | some v => ("partialResultToken", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson ApplyWorkspaceEditResult where
+instance : FromJson FoldingRangeParams where
   fromJson? json := do
-    let applied ← json.getObjValAs? Bool "applied"
-    let failureReason := (json.getObjValAs? String "failureReason").toOption
-    let failedChange := (json.getObjValAs? Nat "failedChange").toOption
-    return { applied, failureReason, failedChange }
+    let _obj ← json.getObj?
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let partialResultToken : Option ProgressToken := (_obj.find compare "partialResultToken").bind fun v => (fromJson? v).toOption
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    return { workDoneToken, partialResultToken, textDocument }
 
-structure WorkDoneProgressBegin where
-  kind : String
-  title : String
-  cancellable : (Option Bool) := none
-  message : (Option String) := none
-  percentage : (Option Nat) := none
+/-- Represents a folding range. To be valid, start and end line must be bigger than zero and smaller than the number of lines in the document. Clients are free to ignore invalid ranges. -/
+structure FoldingRange where
+  startLine : Nat
+  startCharacter : (Option Nat) := none
+  endLine : Nat
+  endCharacter : (Option Nat) := none
+  kind : (Option FoldingRangeKind) := none
+  collapsedText : (Option String) := none
   deriving Inhabited
 
-instance : ToJson WorkDoneProgressBegin where
-  toJson s := Json.mkObj <|
-    [("kind", toJson s.kind)] ++
-    [("title", toJson s.title)] ++
-    (match s.cancellable with | some v => [("cancellable", toJson v)] | none => []) ++
-    (match s.message with | some v => [("message", toJson v)] | none => []) ++
-    (match s.percentage with | some v => [("percentage", toJson v)] | none => [])
+instance : ToJson FoldingRange where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.collapsedText with | some v => ("collapsedText", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.kind with | some v => ("kind", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.endCharacter with | some v => ("endCharacter", toJson v) :: kvs | none => kvs)
+    let kvs := ("endLine", toJson s.endLine) :: kvs
+    let kvs := (match s.startCharacter with | some v => ("startCharacter", toJson v) :: kvs | none => kvs)
+    let kvs := ("startLine", toJson s.startLine) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson WorkDoneProgressBegin where
+instance : FromJson FoldingRange where
   fromJson? json := do
-    let kind ← json.getObjValAs? String "kind"
-    let title ← json.getObjValAs? String "title"
-    let cancellable := (json.getObjValAs? Bool "cancellable").toOption
-    let message := (json.getObjValAs? String "message").toOption
-    let percentage := (json.getObjValAs? Nat "percentage").toOption
-    return { kind, title, cancellable, message, percentage }
+    let _obj ← json.getObj?
+    let startLine : Nat ← match _obj.find compare "startLine" with | some v => fromJson? v | none => throw "property not found: startLine"
+    let startCharacter : Option Nat := (_obj.find compare "startCharacter").bind fun v => (fromJson? v).toOption
+    let endLine : Nat ← match _obj.find compare "endLine" with | some v => fromJson? v | none => throw "property not found: endLine"
+    let endCharacter : Option Nat := (_obj.find compare "endCharacter").bind fun v => (fromJson? v).toOption
+    let kind : Option FoldingRangeKind := (_obj.find compare "kind").bind fun v => (fromJson? v).toOption
+    let collapsedText : Option String := (_obj.find compare "collapsedText").bind fun v => (fromJson? v).toOption
+    return { startLine, startCharacter, endLine, endCharacter, kind, collapsedText }
 
-structure WorkDoneProgressReport where
-  kind : String
-  cancellable : (Option Bool) := none
-  message : (Option String) := none
-  percentage : (Option Nat) := none
+structure FoldingRangeRegistrationOptions where
+  documentSelector : (Option Json)
+  id : (Option String) := none
   deriving Inhabited
 
-instance : ToJson WorkDoneProgressReport where
-  toJson s := Json.mkObj <|
-    [("kind", toJson s.kind)] ++
-    (match s.cancellable with | some v => [("cancellable", toJson v)] | none => []) ++
-    (match s.message with | some v => [("message", toJson v)] | none => []) ++
-    (match s.percentage with | some v => [("percentage", toJson v)] | none => [])
+instance : ToJson FoldingRangeRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.id with | some v => ("id", toJson v) :: kvs | none => kvs)
+    let kvs := ("documentSelector", toJson s.documentSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson WorkDoneProgressReport where
+instance : FromJson FoldingRangeRegistrationOptions where
   fromJson? json := do
-    let kind ← json.getObjValAs? String "kind"
-    let cancellable := (json.getObjValAs? Bool "cancellable").toOption
-    let message := (json.getObjValAs? String "message").toOption
-    let percentage := (json.getObjValAs? Nat "percentage").toOption
-    return { kind, cancellable, message, percentage }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    let id : Option String := (_obj.find compare "id").bind fun v => (fromJson? v).toOption
+    return { documentSelector, id }
 
-structure WorkDoneProgressEnd where
-  kind : String
-  message : (Option String) := none
+structure DeclarationParams where
+  textDocument : TextDocumentIdentifier
+  position : Position
+  workDoneToken : (Option ProgressToken) := none
+  partialResultToken : (Option ProgressToken) := none
   deriving Inhabited
 
-instance : ToJson WorkDoneProgressEnd where
-  toJson s := Json.mkObj <|
-    [("kind", toJson s.kind)] ++
-    (match s.message with | some v => [("message", toJson v)] | none => [])
+instance : ToJson DeclarationParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.partialResultToken with | some v => ("partialResultToken", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    let kvs := ("textDocument", toJson s.textDocument) :: ("position", toJson s.position) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson WorkDoneProgressEnd where
+instance : FromJson DeclarationParams where
   fromJson? json := do
-    let kind ← json.getObjValAs? String "kind"
-    let message := (json.getObjValAs? String "message").toOption
-    return { kind, message }
+    let _obj ← json.getObj?
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let position : Position ← match _obj.find compare "position" with | some v => fromJson? v | none => throw "property not found: position"
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let partialResultToken : Option ProgressToken := (_obj.find compare "partialResultToken").bind fun v => (fromJson? v).toOption
+    return { textDocument, position, workDoneToken, partialResultToken }
 
-structure SetTraceParams where
-  value : TraceValue
+structure DeclarationRegistrationOptions where
+  documentSelector : (Option Json)
+  id : (Option String) := none
   deriving Inhabited
 
-instance : ToJson SetTraceParams where
-  toJson s := Json.mkObj <|
-    [("value", toJson s.value)]
+instance : ToJson DeclarationRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.id with | some v => ("id", toJson v) :: kvs | none => kvs)
+    let kvs := ("documentSelector", toJson s.documentSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson SetTraceParams where
+instance : FromJson DeclarationRegistrationOptions where
   fromJson? json := do
-    let value ← json.getObjValAs? TraceValue "value"
-    return { value }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    let id : Option String := (_obj.find compare "id").bind fun v => (fromJson? v).toOption
+    return { documentSelector, id }
 
-structure LogTraceParams where
-  message : String
-  verbose : (Option String) := none
+/-- A parameter literal used in selection range requests. -/
+structure SelectionRangeParams where
+  workDoneToken : (Option ProgressToken) := none
+  partialResultToken : (Option ProgressToken) := none
+  textDocument : TextDocumentIdentifier
+  positions : (Array Position)
   deriving Inhabited
 
-instance : ToJson LogTraceParams where
-  toJson s := Json.mkObj <|
-    [("message", toJson s.message)] ++
-    (match s.verbose with | some v => [("verbose", toJson v)] | none => [])
+instance : ToJson SelectionRangeParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("textDocument", toJson s.textDocument) :: ("positions", toJson s.positions) :: kvs
+    let kvs := (match s.partialResultToken with | some v => ("partialResultToken", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson LogTraceParams where
+instance : FromJson SelectionRangeParams where
   fromJson? json := do
-    let message ← json.getObjValAs? String "message"
-    let verbose := (json.getObjValAs? String "verbose").toOption
-    return { message, verbose }
+    let _obj ← json.getObj?
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let partialResultToken : Option ProgressToken := (_obj.find compare "partialResultToken").bind fun v => (fromJson? v).toOption
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let positions : (Array Position) ← match _obj.find compare "positions" with | some v => fromJson? v | none => throw "property not found: positions"
+    return { workDoneToken, partialResultToken, textDocument, positions }
 
-structure CancelParams where
-  id : Json
+/-- A selection range represents a part of a selection hierarchy. A selection range may have a parent selection range that contains it. -/
+structure SelectionRange where
+  range : Range
+  parent : (Option SelectionRange) := none
   deriving Inhabited
 
-instance : ToJson CancelParams where
-  toJson s := Json.mkObj <|
-    [("id", toJson s.id)]
-
-instance : FromJson CancelParams where
-  fromJson? json := do
-    let id := json.getObjVal? "id" |>.toOption |>.getD Json.null
-    return { id }
+partial def SelectionRange.toJsonImpl (s : SelectionRange) : Json :=
+  letI : ToJson SelectionRange := ⟨SelectionRange.toJsonImpl⟩
+  let kvs : List (String × Json) := []
+  let kvs := (match s.parent with | some v => ("parent", toJson v) :: kvs | none => kvs)
+  let kvs := ("range", toJson s.range) :: kvs
+  Json.mkObj kvs
 
-structure ProgressParams where
-  token : ProgressToken
-  value : Json
-  deriving Inhabited
+instance : ToJson SelectionRange := ⟨SelectionRange.toJsonImpl⟩
 
-instance : ToJson ProgressParams where
-  toJson s := Json.mkObj <|
-    [("token", toJson s.token)] ++
-    [("value", toJson s.value)]
+partial def SelectionRange.fromJsonImpl (json : Json) : Except String SelectionRange :=
+  letI : FromJson SelectionRange := ⟨SelectionRange.fromJsonImpl⟩
+  do
+    let _obj ← json.getObj?
+    let range : Range ← match _obj.find compare "range" with | some v => fromJson? v | none => throw "property not found: range"
+    let parent : Option SelectionRange := (_obj.find compare "parent").bind fun v => (fromJson? v).toOption
+    return { range, parent }
 
-instance : FromJson ProgressParams where
-  fromJson? json := do
-    let token ← json.getObjValAs? ProgressToken "token"
-    let value := json.getObjVal? "value" |>.toOption |>.getD Json.null
-    return { token, value }
+instance : FromJson SelectionRange := ⟨SelectionRange.fromJsonImpl⟩
 
-structure WorkDoneProgressParams where
-  workDoneToken : (Option ProgressToken) := none
+structure SelectionRangeRegistrationOptions where
+  documentSelector : (Option Json)
+  id : (Option String) := none
   deriving Inhabited
 
-instance : ToJson WorkDoneProgressParams where
-  toJson s := Json.mkObj <|
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => [])
+instance : ToJson SelectionRangeRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.id with | some v => ("id", toJson v) :: kvs | none => kvs)
+    let kvs := ("documentSelector", toJson s.documentSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson WorkDoneProgressParams where
+instance : FromJson SelectionRangeRegistrationOptions where
   fromJson? json := do
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    return { workDoneToken }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    let id : Option String := (_obj.find compare "id").bind fun v => (fromJson? v).toOption
+    return { documentSelector, id }
 
-structure PartialResultParams where
-  partialResultToken : (Option ProgressToken) := none
+structure WorkDoneProgressCreateParams where
+  token : ProgressToken
   deriving Inhabited
 
-instance : ToJson PartialResultParams where
-  toJson s := Json.mkObj <|
-    (match s.partialResultToken with | some v => [("partialResultToken", toJson v)] | none => [])
+instance : ToJson WorkDoneProgressCreateParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("token", toJson s.token) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson PartialResultParams where
+instance : FromJson WorkDoneProgressCreateParams where
   fromJson? json := do
-    let partialResultToken := (json.getObjValAs? ProgressToken "partialResultToken").toOption
-    return { partialResultToken }
+    let _obj ← json.getObj?
+    let token : ProgressToken ← match _obj.find compare "token" with | some v => fromJson? v | none => throw "property not found: token"
+    return { token }
 
-/-- Static registration options to be returned in the initialize request. -/
-structure StaticRegistrationOptions where
-  id : (Option String) := none
+structure WorkDoneProgressCancelParams where
+  token : ProgressToken
   deriving Inhabited
 
-instance : ToJson StaticRegistrationOptions where
-  toJson s := Json.mkObj <|
-    (match s.id with | some v => [("id", toJson v)] | none => [])
+instance : ToJson WorkDoneProgressCancelParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("token", toJson s.token) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson StaticRegistrationOptions where
+instance : FromJson WorkDoneProgressCancelParams where
   fromJson? json := do
-    let id := (json.getObjValAs? String "id").toOption
-    return { id }
+    let _obj ← json.getObj?
+    let token : ProgressToken ← match _obj.find compare "token" with | some v => fromJson? v | none => throw "property not found: token"
+    return { token }
 
-structure ConfigurationItem where
-  scopeUri : (Option String) := none
-  «section» : (Option String) := none
+/-- The parameter of a `textDocument/prepareCallHierarchy` request.  @since 3.16.0 -/
+structure CallHierarchyPrepareParams where
+  textDocument : TextDocumentIdentifier
+  position : Position
+  workDoneToken : (Option ProgressToken) := none
   deriving Inhabited
 
-instance : ToJson ConfigurationItem where
-  toJson s := Json.mkObj <|
-    (match s.scopeUri with | some v => [("scopeUri", toJson v)] | none => []) ++
-    (match s.«section» with | some v => [("section", toJson v)] | none => [])
+instance : ToJson CallHierarchyPrepareParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    let kvs := ("textDocument", toJson s.textDocument) :: ("position", toJson s.position) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ConfigurationItem where
+instance : FromJson CallHierarchyPrepareParams where
   fromJson? json := do
-    let scopeUri := (json.getObjValAs? String "scopeUri").toOption
-    let «section» := (json.getObjValAs? String "section").toOption
-    return { scopeUri, «section» }
+    let _obj ← json.getObj?
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let position : Position ← match _obj.find compare "position" with | some v => fromJson? v | none => throw "property not found: position"
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    return { textDocument, position, workDoneToken }
 
-/-- A literal to identify a text document in the client. -/
-structure TextDocumentIdentifier where
+/-- Represents programming constructs like functions or constructors in the context of call hierarchy.  @since 3.16.0 -/
+structure CallHierarchyItem where
+  name : String
+  kind : SymbolKind
+  tags : (Option (Array SymbolTag)) := none
+  detail : (Option String) := none
   uri : String
+  range : Range
+  selectionRange : Range
+  data : Json := Json.null
   deriving Inhabited
 
-instance : ToJson TextDocumentIdentifier where
-  toJson s := Json.mkObj <|
-    [("uri", toJson s.uri)]
+instance : ToJson CallHierarchyItem where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("uri", toJson s.uri) :: ("range", toJson s.range) :: ("selectionRange", toJson s.selectionRange) :: ("data", toJson s.data) :: kvs
+    let kvs := (match s.detail with | some v => ("detail", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.tags with | some v => ("tags", toJson v) :: kvs | none => kvs)
+    let kvs := ("name", toJson s.name) :: ("kind", toJson s.kind) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson TextDocumentIdentifier where
+instance : FromJson CallHierarchyItem where
   fromJson? json := do
-    let uri ← json.getObjValAs? String "uri"
-    return { uri }
+    let _obj ← json.getObj?
+    let name : String ← match _obj.find compare "name" with | some v => fromJson? v | none => throw "property not found: name"
+    let kind : SymbolKind ← match _obj.find compare "kind" with | some v => fromJson? v | none => throw "property not found: kind"
+    let tags : Option (Array SymbolTag) := (_obj.find compare "tags").bind fun v => (fromJson? v).toOption
+    let detail : Option String := (_obj.find compare "detail").bind fun v => (fromJson? v).toOption
+    let uri : String ← match _obj.find compare "uri" with | some v => fromJson? v | none => throw "property not found: uri"
+    let range : Range ← match _obj.find compare "range" with | some v => fromJson? v | none => throw "property not found: range"
+    let selectionRange : Range ← match _obj.find compare "selectionRange" with | some v => fromJson? v | none => throw "property not found: selectionRange"
+    let data : Json := (_obj.find compare "data").getD Json.null
+    return { name, kind, tags, detail, uri, range, selectionRange, data }
 
-/-- Represents a color in RGBA space. -/
-structure Color where
-  red : Float
-  green : Float
-  blue : Float
-  alpha : Float
+/-- Call hierarchy options used during static or dynamic registration.  @since 3.16.0 -/
+structure CallHierarchyRegistrationOptions where
+  documentSelector : (Option Json)
+  id : (Option String) := none
   deriving Inhabited
 
-instance : ToJson Color where
-  toJson s := Json.mkObj <|
-    [("red", toJson s.red)] ++
-    [("green", toJson s.green)] ++
-    [("blue", toJson s.blue)] ++
-    [("alpha", toJson s.alpha)]
+instance : ToJson CallHierarchyRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.id with | some v => ("id", toJson v) :: kvs | none => kvs)
+    let kvs := ("documentSelector", toJson s.documentSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson Color where
+instance : FromJson CallHierarchyRegistrationOptions where
   fromJson? json := do
-    let red ← json.getObjValAs? Float "red"
-    let green ← json.getObjValAs? Float "green"
-    let blue ← json.getObjValAs? Float "blue"
-    let alpha ← json.getObjValAs? Float "alpha"
-    return { red, green, blue, alpha }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    let id : Option String := (_obj.find compare "id").bind fun v => (fromJson? v).toOption
+    return { documentSelector, id }
 
-/-- Position in a text document expressed as zero-based line and character offset. Prior to 3.17 the offsets were always based on a UTF-16 string representation. So a string of the form `a𐐀b` the character offset of the character `a` is 0, the character offset of `𐐀` is 1 and the character offset of b i... -/
-structure Position where
-  line : Nat
-  character : Nat
+/-- The parameter of a `callHierarchy/incomingCalls` request.  @since 3.16.0 -/
+structure CallHierarchyIncomingCallsParams where
+  workDoneToken : (Option ProgressToken) := none
+  partialResultToken : (Option ProgressToken) := none
+  item : CallHierarchyItem
   deriving Inhabited
 
-instance : ToJson Position where
-  toJson s := Json.mkObj <|
-    [("line", toJson s.line)] ++
-    [("character", toJson s.character)]
+instance : ToJson CallHierarchyIncomingCallsParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("item", toJson s.item) :: kvs
+    let kvs := (match s.partialResultToken with | some v => ("partialResultToken", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson Position where
+instance : FromJson CallHierarchyIncomingCallsParams where
   fromJson? json := do
-    let line ← json.getObjValAs? Nat "line"
-    let character ← json.getObjValAs? Nat "character"
-    return { line, character }
+    let _obj ← json.getObj?
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let partialResultToken : Option ProgressToken := (_obj.find compare "partialResultToken").bind fun v => (fromJson? v).toOption
+    let item : CallHierarchyItem ← match _obj.find compare "item" with | some v => fromJson? v | none => throw "property not found: item"
+    return { workDoneToken, partialResultToken, item }
 
-/-- @since 3.16.0 -/
-structure SemanticTokensEdit where
-  start : Nat
-  deleteCount : Nat
-  data : (Option (Array Nat)) := none
+/-- Represents an incoming call, e.g. a caller of a method or constructor.  @since 3.16.0 -/
+structure CallHierarchyIncomingCall where
+  «from» : CallHierarchyItem
+  fromRanges : (Array Range)
   deriving Inhabited
 
-instance : ToJson SemanticTokensEdit where
-  toJson s := Json.mkObj <|
-    [("start", toJson s.start)] ++
-    [("deleteCount", toJson s.deleteCount)] ++
-    (match s.data with | some v => [("data", toJson v)] | none => [])
+instance : ToJson CallHierarchyIncomingCall where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("from", toJson s.«from») :: ("fromRanges", toJson s.fromRanges) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson SemanticTokensEdit where
+instance : FromJson CallHierarchyIncomingCall where
   fromJson? json := do
-    let start ← json.getObjValAs? Nat "start"
-    let deleteCount ← json.getObjValAs? Nat "deleteCount"
-    let data := (json.getObjValAs? (Array Nat) "data").toOption
-    return { start, deleteCount, data }
+    let _obj ← json.getObj?
+    let «from» : CallHierarchyItem ← match _obj.find compare "from" with | some v => fromJson? v | none => throw "property not found: from"
+    let fromRanges : (Array Range) ← match _obj.find compare "fromRanges" with | some v => fromJson? v | none => throw "property not found: fromRanges"
+    return { «from», fromRanges }
 
-/-- Represents information on a file/folder create.  @since 3.16.0 -/
-structure FileCreate where
-  uri : String
+/-- The parameter of a `callHierarchy/outgoingCalls` request.  @since 3.16.0 -/
+structure CallHierarchyOutgoingCallsParams where
+  workDoneToken : (Option ProgressToken) := none
+  partialResultToken : (Option ProgressToken) := none
+  item : CallHierarchyItem
   deriving Inhabited
 
-instance : ToJson FileCreate where
-  toJson s := Json.mkObj <|
-    [("uri", toJson s.uri)]
+instance : ToJson CallHierarchyOutgoingCallsParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("item", toJson s.item) :: kvs
+    let kvs := (match s.partialResultToken with | some v => ("partialResultToken", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson FileCreate where
+instance : FromJson CallHierarchyOutgoingCallsParams where
   fromJson? json := do
-    let uri ← json.getObjValAs? String "uri"
-    return { uri }
+    let _obj ← json.getObj?
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let partialResultToken : Option ProgressToken := (_obj.find compare "partialResultToken").bind fun v => (fromJson? v).toOption
+    let item : CallHierarchyItem ← match _obj.find compare "item" with | some v => fromJson? v | none => throw "property not found: item"
+    return { workDoneToken, partialResultToken, item }
 
-/-- Additional information that describes document changes.  @since 3.16.0 -/
-structure ChangeAnnotation where
-  label : String
-  needsConfirmation : (Option Bool) := none
-  description : (Option String) := none
+/-- Represents an outgoing call, e.g. calling a getter from a method or a method from a constructor etc.  @since 3.16.0 -/
+structure CallHierarchyOutgoingCall where
+  to : CallHierarchyItem
+  fromRanges : (Array Range)
   deriving Inhabited
 
-instance : ToJson ChangeAnnotation where
-  toJson s := Json.mkObj <|
-    [("label", toJson s.label)] ++
-    (match s.needsConfirmation with | some v => [("needsConfirmation", toJson v)] | none => []) ++
-    (match s.description with | some v => [("description", toJson v)] | none => [])
+instance : ToJson CallHierarchyOutgoingCall where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("to", toJson s.to) :: ("fromRanges", toJson s.fromRanges) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ChangeAnnotation where
+instance : FromJson CallHierarchyOutgoingCall where
   fromJson? json := do
-    let label ← json.getObjValAs? String "label"
-    let needsConfirmation := (json.getObjValAs? Bool "needsConfirmation").toOption
-    let description := (json.getObjValAs? String "description").toOption
-    return { label, needsConfirmation, description }
+    let _obj ← json.getObj?
+    let to : CallHierarchyItem ← match _obj.find compare "to" with | some v => fromJson? v | none => throw "property not found: to"
+    let fromRanges : (Array Range) ← match _obj.find compare "fromRanges" with | some v => fromJson? v | none => throw "property not found: fromRanges"
+    return { to, fromRanges }
 
-/-- A filter to describe in which file operation requests or notifications the server is interested in receiving.  @since 3.16.0 -/
-structure FileOperationFilter where
-  scheme : (Option String) := none
-  pattern : Json
+/-- @since 3.16.0 -/
+structure SemanticTokensParams where
+  workDoneToken : (Option ProgressToken) := none
+  partialResultToken : (Option ProgressToken) := none
+  textDocument : TextDocumentIdentifier
   deriving Inhabited
 
-instance : ToJson FileOperationFilter where
-  toJson s := Json.mkObj <|
-    (match s.scheme with | some v => [("scheme", toJson v)] | none => []) ++
-    [("pattern", toJson s.pattern)]
+instance : ToJson SemanticTokensParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("textDocument", toJson s.textDocument) :: kvs
+    let kvs := (match s.partialResultToken with | some v => ("partialResultToken", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson FileOperationFilter where
+instance : FromJson SemanticTokensParams where
   fromJson? json := do
-    let scheme := (json.getObjValAs? String "scheme").toOption
-    let pattern := json.getObjVal? "pattern" |>.toOption |>.getD Json.null
-    return { scheme, pattern }
+    let _obj ← json.getObj?
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let partialResultToken : Option ProgressToken := (_obj.find compare "partialResultToken").bind fun v => (fromJson? v).toOption
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    return { workDoneToken, partialResultToken, textDocument }
 
-/-- Represents information on a file/folder rename.  @since 3.16.0 -/
-structure FileRename where
-  oldUri : String
-  newUri : String
+/-- @since 3.16.0 -/
+structure SemanticTokens where
+  resultId : (Option String) := none
+  data : (Array Nat)
   deriving Inhabited
 
-instance : ToJson FileRename where
-  toJson s := Json.mkObj <|
-    [("oldUri", toJson s.oldUri)] ++
-    [("newUri", toJson s.newUri)]
+instance : ToJson SemanticTokens where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("data", toJson s.data) :: kvs
+    let kvs := (match s.resultId with | some v => ("resultId", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson FileRename where
+instance : FromJson SemanticTokens where
   fromJson? json := do
-    let oldUri ← json.getObjValAs? String "oldUri"
-    let newUri ← json.getObjValAs? String "newUri"
-    return { oldUri, newUri }
+    let _obj ← json.getObj?
+    let resultId : Option String := (_obj.find compare "resultId").bind fun v => (fromJson? v).toOption
+    let data : (Array Nat) ← match _obj.find compare "data" with | some v => fromJson? v | none => throw "property not found: data"
+    return { resultId, data }
 
-/-- Represents information on a file/folder delete.  @since 3.16.0 -/
-structure FileDelete where
-  uri : String
+/-- @since 3.16.0 -/
+structure SemanticTokensPartialResult where
+  data : (Array Nat)
   deriving Inhabited
 
-instance : ToJson FileDelete where
-  toJson s := Json.mkObj <|
-    [("uri", toJson s.uri)]
+instance : ToJson SemanticTokensPartialResult where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("data", toJson s.data) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson FileDelete where
+instance : FromJson SemanticTokensPartialResult where
   fromJson? json := do
-    let uri ← json.getObjValAs? String "uri"
-    return { uri }
+    let _obj ← json.getObj?
+    let data : (Array Nat) ← match _obj.find compare "data" with | some v => fromJson? v | none => throw "property not found: data"
+    return { data }
 
-/-- A `MarkupContent` literal represents a string value which content is interpreted base on its kind flag. Currently the protocol supports `plaintext` and `markdown` as markup kinds.  If the kind is `markdown` then the value can contain fenced code blocks like in GitHub issues. See https://help.github.... -/
-structure MarkupContent where
-  kind : MarkupKind
-  value : String
+/-- @since 3.16.0 -/
+structure SemanticTokensLegend where
+  tokenTypes : (Array String)
+  tokenModifiers : (Array String)
   deriving Inhabited
 
-instance : ToJson MarkupContent where
-  toJson s := Json.mkObj <|
-    [("kind", toJson s.kind)] ++
-    [("value", toJson s.value)]
+instance : ToJson SemanticTokensLegend where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("tokenTypes", toJson s.tokenTypes) :: ("tokenModifiers", toJson s.tokenModifiers) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson MarkupContent where
+instance : FromJson SemanticTokensLegend where
   fromJson? json := do
-    let kind ← json.getObjValAs? MarkupKind "kind"
-    let value ← json.getObjValAs? String "value"
-    return { kind, value }
+    let _obj ← json.getObj?
+    let tokenTypes : (Array String) ← match _obj.find compare "tokenTypes" with | some v => fromJson? v | none => throw "property not found: tokenTypes"
+    let tokenModifiers : (Array String) ← match _obj.find compare "tokenModifiers" with | some v => fromJson? v | none => throw "property not found: tokenModifiers"
+    return { tokenTypes, tokenModifiers }
 
-/-- A diagnostic report with a full set of problems.  @since 3.17.0 -/
-structure FullDocumentDiagnosticReport where
-  kind : String
-  resultId : (Option String) := none
-  items : Json
+/-- @since 3.16.0 -/
+structure SemanticTokensRegistrationOptions where
+  documentSelector : (Option Json)
+  legend : SemanticTokensLegend
+  range : Json := Json.null
+  full : Json := Json.null
+  id : (Option String) := none
   deriving Inhabited
 
-instance : ToJson FullDocumentDiagnosticReport where
-  toJson s := Json.mkObj <|
-    [("kind", toJson s.kind)] ++
-    (match s.resultId with | some v => [("resultId", toJson v)] | none => []) ++
-    [("items", toJson s.items)]
+instance : ToJson SemanticTokensRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.id with | some v => ("id", toJson v) :: kvs | none => kvs)
+    let kvs := ("documentSelector", toJson s.documentSelector) :: ("legend", toJson s.legend) :: ("range", toJson s.range) :: ("full", toJson s.full) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson FullDocumentDiagnosticReport where
+instance : FromJson SemanticTokensRegistrationOptions where
   fromJson? json := do
-    let kind ← json.getObjValAs? String "kind"
-    let resultId := (json.getObjValAs? String "resultId").toOption
-    let items := json.getObjVal? "items" |>.toOption |>.getD Json.null
-    return { kind, resultId, items }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    let legend : SemanticTokensLegend ← match _obj.find compare "legend" with | some v => fromJson? v | none => throw "property not found: legend"
+    let range : Json := (_obj.find compare "range").getD Json.null
+    let full : Json := (_obj.find compare "full").getD Json.null
+    let id : Option String := (_obj.find compare "id").bind fun v => (fromJson? v).toOption
+    return { documentSelector, legend, range, full, id }
 
-/-- A diagnostic report indicating that the last returned report is still accurate.  @since 3.17.0 -/
-structure UnchangedDocumentDiagnosticReport where
-  kind : String
-  resultId : String
+/-- @since 3.16.0 -/
+structure SemanticTokensDeltaParams where
+  workDoneToken : (Option ProgressToken) := none
+  partialResultToken : (Option ProgressToken) := none
+  textDocument : TextDocumentIdentifier
+  previousResultId : String
   deriving Inhabited
 
-instance : ToJson UnchangedDocumentDiagnosticReport where
-  toJson s := Json.mkObj <|
-    [("kind", toJson s.kind)] ++
-    [("resultId", toJson s.resultId)]
+instance : ToJson SemanticTokensDeltaParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("textDocument", toJson s.textDocument) :: ("previousResultId", toJson s.previousResultId) :: kvs
+    let kvs := (match s.partialResultToken with | some v => ("partialResultToken", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson UnchangedDocumentDiagnosticReport where
+instance : FromJson SemanticTokensDeltaParams where
   fromJson? json := do
-    let kind ← json.getObjValAs? String "kind"
-    let resultId ← json.getObjValAs? String "resultId"
-    return { kind, resultId }
+    let _obj ← json.getObj?
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let partialResultToken : Option ProgressToken := (_obj.find compare "partialResultToken").bind fun v => (fromJson? v).toOption
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let previousResultId : String ← match _obj.find compare "previousResultId" with | some v => fromJson? v | none => throw "property not found: previousResultId"
+    return { workDoneToken, partialResultToken, textDocument, previousResultId }
 
-/-- A previous result id in a workspace pull request.  @since 3.17.0 -/
-structure PreviousResultId where
-  uri : String
-  value : String
+/-- @since 3.16.0 -/
+structure SemanticTokensEdit where
+  start : Nat
+  deleteCount : Nat
+  data : (Option (Array Nat)) := none
   deriving Inhabited
 
-instance : ToJson PreviousResultId where
-  toJson s := Json.mkObj <|
-    [("uri", toJson s.uri)] ++
-    [("value", toJson s.value)]
+instance : ToJson SemanticTokensEdit where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.data with | some v => ("data", toJson v) :: kvs | none => kvs)
+    let kvs := ("start", toJson s.start) :: ("deleteCount", toJson s.deleteCount) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson PreviousResultId where
+instance : FromJson SemanticTokensEdit where
   fromJson? json := do
-    let uri ← json.getObjValAs? String "uri"
-    let value ← json.getObjValAs? String "value"
-    return { uri, value }
+    let _obj ← json.getObj?
+    let start : Nat ← match _obj.find compare "start" with | some v => fromJson? v | none => throw "property not found: start"
+    let deleteCount : Nat ← match _obj.find compare "deleteCount" with | some v => fromJson? v | none => throw "property not found: deleteCount"
+    let data : Option (Array Nat) := (_obj.find compare "data").bind fun v => (fromJson? v).toOption
+    return { start, deleteCount, data }
 
-/-- A notebook document.  @since 3.17.0 -/
-structure NotebookDocument where
-  uri : String
-  notebookType : String
-  version : Int
-  metadata : Json := Json.null
-  cells : Json
+/-- @since 3.16.0 -/
+structure SemanticTokensDelta where
+  resultId : (Option String) := none
+  edits : (Array SemanticTokensEdit)
   deriving Inhabited
 
-instance : ToJson NotebookDocument where
-  toJson s := Json.mkObj <|
-    [("uri", toJson s.uri)] ++
-    [("notebookType", toJson s.notebookType)] ++
-    [("version", toJson s.version)] ++
-    [("metadata", toJson s.metadata)] ++
-    [("cells", toJson s.cells)]
+instance : ToJson SemanticTokensDelta where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("edits", toJson s.edits) :: kvs
+    let kvs := (match s.resultId with | some v => ("resultId", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson NotebookDocument where
+instance : FromJson SemanticTokensDelta where
   fromJson? json := do
-    let uri ← json.getObjValAs? String "uri"
-    let notebookType ← json.getObjValAs? String "notebookType"
-    let version ← json.getObjValAs? Int "version"
-    let metadata := json.getObjVal? "metadata" |>.toOption |>.getD Json.null
-    let cells := json.getObjVal? "cells" |>.toOption |>.getD Json.null
-    return { uri, notebookType, version, metadata, cells }
+    let _obj ← json.getObj?
+    let resultId : Option String := (_obj.find compare "resultId").bind fun v => (fromJson? v).toOption
+    let edits : (Array SemanticTokensEdit) ← match _obj.find compare "edits" with | some v => fromJson? v | none => throw "property not found: edits"
+    return { resultId, edits }
 
-/-- An item to transfer a text document from the client to the server. -/
-structure TextDocumentItem where
-  uri : String
-  languageId : LanguageKind
-  version : Int
-  text : String
+/-- @since 3.16.0 -/
+structure SemanticTokensDeltaPartialResult where
+  edits : (Array SemanticTokensEdit)
   deriving Inhabited
 
-instance : ToJson TextDocumentItem where
-  toJson s := Json.mkObj <|
-    [("uri", toJson s.uri)] ++
-    [("languageId", toJson s.languageId)] ++
-    [("version", toJson s.version)] ++
-    [("text", toJson s.text)]
+instance : ToJson SemanticTokensDeltaPartialResult where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("edits", toJson s.edits) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson TextDocumentItem where
+instance : FromJson SemanticTokensDeltaPartialResult where
   fromJson? json := do
-    let uri ← json.getObjValAs? String "uri"
-    let languageId ← json.getObjValAs? LanguageKind "languageId"
-    let version ← json.getObjValAs? Int "version"
-    let text ← json.getObjValAs? String "text"
-    return { uri, languageId, version, text }
+    let _obj ← json.getObj?
+    let edits : (Array SemanticTokensEdit) ← match _obj.find compare "edits" with | some v => fromJson? v | none => throw "property not found: edits"
+    return { edits }
 
-/-- A versioned notebook document identifier.  @since 3.17.0 -/
-structure VersionedNotebookDocumentIdentifier where
-  version : Int
-  uri : String
+/-- @since 3.16.0 -/
+structure SemanticTokensRangeParams where
+  workDoneToken : (Option ProgressToken) := none
+  partialResultToken : (Option ProgressToken) := none
+  textDocument : TextDocumentIdentifier
+  range : Range
   deriving Inhabited
 
-instance : ToJson VersionedNotebookDocumentIdentifier where
-  toJson s := Json.mkObj <|
-    [("version", toJson s.version)] ++
-    [("uri", toJson s.uri)]
+instance : ToJson SemanticTokensRangeParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("textDocument", toJson s.textDocument) :: ("range", toJson s.range) :: kvs
+    let kvs := (match s.partialResultToken with | some v => ("partialResultToken", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson VersionedNotebookDocumentIdentifier where
+instance : FromJson SemanticTokensRangeParams where
   fromJson? json := do
-    let version ← json.getObjValAs? Int "version"
-    let uri ← json.getObjValAs? String "uri"
-    return { version, uri }
+    let _obj ← json.getObj?
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let partialResultToken : Option ProgressToken := (_obj.find compare "partialResultToken").bind fun v => (fromJson? v).toOption
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let range : Range ← match _obj.find compare "range" with | some v => fromJson? v | none => throw "property not found: range"
+    return { workDoneToken, partialResultToken, textDocument, range }
 
-/-- A literal to identify a notebook document in the client.  @since 3.17.0 -/
-structure NotebookDocumentIdentifier where
+/-- Params to show a resource in the UI.  @since 3.16.0 -/
+structure ShowDocumentParams where
   uri : String
+  external : (Option Bool) := none
+  takeFocus : (Option Bool) := none
+  selection : (Option Range) := none
   deriving Inhabited
 
-instance : ToJson NotebookDocumentIdentifier where
-  toJson s := Json.mkObj <|
-    [("uri", toJson s.uri)]
+instance : ToJson ShowDocumentParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.selection with | some v => ("selection", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.takeFocus with | some v => ("takeFocus", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.external with | some v => ("external", toJson v) :: kvs | none => kvs)
+    let kvs := ("uri", toJson s.uri) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson NotebookDocumentIdentifier where
+instance : FromJson ShowDocumentParams where
   fromJson? json := do
-    let uri ← json.getObjValAs? String "uri"
-    return { uri }
+    let _obj ← json.getObj?
+    let uri : String ← match _obj.find compare "uri" with | some v => fromJson? v | none => throw "property not found: uri"
+    let external : Option Bool := (_obj.find compare "external").bind fun v => (fromJson? v).toOption
+    let takeFocus : Option Bool := (_obj.find compare "takeFocus").bind fun v => (fromJson? v).toOption
+    let selection : Option Range := (_obj.find compare "selection").bind fun v => (fromJson? v).toOption
+    return { uri, external, takeFocus, selection }
 
-/-- General parameters to register for a notification or to register a provider. -/
-structure Registration where
-  id : String
-  method : String
-  registerOptions : Json := Json.null
+/-- The result of a showDocument request.  @since 3.16.0 -/
+structure ShowDocumentResult where
+  success : Bool
   deriving Inhabited
 
-instance : ToJson Registration where
-  toJson s := Json.mkObj <|
-    [("id", toJson s.id)] ++
-    [("method", toJson s.method)] ++
-    [("registerOptions", toJson s.registerOptions)]
+instance : ToJson ShowDocumentResult where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("success", toJson s.success) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson Registration where
+instance : FromJson ShowDocumentResult where
   fromJson? json := do
-    let id ← json.getObjValAs? String "id"
-    let method ← json.getObjValAs? String "method"
-    let registerOptions := json.getObjVal? "registerOptions" |>.toOption |>.getD Json.null
-    return { id, method, registerOptions }
+    let _obj ← json.getObj?
+    let success : Bool ← match _obj.find compare "success" with | some v => fromJson? v | none => throw "property not found: success"
+    return { success }
 
-/-- General parameters to unregister a request or notification. -/
-structure Unregistration where
-  id : String
-  method : String
+structure LinkedEditingRangeParams where
+  textDocument : TextDocumentIdentifier
+  position : Position
+  workDoneToken : (Option ProgressToken) := none
   deriving Inhabited
 
-instance : ToJson Unregistration where
-  toJson s := Json.mkObj <|
-    [("id", toJson s.id)] ++
-    [("method", toJson s.method)]
+instance : ToJson LinkedEditingRangeParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    let kvs := ("textDocument", toJson s.textDocument) :: ("position", toJson s.position) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson Unregistration where
+instance : FromJson LinkedEditingRangeParams where
   fromJson? json := do
-    let id ← json.getObjValAs? String "id"
-    let method ← json.getObjValAs? String "method"
-    return { id, method }
+    let _obj ← json.getObj?
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let position : Position ← match _obj.find compare "position" with | some v => fromJson? v | none => throw "property not found: position"
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    return { textDocument, position, workDoneToken }
 
-/-- Information about the server  @since 3.15.0 @since 3.18.0 ServerInfo type name added. -/
-structure ServerInfo where
-  name : String
-  version : (Option String) := none
+/-- The result of a linked editing range request.  @since 3.16.0 -/
+structure LinkedEditingRanges where
+  ranges : (Array Range)
+  wordPattern : (Option String) := none
   deriving Inhabited
 
-instance : ToJson ServerInfo where
-  toJson s := Json.mkObj <|
-    [("name", toJson s.name)] ++
-    (match s.version with | some v => [("version", toJson v)] | none => [])
+instance : ToJson LinkedEditingRanges where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.wordPattern with | some v => ("wordPattern", toJson v) :: kvs | none => kvs)
+    let kvs := ("ranges", toJson s.ranges) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ServerInfo where
+instance : FromJson LinkedEditingRanges where
   fromJson? json := do
-    let name ← json.getObjValAs? String "name"
-    let version := (json.getObjValAs? String "version").toOption
-    return { name, version }
+    let _obj ← json.getObj?
+    let ranges : (Array Range) ← match _obj.find compare "ranges" with | some v => fromJson? v | none => throw "property not found: ranges"
+    let wordPattern : Option String := (_obj.find compare "wordPattern").bind fun v => (fromJson? v).toOption
+    return { ranges, wordPattern }
 
-/-- Save options. -/
-structure SaveOptions where
-  includeText : (Option Bool) := none
+structure LinkedEditingRangeRegistrationOptions where
+  documentSelector : (Option Json)
+  id : (Option String) := none
   deriving Inhabited
 
-instance : ToJson SaveOptions where
-  toJson s := Json.mkObj <|
-    (match s.includeText with | some v => [("includeText", toJson v)] | none => [])
+instance : ToJson LinkedEditingRangeRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.id with | some v => ("id", toJson v) :: kvs | none => kvs)
+    let kvs := ("documentSelector", toJson s.documentSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson SaveOptions where
+instance : FromJson LinkedEditingRangeRegistrationOptions where
   fromJson? json := do
-    let includeText := (json.getObjValAs? Bool "includeText").toOption
-    return { includeText }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    let id : Option String := (_obj.find compare "id").bind fun v => (fromJson? v).toOption
+    return { documentSelector, id }
 
-/-- An event describing a file change. -/
-structure FileEvent where
+/-- Represents information on a file/folder create.  @since 3.16.0 -/
+structure FileCreate where
   uri : String
-  «type» : FileChangeType
   deriving Inhabited
 
-instance : ToJson FileEvent where
-  toJson s := Json.mkObj <|
-    [("uri", toJson s.uri)] ++
-    [("type", toJson s.«type»)]
+instance : ToJson FileCreate where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("uri", toJson s.uri) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson FileEvent where
+instance : FromJson FileCreate where
   fromJson? json := do
-    let uri ← json.getObjValAs? String "uri"
-    let «type» ← json.getObjValAs? FileChangeType "type"
-    return { uri, «type» }
+    let _obj ← json.getObj?
+    let uri : String ← match _obj.find compare "uri" with | some v => fromJson? v | none => throw "property not found: uri"
+    return { uri }
 
-structure FileSystemWatcher where
-  globPattern : GlobPattern
-  kind : (Option WatchKind) := none
+/-- The parameters sent in notifications/requests for user-initiated creation of files.  @since 3.16.0 -/
+structure CreateFilesParams where
+  files : (Array FileCreate)
   deriving Inhabited
 
-instance : ToJson FileSystemWatcher where
-  toJson s := Json.mkObj <|
-    [("globPattern", toJson s.globPattern)] ++
-    (match s.kind with | some v => [("kind", toJson v)] | none => [])
+instance : ToJson CreateFilesParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("files", toJson s.files) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson FileSystemWatcher where
+instance : FromJson CreateFilesParams where
   fromJson? json := do
-    let globPattern ← json.getObjValAs? GlobPattern "globPattern"
-    let kind := (json.getObjValAs? WatchKind "kind").toOption
-    return { globPattern, kind }
+    let _obj ← json.getObj?
+    let files : (Array FileCreate) ← match _obj.find compare "files" with | some v => fromJson? v | none => throw "property not found: files"
+    return { files }
 
-/-- Contains additional information about the context in which a completion request is triggered. -/
-structure CompletionContext where
-  triggerKind : CompletionTriggerKind
-  triggerCharacter : (Option String) := none
+/-- A workspace edit represents changes to many resources managed in the workspace. The edit should either provide `changes` or `documentChanges`. If documentChanges are present they are preferred over `changes` if the client can handle versioned document edits.  Since version 3.13.0 a workspace edit ca... -/
+structure WorkspaceEdit where
+  changes : Json := Json.null
+  documentChanges : Json := Json.null
+  changeAnnotations : Json := Json.null
   deriving Inhabited
 
-instance : ToJson CompletionContext where
-  toJson s := Json.mkObj <|
-    [("triggerKind", toJson s.triggerKind)] ++
-    (match s.triggerCharacter with | some v => [("triggerCharacter", toJson v)] | none => [])
+instance : ToJson WorkspaceEdit where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("changes", toJson s.changes) :: ("documentChanges", toJson s.documentChanges) :: ("changeAnnotations", toJson s.changeAnnotations) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson CompletionContext where
+instance : FromJson WorkspaceEdit where
   fromJson? json := do
-    let triggerKind ← json.getObjValAs? CompletionTriggerKind "triggerKind"
-    let triggerCharacter := (json.getObjValAs? String "triggerCharacter").toOption
-    return { triggerKind, triggerCharacter }
+    let _obj ← json.getObj?
+    let changes : Json := (_obj.find compare "changes").getD Json.null
+    let documentChanges : Json := (_obj.find compare "documentChanges").getD Json.null
+    let changeAnnotations : Json := (_obj.find compare "changeAnnotations").getD Json.null
+    return { changes, documentChanges, changeAnnotations }
 
-/-- Additional details for a completion item label.  @since 3.17.0 -/
-structure CompletionItemLabelDetails where
-  detail : (Option String) := none
-  description : (Option String) := none
+/-- Matching options for the file operation pattern.  @since 3.16.0 -/
+structure FileOperationPatternOptions where
+  ignoreCase : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson CompletionItemLabelDetails where
-  toJson s := Json.mkObj <|
-    (match s.detail with | some v => [("detail", toJson v)] | none => []) ++
-    (match s.description with | some v => [("description", toJson v)] | none => [])
+instance : ToJson FileOperationPatternOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.ignoreCase with | some v => ("ignoreCase", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson CompletionItemLabelDetails where
+instance : FromJson FileOperationPatternOptions where
   fromJson? json := do
-    let detail := (json.getObjValAs? String "detail").toOption
-    let description := (json.getObjValAs? String "description").toOption
-    return { detail, description }
+    let _obj ← json.getObj?
+    let ignoreCase : Option Bool := (_obj.find compare "ignoreCase").bind fun v => (fromJson? v).toOption
+    return { ignoreCase }
 
-/-- Specifies how fields from a completion item should be combined with those from `completionList.itemDefaults`.  If unspecified, all fields will be treated as ApplyKind.Replace.  If a field's value is ApplyKind.Replace, the value from a completion item (if provided and not `null`) will always be used ... -/
-structure CompletionItemApplyKinds where
-  commitCharacters : (Option ApplyKind) := none
-  data : (Option ApplyKind) := none
+/-- A pattern to describe in which file operation requests or notifications the server is interested in receiving.  @since 3.16.0 -/
+structure FileOperationPattern where
+  glob : String
+  «matches» : (Option FileOperationPatternKind) := none
+  options : (Option FileOperationPatternOptions) := none
   deriving Inhabited
 
-instance : ToJson CompletionItemApplyKinds where
-  toJson s := Json.mkObj <|
-    (match s.commitCharacters with | some v => [("commitCharacters", toJson v)] | none => []) ++
-    (match s.data with | some v => [("data", toJson v)] | none => [])
+instance : ToJson FileOperationPattern where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.options with | some v => ("options", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.«matches» with | some v => ("matches", toJson v) :: kvs | none => kvs)
+    let kvs := ("glob", toJson s.glob) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson CompletionItemApplyKinds where
+instance : FromJson FileOperationPattern where
   fromJson? json := do
-    let commitCharacters := (json.getObjValAs? ApplyKind "commitCharacters").toOption
-    let data := (json.getObjValAs? ApplyKind "data").toOption
-    return { commitCharacters, data }
+    let _obj ← json.getObj?
+    let glob : String ← match _obj.find compare "glob" with | some v => fromJson? v | none => throw "property not found: glob"
+    let «matches» : Option FileOperationPatternKind := (_obj.find compare "matches").bind fun v => (fromJson? v).toOption
+    let options : Option FileOperationPatternOptions := (_obj.find compare "options").bind fun v => (fromJson? v).toOption
+    return { glob, «matches», options }
 
-/-- Value-object that contains additional information when requesting references. -/
-structure ReferenceContext where
-  includeDeclaration : Bool
+/-- A filter to describe in which file operation requests or notifications the server is interested in receiving.  @since 3.16.0 -/
+structure FileOperationFilter where
+  scheme : (Option String) := none
+  pattern : FileOperationPattern
   deriving Inhabited
 
-instance : ToJson ReferenceContext where
-  toJson s := Json.mkObj <|
-    [("includeDeclaration", toJson s.includeDeclaration)]
+instance : ToJson FileOperationFilter where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("pattern", toJson s.pattern) :: kvs
+    let kvs := (match s.scheme with | some v => ("scheme", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson ReferenceContext where
+instance : FromJson FileOperationFilter where
   fromJson? json := do
-    let includeDeclaration ← json.getObjValAs? Bool "includeDeclaration"
-    return { includeDeclaration }
+    let _obj ← json.getObj?
+    let scheme : Option String := (_obj.find compare "scheme").bind fun v => (fromJson? v).toOption
+    let pattern : FileOperationPattern ← match _obj.find compare "pattern" with | some v => fromJson? v | none => throw "property not found: pattern"
+    return { scheme, pattern }
 
-/-- A base for all symbol information. -/
-structure BaseSymbolInformation where
-  name : String
-  kind : SymbolKind
-  tags : (Option (Array SymbolTag)) := none
-  containerName : (Option String) := none
+/-- The options to register for file operations.  @since 3.16.0 -/
+structure FileOperationRegistrationOptions where
+  filters : (Array FileOperationFilter)
   deriving Inhabited
 
-instance : ToJson BaseSymbolInformation where
-  toJson s := Json.mkObj <|
-    [("name", toJson s.name)] ++
-    [("kind", toJson s.kind)] ++
-    (match s.tags with | some v => [("tags", toJson v)] | none => []) ++
-    (match s.containerName with | some v => [("containerName", toJson v)] | none => [])
+instance : ToJson FileOperationRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("filters", toJson s.filters) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson BaseSymbolInformation where
+instance : FromJson FileOperationRegistrationOptions where
   fromJson? json := do
-    let name ← json.getObjValAs? String "name"
-    let kind ← json.getObjValAs? SymbolKind "kind"
-    let tags := (json.getObjValAs? (Array SymbolTag) "tags").toOption
-    let containerName := (json.getObjValAs? String "containerName").toOption
-    return { name, kind, tags, containerName }
+    let _obj ← json.getObj?
+    let filters : (Array FileOperationFilter) ← match _obj.find compare "filters" with | some v => fromJson? v | none => throw "property not found: filters"
+    return { filters }
 
-/-- Contains additional diagnostic information about the context in which a {@link CodeActionProvider.provideCodeActions code action} is run. -/
-structure CodeActionContext where
-  diagnostics : Json
-  only : (Option (Array CodeActionKind)) := none
-  triggerKind : (Option CodeActionTriggerKind) := none
+/-- Represents information on a file/folder rename.  @since 3.16.0 -/
+structure FileRename where
+  oldUri : String
+  newUri : String
   deriving Inhabited
 
-instance : ToJson CodeActionContext where
-  toJson s := Json.mkObj <|
-    [("diagnostics", toJson s.diagnostics)] ++
-    (match s.only with | some v => [("only", toJson v)] | none => []) ++
-    (match s.triggerKind with | some v => [("triggerKind", toJson v)] | none => [])
+instance : ToJson FileRename where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("oldUri", toJson s.oldUri) :: ("newUri", toJson s.newUri) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson CodeActionContext where
+instance : FromJson FileRename where
   fromJson? json := do
-    let diagnostics := json.getObjVal? "diagnostics" |>.toOption |>.getD Json.null
-    let only := (json.getObjValAs? (Array CodeActionKind) "only").toOption
-    let triggerKind := (json.getObjValAs? CodeActionTriggerKind "triggerKind").toOption
-    return { diagnostics, only, triggerKind }
+    let _obj ← json.getObj?
+    let oldUri : String ← match _obj.find compare "oldUri" with | some v => fromJson? v | none => throw "property not found: oldUri"
+    let newUri : String ← match _obj.find compare "newUri" with | some v => fromJson? v | none => throw "property not found: newUri"
+    return { oldUri, newUri }
 
-/-- Captures why the code action is currently disabled.  @since 3.18.0 -/
-structure CodeActionDisabled where
-  reason : String
+/-- The parameters sent in notifications/requests for user-initiated renames of files.  @since 3.16.0 -/
+structure RenameFilesParams where
+  files : (Array FileRename)
   deriving Inhabited
 
-instance : ToJson CodeActionDisabled where
-  toJson s := Json.mkObj <|
-    [("reason", toJson s.reason)]
+instance : ToJson RenameFilesParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("files", toJson s.files) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson CodeActionDisabled where
+instance : FromJson RenameFilesParams where
   fromJson? json := do
-    let reason ← json.getObjValAs? String "reason"
-    return { reason }
+    let _obj ← json.getObj?
+    let files : (Array FileRename) ← match _obj.find compare "files" with | some v => fromJson? v | none => throw "property not found: files"
+    return { files }
 
-/-- Location with only uri and does not include range.  @since 3.18.0 -/
-structure LocationUriOnly where
+/-- Represents information on a file/folder delete.  @since 3.16.0 -/
+structure FileDelete where
   uri : String
   deriving Inhabited
 
-instance : ToJson LocationUriOnly where
-  toJson s := Json.mkObj <|
-    [("uri", toJson s.uri)]
+instance : ToJson FileDelete where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("uri", toJson s.uri) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson LocationUriOnly where
+instance : FromJson FileDelete where
   fromJson? json := do
-    let uri ← json.getObjValAs? String "uri"
+    let _obj ← json.getObj?
+    let uri : String ← match _obj.find compare "uri" with | some v => fromJson? v | none => throw "property not found: uri"
     return { uri }
 
-/-- Value-object describing what options formatting should use. -/
-structure FormattingOptions where
-  tabSize : Nat
-  insertSpaces : Bool
-  trimTrailingWhitespace : (Option Bool) := none
-  insertFinalNewline : (Option Bool) := none
-  trimFinalNewlines : (Option Bool) := none
+/-- The parameters sent in notifications/requests for user-initiated deletes of files.  @since 3.16.0 -/
+structure DeleteFilesParams where
+  files : (Array FileDelete)
   deriving Inhabited
 
-instance : ToJson FormattingOptions where
-  toJson s := Json.mkObj <|
-    [("tabSize", toJson s.tabSize)] ++
-    [("insertSpaces", toJson s.insertSpaces)] ++
-    (match s.trimTrailingWhitespace with | some v => [("trimTrailingWhitespace", toJson v)] | none => []) ++
-    (match s.insertFinalNewline with | some v => [("insertFinalNewline", toJson v)] | none => []) ++
-    (match s.trimFinalNewlines with | some v => [("trimFinalNewlines", toJson v)] | none => [])
+instance : ToJson DeleteFilesParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("files", toJson s.files) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson FormattingOptions where
+instance : FromJson DeleteFilesParams where
   fromJson? json := do
-    let tabSize ← json.getObjValAs? Nat "tabSize"
-    let insertSpaces ← json.getObjValAs? Bool "insertSpaces"
-    let trimTrailingWhitespace := (json.getObjValAs? Bool "trimTrailingWhitespace").toOption
-    let insertFinalNewline := (json.getObjValAs? Bool "insertFinalNewline").toOption
-    let trimFinalNewlines := (json.getObjValAs? Bool "trimFinalNewlines").toOption
-    return { tabSize, insertSpaces, trimTrailingWhitespace, insertFinalNewline, trimFinalNewlines }
+    let _obj ← json.getObj?
+    let files : (Array FileDelete) ← match _obj.find compare "files" with | some v => fromJson? v | none => throw "property not found: files"
+    return { files }
 
-/-- Provider options for a {@link DocumentOnTypeFormattingRequest}. -/
-structure DocumentOnTypeFormattingOptions where
-  firstTriggerCharacter : String
-  moreTriggerCharacter : (Option (Array String)) := none
+structure MonikerParams where
+  textDocument : TextDocumentIdentifier
+  position : Position
+  workDoneToken : (Option ProgressToken) := none
+  partialResultToken : (Option ProgressToken) := none
   deriving Inhabited
 
-instance : ToJson DocumentOnTypeFormattingOptions where
-  toJson s := Json.mkObj <|
-    [("firstTriggerCharacter", toJson s.firstTriggerCharacter)] ++
-    (match s.moreTriggerCharacter with | some v => [("moreTriggerCharacter", toJson v)] | none => [])
+instance : ToJson MonikerParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.partialResultToken with | some v => ("partialResultToken", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    let kvs := ("textDocument", toJson s.textDocument) :: ("position", toJson s.position) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DocumentOnTypeFormattingOptions where
+instance : FromJson MonikerParams where
   fromJson? json := do
-    let firstTriggerCharacter ← json.getObjValAs? String "firstTriggerCharacter"
-    let moreTriggerCharacter := (json.getObjValAs? (Array String) "moreTriggerCharacter").toOption
-    return { firstTriggerCharacter, moreTriggerCharacter }
+    let _obj ← json.getObj?
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let position : Position ← match _obj.find compare "position" with | some v => fromJson? v | none => throw "property not found: position"
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let partialResultToken : Option ProgressToken := (_obj.find compare "partialResultToken").bind fun v => (fromJson? v).toOption
+    return { textDocument, position, workDoneToken, partialResultToken }
 
-/-- @since 3.18.0 -/
-structure PrepareRenameDefaultBehavior where
-  defaultBehavior : Bool
+/-- Moniker definition to match LSIF 0.5 moniker definition.  @since 3.16.0 -/
+structure Moniker where
+  scheme : String
+  identifier : String
+  unique : UniquenessLevel
+  kind : (Option MonikerKind) := none
   deriving Inhabited
 
-instance : ToJson PrepareRenameDefaultBehavior where
-  toJson s := Json.mkObj <|
-    [("defaultBehavior", toJson s.defaultBehavior)]
+instance : ToJson Moniker where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.kind with | some v => ("kind", toJson v) :: kvs | none => kvs)
+    let kvs := ("scheme", toJson s.scheme) :: ("identifier", toJson s.identifier) :: ("unique", toJson s.unique) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson PrepareRenameDefaultBehavior where
+instance : FromJson Moniker where
   fromJson? json := do
-    let defaultBehavior ← json.getObjValAs? Bool "defaultBehavior"
-    return { defaultBehavior }
+    let _obj ← json.getObj?
+    let scheme : String ← match _obj.find compare "scheme" with | some v => fromJson? v | none => throw "property not found: scheme"
+    let identifier : String ← match _obj.find compare "identifier" with | some v => fromJson? v | none => throw "property not found: identifier"
+    let unique : UniquenessLevel ← match _obj.find compare "unique" with | some v => fromJson? v | none => throw "property not found: unique"
+    let kind : Option MonikerKind := (_obj.find compare "kind").bind fun v => (fromJson? v).toOption
+    return { scheme, identifier, unique, kind }
 
-/-- @since 3.16.0 -/
-structure SemanticTokensLegend where
-  tokenTypes : (Array String)
-  tokenModifiers : (Array String)
+structure MonikerRegistrationOptions where
+  documentSelector : (Option Json)
   deriving Inhabited
 
-instance : ToJson SemanticTokensLegend where
-  toJson s := Json.mkObj <|
-    [("tokenTypes", toJson s.tokenTypes)] ++
-    [("tokenModifiers", toJson s.tokenModifiers)]
+instance : ToJson MonikerRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("documentSelector", toJson s.documentSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson SemanticTokensLegend where
+instance : FromJson MonikerRegistrationOptions where
   fromJson? json := do
-    let tokenTypes ← json.getObjValAs? (Array String) "tokenTypes"
-    let tokenModifiers ← json.getObjValAs? (Array String) "tokenModifiers"
-    return { tokenTypes, tokenModifiers }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    return { documentSelector }
 
-/-- Semantic tokens options to support deltas for full documents  @since 3.18.0 -/
-structure SemanticTokensFullDelta where
-  delta : (Option Bool) := none
+/-- The parameter of a `textDocument/prepareTypeHierarchy` request.  @since 3.17.0 -/
+structure TypeHierarchyPrepareParams where
+  textDocument : TextDocumentIdentifier
+  position : Position
+  workDoneToken : (Option ProgressToken) := none
   deriving Inhabited
 
-instance : ToJson SemanticTokensFullDelta where
-  toJson s := Json.mkObj <|
-    (match s.delta with | some v => [("delta", toJson v)] | none => [])
+instance : ToJson TypeHierarchyPrepareParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    let kvs := ("textDocument", toJson s.textDocument) :: ("position", toJson s.position) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson SemanticTokensFullDelta where
+instance : FromJson TypeHierarchyPrepareParams where
   fromJson? json := do
-    let delta := (json.getObjValAs? Bool "delta").toOption
-    return { delta }
+    let _obj ← json.getObj?
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let position : Position ← match _obj.find compare "position" with | some v => fromJson? v | none => throw "property not found: position"
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    return { textDocument, position, workDoneToken }
 
-/-- A generic resource operation. -/
-structure ResourceOperation where
-  kind : String
-  annotationId : (Option ChangeAnnotationIdentifier) := none
+/-- @since 3.17.0 -/
+structure TypeHierarchyItem where
+  name : String
+  kind : SymbolKind
+  tags : (Option (Array SymbolTag)) := none
+  detail : (Option String) := none
+  uri : String
+  range : Range
+  selectionRange : Range
+  data : Json := Json.null
   deriving Inhabited
 
-instance : ToJson ResourceOperation where
-  toJson s := Json.mkObj <|
-    [("kind", toJson s.kind)] ++
-    (match s.annotationId with | some v => [("annotationId", toJson v)] | none => [])
+instance : ToJson TypeHierarchyItem where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("uri", toJson s.uri) :: ("range", toJson s.range) :: ("selectionRange", toJson s.selectionRange) :: ("data", toJson s.data) :: kvs
+    let kvs := (match s.detail with | some v => ("detail", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.tags with | some v => ("tags", toJson v) :: kvs | none => kvs)
+    let kvs := ("name", toJson s.name) :: ("kind", toJson s.kind) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ResourceOperation where
+instance : FromJson TypeHierarchyItem where
   fromJson? json := do
-    let kind ← json.getObjValAs? String "kind"
-    let annotationId := (json.getObjValAs? ChangeAnnotationIdentifier "annotationId").toOption
-    return { kind, annotationId }
+    let _obj ← json.getObj?
+    let name : String ← match _obj.find compare "name" with | some v => fromJson? v | none => throw "property not found: name"
+    let kind : SymbolKind ← match _obj.find compare "kind" with | some v => fromJson? v | none => throw "property not found: kind"
+    let tags : Option (Array SymbolTag) := (_obj.find compare "tags").bind fun v => (fromJson? v).toOption
+    let detail : Option String := (_obj.find compare "detail").bind fun v => (fromJson? v).toOption
+    let uri : String ← match _obj.find compare "uri" with | some v => fromJson? v | none => throw "property not found: uri"
+    let range : Range ← match _obj.find compare "range" with | some v => fromJson? v | none => throw "property not found: range"
+    let selectionRange : Range ← match _obj.find compare "selectionRange" with | some v => fromJson? v | none => throw "property not found: selectionRange"
+    let data : Json := (_obj.find compare "data").getD Json.null
+    return { name, kind, tags, detail, uri, range, selectionRange, data }
 
-/-- Options to create a file. -/
-structure CreateFileOptions where
-  overwrite : (Option Bool) := none
-  ignoreIfExists : (Option Bool) := none
+/-- Type hierarchy options used during static or dynamic registration.  @since 3.17.0 -/
+structure TypeHierarchyRegistrationOptions where
+  documentSelector : (Option Json)
+  id : (Option String) := none
   deriving Inhabited
 
-instance : ToJson CreateFileOptions where
-  toJson s := Json.mkObj <|
-    (match s.overwrite with | some v => [("overwrite", toJson v)] | none => []) ++
-    (match s.ignoreIfExists with | some v => [("ignoreIfExists", toJson v)] | none => [])
+instance : ToJson TypeHierarchyRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.id with | some v => ("id", toJson v) :: kvs | none => kvs)
+    let kvs := ("documentSelector", toJson s.documentSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson CreateFileOptions where
+instance : FromJson TypeHierarchyRegistrationOptions where
   fromJson? json := do
-    let overwrite := (json.getObjValAs? Bool "overwrite").toOption
-    let ignoreIfExists := (json.getObjValAs? Bool "ignoreIfExists").toOption
-    return { overwrite, ignoreIfExists }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    let id : Option String := (_obj.find compare "id").bind fun v => (fromJson? v).toOption
+    return { documentSelector, id }
 
-/-- Rename file options -/
-structure RenameFileOptions where
-  overwrite : (Option Bool) := none
-  ignoreIfExists : (Option Bool) := none
+/-- The parameter of a `typeHierarchy/supertypes` request.  @since 3.17.0 -/
+structure TypeHierarchySupertypesParams where
+  workDoneToken : (Option ProgressToken) := none
+  partialResultToken : (Option ProgressToken) := none
+  item : TypeHierarchyItem
   deriving Inhabited
 
-instance : ToJson RenameFileOptions where
-  toJson s := Json.mkObj <|
-    (match s.overwrite with | some v => [("overwrite", toJson v)] | none => []) ++
-    (match s.ignoreIfExists with | some v => [("ignoreIfExists", toJson v)] | none => [])
+instance : ToJson TypeHierarchySupertypesParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("item", toJson s.item) :: kvs
+    let kvs := (match s.partialResultToken with | some v => ("partialResultToken", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson RenameFileOptions where
+instance : FromJson TypeHierarchySupertypesParams where
   fromJson? json := do
-    let overwrite := (json.getObjValAs? Bool "overwrite").toOption
-    let ignoreIfExists := (json.getObjValAs? Bool "ignoreIfExists").toOption
-    return { overwrite, ignoreIfExists }
+    let _obj ← json.getObj?
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let partialResultToken : Option ProgressToken := (_obj.find compare "partialResultToken").bind fun v => (fromJson? v).toOption
+    let item : TypeHierarchyItem ← match _obj.find compare "item" with | some v => fromJson? v | none => throw "property not found: item"
+    return { workDoneToken, partialResultToken, item }
 
-/-- Delete file options -/
-structure DeleteFileOptions where
-  recursive : (Option Bool) := none
-  ignoreIfNotExists : (Option Bool) := none
+/-- The parameter of a `typeHierarchy/subtypes` request.  @since 3.17.0 -/
+structure TypeHierarchySubtypesParams where
+  workDoneToken : (Option ProgressToken) := none
+  partialResultToken : (Option ProgressToken) := none
+  item : TypeHierarchyItem
   deriving Inhabited
 
-instance : ToJson DeleteFileOptions where
-  toJson s := Json.mkObj <|
-    (match s.recursive with | some v => [("recursive", toJson v)] | none => []) ++
-    (match s.ignoreIfNotExists with | some v => [("ignoreIfNotExists", toJson v)] | none => [])
+instance : ToJson TypeHierarchySubtypesParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("item", toJson s.item) :: kvs
+    let kvs := (match s.partialResultToken with | some v => ("partialResultToken", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson DeleteFileOptions where
+instance : FromJson TypeHierarchySubtypesParams where
   fromJson? json := do
-    let recursive := (json.getObjValAs? Bool "recursive").toOption
-    let ignoreIfNotExists := (json.getObjValAs? Bool "ignoreIfNotExists").toOption
-    return { recursive, ignoreIfNotExists }
+    let _obj ← json.getObj?
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let partialResultToken : Option ProgressToken := (_obj.find compare "partialResultToken").bind fun v => (fromJson? v).toOption
+    let item : TypeHierarchyItem ← match _obj.find compare "item" with | some v => fromJson? v | none => throw "property not found: item"
+    return { workDoneToken, partialResultToken, item }
 
-/-- Information about the client  @since 3.15.0 @since 3.18.0 ClientInfo type name added. -/
-structure ClientInfo where
-  name : String
-  version : (Option String) := none
+/-- @since 3.17.0 -/
+structure InlineValueContext where
+  frameId : Int
+  stoppedLocation : Range
   deriving Inhabited
 
-instance : ToJson ClientInfo where
-  toJson s := Json.mkObj <|
-    [("name", toJson s.name)] ++
-    (match s.version with | some v => [("version", toJson v)] | none => [])
+instance : ToJson InlineValueContext where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("frameId", toJson s.frameId) :: ("stoppedLocation", toJson s.stoppedLocation) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ClientInfo where
+instance : FromJson InlineValueContext where
   fromJson? json := do
-    let name ← json.getObjValAs? String "name"
-    let version := (json.getObjValAs? String "version").toOption
-    return { name, version }
+    let _obj ← json.getObj?
+    let frameId : Int ← match _obj.find compare "frameId" with | some v => fromJson? v | none => throw "property not found: frameId"
+    let stoppedLocation : Range ← match _obj.find compare "stoppedLocation" with | some v => fromJson? v | none => throw "property not found: stoppedLocation"
+    return { frameId, stoppedLocation }
 
-/-- @since 3.18.0 -/
-structure TextDocumentContentChangeWholeDocument where
-  text : String
+/-- A parameter literal used in inline value requests.  @since 3.17.0 -/
+structure InlineValueParams where
+  workDoneToken : (Option ProgressToken) := none
+  textDocument : TextDocumentIdentifier
+  range : Range
+  context : InlineValueContext
   deriving Inhabited
 
-instance : ToJson TextDocumentContentChangeWholeDocument where
-  toJson s := Json.mkObj <|
-    [("text", toJson s.text)]
+instance : ToJson InlineValueParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("textDocument", toJson s.textDocument) :: ("range", toJson s.range) :: ("context", toJson s.context) :: kvs
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson TextDocumentContentChangeWholeDocument where
+instance : FromJson InlineValueParams where
   fromJson? json := do
-    let text ← json.getObjValAs? String "text"
-    return { text }
+    let _obj ← json.getObj?
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let range : Range ← match _obj.find compare "range" with | some v => fromJson? v | none => throw "property not found: range"
+    let context : InlineValueContext ← match _obj.find compare "context" with | some v => fromJson? v | none => throw "property not found: context"
+    return { workDoneToken, textDocument, range, context }
 
-/-- Structure to capture a description for an error code.  @since 3.16.0 -/
-structure CodeDescription where
-  href : String
+/-- Inline value options used during static or dynamic registration.  @since 3.17.0 -/
+structure InlineValueRegistrationOptions where
+  documentSelector : (Option Json)
+  id : (Option String) := none
   deriving Inhabited
 
-instance : ToJson CodeDescription where
-  toJson s := Json.mkObj <|
-    [("href", toJson s.href)]
+instance : ToJson InlineValueRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.id with | some v => ("id", toJson v) :: kvs | none => kvs)
+    let kvs := ("documentSelector", toJson s.documentSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson CodeDescription where
+instance : FromJson InlineValueRegistrationOptions where
   fromJson? json := do
-    let href ← json.getObjValAs? String "href"
-    return { href }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    let id : Option String := (_obj.find compare "id").bind fun v => (fromJson? v).toOption
+    return { documentSelector, id }
 
-/-- @since 3.18.0 -/
-structure ServerCompletionItemOptions where
-  labelDetailsSupport : (Option Bool) := none
+/-- A parameter literal used in inlay hint requests.  @since 3.17.0 -/
+structure InlayHintParams where
+  workDoneToken : (Option ProgressToken) := none
+  textDocument : TextDocumentIdentifier
+  range : Range
   deriving Inhabited
 
-instance : ToJson ServerCompletionItemOptions where
-  toJson s := Json.mkObj <|
-    (match s.labelDetailsSupport with | some v => [("labelDetailsSupport", toJson v)] | none => [])
+instance : ToJson InlayHintParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("textDocument", toJson s.textDocument) :: ("range", toJson s.range) :: kvs
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson ServerCompletionItemOptions where
+instance : FromJson InlayHintParams where
   fromJson? json := do
-    let labelDetailsSupport := (json.getObjValAs? Bool "labelDetailsSupport").toOption
-    return { labelDetailsSupport }
+    let _obj ← json.getObj?
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let range : Range ← match _obj.find compare "range" with | some v => fromJson? v | none => throw "property not found: range"
+    return { workDoneToken, textDocument, range }
 
-/-- @since 3.18.0 @deprecated use MarkupContent instead. -/
-structure MarkedStringWithLanguage where
-  language : String
-  value : String
+/-- Inlay hint information.  @since 3.17.0 -/
+structure InlayHint where
+  position : Position
+  label : Json
+  kind : (Option InlayHintKind) := none
+  textEdits : (Option (Array TextEdit)) := none
+  tooltip : Json := Json.null
+  paddingLeft : (Option Bool) := none
+  paddingRight : (Option Bool) := none
+  data : Json := Json.null
   deriving Inhabited
 
-instance : ToJson MarkedStringWithLanguage where
-  toJson s := Json.mkObj <|
-    [("language", toJson s.language)] ++
-    [("value", toJson s.value)]
+instance : ToJson InlayHint where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("data", toJson s.data) :: kvs
+    let kvs := (match s.paddingRight with | some v => ("paddingRight", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.paddingLeft with | some v => ("paddingLeft", toJson v) :: kvs | none => kvs)
+    let kvs := ("tooltip", toJson s.tooltip) :: kvs
+    let kvs := (match s.textEdits with | some v => ("textEdits", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.kind with | some v => ("kind", toJson v) :: kvs | none => kvs)
+    let kvs := ("position", toJson s.position) :: ("label", toJson s.label) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson MarkedStringWithLanguage where
+instance : FromJson InlayHint where
   fromJson? json := do
-    let language ← json.getObjValAs? String "language"
-    let value ← json.getObjValAs? String "value"
-    return { language, value }
+    let _obj ← json.getObj?
+    let position : Position ← match _obj.find compare "position" with | some v => fromJson? v | none => throw "property not found: position"
+    let label : Json := (_obj.find compare "label").getD Json.null
+    let kind : Option InlayHintKind := (_obj.find compare "kind").bind fun v => (fromJson? v).toOption
+    let textEdits : Option (Array TextEdit) := (_obj.find compare "textEdits").bind fun v => (fromJson? v).toOption
+    let tooltip : Json := (_obj.find compare "tooltip").getD Json.null
+    let paddingLeft : Option Bool := (_obj.find compare "paddingLeft").bind fun v => (fromJson? v).toOption
+    let paddingRight : Option Bool := (_obj.find compare "paddingRight").bind fun v => (fromJson? v).toOption
+    let data : Json := (_obj.find compare "data").getD Json.null
+    return { position, label, kind, textEdits, tooltip, paddingLeft, paddingRight, data }
 
-/-- A notebook cell text document filter denotes a cell text document by different properties.  @since 3.17.0 -/
-structure NotebookCellTextDocumentFilter where
-  notebook : Json
-  language : (Option String) := none
+/-- Inlay hint options used during static or dynamic registration.  @since 3.17.0 -/
+structure InlayHintRegistrationOptions where
+  resolveProvider : (Option Bool) := none
+  documentSelector : (Option Json)
+  id : (Option String) := none
   deriving Inhabited
 
-instance : ToJson NotebookCellTextDocumentFilter where
-  toJson s := Json.mkObj <|
-    [("notebook", toJson s.notebook)] ++
-    (match s.language with | some v => [("language", toJson v)] | none => [])
+instance : ToJson InlayHintRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.id with | some v => ("id", toJson v) :: kvs | none => kvs)
+    let kvs := ("documentSelector", toJson s.documentSelector) :: kvs
+    let kvs := (match s.resolveProvider with | some v => ("resolveProvider", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson NotebookCellTextDocumentFilter where
+instance : FromJson InlayHintRegistrationOptions where
   fromJson? json := do
-    let notebook := json.getObjVal? "notebook" |>.toOption |>.getD Json.null
-    let language := (json.getObjValAs? String "language").toOption
-    return { notebook, language }
+    let _obj ← json.getObj?
+    let resolveProvider : Option Bool := (_obj.find compare "resolveProvider").bind fun v => (fromJson? v).toOption
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    let id : Option String := (_obj.find compare "id").bind fun v => (fromJson? v).toOption
+    return { resolveProvider, documentSelector, id }
 
-/-- Matching options for the file operation pattern.  @since 3.16.0 -/
-structure FileOperationPatternOptions where
-  ignoreCase : (Option Bool) := none
+/-- Parameters of the document diagnostic request.  @since 3.17.0 -/
+structure DocumentDiagnosticParams where
+  workDoneToken : (Option ProgressToken) := none
+  partialResultToken : (Option ProgressToken) := none
+  textDocument : TextDocumentIdentifier
+  identifier : (Option String) := none
+  previousResultId : (Option String) := none
   deriving Inhabited
 
-instance : ToJson FileOperationPatternOptions where
-  toJson s := Json.mkObj <|
-    (match s.ignoreCase with | some v => [("ignoreCase", toJson v)] | none => [])
+instance : ToJson DocumentDiagnosticParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.previousResultId with | some v => ("previousResultId", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.identifier with | some v => ("identifier", toJson v) :: kvs | none => kvs)
+    let kvs := ("textDocument", toJson s.textDocument) :: kvs
+    let kvs := (match s.partialResultToken with | some v => ("partialResultToken", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson FileOperationPatternOptions where
+instance : FromJson DocumentDiagnosticParams where
   fromJson? json := do
-    let ignoreCase := (json.getObjValAs? Bool "ignoreCase").toOption
-    return { ignoreCase }
+    let _obj ← json.getObj?
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let partialResultToken : Option ProgressToken := (_obj.find compare "partialResultToken").bind fun v => (fromJson? v).toOption
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let identifier : Option String := (_obj.find compare "identifier").bind fun v => (fromJson? v).toOption
+    let previousResultId : Option String := (_obj.find compare "previousResultId").bind fun v => (fromJson? v).toOption
+    return { workDoneToken, partialResultToken, textDocument, identifier, previousResultId }
 
-structure ExecutionSummary where
-  executionOrder : Nat
-  success : (Option Bool) := none
+/-- A partial result for a document diagnostic report.  @since 3.17.0 -/
+structure DocumentDiagnosticReportPartialResult where
+  relatedDocuments : Json
   deriving Inhabited
 
-instance : ToJson ExecutionSummary where
-  toJson s := Json.mkObj <|
-    [("executionOrder", toJson s.executionOrder)] ++
-    (match s.success with | some v => [("success", toJson v)] | none => [])
+instance : ToJson DocumentDiagnosticReportPartialResult where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("relatedDocuments", toJson s.relatedDocuments) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ExecutionSummary where
+instance : FromJson DocumentDiagnosticReportPartialResult where
   fromJson? json := do
-    let executionOrder ← json.getObjValAs? Nat "executionOrder"
-    let success := (json.getObjValAs? Bool "success").toOption
-    return { executionOrder, success }
+    let _obj ← json.getObj?
+    let relatedDocuments : Json := (_obj.find compare "relatedDocuments").getD Json.null
+    return { relatedDocuments }
 
-/-- @since 3.18.0 -/
-structure NotebookCellLanguage where
-  language : String
+/-- Cancellation data returned from a diagnostic request.  @since 3.17.0 -/
+structure DiagnosticServerCancellationData where
+  retriggerRequest : Bool
   deriving Inhabited
 
-instance : ToJson NotebookCellLanguage where
-  toJson s := Json.mkObj <|
-    [("language", toJson s.language)]
+instance : ToJson DiagnosticServerCancellationData where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("retriggerRequest", toJson s.retriggerRequest) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson NotebookCellLanguage where
+instance : FromJson DiagnosticServerCancellationData where
   fromJson? json := do
-    let language ← json.getObjValAs? String "language"
-    return { language }
+    let _obj ← json.getObj?
+    let retriggerRequest : Bool ← match _obj.find compare "retriggerRequest" with | some v => fromJson? v | none => throw "property not found: retriggerRequest"
+    return { retriggerRequest }
 
-structure WorkspaceFoldersServerCapabilities where
-  supported : (Option Bool) := none
-  changeNotifications : Json := Json.null
+/-- Diagnostic registration options.  @since 3.17.0 -/
+structure DiagnosticRegistrationOptions where
+  documentSelector : (Option Json)
+  identifier : (Option String) := none
+  interFileDependencies : Bool
+  workspaceDiagnostics : Bool
+  id : (Option String) := none
   deriving Inhabited
 
-instance : ToJson WorkspaceFoldersServerCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.supported with | some v => [("supported", toJson v)] | none => []) ++
-    [("changeNotifications", toJson s.changeNotifications)]
+instance : ToJson DiagnosticRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.id with | some v => ("id", toJson v) :: kvs | none => kvs)
+    let kvs := ("interFileDependencies", toJson s.interFileDependencies) :: ("workspaceDiagnostics", toJson s.workspaceDiagnostics) :: kvs
+    let kvs := (match s.identifier with | some v => ("identifier", toJson v) :: kvs | none => kvs)
+    let kvs := ("documentSelector", toJson s.documentSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson WorkspaceFoldersServerCapabilities where
+instance : FromJson DiagnosticRegistrationOptions where
   fromJson? json := do
-    let supported := (json.getObjValAs? Bool "supported").toOption
-    let changeNotifications := json.getObjVal? "changeNotifications" |>.toOption |>.getD Json.null
-    return { supported, changeNotifications }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    let identifier : Option String := (_obj.find compare "identifier").bind fun v => (fromJson? v).toOption
+    let interFileDependencies : Bool ← match _obj.find compare "interFileDependencies" with | some v => fromJson? v | none => throw "property not found: interFileDependencies"
+    let workspaceDiagnostics : Bool ← match _obj.find compare "workspaceDiagnostics" with | some v => fromJson? v | none => throw "property not found: workspaceDiagnostics"
+    let id : Option String := (_obj.find compare "id").bind fun v => (fromJson? v).toOption
+    return { documentSelector, identifier, interFileDependencies, workspaceDiagnostics, id }
 
-/-- A document filter where `language` is required field.  @since 3.18.0 -/
-structure TextDocumentFilterLanguage where
-  language : String
-  scheme : (Option String) := none
-  pattern : (Option GlobPattern) := none
+/-- A previous result id in a workspace pull request.  @since 3.17.0 -/
+structure PreviousResultId where
+  uri : String
+  value : String
   deriving Inhabited
 
-instance : ToJson TextDocumentFilterLanguage where
-  toJson s := Json.mkObj <|
-    [("language", toJson s.language)] ++
-    (match s.scheme with | some v => [("scheme", toJson v)] | none => []) ++
-    (match s.pattern with | some v => [("pattern", toJson v)] | none => [])
+instance : ToJson PreviousResultId where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("uri", toJson s.uri) :: ("value", toJson s.value) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson TextDocumentFilterLanguage where
+instance : FromJson PreviousResultId where
   fromJson? json := do
-    let language ← json.getObjValAs? String "language"
-    let scheme := (json.getObjValAs? String "scheme").toOption
-    let pattern := (json.getObjValAs? GlobPattern "pattern").toOption
-    return { language, scheme, pattern }
+    let _obj ← json.getObj?
+    let uri : String ← match _obj.find compare "uri" with | some v => fromJson? v | none => throw "property not found: uri"
+    let value : String ← match _obj.find compare "value" with | some v => fromJson? v | none => throw "property not found: value"
+    return { uri, value }
 
-/-- A document filter where `scheme` is required field.  @since 3.18.0 -/
-structure TextDocumentFilterScheme where
-  language : (Option String) := none
-  scheme : String
-  pattern : (Option GlobPattern) := none
+/-- Parameters of the workspace diagnostic request.  @since 3.17.0 -/
+structure WorkspaceDiagnosticParams where
+  workDoneToken : (Option ProgressToken) := none
+  partialResultToken : (Option ProgressToken) := none
+  identifier : (Option String) := none
+  previousResultIds : (Array PreviousResultId)
   deriving Inhabited
 
-instance : ToJson TextDocumentFilterScheme where
-  toJson s := Json.mkObj <|
-    (match s.language with | some v => [("language", toJson v)] | none => []) ++
-    [("scheme", toJson s.scheme)] ++
-    (match s.pattern with | some v => [("pattern", toJson v)] | none => [])
+instance : ToJson WorkspaceDiagnosticParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("previousResultIds", toJson s.previousResultIds) :: kvs
+    let kvs := (match s.identifier with | some v => ("identifier", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.partialResultToken with | some v => ("partialResultToken", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson TextDocumentFilterScheme where
+instance : FromJson WorkspaceDiagnosticParams where
   fromJson? json := do
-    let language := (json.getObjValAs? String "language").toOption
-    let scheme ← json.getObjValAs? String "scheme"
-    let pattern := (json.getObjValAs? GlobPattern "pattern").toOption
-    return { language, scheme, pattern }
+    let _obj ← json.getObj?
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let partialResultToken : Option ProgressToken := (_obj.find compare "partialResultToken").bind fun v => (fromJson? v).toOption
+    let identifier : Option String := (_obj.find compare "identifier").bind fun v => (fromJson? v).toOption
+    let previousResultIds : (Array PreviousResultId) ← match _obj.find compare "previousResultIds" with | some v => fromJson? v | none => throw "property not found: previousResultIds"
+    return { workDoneToken, partialResultToken, identifier, previousResultIds }
 
-/-- A document filter where `pattern` is required field.  @since 3.18.0 -/
-structure TextDocumentFilterPattern where
-  language : (Option String) := none
-  scheme : (Option String) := none
-  pattern : GlobPattern
+/-- A workspace diagnostic report.  @since 3.17.0 -/
+structure WorkspaceDiagnosticReport where
+  items : (Array WorkspaceDocumentDiagnosticReport)
   deriving Inhabited
 
-instance : ToJson TextDocumentFilterPattern where
-  toJson s := Json.mkObj <|
-    (match s.language with | some v => [("language", toJson v)] | none => []) ++
-    (match s.scheme with | some v => [("scheme", toJson v)] | none => []) ++
-    [("pattern", toJson s.pattern)]
+instance : ToJson WorkspaceDiagnosticReport where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("items", toJson s.items) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson TextDocumentFilterPattern where
+instance : FromJson WorkspaceDiagnosticReport where
   fromJson? json := do
-    let language := (json.getObjValAs? String "language").toOption
-    let scheme := (json.getObjValAs? String "scheme").toOption
-    let pattern ← json.getObjValAs? GlobPattern "pattern"
-    return { language, scheme, pattern }
+    let _obj ← json.getObj?
+    let items : (Array WorkspaceDocumentDiagnosticReport) ← match _obj.find compare "items" with | some v => fromJson? v | none => throw "property not found: items"
+    return { items }
 
-/-- A notebook document filter where `notebookType` is required field.  @since 3.18.0 -/
-structure NotebookDocumentFilterNotebookType where
-  notebookType : String
-  scheme : (Option String) := none
-  pattern : (Option GlobPattern) := none
+/-- A partial result for a workspace diagnostic report.  @since 3.17.0 -/
+structure WorkspaceDiagnosticReportPartialResult where
+  items : (Array WorkspaceDocumentDiagnosticReport)
   deriving Inhabited
 
-instance : ToJson NotebookDocumentFilterNotebookType where
-  toJson s := Json.mkObj <|
-    [("notebookType", toJson s.notebookType)] ++
-    (match s.scheme with | some v => [("scheme", toJson v)] | none => []) ++
-    (match s.pattern with | some v => [("pattern", toJson v)] | none => [])
+instance : ToJson WorkspaceDiagnosticReportPartialResult where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("items", toJson s.items) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson NotebookDocumentFilterNotebookType where
+instance : FromJson WorkspaceDiagnosticReportPartialResult where
   fromJson? json := do
-    let notebookType ← json.getObjValAs? String "notebookType"
-    let scheme := (json.getObjValAs? String "scheme").toOption
-    let pattern := (json.getObjValAs? GlobPattern "pattern").toOption
-    return { notebookType, scheme, pattern }
+    let _obj ← json.getObj?
+    let items : (Array WorkspaceDocumentDiagnosticReport) ← match _obj.find compare "items" with | some v => fromJson? v | none => throw "property not found: items"
+    return { items }
 
-/-- A notebook document filter where `scheme` is required field.  @since 3.18.0 -/
-structure NotebookDocumentFilterScheme where
-  notebookType : (Option String) := none
-  scheme : String
-  pattern : (Option GlobPattern) := none
+structure ExecutionSummary where
+  executionOrder : Nat
+  success : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson NotebookDocumentFilterScheme where
-  toJson s := Json.mkObj <|
-    (match s.notebookType with | some v => [("notebookType", toJson v)] | none => []) ++
-    [("scheme", toJson s.scheme)] ++
-    (match s.pattern with | some v => [("pattern", toJson v)] | none => [])
+instance : ToJson ExecutionSummary where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.success with | some v => ("success", toJson v) :: kvs | none => kvs)
+    let kvs := ("executionOrder", toJson s.executionOrder) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson NotebookDocumentFilterScheme where
+instance : FromJson ExecutionSummary where
   fromJson? json := do
-    let notebookType := (json.getObjValAs? String "notebookType").toOption
-    let scheme ← json.getObjValAs? String "scheme"
-    let pattern := (json.getObjValAs? GlobPattern "pattern").toOption
-    return { notebookType, scheme, pattern }
+    let _obj ← json.getObj?
+    let executionOrder : Nat ← match _obj.find compare "executionOrder" with | some v => fromJson? v | none => throw "property not found: executionOrder"
+    let success : Option Bool := (_obj.find compare "success").bind fun v => (fromJson? v).toOption
+    return { executionOrder, success }
 
-/-- A notebook document filter where `pattern` is required field.  @since 3.18.0 -/
-structure NotebookDocumentFilterPattern where
-  notebookType : (Option String) := none
-  scheme : (Option String) := none
-  pattern : GlobPattern
+/-- A notebook cell.  A cell's document URI must be unique across ALL notebook cells and can therefore be used to uniquely identify a notebook cell or the cell's text document.  @since 3.17.0 -/
+structure NotebookCell where
+  kind : NotebookCellKind
+  document : String
+  metadata : Json := Json.null
+  executionSummary : (Option ExecutionSummary) := none
   deriving Inhabited
 
-instance : ToJson NotebookDocumentFilterPattern where
-  toJson s := Json.mkObj <|
-    (match s.notebookType with | some v => [("notebookType", toJson v)] | none => []) ++
-    (match s.scheme with | some v => [("scheme", toJson v)] | none => []) ++
-    [("pattern", toJson s.pattern)]
+instance : ToJson NotebookCell where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.executionSummary with | some v => ("executionSummary", toJson v) :: kvs | none => kvs)
+    let kvs := ("kind", toJson s.kind) :: ("document", toJson s.document) :: ("metadata", toJson s.metadata) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson NotebookDocumentFilterPattern where
+instance : FromJson NotebookCell where
   fromJson? json := do
-    let notebookType := (json.getObjValAs? String "notebookType").toOption
-    let scheme := (json.getObjValAs? String "scheme").toOption
-    let pattern ← json.getObjValAs? GlobPattern "pattern"
-    return { notebookType, scheme, pattern }
+    let _obj ← json.getObj?
+    let kind : NotebookCellKind ← match _obj.find compare "kind" with | some v => fromJson? v | none => throw "property not found: kind"
+    let document : String ← match _obj.find compare "document" with | some v => fromJson? v | none => throw "property not found: document"
+    let metadata : Json := (_obj.find compare "metadata").getD Json.null
+    let executionSummary : Option ExecutionSummary := (_obj.find compare "executionSummary").bind fun v => (fromJson? v).toOption
+    return { kind, document, metadata, executionSummary }
 
-/-- A change describing how to move a `NotebookCell` array from state S to S'.  @since 3.17.0 -/
-structure NotebookCellArrayChange where
-  start : Nat
-  deleteCount : Nat
-  cells : Json := Json.null
+/-- A notebook document.  @since 3.17.0 -/
+structure NotebookDocument where
+  uri : String
+  notebookType : String
+  version : Int
+  metadata : Json := Json.null
+  cells : (Array NotebookCell)
   deriving Inhabited
 
-instance : ToJson NotebookCellArrayChange where
-  toJson s := Json.mkObj <|
-    [("start", toJson s.start)] ++
-    [("deleteCount", toJson s.deleteCount)] ++
-    [("cells", toJson s.cells)]
+instance : ToJson NotebookDocument where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("uri", toJson s.uri) :: ("notebookType", toJson s.notebookType) :: ("version", toJson s.version) :: ("metadata", toJson s.metadata) :: ("cells", toJson s.cells) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson NotebookCellArrayChange where
+instance : FromJson NotebookDocument where
   fromJson? json := do
-    let start ← json.getObjValAs? Nat "start"
-    let deleteCount ← json.getObjValAs? Nat "deleteCount"
-    let cells := json.getObjVal? "cells" |>.toOption |>.getD Json.null
-    return { start, deleteCount, cells }
+    let _obj ← json.getObj?
+    let uri : String ← match _obj.find compare "uri" with | some v => fromJson? v | none => throw "property not found: uri"
+    let notebookType : String ← match _obj.find compare "notebookType" with | some v => fromJson? v | none => throw "property not found: notebookType"
+    let version : Int ← match _obj.find compare "version" with | some v => fromJson? v | none => throw "property not found: version"
+    let metadata : Json := (_obj.find compare "metadata").getD Json.null
+    let cells : (Array NotebookCell) ← match _obj.find compare "cells" with | some v => fromJson? v | none => throw "property not found: cells"
+    return { uri, notebookType, version, metadata, cells }
 
-structure DidChangeConfigurationClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
+/-- An item to transfer a text document from the client to the server. -/
+structure TextDocumentItem where
+  uri : String
+  languageId : LanguageKind
+  version : Int
+  text : String
   deriving Inhabited
 
-instance : ToJson DidChangeConfigurationClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => [])
+instance : ToJson TextDocumentItem where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("uri", toJson s.uri) :: ("languageId", toJson s.languageId) :: ("version", toJson s.version) :: ("text", toJson s.text) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DidChangeConfigurationClientCapabilities where
+instance : FromJson TextDocumentItem where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    return { dynamicRegistration }
+    let _obj ← json.getObj?
+    let uri : String ← match _obj.find compare "uri" with | some v => fromJson? v | none => throw "property not found: uri"
+    let languageId : LanguageKind ← match _obj.find compare "languageId" with | some v => fromJson? v | none => throw "property not found: languageId"
+    let version : Int ← match _obj.find compare "version" with | some v => fromJson? v | none => throw "property not found: version"
+    let text : String ← match _obj.find compare "text" with | some v => fromJson? v | none => throw "property not found: text"
+    return { uri, languageId, version, text }
 
-structure DidChangeWatchedFilesClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
-  relativePatternSupport : (Option Bool) := none
+/-- The params sent in an open notebook document notification.  @since 3.17.0 -/
+structure DidOpenNotebookDocumentParams where
+  notebookDocument : NotebookDocument
+  cellTextDocuments : (Array TextDocumentItem)
   deriving Inhabited
 
-instance : ToJson DidChangeWatchedFilesClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => []) ++
-    (match s.relativePatternSupport with | some v => [("relativePatternSupport", toJson v)] | none => [])
+instance : ToJson DidOpenNotebookDocumentParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("notebookDocument", toJson s.notebookDocument) :: ("cellTextDocuments", toJson s.cellTextDocuments) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DidChangeWatchedFilesClientCapabilities where
+instance : FromJson DidOpenNotebookDocumentParams where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    let relativePatternSupport := (json.getObjValAs? Bool "relativePatternSupport").toOption
-    return { dynamicRegistration, relativePatternSupport }
+    let _obj ← json.getObj?
+    let notebookDocument : NotebookDocument ← match _obj.find compare "notebookDocument" with | some v => fromJson? v | none => throw "property not found: notebookDocument"
+    let cellTextDocuments : (Array TextDocumentItem) ← match _obj.find compare "cellTextDocuments" with | some v => fromJson? v | none => throw "property not found: cellTextDocuments"
+    return { notebookDocument, cellTextDocuments }
 
-/-- The client capabilities of a {@link ExecuteCommandRequest}. -/
-structure ExecuteCommandClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
+/-- Registration options specific to a notebook.  @since 3.17.0 -/
+structure NotebookDocumentSyncRegistrationOptions where
+  notebookSelector : Json
+  save : (Option Bool) := none
+  id : (Option String) := none
   deriving Inhabited
 
-instance : ToJson ExecuteCommandClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => [])
+instance : ToJson NotebookDocumentSyncRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.id with | some v => ("id", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.save with | some v => ("save", toJson v) :: kvs | none => kvs)
+    let kvs := ("notebookSelector", toJson s.notebookSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ExecuteCommandClientCapabilities where
+instance : FromJson NotebookDocumentSyncRegistrationOptions where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    return { dynamicRegistration }
+    let _obj ← json.getObj?
+    let notebookSelector : Json := (_obj.find compare "notebookSelector").getD Json.null
+    let save : Option Bool := (_obj.find compare "save").bind fun v => (fromJson? v).toOption
+    let id : Option String := (_obj.find compare "id").bind fun v => (fromJson? v).toOption
+    return { notebookSelector, save, id }
 
-/-- @since 3.16.0 -/
-structure SemanticTokensWorkspaceClientCapabilities where
-  refreshSupport : (Option Bool) := none
+/-- A change describing how to move a `NotebookCell` array from state S to S'.  @since 3.17.0 -/
+structure NotebookCellArrayChange where
+  start : Nat
+  deleteCount : Nat
+  cells : (Option (Array NotebookCell)) := none
   deriving Inhabited
 
-instance : ToJson SemanticTokensWorkspaceClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.refreshSupport with | some v => [("refreshSupport", toJson v)] | none => [])
+instance : ToJson NotebookCellArrayChange where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.cells with | some v => ("cells", toJson v) :: kvs | none => kvs)
+    let kvs := ("start", toJson s.start) :: ("deleteCount", toJson s.deleteCount) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson SemanticTokensWorkspaceClientCapabilities where
+instance : FromJson NotebookCellArrayChange where
   fromJson? json := do
-    let refreshSupport := (json.getObjValAs? Bool "refreshSupport").toOption
-    return { refreshSupport }
+    let _obj ← json.getObj?
+    let start : Nat ← match _obj.find compare "start" with | some v => fromJson? v | none => throw "property not found: start"
+    let deleteCount : Nat ← match _obj.find compare "deleteCount" with | some v => fromJson? v | none => throw "property not found: deleteCount"
+    let cells : Option (Array NotebookCell) := (_obj.find compare "cells").bind fun v => (fromJson? v).toOption
+    return { start, deleteCount, cells }
 
-/-- @since 3.16.0 -/
-structure CodeLensWorkspaceClientCapabilities where
-  refreshSupport : (Option Bool) := none
+/-- Structural changes to cells in a notebook document.  @since 3.18.0 -/
+structure NotebookDocumentCellChangeStructure where
+  array : NotebookCellArrayChange
+  didOpen : (Option (Array TextDocumentItem)) := none
+  didClose : (Option (Array TextDocumentIdentifier)) := none
   deriving Inhabited
 
-instance : ToJson CodeLensWorkspaceClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.refreshSupport with | some v => [("refreshSupport", toJson v)] | none => [])
+instance : ToJson NotebookDocumentCellChangeStructure where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.didClose with | some v => ("didClose", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.didOpen with | some v => ("didOpen", toJson v) :: kvs | none => kvs)
+    let kvs := ("array", toJson s.array) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson CodeLensWorkspaceClientCapabilities where
+instance : FromJson NotebookDocumentCellChangeStructure where
   fromJson? json := do
-    let refreshSupport := (json.getObjValAs? Bool "refreshSupport").toOption
-    return { refreshSupport }
+    let _obj ← json.getObj?
+    let array : NotebookCellArrayChange ← match _obj.find compare "array" with | some v => fromJson? v | none => throw "property not found: array"
+    let didOpen : Option (Array TextDocumentItem) := (_obj.find compare "didOpen").bind fun v => (fromJson? v).toOption
+    let didClose : Option (Array TextDocumentIdentifier) := (_obj.find compare "didClose").bind fun v => (fromJson? v).toOption
+    return { array, didOpen, didClose }
 
-/-- Capabilities relating to events from file operations by the user in the client.  These events do not come from the file system, they come from user operations like renaming a file in the UI.  @since 3.16.0 -/
-structure FileOperationClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
-  didCreate : (Option Bool) := none
-  willCreate : (Option Bool) := none
-  didRename : (Option Bool) := none
-  willRename : (Option Bool) := none
-  didDelete : (Option Bool) := none
-  willDelete : (Option Bool) := none
+/-- A text document identifier to denote a specific version of a text document. -/
+structure VersionedTextDocumentIdentifier where
+  uri : String
+  version : Int
   deriving Inhabited
 
-instance : ToJson FileOperationClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => []) ++
-    (match s.didCreate with | some v => [("didCreate", toJson v)] | none => []) ++
-    (match s.willCreate with | some v => [("willCreate", toJson v)] | none => []) ++
-    (match s.didRename with | some v => [("didRename", toJson v)] | none => []) ++
-    (match s.willRename with | some v => [("willRename", toJson v)] | none => []) ++
-    (match s.didDelete with | some v => [("didDelete", toJson v)] | none => []) ++
-    (match s.willDelete with | some v => [("willDelete", toJson v)] | none => [])
+instance : ToJson VersionedTextDocumentIdentifier where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("uri", toJson s.uri) :: ("version", toJson s.version) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson FileOperationClientCapabilities where
+instance : FromJson VersionedTextDocumentIdentifier where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    let didCreate := (json.getObjValAs? Bool "didCreate").toOption
-    let willCreate := (json.getObjValAs? Bool "willCreate").toOption
-    let didRename := (json.getObjValAs? Bool "didRename").toOption
-    let willRename := (json.getObjValAs? Bool "willRename").toOption
-    let didDelete := (json.getObjValAs? Bool "didDelete").toOption
-    let willDelete := (json.getObjValAs? Bool "willDelete").toOption
-    return { dynamicRegistration, didCreate, willCreate, didRename, willRename, didDelete, willDelete }
+    let _obj ← json.getObj?
+    let uri : String ← match _obj.find compare "uri" with | some v => fromJson? v | none => throw "property not found: uri"
+    let version : Int ← match _obj.find compare "version" with | some v => fromJson? v | none => throw "property not found: version"
+    return { uri, version }
 
-/-- Client workspace capabilities specific to inline values.  @since 3.17.0 -/
-structure InlineValueWorkspaceClientCapabilities where
-  refreshSupport : (Option Bool) := none
+/-- Content changes to a cell in a notebook document.  @since 3.18.0 -/
+structure NotebookDocumentCellContentChanges where
+  document : VersionedTextDocumentIdentifier
+  changes : (Array TextDocumentContentChangeEvent)
   deriving Inhabited
 
-instance : ToJson InlineValueWorkspaceClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.refreshSupport with | some v => [("refreshSupport", toJson v)] | none => [])
+instance : ToJson NotebookDocumentCellContentChanges where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("document", toJson s.document) :: ("changes", toJson s.changes) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson InlineValueWorkspaceClientCapabilities where
+instance : FromJson NotebookDocumentCellContentChanges where
   fromJson? json := do
-    let refreshSupport := (json.getObjValAs? Bool "refreshSupport").toOption
-    return { refreshSupport }
+    let _obj ← json.getObj?
+    let document : VersionedTextDocumentIdentifier ← match _obj.find compare "document" with | some v => fromJson? v | none => throw "property not found: document"
+    let changes : (Array TextDocumentContentChangeEvent) ← match _obj.find compare "changes" with | some v => fromJson? v | none => throw "property not found: changes"
+    return { document, changes }
 
-/-- Client workspace capabilities specific to inlay hints.  @since 3.17.0 -/
-structure InlayHintWorkspaceClientCapabilities where
-  refreshSupport : (Option Bool) := none
+/-- Cell changes to a notebook document.  @since 3.18.0 -/
+structure NotebookDocumentCellChanges where
+  «structure» : (Option NotebookDocumentCellChangeStructure) := none
+  data : (Option (Array NotebookCell)) := none
+  textContent : (Option (Array NotebookDocumentCellContentChanges)) := none
   deriving Inhabited
 
-instance : ToJson InlayHintWorkspaceClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.refreshSupport with | some v => [("refreshSupport", toJson v)] | none => [])
+instance : ToJson NotebookDocumentCellChanges where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.textContent with | some v => ("textContent", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.data with | some v => ("data", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.«structure» with | some v => ("structure", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson InlayHintWorkspaceClientCapabilities where
+instance : FromJson NotebookDocumentCellChanges where
   fromJson? json := do
-    let refreshSupport := (json.getObjValAs? Bool "refreshSupport").toOption
-    return { refreshSupport }
+    let _obj ← json.getObj?
+    let «structure» : Option NotebookDocumentCellChangeStructure := (_obj.find compare "structure").bind fun v => (fromJson? v).toOption
+    let data : Option (Array NotebookCell) := (_obj.find compare "data").bind fun v => (fromJson? v).toOption
+    let textContent : Option (Array NotebookDocumentCellContentChanges) := (_obj.find compare "textContent").bind fun v => (fromJson? v).toOption
+    return { «structure», data, textContent }
 
-/-- Workspace client capabilities specific to diagnostic pull requests.  @since 3.17.0 -/
-structure DiagnosticWorkspaceClientCapabilities where
-  refreshSupport : (Option Bool) := none
+/-- A change event for a notebook document.  @since 3.17.0 -/
+structure NotebookDocumentChangeEvent where
+  metadata : Json := Json.null
+  cells : (Option NotebookDocumentCellChanges) := none
   deriving Inhabited
 
-instance : ToJson DiagnosticWorkspaceClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.refreshSupport with | some v => [("refreshSupport", toJson v)] | none => [])
+instance : ToJson NotebookDocumentChangeEvent where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.cells with | some v => ("cells", toJson v) :: kvs | none => kvs)
+    let kvs := ("metadata", toJson s.metadata) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DiagnosticWorkspaceClientCapabilities where
+instance : FromJson NotebookDocumentChangeEvent where
   fromJson? json := do
-    let refreshSupport := (json.getObjValAs? Bool "refreshSupport").toOption
-    return { refreshSupport }
+    let _obj ← json.getObj?
+    let metadata : Json := (_obj.find compare "metadata").getD Json.null
+    let cells : Option NotebookDocumentCellChanges := (_obj.find compare "cells").bind fun v => (fromJson? v).toOption
+    return { metadata, cells }
 
-structure TextDocumentSyncClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
-  willSave : (Option Bool) := none
-  willSaveWaitUntil : (Option Bool) := none
-  didSave : (Option Bool) := none
+/-- A versioned notebook document identifier.  @since 3.17.0 -/
+structure VersionedNotebookDocumentIdentifier where
+  version : Int
+  uri : String
   deriving Inhabited
 
-instance : ToJson TextDocumentSyncClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => []) ++
-    (match s.willSave with | some v => [("willSave", toJson v)] | none => []) ++
-    (match s.willSaveWaitUntil with | some v => [("willSaveWaitUntil", toJson v)] | none => []) ++
-    (match s.didSave with | some v => [("didSave", toJson v)] | none => [])
+instance : ToJson VersionedNotebookDocumentIdentifier where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("version", toJson s.version) :: ("uri", toJson s.uri) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson TextDocumentSyncClientCapabilities where
+instance : FromJson VersionedNotebookDocumentIdentifier where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    let willSave := (json.getObjValAs? Bool "willSave").toOption
-    let willSaveWaitUntil := (json.getObjValAs? Bool "willSaveWaitUntil").toOption
-    let didSave := (json.getObjValAs? Bool "didSave").toOption
-    return { dynamicRegistration, willSave, willSaveWaitUntil, didSave }
+    let _obj ← json.getObj?
+    let version : Int ← match _obj.find compare "version" with | some v => fromJson? v | none => throw "property not found: version"
+    let uri : String ← match _obj.find compare "uri" with | some v => fromJson? v | none => throw "property not found: uri"
+    return { version, uri }
 
-structure TextDocumentFilterClientCapabilities where
-  relativePatternSupport : (Option Bool) := none
+/-- The params sent in a change notebook document notification.  @since 3.17.0 -/
+structure DidChangeNotebookDocumentParams where
+  notebookDocument : VersionedNotebookDocumentIdentifier
+  change : NotebookDocumentChangeEvent
   deriving Inhabited
 
-instance : ToJson TextDocumentFilterClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.relativePatternSupport with | some v => [("relativePatternSupport", toJson v)] | none => [])
+instance : ToJson DidChangeNotebookDocumentParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("notebookDocument", toJson s.notebookDocument) :: ("change", toJson s.change) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson TextDocumentFilterClientCapabilities where
+instance : FromJson DidChangeNotebookDocumentParams where
   fromJson? json := do
-    let relativePatternSupport := (json.getObjValAs? Bool "relativePatternSupport").toOption
-    return { relativePatternSupport }
+    let _obj ← json.getObj?
+    let notebookDocument : VersionedNotebookDocumentIdentifier ← match _obj.find compare "notebookDocument" with | some v => fromJson? v | none => throw "property not found: notebookDocument"
+    let change : NotebookDocumentChangeEvent ← match _obj.find compare "change" with | some v => fromJson? v | none => throw "property not found: change"
+    return { notebookDocument, change }
 
-structure HoverClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
-  contentFormat : (Option (Array MarkupKind)) := none
+/-- A literal to identify a notebook document in the client.  @since 3.17.0 -/
+structure NotebookDocumentIdentifier where
+  uri : String
   deriving Inhabited
 
-instance : ToJson HoverClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => []) ++
-    (match s.contentFormat with | some v => [("contentFormat", toJson v)] | none => [])
+instance : ToJson NotebookDocumentIdentifier where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("uri", toJson s.uri) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson HoverClientCapabilities where
+instance : FromJson NotebookDocumentIdentifier where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    let contentFormat := (json.getObjValAs? (Array MarkupKind) "contentFormat").toOption
-    return { dynamicRegistration, contentFormat }
+    let _obj ← json.getObj?
+    let uri : String ← match _obj.find compare "uri" with | some v => fromJson? v | none => throw "property not found: uri"
+    return { uri }
 
-/-- @since 3.14.0 -/
-structure DeclarationClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
-  linkSupport : (Option Bool) := none
+/-- The params sent in a save notebook document notification.  @since 3.17.0 -/
+structure DidSaveNotebookDocumentParams where
+  notebookDocument : NotebookDocumentIdentifier
   deriving Inhabited
 
-instance : ToJson DeclarationClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => []) ++
-    (match s.linkSupport with | some v => [("linkSupport", toJson v)] | none => [])
+instance : ToJson DidSaveNotebookDocumentParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("notebookDocument", toJson s.notebookDocument) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DeclarationClientCapabilities where
+instance : FromJson DidSaveNotebookDocumentParams where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    let linkSupport := (json.getObjValAs? Bool "linkSupport").toOption
-    return { dynamicRegistration, linkSupport }
+    let _obj ← json.getObj?
+    let notebookDocument : NotebookDocumentIdentifier ← match _obj.find compare "notebookDocument" with | some v => fromJson? v | none => throw "property not found: notebookDocument"
+    return { notebookDocument }
 
-/-- Client Capabilities for a {@link DefinitionRequest}. -/
-structure DefinitionClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
-  linkSupport : (Option Bool) := none
+/-- The params sent in a close notebook document notification.  @since 3.17.0 -/
+structure DidCloseNotebookDocumentParams where
+  notebookDocument : NotebookDocumentIdentifier
+  cellTextDocuments : (Array TextDocumentIdentifier)
   deriving Inhabited
 
-instance : ToJson DefinitionClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => []) ++
-    (match s.linkSupport with | some v => [("linkSupport", toJson v)] | none => [])
+instance : ToJson DidCloseNotebookDocumentParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("notebookDocument", toJson s.notebookDocument) :: ("cellTextDocuments", toJson s.cellTextDocuments) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DefinitionClientCapabilities where
+instance : FromJson DidCloseNotebookDocumentParams where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    let linkSupport := (json.getObjValAs? Bool "linkSupport").toOption
-    return { dynamicRegistration, linkSupport }
+    let _obj ← json.getObj?
+    let notebookDocument : NotebookDocumentIdentifier ← match _obj.find compare "notebookDocument" with | some v => fromJson? v | none => throw "property not found: notebookDocument"
+    let cellTextDocuments : (Array TextDocumentIdentifier) ← match _obj.find compare "cellTextDocuments" with | some v => fromJson? v | none => throw "property not found: cellTextDocuments"
+    return { notebookDocument, cellTextDocuments }
 
-/-- Since 3.6.0 -/
-structure TypeDefinitionClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
-  linkSupport : (Option Bool) := none
+/-- General parameters to register for a notification or to register a provider. -/
+structure Registration where
+  id : String
+  method : String
+  registerOptions : Json := Json.null
   deriving Inhabited
 
-instance : ToJson TypeDefinitionClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => []) ++
-    (match s.linkSupport with | some v => [("linkSupport", toJson v)] | none => [])
+instance : ToJson Registration where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("id", toJson s.id) :: ("method", toJson s.method) :: ("registerOptions", toJson s.registerOptions) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson TypeDefinitionClientCapabilities where
+instance : FromJson Registration where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    let linkSupport := (json.getObjValAs? Bool "linkSupport").toOption
-    return { dynamicRegistration, linkSupport }
+    let _obj ← json.getObj?
+    let id : String ← match _obj.find compare "id" with | some v => fromJson? v | none => throw "property not found: id"
+    let method : String ← match _obj.find compare "method" with | some v => fromJson? v | none => throw "property not found: method"
+    let registerOptions : Json := (_obj.find compare "registerOptions").getD Json.null
+    return { id, method, registerOptions }
 
-/-- @since 3.6.0 -/
-structure ImplementationClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
-  linkSupport : (Option Bool) := none
+structure RegistrationParams where
+  registrations : (Array Registration)
   deriving Inhabited
 
-instance : ToJson ImplementationClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => []) ++
-    (match s.linkSupport with | some v => [("linkSupport", toJson v)] | none => [])
+instance : ToJson RegistrationParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("registrations", toJson s.registrations) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ImplementationClientCapabilities where
+instance : FromJson RegistrationParams where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    let linkSupport := (json.getObjValAs? Bool "linkSupport").toOption
-    return { dynamicRegistration, linkSupport }
+    let _obj ← json.getObj?
+    let registrations : (Array Registration) ← match _obj.find compare "registrations" with | some v => fromJson? v | none => throw "property not found: registrations"
+    return { registrations }
 
-/-- Client Capabilities for a {@link ReferencesRequest}. -/
-structure ReferenceClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
+/-- General parameters to unregister a request or notification. -/
+structure Unregistration where
+  id : String
+  method : String
   deriving Inhabited
 
-instance : ToJson ReferenceClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => [])
+instance : ToJson Unregistration where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("id", toJson s.id) :: ("method", toJson s.method) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ReferenceClientCapabilities where
+instance : FromJson Unregistration where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    return { dynamicRegistration }
+    let _obj ← json.getObj?
+    let id : String ← match _obj.find compare "id" with | some v => fromJson? v | none => throw "property not found: id"
+    let method : String ← match _obj.find compare "method" with | some v => fromJson? v | none => throw "property not found: method"
+    return { id, method }
 
-/-- Client Capabilities for a {@link DocumentHighlightRequest}. -/
-structure DocumentHighlightClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
+structure UnregistrationParams where
+  unregisterations : (Array Unregistration)
   deriving Inhabited
 
-instance : ToJson DocumentHighlightClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => [])
+instance : ToJson UnregistrationParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("unregisterations", toJson s.unregisterations) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DocumentHighlightClientCapabilities where
+instance : FromJson UnregistrationParams where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    return { dynamicRegistration }
+    let _obj ← json.getObj?
+    let unregisterations : (Array Unregistration) ← match _obj.find compare "unregisterations" with | some v => fromJson? v | none => throw "property not found: unregisterations"
+    return { unregisterations }
 
-/-- The client capabilities of a {@link DocumentLinkRequest}. -/
-structure DocumentLinkClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
-  tooltipSupport : (Option Bool) := none
+/-- Information about the client  @since 3.15.0 @since 3.18.0 ClientInfo type name added. -/
+structure ClientInfo where
+  name : String
+  version : (Option String) := none
   deriving Inhabited
 
-instance : ToJson DocumentLinkClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => []) ++
-    (match s.tooltipSupport with | some v => [("tooltipSupport", toJson v)] | none => [])
+instance : ToJson ClientInfo where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.version with | some v => ("version", toJson v) :: kvs | none => kvs)
+    let kvs := ("name", toJson s.name) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DocumentLinkClientCapabilities where
+instance : FromJson ClientInfo where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    let tooltipSupport := (json.getObjValAs? Bool "tooltipSupport").toOption
-    return { dynamicRegistration, tooltipSupport }
+    let _obj ← json.getObj?
+    let name : String ← match _obj.find compare "name" with | some v => fromJson? v | none => throw "property not found: name"
+    let version : Option String := (_obj.find compare "version").bind fun v => (fromJson? v).toOption
+    return { name, version }
 
-structure DocumentColorClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
+structure InitializeParams where
+  processId : (Option Int)
+  clientInfo : (Option ClientInfo) := none
+  locale : (Option String) := none
+  rootPath : (Option String) := none
+  rootUri : (Option String)
+  capabilities : Json
+  initializationOptions : Json := Json.null
+  trace : (Option TraceValue) := none
+  workspaceFolders : (Option (Array WorkspaceFolder)) := none
   deriving Inhabited
 
-instance : ToJson DocumentColorClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => [])
+instance : ToJson InitializeParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.workspaceFolders with | some v => ("workspaceFolders", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.trace with | some v => ("trace", toJson v) :: kvs | none => kvs)
+    let kvs := ("rootUri", toJson s.rootUri) :: ("capabilities", toJson s.capabilities) :: ("initializationOptions", toJson s.initializationOptions) :: kvs
+    let kvs := (match s.rootPath with | some v => ("rootPath", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.locale with | some v => ("locale", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.clientInfo with | some v => ("clientInfo", toJson v) :: kvs | none => kvs)
+    let kvs := ("processId", toJson s.processId) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DocumentColorClientCapabilities where
+instance : FromJson InitializeParams where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    return { dynamicRegistration }
+    let _obj ← json.getObj?
+    let processId : (Option Int) ← match _obj.find compare "processId" with | some v => fromJson? v | none => throw "property not found: processId"
+    let clientInfo : Option ClientInfo := (_obj.find compare "clientInfo").bind fun v => (fromJson? v).toOption
+    let locale : Option String := (_obj.find compare "locale").bind fun v => (fromJson? v).toOption
+    let rootPath : Option String := (_obj.find compare "rootPath").bind fun v => (fromJson? v).toOption
+    let rootUri : (Option String) ← match _obj.find compare "rootUri" with | some v => fromJson? v | none => throw "property not found: rootUri"
+    let capabilities : Json := (_obj.find compare "capabilities").getD Json.null
+    let initializationOptions : Json := (_obj.find compare "initializationOptions").getD Json.null
+    let trace : Option TraceValue := (_obj.find compare "trace").bind fun v => (fromJson? v).toOption
+    let workspaceFolders : Option (Array WorkspaceFolder) := (_obj.find compare "workspaceFolders").bind fun v => (fromJson? v).toOption
+    return { processId, clientInfo, locale, rootPath, rootUri, capabilities, initializationOptions, trace, workspaceFolders }
 
-/-- Client capabilities of a {@link DocumentFormattingRequest}. -/
-structure DocumentFormattingClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
+/-- Code Lens provider options of a {@link CodeLensRequest}. -/
+structure CodeLensOptions where
+  workDoneProgress : (Option Bool) := none
+  resolveProvider : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson DocumentFormattingClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => [])
+instance : ToJson CodeLensOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.resolveProvider with | some v => ("resolveProvider", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson DocumentFormattingClientCapabilities where
+instance : FromJson CodeLensOptions where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    return { dynamicRegistration }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    let resolveProvider : Option Bool := (_obj.find compare "resolveProvider").bind fun v => (fromJson? v).toOption
+    return { workDoneProgress, resolveProvider }
 
-/-- Client capabilities of a {@link DocumentRangeFormattingRequest}. -/
-structure DocumentRangeFormattingClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
-  rangesSupport : (Option Bool) := none
+/-- @since 3.18.0 -/
+structure ServerCompletionItemOptions where
+  labelDetailsSupport : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson DocumentRangeFormattingClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => []) ++
-    (match s.rangesSupport with | some v => [("rangesSupport", toJson v)] | none => [])
+instance : ToJson ServerCompletionItemOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.labelDetailsSupport with | some v => ("labelDetailsSupport", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson DocumentRangeFormattingClientCapabilities where
+instance : FromJson ServerCompletionItemOptions where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    let rangesSupport := (json.getObjValAs? Bool "rangesSupport").toOption
-    return { dynamicRegistration, rangesSupport }
+    let _obj ← json.getObj?
+    let labelDetailsSupport : Option Bool := (_obj.find compare "labelDetailsSupport").bind fun v => (fromJson? v).toOption
+    return { labelDetailsSupport }
 
-/-- Client capabilities of a {@link DocumentOnTypeFormattingRequest}. -/
-structure DocumentOnTypeFormattingClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
+/-- Completion options. -/
+structure CompletionOptions where
+  workDoneProgress : (Option Bool) := none
+  triggerCharacters : (Option (Array String)) := none
+  allCommitCharacters : (Option (Array String)) := none
+  resolveProvider : (Option Bool) := none
+  completionItem : (Option ServerCompletionItemOptions) := none
   deriving Inhabited
 
-instance : ToJson DocumentOnTypeFormattingClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => [])
+instance : ToJson CompletionOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.completionItem with | some v => ("completionItem", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.resolveProvider with | some v => ("resolveProvider", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.allCommitCharacters with | some v => ("allCommitCharacters", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.triggerCharacters with | some v => ("triggerCharacters", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson DocumentOnTypeFormattingClientCapabilities where
+instance : FromJson CompletionOptions where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    return { dynamicRegistration }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    let triggerCharacters : Option (Array String) := (_obj.find compare "triggerCharacters").bind fun v => (fromJson? v).toOption
+    let allCommitCharacters : Option (Array String) := (_obj.find compare "allCommitCharacters").bind fun v => (fromJson? v).toOption
+    let resolveProvider : Option Bool := (_obj.find compare "resolveProvider").bind fun v => (fromJson? v).toOption
+    let completionItem : Option ServerCompletionItemOptions := (_obj.find compare "completionItem").bind fun v => (fromJson? v).toOption
+    return { workDoneProgress, triggerCharacters, allCommitCharacters, resolveProvider, completionItem }
 
-structure RenameClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
-  prepareSupport : (Option Bool) := none
-  prepareSupportDefaultBehavior : (Option PrepareSupportDefaultBehavior) := none
-  honorsChangeAnnotations : (Option Bool) := none
+/-- Provider options for a {@link DocumentLinkRequest}. -/
+structure DocumentLinkOptions where
+  workDoneProgress : (Option Bool) := none
+  resolveProvider : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson RenameClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => []) ++
-    (match s.prepareSupport with | some v => [("prepareSupport", toJson v)] | none => []) ++
-    (match s.prepareSupportDefaultBehavior with | some v => [("prepareSupportDefaultBehavior", toJson v)] | none => []) ++
-    (match s.honorsChangeAnnotations with | some v => [("honorsChangeAnnotations", toJson v)] | none => [])
+instance : ToJson DocumentLinkOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.resolveProvider with | some v => ("resolveProvider", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson RenameClientCapabilities where
+instance : FromJson DocumentLinkOptions where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    let prepareSupport := (json.getObjValAs? Bool "prepareSupport").toOption
-    let prepareSupportDefaultBehavior := (json.getObjValAs? PrepareSupportDefaultBehavior "prepareSupportDefaultBehavior").toOption
-    let honorsChangeAnnotations := (json.getObjValAs? Bool "honorsChangeAnnotations").toOption
-    return { dynamicRegistration, prepareSupport, prepareSupportDefaultBehavior, honorsChangeAnnotations }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    let resolveProvider : Option Bool := (_obj.find compare "resolveProvider").bind fun v => (fromJson? v).toOption
+    return { workDoneProgress, resolveProvider }
 
-structure SelectionRangeClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
+/-- Provider options for a {@link DocumentOnTypeFormattingRequest}. -/
+structure DocumentOnTypeFormattingOptions where
+  firstTriggerCharacter : String
+  moreTriggerCharacter : (Option (Array String)) := none
   deriving Inhabited
 
-instance : ToJson SelectionRangeClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => [])
+instance : ToJson DocumentOnTypeFormattingOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.moreTriggerCharacter with | some v => ("moreTriggerCharacter", toJson v) :: kvs | none => kvs)
+    let kvs := ("firstTriggerCharacter", toJson s.firstTriggerCharacter) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson SelectionRangeClientCapabilities where
+instance : FromJson DocumentOnTypeFormattingOptions where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    return { dynamicRegistration }
+    let _obj ← json.getObj?
+    let firstTriggerCharacter : String ← match _obj.find compare "firstTriggerCharacter" with | some v => fromJson? v | none => throw "property not found: firstTriggerCharacter"
+    let moreTriggerCharacter : Option (Array String) := (_obj.find compare "moreTriggerCharacter").bind fun v => (fromJson? v).toOption
+    return { firstTriggerCharacter, moreTriggerCharacter }
 
-/-- @since 3.16.0 -/
-structure CallHierarchyClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
+/-- The server capabilities of a {@link ExecuteCommandRequest}. -/
+structure ExecuteCommandOptions where
+  workDoneProgress : (Option Bool) := none
+  commands : (Array String)
   deriving Inhabited
 
-instance : ToJson CallHierarchyClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => [])
+instance : ToJson ExecuteCommandOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("commands", toJson s.commands) :: kvs
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson CallHierarchyClientCapabilities where
+instance : FromJson ExecuteCommandOptions where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    return { dynamicRegistration }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    let commands : (Array String) ← match _obj.find compare "commands" with | some v => fromJson? v | none => throw "property not found: commands"
+    return { workDoneProgress, commands }
 
-/-- Client capabilities for the linked editing range request.  @since 3.16.0 -/
-structure LinkedEditingRangeClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
+/-- Server Capabilities for a {@link SignatureHelpRequest}. -/
+structure SignatureHelpOptions where
+  workDoneProgress : (Option Bool) := none
+  triggerCharacters : (Option (Array String)) := none
+  retriggerCharacters : (Option (Array String)) := none
   deriving Inhabited
 
-instance : ToJson LinkedEditingRangeClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => [])
+instance : ToJson SignatureHelpOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.retriggerCharacters with | some v => ("retriggerCharacters", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.triggerCharacters with | some v => ("triggerCharacters", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson LinkedEditingRangeClientCapabilities where
+instance : FromJson SignatureHelpOptions where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    return { dynamicRegistration }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    let triggerCharacters : Option (Array String) := (_obj.find compare "triggerCharacters").bind fun v => (fromJson? v).toOption
+    let retriggerCharacters : Option (Array String) := (_obj.find compare "retriggerCharacters").bind fun v => (fromJson? v).toOption
+    return { workDoneProgress, triggerCharacters, retriggerCharacters }
 
-/-- Client capabilities specific to the moniker request.  @since 3.16.0 -/
-structure MonikerClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
+/-- Options for notifications/requests for user operations on files.  @since 3.16.0 -/
+structure FileOperationOptions where
+  didCreate : (Option FileOperationRegistrationOptions) := none
+  willCreate : (Option FileOperationRegistrationOptions) := none
+  didRename : (Option FileOperationRegistrationOptions) := none
+  willRename : (Option FileOperationRegistrationOptions) := none
+  didDelete : (Option FileOperationRegistrationOptions) := none
+  willDelete : (Option FileOperationRegistrationOptions) := none
   deriving Inhabited
 
-instance : ToJson MonikerClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => [])
+instance : ToJson FileOperationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.willDelete with | some v => ("willDelete", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.didDelete with | some v => ("didDelete", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.willRename with | some v => ("willRename", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.didRename with | some v => ("didRename", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.willCreate with | some v => ("willCreate", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.didCreate with | some v => ("didCreate", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson MonikerClientCapabilities where
+instance : FromJson FileOperationOptions where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    return { dynamicRegistration }
+    let _obj ← json.getObj?
+    let didCreate : Option FileOperationRegistrationOptions := (_obj.find compare "didCreate").bind fun v => (fromJson? v).toOption
+    let willCreate : Option FileOperationRegistrationOptions := (_obj.find compare "willCreate").bind fun v => (fromJson? v).toOption
+    let didRename : Option FileOperationRegistrationOptions := (_obj.find compare "didRename").bind fun v => (fromJson? v).toOption
+    let willRename : Option FileOperationRegistrationOptions := (_obj.find compare "willRename").bind fun v => (fromJson? v).toOption
+    let didDelete : Option FileOperationRegistrationOptions := (_obj.find compare "didDelete").bind fun v => (fromJson? v).toOption
+    let willDelete : Option FileOperationRegistrationOptions := (_obj.find compare "willDelete").bind fun v => (fromJson? v).toOption
+    return { didCreate, willCreate, didRename, willRename, didDelete, willDelete }
 
-/-- @since 3.17.0 -/
-structure TypeHierarchyClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
+structure WorkspaceFoldersServerCapabilities where
+  supported : (Option Bool) := none
+  changeNotifications : Json := Json.null
   deriving Inhabited
 
-instance : ToJson TypeHierarchyClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => [])
+instance : ToJson WorkspaceFoldersServerCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("changeNotifications", toJson s.changeNotifications) :: kvs
+    let kvs := (match s.supported with | some v => ("supported", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson TypeHierarchyClientCapabilities where
+instance : FromJson WorkspaceFoldersServerCapabilities where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    return { dynamicRegistration }
+    let _obj ← json.getObj?
+    let supported : Option Bool := (_obj.find compare "supported").bind fun v => (fromJson? v).toOption
+    let changeNotifications : Json := (_obj.find compare "changeNotifications").getD Json.null
+    return { supported, changeNotifications }
 
-/-- Client capabilities specific to inline values.  @since 3.17.0 -/
-structure InlineValueClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
+/-- Defines workspace specific capabilities of the server.  @since 3.18.0 -/
+structure WorkspaceOptions where
+  workspaceFolders : (Option WorkspaceFoldersServerCapabilities) := none
+  fileOperations : (Option FileOperationOptions) := none
+  textDocumentContent : Json := Json.null
   deriving Inhabited
 
-instance : ToJson InlineValueClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => [])
+instance : ToJson WorkspaceOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("textDocumentContent", toJson s.textDocumentContent) :: kvs
+    let kvs := (match s.fileOperations with | some v => ("fileOperations", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workspaceFolders with | some v => ("workspaceFolders", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson InlineValueClientCapabilities where
+instance : FromJson WorkspaceOptions where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    return { dynamicRegistration }
+    let _obj ← json.getObj?
+    let workspaceFolders : Option WorkspaceFoldersServerCapabilities := (_obj.find compare "workspaceFolders").bind fun v => (fromJson? v).toOption
+    let fileOperations : Option FileOperationOptions := (_obj.find compare "fileOperations").bind fun v => (fromJson? v).toOption
+    let textDocumentContent : Json := (_obj.find compare "textDocumentContent").getD Json.null
+    return { workspaceFolders, fileOperations, textDocumentContent }
 
-/-- Notebook specific client capabilities.  @since 3.17.0 -/
-structure NotebookDocumentSyncClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
-  executionSummarySupport : (Option Bool) := none
+/-- Defines the capabilities provided by a language server. -/
+structure ServerCapabilities where
+  positionEncoding : (Option PositionEncodingKind) := none
+  textDocumentSync : Json := Json.null
+  notebookDocumentSync : Json := Json.null
+  completionProvider : (Option CompletionOptions) := none
+  hoverProvider : Json := Json.null
+  signatureHelpProvider : (Option SignatureHelpOptions) := none
+  declarationProvider : Json := Json.null
+  definitionProvider : Json := Json.null
+  typeDefinitionProvider : Json := Json.null
+  implementationProvider : Json := Json.null
+  referencesProvider : Json := Json.null
+  documentHighlightProvider : Json := Json.null
+  documentSymbolProvider : Json := Json.null
+  codeActionProvider : Json := Json.null
+  codeLensProvider : (Option CodeLensOptions) := none
+  documentLinkProvider : (Option DocumentLinkOptions) := none
+  colorProvider : Json := Json.null
+  workspaceSymbolProvider : Json := Json.null
+  documentFormattingProvider : Json := Json.null
+  documentRangeFormattingProvider : Json := Json.null
+  documentOnTypeFormattingProvider : (Option DocumentOnTypeFormattingOptions) := none
+  renameProvider : Json := Json.null
+  foldingRangeProvider : Json := Json.null
+  selectionRangeProvider : Json := Json.null
+  executeCommandProvider : (Option ExecuteCommandOptions) := none
+  callHierarchyProvider : Json := Json.null
+  linkedEditingRangeProvider : Json := Json.null
+  semanticTokensProvider : Json := Json.null
+  monikerProvider : Json := Json.null
+  typeHierarchyProvider : Json := Json.null
+  inlineValueProvider : Json := Json.null
+  inlayHintProvider : Json := Json.null
+  diagnosticProvider : Json := Json.null
+  inlineCompletionProvider : Json := Json.null
+  workspace : (Option WorkspaceOptions) := none
+  experimental : Json := Json.null
   deriving Inhabited
 
-instance : ToJson NotebookDocumentSyncClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => []) ++
-    (match s.executionSummarySupport with | some v => [("executionSummarySupport", toJson v)] | none => [])
+instance : ToJson ServerCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("experimental", toJson s.experimental) :: kvs
+    let kvs := (match s.workspace with | some v => ("workspace", toJson v) :: kvs | none => kvs)
+    let kvs := ("callHierarchyProvider", toJson s.callHierarchyProvider) :: ("linkedEditingRangeProvider", toJson s.linkedEditingRangeProvider) :: ("semanticTokensProvider", toJson s.semanticTokensProvider) :: ("monikerProvider", toJson s.monikerProvider) :: ("typeHierarchyProvider", toJson s.typeHierarchyProvider) :: ("inlineValueProvider", toJson s.inlineValueProvider) :: ("inlayHintProvider", toJson s.inlayHintProvider) :: ("diagnosticProvider", toJson s.diagnosticProvider) :: ("inlineCompletionProvider", toJson s.inlineCompletionProvider) :: kvs
+    let kvs := (match s.executeCommandProvider with | some v => ("executeCommandProvider", toJson v) :: kvs | none => kvs)
+    let kvs := ("renameProvider", toJson s.renameProvider) :: ("foldingRangeProvider", toJson s.foldingRangeProvider) :: ("selectionRangeProvider", toJson s.selectionRangeProvider) :: kvs
+    let kvs := (match s.documentOnTypeFormattingProvider with | some v => ("documentOnTypeFormattingProvider", toJson v) :: kvs | none => kvs)
+    let kvs := ("colorProvider", toJson s.colorProvider) :: ("workspaceSymbolProvider", toJson s.workspaceSymbolProvider) :: ("documentFormattingProvider", toJson s.documentFormattingProvider) :: ("documentRangeFormattingProvider", toJson s.documentRangeFormattingProvider) :: kvs
+    let kvs := (match s.documentLinkProvider with | some v => ("documentLinkProvider", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.codeLensProvider with | some v => ("codeLensProvider", toJson v) :: kvs | none => kvs)
+    let kvs := ("declarationProvider", toJson s.declarationProvider) :: ("definitionProvider", toJson s.definitionProvider) :: ("typeDefinitionProvider", toJson s.typeDefinitionProvider) :: ("implementationProvider", toJson s.implementationProvider) :: ("referencesProvider", toJson s.referencesProvider) :: ("documentHighlightProvider", toJson s.documentHighlightProvider) :: ("documentSymbolProvider", toJson s.documentSymbolProvider) :: ("codeActionProvider", toJson s.codeActionProvider) :: kvs
+    let kvs := (match s.signatureHelpProvider with | some v => ("signatureHelpProvider", toJson v) :: kvs | none => kvs)
+    let kvs := ("hoverProvider", toJson s.hoverProvider) :: kvs
+    let kvs := (match s.completionProvider with | some v => ("completionProvider", toJson v) :: kvs | none => kvs)
+    let kvs := ("textDocumentSync", toJson s.textDocumentSync) :: ("notebookDocumentSync", toJson s.notebookDocumentSync) :: kvs
+    let kvs := (match s.positionEncoding with | some v => ("positionEncoding", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson NotebookDocumentSyncClientCapabilities where
+instance : FromJson ServerCapabilities where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    let executionSummarySupport := (json.getObjValAs? Bool "executionSummarySupport").toOption
-    return { dynamicRegistration, executionSummarySupport }
+    let _obj ← json.getObj?
+    let positionEncoding : Option PositionEncodingKind := (_obj.find compare "positionEncoding").bind fun v => (fromJson? v).toOption
+    let textDocumentSync : Json := (_obj.find compare "textDocumentSync").getD Json.null
+    let notebookDocumentSync : Json := (_obj.find compare "notebookDocumentSync").getD Json.null
+    let completionProvider : Option CompletionOptions := (_obj.find compare "completionProvider").bind fun v => (fromJson? v).toOption
+    let hoverProvider : Json := (_obj.find compare "hoverProvider").getD Json.null
+    let signatureHelpProvider : Option SignatureHelpOptions := (_obj.find compare "signatureHelpProvider").bind fun v => (fromJson? v).toOption
+    let declarationProvider : Json := (_obj.find compare "declarationProvider").getD Json.null
+    let definitionProvider : Json := (_obj.find compare "definitionProvider").getD Json.null
+    let typeDefinitionProvider : Json := (_obj.find compare "typeDefinitionProvider").getD Json.null
+    let implementationProvider : Json := (_obj.find compare "implementationProvider").getD Json.null
+    let referencesProvider : Json := (_obj.find compare "referencesProvider").getD Json.null
+    let documentHighlightProvider : Json := (_obj.find compare "documentHighlightProvider").getD Json.null
+    let documentSymbolProvider : Json := (_obj.find compare "documentSymbolProvider").getD Json.null
+    let codeActionProvider : Json := (_obj.find compare "codeActionProvider").getD Json.null
+    let codeLensProvider : Option CodeLensOptions := (_obj.find compare "codeLensProvider").bind fun v => (fromJson? v).toOption
+    let documentLinkProvider : Option DocumentLinkOptions := (_obj.find compare "documentLinkProvider").bind fun v => (fromJson? v).toOption
+    let colorProvider : Json := (_obj.find compare "colorProvider").getD Json.null
+    let workspaceSymbolProvider : Json := (_obj.find compare "workspaceSymbolProvider").getD Json.null
+    let documentFormattingProvider : Json := (_obj.find compare "documentFormattingProvider").getD Json.null
+    let documentRangeFormattingProvider : Json := (_obj.find compare "documentRangeFormattingProvider").getD Json.null
+    let documentOnTypeFormattingProvider : Option DocumentOnTypeFormattingOptions := (_obj.find compare "documentOnTypeFormattingProvider").bind fun v => (fromJson? v).toOption
+    let renameProvider : Json := (_obj.find compare "renameProvider").getD Json.null
+    let foldingRangeProvider : Json := (_obj.find compare "foldingRangeProvider").getD Json.null
+    let selectionRangeProvider : Json := (_obj.find compare "selectionRangeProvider").getD Json.null
+    let executeCommandProvider : Option ExecuteCommandOptions := (_obj.find compare "executeCommandProvider").bind fun v => (fromJson? v).toOption
+    let callHierarchyProvider : Json := (_obj.find compare "callHierarchyProvider").getD Json.null
+    let linkedEditingRangeProvider : Json := (_obj.find compare "linkedEditingRangeProvider").getD Json.null
+    let semanticTokensProvider : Json := (_obj.find compare "semanticTokensProvider").getD Json.null
+    let monikerProvider : Json := (_obj.find compare "monikerProvider").getD Json.null
+    let typeHierarchyProvider : Json := (_obj.find compare "typeHierarchyProvider").getD Json.null
+    let inlineValueProvider : Json := (_obj.find compare "inlineValueProvider").getD Json.null
+    let inlayHintProvider : Json := (_obj.find compare "inlayHintProvider").getD Json.null
+    let diagnosticProvider : Json := (_obj.find compare "diagnosticProvider").getD Json.null
+    let inlineCompletionProvider : Json := (_obj.find compare "inlineCompletionProvider").getD Json.null
+    let workspace : Option WorkspaceOptions := (_obj.find compare "workspace").bind fun v => (fromJson? v).toOption
+    let experimental : Json := (_obj.find compare "experimental").getD Json.null
+    return { positionEncoding, textDocumentSync, notebookDocumentSync, completionProvider, hoverProvider, signatureHelpProvider, declarationProvider, definitionProvider, typeDefinitionProvider, implementationProvider, referencesProvider, documentHighlightProvider, documentSymbolProvider, codeActionProvider, codeLensProvider, documentLinkProvider, colorProvider, workspaceSymbolProvider, documentFormattingProvider, documentRangeFormattingProvider, documentOnTypeFormattingProvider, renameProvider, foldingRangeProvider, selectionRangeProvider, executeCommandProvider, callHierarchyProvider, linkedEditingRangeProvider, semanticTokensProvider, monikerProvider, typeHierarchyProvider, inlineValueProvider, inlayHintProvider, diagnosticProvider, inlineCompletionProvider, workspace, experimental }
 
-/-- Client capabilities for the showDocument request.  @since 3.16.0 -/
-structure ShowDocumentClientCapabilities where
-  support : Bool
+/-- Information about the server  @since 3.15.0 @since 3.18.0 ServerInfo type name added. -/
+structure ServerInfo where
+  name : String
+  version : (Option String) := none
   deriving Inhabited
 
-instance : ToJson ShowDocumentClientCapabilities where
-  toJson s := Json.mkObj <|
-    [("support", toJson s.support)]
+instance : ToJson ServerInfo where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.version with | some v => ("version", toJson v) :: kvs | none => kvs)
+    let kvs := ("name", toJson s.name) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ShowDocumentClientCapabilities where
+instance : FromJson ServerInfo where
   fromJson? json := do
-    let support ← json.getObjValAs? Bool "support"
-    return { support }
+    let _obj ← json.getObj?
+    let name : String ← match _obj.find compare "name" with | some v => fromJson? v | none => throw "property not found: name"
+    let version : Option String := (_obj.find compare "version").bind fun v => (fromJson? v).toOption
+    return { name, version }
 
-/-- @since 3.18.0 -/
-structure StaleRequestSupportOptions where
-  cancel : Bool
-  retryOnContentModified : (Array String)
+/-- The result returned from an initialize request. -/
+structure InitializeResult where
+  capabilities : ServerCapabilities
+  serverInfo : (Option ServerInfo) := none
   deriving Inhabited
 
-instance : ToJson StaleRequestSupportOptions where
-  toJson s := Json.mkObj <|
-    [("cancel", toJson s.cancel)] ++
-    [("retryOnContentModified", toJson s.retryOnContentModified)]
+instance : ToJson InitializeResult where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.serverInfo with | some v => ("serverInfo", toJson v) :: kvs | none => kvs)
+    let kvs := ("capabilities", toJson s.capabilities) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson StaleRequestSupportOptions where
+instance : FromJson InitializeResult where
   fromJson? json := do
-    let cancel ← json.getObjValAs? Bool "cancel"
-    let retryOnContentModified ← json.getObjValAs? (Array String) "retryOnContentModified"
-    return { cancel, retryOnContentModified }
+    let _obj ← json.getObj?
+    let capabilities : ServerCapabilities ← match _obj.find compare "capabilities" with | some v => fromJson? v | none => throw "property not found: capabilities"
+    let serverInfo : Option ServerInfo := (_obj.find compare "serverInfo").bind fun v => (fromJson? v).toOption
+    return { capabilities, serverInfo }
 
-/-- Client capabilities specific to regular expressions.  @since 3.16.0 -/
-structure RegularExpressionsClientCapabilities where
-  engine : RegularExpressionEngineKind
-  version : (Option String) := none
+/-- The data type of the ResponseError if the initialize request fails. -/
+structure InitializeError where
+  retry : Bool
   deriving Inhabited
 
-instance : ToJson RegularExpressionsClientCapabilities where
-  toJson s := Json.mkObj <|
-    [("engine", toJson s.engine)] ++
-    (match s.version with | some v => [("version", toJson v)] | none => [])
+instance : ToJson InitializeError where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("retry", toJson s.retry) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson RegularExpressionsClientCapabilities where
+instance : FromJson InitializeError where
   fromJson? json := do
-    let engine ← json.getObjValAs? RegularExpressionEngineKind "engine"
-    let version := (json.getObjValAs? String "version").toOption
-    return { engine, version }
+    let _obj ← json.getObj?
+    let retry : Bool ← match _obj.find compare "retry" with | some v => fromJson? v | none => throw "property not found: retry"
+    return { retry }
 
-/-- Client capabilities specific to the used markdown parser.  @since 3.16.0 -/
-structure MarkdownClientCapabilities where
-  parser : String
-  version : (Option String) := none
-  allowedTags : (Option (Array String)) := none
+structure InitializedParams where
+  dummy : Unit := ()
   deriving Inhabited
 
-instance : ToJson MarkdownClientCapabilities where
-  toJson s := Json.mkObj <|
-    [("parser", toJson s.parser)] ++
-    (match s.version with | some v => [("version", toJson v)] | none => []) ++
-    (match s.allowedTags with | some v => [("allowedTags", toJson v)] | none => [])
+instance : ToJson InitializedParams where
+  toJson _ := Json.mkObj []
 
-instance : FromJson MarkdownClientCapabilities where
-  fromJson? json := do
-    let parser ← json.getObjValAs? String "parser"
-    let version := (json.getObjValAs? String "version").toOption
-    let allowedTags := (json.getObjValAs? (Array String) "allowedTags").toOption
-    return { parser, version, allowedTags }
+instance : FromJson InitializedParams where
+  fromJson? _ := return { dummy := () }
 
-/-- @since 3.18.0 -/
-structure ChangeAnnotationsSupportOptions where
-  groupsOnLabel : (Option Bool) := none
+/-- The parameters of a change configuration notification. -/
+structure DidChangeConfigurationParams where
+  settings : Json
   deriving Inhabited
 
-instance : ToJson ChangeAnnotationsSupportOptions where
-  toJson s := Json.mkObj <|
-    (match s.groupsOnLabel with | some v => [("groupsOnLabel", toJson v)] | none => [])
+instance : ToJson DidChangeConfigurationParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("settings", toJson s.settings) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ChangeAnnotationsSupportOptions where
+instance : FromJson DidChangeConfigurationParams where
   fromJson? json := do
-    let groupsOnLabel := (json.getObjValAs? Bool "groupsOnLabel").toOption
-    return { groupsOnLabel }
+    let _obj ← json.getObj?
+    let settings : Json := (_obj.find compare "settings").getD Json.null
+    return { settings }
 
-/-- @since 3.18.0 -/
-structure ClientSymbolKindOptions where
-  valueSet : (Option (Array SymbolKind)) := none
+structure DidChangeConfigurationRegistrationOptions where
+  «section» : Json := Json.null
   deriving Inhabited
 
-instance : ToJson ClientSymbolKindOptions where
-  toJson s := Json.mkObj <|
-    (match s.valueSet with | some v => [("valueSet", toJson v)] | none => [])
+instance : ToJson DidChangeConfigurationRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("section", toJson s.«section») :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ClientSymbolKindOptions where
+instance : FromJson DidChangeConfigurationRegistrationOptions where
   fromJson? json := do
-    let valueSet := (json.getObjValAs? (Array SymbolKind) "valueSet").toOption
-    return { valueSet }
+    let _obj ← json.getObj?
+    let «section» : Json := (_obj.find compare "section").getD Json.null
+    return { «section» }
 
-/-- @since 3.18.0 -/
-structure ClientSymbolTagOptions where
-  valueSet : (Array SymbolTag)
+/-- The parameters of a notification message. -/
+structure ShowMessageParams where
+  «type» : MessageType
+  message : String
   deriving Inhabited
 
-instance : ToJson ClientSymbolTagOptions where
-  toJson s := Json.mkObj <|
-    [("valueSet", toJson s.valueSet)]
+instance : ToJson ShowMessageParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("type", toJson s.«type») :: ("message", toJson s.message) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ClientSymbolTagOptions where
+instance : FromJson ShowMessageParams where
   fromJson? json := do
-    let valueSet ← json.getObjValAs? (Array SymbolTag) "valueSet"
-    return { valueSet }
+    let _obj ← json.getObj?
+    let «type» : MessageType ← match _obj.find compare "type" with | some v => fromJson? v | none => throw "property not found: type"
+    let message : String ← match _obj.find compare "message" with | some v => fromJson? v | none => throw "property not found: message"
+    return { «type», message }
 
-/-- @since 3.18.0 -/
-structure ClientSymbolResolveOptions where
-  properties : (Array String)
+structure MessageActionItem where
+  title : String
   deriving Inhabited
 
-instance : ToJson ClientSymbolResolveOptions where
-  toJson s := Json.mkObj <|
-    [("properties", toJson s.properties)]
+instance : ToJson MessageActionItem where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("title", toJson s.title) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ClientSymbolResolveOptions where
+instance : FromJson MessageActionItem where
   fromJson? json := do
-    let properties ← json.getObjValAs? (Array String) "properties"
-    return { properties }
+    let _obj ← json.getObj?
+    let title : String ← match _obj.find compare "title" with | some v => fromJson? v | none => throw "property not found: title"
+    return { title }
 
-/-- @since 3.18.0 -/
-structure ClientCompletionItemOptionsKind where
-  valueSet : (Option (Array CompletionItemKind)) := none
+structure ShowMessageRequestParams where
+  «type» : MessageType
+  message : String
+  actions : (Option (Array MessageActionItem)) := none
   deriving Inhabited
 
-instance : ToJson ClientCompletionItemOptionsKind where
-  toJson s := Json.mkObj <|
-    (match s.valueSet with | some v => [("valueSet", toJson v)] | none => [])
+instance : ToJson ShowMessageRequestParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.actions with | some v => ("actions", toJson v) :: kvs | none => kvs)
+    let kvs := ("type", toJson s.«type») :: ("message", toJson s.message) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ClientCompletionItemOptionsKind where
+instance : FromJson ShowMessageRequestParams where
   fromJson? json := do
-    let valueSet := (json.getObjValAs? (Array CompletionItemKind) "valueSet").toOption
-    return { valueSet }
+    let _obj ← json.getObj?
+    let «type» : MessageType ← match _obj.find compare "type" with | some v => fromJson? v | none => throw "property not found: type"
+    let message : String ← match _obj.find compare "message" with | some v => fromJson? v | none => throw "property not found: message"
+    let actions : Option (Array MessageActionItem) := (_obj.find compare "actions").bind fun v => (fromJson? v).toOption
+    return { «type», message, actions }
 
-/-- The client supports the following `CompletionList` specific capabilities.  @since 3.17.0 -/
-structure CompletionListCapabilities where
-  itemDefaults : (Option (Array String)) := none
-  applyKindSupport : (Option Bool) := none
+/-- The log message parameters. -/
+structure LogMessageParams where
+  «type» : MessageType
+  message : String
   deriving Inhabited
 
-instance : ToJson CompletionListCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.itemDefaults with | some v => [("itemDefaults", toJson v)] | none => []) ++
-    (match s.applyKindSupport with | some v => [("applyKindSupport", toJson v)] | none => [])
+instance : ToJson LogMessageParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("type", toJson s.«type») :: ("message", toJson s.message) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson CompletionListCapabilities where
+instance : FromJson LogMessageParams where
   fromJson? json := do
-    let itemDefaults := (json.getObjValAs? (Array String) "itemDefaults").toOption
-    let applyKindSupport := (json.getObjValAs? Bool "applyKindSupport").toOption
-    return { itemDefaults, applyKindSupport }
+    let _obj ← json.getObj?
+    let «type» : MessageType ← match _obj.find compare "type" with | some v => fromJson? v | none => throw "property not found: type"
+    let message : String ← match _obj.find compare "message" with | some v => fromJson? v | none => throw "property not found: message"
+    return { «type», message }
 
-/-- @since 3.18.0 -/
-structure ClientCodeActionResolveOptions where
-  properties : (Array String)
+/-- The parameters sent in an open text document notification -/
+structure DidOpenTextDocumentParams where
+  textDocument : TextDocumentItem
   deriving Inhabited
 
-instance : ToJson ClientCodeActionResolveOptions where
-  toJson s := Json.mkObj <|
-    [("properties", toJson s.properties)]
+instance : ToJson DidOpenTextDocumentParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("textDocument", toJson s.textDocument) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ClientCodeActionResolveOptions where
+instance : FromJson DidOpenTextDocumentParams where
   fromJson? json := do
-    let properties ← json.getObjValAs? (Array String) "properties"
-    return { properties }
+    let _obj ← json.getObj?
+    let textDocument : TextDocumentItem ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    return { textDocument }
 
-/-- @since 3.18.0 - proposed -/
-structure CodeActionTagOptions where
-  valueSet : (Array CodeActionTag)
+/-- The change text document notification's parameters. -/
+structure DidChangeTextDocumentParams where
+  textDocument : VersionedTextDocumentIdentifier
+  contentChanges : (Array TextDocumentContentChangeEvent)
   deriving Inhabited
 
-instance : ToJson CodeActionTagOptions where
-  toJson s := Json.mkObj <|
-    [("valueSet", toJson s.valueSet)]
+instance : ToJson DidChangeTextDocumentParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("textDocument", toJson s.textDocument) :: ("contentChanges", toJson s.contentChanges) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson CodeActionTagOptions where
+instance : FromJson DidChangeTextDocumentParams where
   fromJson? json := do
-    let valueSet ← json.getObjValAs? (Array CodeActionTag) "valueSet"
-    return { valueSet }
+    let _obj ← json.getObj?
+    let textDocument : VersionedTextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let contentChanges : (Array TextDocumentContentChangeEvent) ← match _obj.find compare "contentChanges" with | some v => fromJson? v | none => throw "property not found: contentChanges"
+    return { textDocument, contentChanges }
 
-/-- @since 3.18.0 -/
-structure ClientCodeLensResolveOptions where
-  properties : (Array String)
+/-- Describe options to be used when registered for text document change events. -/
+structure TextDocumentChangeRegistrationOptions where
+  documentSelector : (Option Json)
+  syncKind : TextDocumentSyncKind
   deriving Inhabited
 
-instance : ToJson ClientCodeLensResolveOptions where
-  toJson s := Json.mkObj <|
-    [("properties", toJson s.properties)]
+instance : ToJson TextDocumentChangeRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("documentSelector", toJson s.documentSelector) :: ("syncKind", toJson s.syncKind) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ClientCodeLensResolveOptions where
+instance : FromJson TextDocumentChangeRegistrationOptions where
   fromJson? json := do
-    let properties ← json.getObjValAs? (Array String) "properties"
-    return { properties }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    let syncKind : TextDocumentSyncKind ← match _obj.find compare "syncKind" with | some v => fromJson? v | none => throw "property not found: syncKind"
+    return { documentSelector, syncKind }
 
-/-- @since 3.18.0 -/
-structure ClientFoldingRangeKindOptions where
-  valueSet : (Option (Array FoldingRangeKind)) := none
+/-- The parameters sent in a close text document notification -/
+structure DidCloseTextDocumentParams where
+  textDocument : TextDocumentIdentifier
   deriving Inhabited
 
-instance : ToJson ClientFoldingRangeKindOptions where
-  toJson s := Json.mkObj <|
-    (match s.valueSet with | some v => [("valueSet", toJson v)] | none => [])
+instance : ToJson DidCloseTextDocumentParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("textDocument", toJson s.textDocument) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ClientFoldingRangeKindOptions where
+instance : FromJson DidCloseTextDocumentParams where
   fromJson? json := do
-    let valueSet := (json.getObjValAs? (Array FoldingRangeKind) "valueSet").toOption
-    return { valueSet }
+    let _obj ← json.getObj?
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    return { textDocument }
 
-/-- @since 3.18.0 -/
-structure ClientFoldingRangeOptions where
-  collapsedText : (Option Bool) := none
+/-- The parameters sent in a save text document notification -/
+structure DidSaveTextDocumentParams where
+  textDocument : TextDocumentIdentifier
+  text : (Option String) := none
   deriving Inhabited
 
-instance : ToJson ClientFoldingRangeOptions where
-  toJson s := Json.mkObj <|
-    (match s.collapsedText with | some v => [("collapsedText", toJson v)] | none => [])
+instance : ToJson DidSaveTextDocumentParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.text with | some v => ("text", toJson v) :: kvs | none => kvs)
+    let kvs := ("textDocument", toJson s.textDocument) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ClientFoldingRangeOptions where
+instance : FromJson DidSaveTextDocumentParams where
   fromJson? json := do
-    let collapsedText := (json.getObjValAs? Bool "collapsedText").toOption
-    return { collapsedText }
+    let _obj ← json.getObj?
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let text : Option String := (_obj.find compare "text").bind fun v => (fromJson? v).toOption
+    return { textDocument, text }
 
-/-- @since 3.18.0 -/
-structure ClientInlayHintResolveOptions where
-  properties : (Array String)
+/-- Save registration options. -/
+structure TextDocumentSaveRegistrationOptions where
+  documentSelector : (Option Json)
+  includeText : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson ClientInlayHintResolveOptions where
-  toJson s := Json.mkObj <|
-    [("properties", toJson s.properties)]
+instance : ToJson TextDocumentSaveRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.includeText with | some v => ("includeText", toJson v) :: kvs | none => kvs)
+    let kvs := ("documentSelector", toJson s.documentSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ClientInlayHintResolveOptions where
+instance : FromJson TextDocumentSaveRegistrationOptions where
   fromJson? json := do
-    let properties ← json.getObjValAs? (Array String) "properties"
-    return { properties }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    let includeText : Option Bool := (_obj.find compare "includeText").bind fun v => (fromJson? v).toOption
+    return { documentSelector, includeText }
 
-/-- @since 3.18.0 -/
-structure ClientShowMessageActionItemOptions where
-  additionalPropertiesSupport : (Option Bool) := none
+/-- The parameters sent in a will save text document notification. -/
+structure WillSaveTextDocumentParams where
+  textDocument : TextDocumentIdentifier
+  reason : TextDocumentSaveReason
   deriving Inhabited
 
-instance : ToJson ClientShowMessageActionItemOptions where
-  toJson s := Json.mkObj <|
-    (match s.additionalPropertiesSupport with | some v => [("additionalPropertiesSupport", toJson v)] | none => [])
+instance : ToJson WillSaveTextDocumentParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("textDocument", toJson s.textDocument) :: ("reason", toJson s.reason) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ClientShowMessageActionItemOptions where
+instance : FromJson WillSaveTextDocumentParams where
   fromJson? json := do
-    let additionalPropertiesSupport := (json.getObjValAs? Bool "additionalPropertiesSupport").toOption
-    return { additionalPropertiesSupport }
+    let _obj ← json.getObj?
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let reason : TextDocumentSaveReason ← match _obj.find compare "reason" with | some v => fromJson? v | none => throw "property not found: reason"
+    return { textDocument, reason }
 
-/-- @since 3.18.0 -/
-structure CompletionItemTagOptions where
-  valueSet : (Array CompletionItemTag)
+/-- An event describing a file change. -/
+structure FileEvent where
+  uri : String
+  «type» : FileChangeType
   deriving Inhabited
 
-instance : ToJson CompletionItemTagOptions where
-  toJson s := Json.mkObj <|
-    [("valueSet", toJson s.valueSet)]
+instance : ToJson FileEvent where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("uri", toJson s.uri) :: ("type", toJson s.«type») :: kvs
+    Json.mkObj kvs
 
-instance : FromJson CompletionItemTagOptions where
+instance : FromJson FileEvent where
   fromJson? json := do
-    let valueSet ← json.getObjValAs? (Array CompletionItemTag) "valueSet"
-    return { valueSet }
+    let _obj ← json.getObj?
+    let uri : String ← match _obj.find compare "uri" with | some v => fromJson? v | none => throw "property not found: uri"
+    let «type» : FileChangeType ← match _obj.find compare "type" with | some v => fromJson? v | none => throw "property not found: type"
+    return { uri, «type» }
 
-/-- @since 3.18.0 -/
-structure ClientCompletionItemResolveOptions where
-  properties : (Array String)
+/-- The watched files change notification's parameters. -/
+structure DidChangeWatchedFilesParams where
+  changes : (Array FileEvent)
   deriving Inhabited
 
-instance : ToJson ClientCompletionItemResolveOptions where
-  toJson s := Json.mkObj <|
-    [("properties", toJson s.properties)]
+instance : ToJson DidChangeWatchedFilesParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("changes", toJson s.changes) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ClientCompletionItemResolveOptions where
+instance : FromJson DidChangeWatchedFilesParams where
   fromJson? json := do
-    let properties ← json.getObjValAs? (Array String) "properties"
-    return { properties }
+    let _obj ← json.getObj?
+    let changes : (Array FileEvent) ← match _obj.find compare "changes" with | some v => fromJson? v | none => throw "property not found: changes"
+    return { changes }
 
-/-- @since 3.18.0 -/
-structure ClientCompletionItemInsertTextModeOptions where
-  valueSet : (Array InsertTextMode)
+structure FileSystemWatcher where
+  globPattern : GlobPattern
+  kind : (Option WatchKind) := none
   deriving Inhabited
 
-instance : ToJson ClientCompletionItemInsertTextModeOptions where
-  toJson s := Json.mkObj <|
-    [("valueSet", toJson s.valueSet)]
+instance : ToJson FileSystemWatcher where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.kind with | some v => ("kind", toJson v) :: kvs | none => kvs)
+    let kvs := ("globPattern", toJson s.globPattern) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ClientCompletionItemInsertTextModeOptions where
+instance : FromJson FileSystemWatcher where
   fromJson? json := do
-    let valueSet ← json.getObjValAs? (Array InsertTextMode) "valueSet"
-    return { valueSet }
+    let _obj ← json.getObj?
+    let globPattern : GlobPattern ← match _obj.find compare "globPattern" with | some v => fromJson? v | none => throw "property not found: globPattern"
+    let kind : Option WatchKind := (_obj.find compare "kind").bind fun v => (fromJson? v).toOption
+    return { globPattern, kind }
 
-/-- @since 3.18.0 -/
-structure ClientSignatureParameterInformationOptions where
-  labelOffsetSupport : (Option Bool) := none
+/-- Describe options to be used when registered for text document change events. -/
+structure DidChangeWatchedFilesRegistrationOptions where
+  watchers : (Array FileSystemWatcher)
   deriving Inhabited
 
-instance : ToJson ClientSignatureParameterInformationOptions where
-  toJson s := Json.mkObj <|
-    (match s.labelOffsetSupport with | some v => [("labelOffsetSupport", toJson v)] | none => [])
+instance : ToJson DidChangeWatchedFilesRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("watchers", toJson s.watchers) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ClientSignatureParameterInformationOptions where
+instance : FromJson DidChangeWatchedFilesRegistrationOptions where
   fromJson? json := do
-    let labelOffsetSupport := (json.getObjValAs? Bool "labelOffsetSupport").toOption
-    return { labelOffsetSupport }
+    let _obj ← json.getObj?
+    let watchers : (Array FileSystemWatcher) ← match _obj.find compare "watchers" with | some v => fromJson? v | none => throw "property not found: watchers"
+    return { watchers }
 
-/-- @since 3.18.0 -/
-structure ClientCodeActionKindOptions where
-  valueSet : (Array CodeActionKind)
+/-- The publish diagnostic notification's parameters. -/
+structure PublishDiagnosticsParams where
+  uri : String
+  version : (Option Int) := none
+  diagnostics : Json
   deriving Inhabited
 
-instance : ToJson ClientCodeActionKindOptions where
-  toJson s := Json.mkObj <|
-    [("valueSet", toJson s.valueSet)]
+instance : ToJson PublishDiagnosticsParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("diagnostics", toJson s.diagnostics) :: kvs
+    let kvs := (match s.version with | some v => ("version", toJson v) :: kvs | none => kvs)
+    let kvs := ("uri", toJson s.uri) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ClientCodeActionKindOptions where
+instance : FromJson PublishDiagnosticsParams where
   fromJson? json := do
-    let valueSet ← json.getObjValAs? (Array CodeActionKind) "valueSet"
-    return { valueSet }
+    let _obj ← json.getObj?
+    let uri : String ← match _obj.find compare "uri" with | some v => fromJson? v | none => throw "property not found: uri"
+    let version : Option Int := (_obj.find compare "version").bind fun v => (fromJson? v).toOption
+    let diagnostics : Json := (_obj.find compare "diagnostics").getD Json.null
+    return { uri, version, diagnostics }
 
-/-- @since 3.18.0 -/
-structure ClientDiagnosticsTagOptions where
-  valueSet : (Array DiagnosticTag)
+/-- Contains additional information about the context in which a completion request is triggered. -/
+structure CompletionContext where
+  triggerKind : CompletionTriggerKind
+  triggerCharacter : (Option String) := none
   deriving Inhabited
 
-instance : ToJson ClientDiagnosticsTagOptions where
-  toJson s := Json.mkObj <|
-    [("valueSet", toJson s.valueSet)]
+instance : ToJson CompletionContext where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.triggerCharacter with | some v => ("triggerCharacter", toJson v) :: kvs | none => kvs)
+    let kvs := ("triggerKind", toJson s.triggerKind) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ClientDiagnosticsTagOptions where
+instance : FromJson CompletionContext where
   fromJson? json := do
-    let valueSet ← json.getObjValAs? (Array DiagnosticTag) "valueSet"
-    return { valueSet }
+    let _obj ← json.getObj?
+    let triggerKind : CompletionTriggerKind ← match _obj.find compare "triggerKind" with | some v => fromJson? v | none => throw "property not found: triggerKind"
+    let triggerCharacter : Option String := (_obj.find compare "triggerCharacter").bind fun v => (fromJson? v).toOption
+    return { triggerKind, triggerCharacter }
 
-/-- @since 3.18.0 -/
-structure ClientSemanticTokensRequestFullDelta where
-  delta : (Option Bool) := none
+/-- Completion parameters -/
+structure CompletionParams where
+  textDocument : TextDocumentIdentifier
+  position : Position
+  workDoneToken : (Option ProgressToken) := none
+  partialResultToken : (Option ProgressToken) := none
+  context : (Option CompletionContext) := none
   deriving Inhabited
 
-instance : ToJson ClientSemanticTokensRequestFullDelta where
-  toJson s := Json.mkObj <|
-    (match s.delta with | some v => [("delta", toJson v)] | none => [])
+instance : ToJson CompletionParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.context with | some v => ("context", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.partialResultToken with | some v => ("partialResultToken", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    let kvs := ("textDocument", toJson s.textDocument) :: ("position", toJson s.position) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ClientSemanticTokensRequestFullDelta where
+instance : FromJson CompletionParams where
   fromJson? json := do
-    let delta := (json.getObjValAs? Bool "delta").toOption
-    return { delta }
+    let _obj ← json.getObj?
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let position : Position ← match _obj.find compare "position" with | some v => fromJson? v | none => throw "property not found: position"
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let partialResultToken : Option ProgressToken := (_obj.find compare "partialResultToken").bind fun v => (fromJson? v).toOption
+    let context : Option CompletionContext := (_obj.find compare "context").bind fun v => (fromJson? v).toOption
+    return { textDocument, position, workDoneToken, partialResultToken, context }
 
-/-- The workspace folder change event. -/
-structure WorkspaceFoldersChangeEvent where
-  added : (Array WorkspaceFolder)
-  removed : (Array WorkspaceFolder)
+/-- Represents a reference to a command. Provides a title which will be used to represent a command in the UI and, optionally, an array of arguments which will be passed to the command handler function when invoked. -/
+structure Command where
+  title : String
+  tooltip : (Option String) := none
+  command : String
+  arguments : Json := Json.null
   deriving Inhabited
 
-instance : ToJson WorkspaceFoldersChangeEvent where
-  toJson s := Json.mkObj <|
-    [("added", toJson s.added)] ++
-    [("removed", toJson s.removed)]
+instance : ToJson Command where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("command", toJson s.command) :: ("arguments", toJson s.arguments) :: kvs
+    let kvs := (match s.tooltip with | some v => ("tooltip", toJson v) :: kvs | none => kvs)
+    let kvs := ("title", toJson s.title) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson WorkspaceFoldersChangeEvent where
+instance : FromJson Command where
   fromJson? json := do
-    let added ← json.getObjValAs? (Array WorkspaceFolder) "added"
-    let removed ← json.getObjValAs? (Array WorkspaceFolder) "removed"
-    return { added, removed }
+    let _obj ← json.getObj?
+    let title : String ← match _obj.find compare "title" with | some v => fromJson? v | none => throw "property not found: title"
+    let tooltip : Option String := (_obj.find compare "tooltip").bind fun v => (fromJson? v).toOption
+    let command : String ← match _obj.find compare "command" with | some v => fromJson? v | none => throw "property not found: command"
+    let arguments : Json := (_obj.find compare "arguments").getD Json.null
+    return { title, tooltip, command, arguments }
 
-structure WorkspaceFoldersInitializeParams where
-  workspaceFolders : (Option (Array WorkspaceFolder)) := none
+/-- Additional details for a completion item label.  @since 3.17.0 -/
+structure CompletionItemLabelDetails where
+  detail : (Option String) := none
+  description : (Option String) := none
   deriving Inhabited
 
-instance : ToJson WorkspaceFoldersInitializeParams where
-  toJson s := Json.mkObj <|
-    (match s.workspaceFolders with | some v => [("workspaceFolders", toJson v)] | none => [])
+instance : ToJson CompletionItemLabelDetails where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.description with | some v => ("description", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.detail with | some v => ("detail", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson WorkspaceFoldersInitializeParams where
+instance : FromJson CompletionItemLabelDetails where
   fromJson? json := do
-    let workspaceFolders := (json.getObjValAs? (Array WorkspaceFolder) "workspaceFolders").toOption
-    return { workspaceFolders }
+    let _obj ← json.getObj?
+    let detail : Option String := (_obj.find compare "detail").bind fun v => (fromJson? v).toOption
+    let description : Option String := (_obj.find compare "description").bind fun v => (fromJson? v).toOption
+    return { detail, description }
 
-/-- A relative pattern is a helper to construct glob patterns that are matched relatively to a base URI. The common value for a `baseUri` is a workspace folder root, but it can be another absolute URI as well.  @since 3.17.0 -/
-structure RelativePattern where
-  baseUri : Json
-  pattern : Pattern
+/-- A completion item represents a text snippet that is proposed to complete text that is being typed. -/
+structure CompletionItem where
+  label : String
+  labelDetails : (Option CompletionItemLabelDetails) := none
+  kind : (Option CompletionItemKind) := none
+  tags : (Option (Array CompletionItemTag)) := none
+  detail : (Option String) := none
+  documentation : Json := Json.null
+  deprecated : (Option Bool) := none
+  preselect : (Option Bool) := none
+  sortText : (Option String) := none
+  filterText : (Option String) := none
+  insertText : (Option String) := none
+  insertTextFormat : (Option InsertTextFormat) := none
+  insertTextMode : (Option InsertTextMode) := none
+  textEdit : Json := Json.null
+  textEditText : (Option String) := none
+  additionalTextEdits : (Option (Array TextEdit)) := none
+  commitCharacters : (Option (Array String)) := none
+  command : (Option Command) := none
+  data : Json := Json.null
   deriving Inhabited
 
-instance : ToJson RelativePattern where
-  toJson s := Json.mkObj <|
-    [("baseUri", toJson s.baseUri)] ++
-    [("pattern", toJson s.pattern)]
+instance : ToJson CompletionItem where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("data", toJson s.data) :: kvs
+    let kvs := (match s.command with | some v => ("command", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.commitCharacters with | some v => ("commitCharacters", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.additionalTextEdits with | some v => ("additionalTextEdits", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.textEditText with | some v => ("textEditText", toJson v) :: kvs | none => kvs)
+    let kvs := ("textEdit", toJson s.textEdit) :: kvs
+    let kvs := (match s.insertTextMode with | some v => ("insertTextMode", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.insertTextFormat with | some v => ("insertTextFormat", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.insertText with | some v => ("insertText", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.filterText with | some v => ("filterText", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.sortText with | some v => ("sortText", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.preselect with | some v => ("preselect", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.deprecated with | some v => ("deprecated", toJson v) :: kvs | none => kvs)
+    let kvs := ("documentation", toJson s.documentation) :: kvs
+    let kvs := (match s.detail with | some v => ("detail", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.tags with | some v => ("tags", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.kind with | some v => ("kind", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.labelDetails with | some v => ("labelDetails", toJson v) :: kvs | none => kvs)
+    let kvs := ("label", toJson s.label) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson RelativePattern where
+instance : FromJson CompletionItem where
   fromJson? json := do
-    let baseUri := json.getObjVal? "baseUri" |>.toOption |>.getD Json.null
-    let pattern ← json.getObjValAs? Pattern "pattern"
-    return { baseUri, pattern }
+    let _obj ← json.getObj?
+    let label : String ← match _obj.find compare "label" with | some v => fromJson? v | none => throw "property not found: label"
+    let labelDetails : Option CompletionItemLabelDetails := (_obj.find compare "labelDetails").bind fun v => (fromJson? v).toOption
+    let kind : Option CompletionItemKind := (_obj.find compare "kind").bind fun v => (fromJson? v).toOption
+    let tags : Option (Array CompletionItemTag) := (_obj.find compare "tags").bind fun v => (fromJson? v).toOption
+    let detail : Option String := (_obj.find compare "detail").bind fun v => (fromJson? v).toOption
+    let documentation : Json := (_obj.find compare "documentation").getD Json.null
+    let deprecated : Option Bool := (_obj.find compare "deprecated").bind fun v => (fromJson? v).toOption
+    let preselect : Option Bool := (_obj.find compare "preselect").bind fun v => (fromJson? v).toOption
+    let sortText : Option String := (_obj.find compare "sortText").bind fun v => (fromJson? v).toOption
+    let filterText : Option String := (_obj.find compare "filterText").bind fun v => (fromJson? v).toOption
+    let insertText : Option String := (_obj.find compare "insertText").bind fun v => (fromJson? v).toOption
+    let insertTextFormat : Option InsertTextFormat := (_obj.find compare "insertTextFormat").bind fun v => (fromJson? v).toOption
+    let insertTextMode : Option InsertTextMode := (_obj.find compare "insertTextMode").bind fun v => (fromJson? v).toOption
+    let textEdit : Json := (_obj.find compare "textEdit").getD Json.null
+    let textEditText : Option String := (_obj.find compare "textEditText").bind fun v => (fromJson? v).toOption
+    let additionalTextEdits : Option (Array TextEdit) := (_obj.find compare "additionalTextEdits").bind fun v => (fromJson? v).toOption
+    let commitCharacters : Option (Array String) := (_obj.find compare "commitCharacters").bind fun v => (fromJson? v).toOption
+    let command : Option Command := (_obj.find compare "command").bind fun v => (fromJson? v).toOption
+    let data : Json := (_obj.find compare "data").getD Json.null
+    return { label, labelDetails, kind, tags, detail, documentation, deprecated, preselect, sortText, filterText, insertText, insertTextFormat, insertTextMode, textEdit, textEditText, additionalTextEdits, commitCharacters, command, data }
 
-structure ImplementationOptions where
-  workDoneProgress : (Option Bool) := none
+/-- Specifies how fields from a completion item should be combined with those from `completionList.itemDefaults`.  If unspecified, all fields will be treated as ApplyKind.Replace.  If a field's value is ApplyKind.Replace, the value from a completion item (if provided and not `null`) will always be used ... -/
+structure CompletionItemApplyKinds where
+  commitCharacters : (Option ApplyKind) := none
+  data : (Option ApplyKind) := none
   deriving Inhabited
 
-instance : ToJson ImplementationOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => [])
+instance : ToJson CompletionItemApplyKinds where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.data with | some v => ("data", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.commitCharacters with | some v => ("commitCharacters", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson ImplementationOptions where
+instance : FromJson CompletionItemApplyKinds where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    return { workDoneProgress }
+    let _obj ← json.getObj?
+    let commitCharacters : Option ApplyKind := (_obj.find compare "commitCharacters").bind fun v => (fromJson? v).toOption
+    let data : Option ApplyKind := (_obj.find compare "data").bind fun v => (fromJson? v).toOption
+    return { commitCharacters, data }
 
-structure TypeDefinitionOptions where
-  workDoneProgress : (Option Bool) := none
+/-- In many cases the items of an actual completion result share the same value for properties like `commitCharacters` or the range of a text edit. A completion list can therefore define item defaults which will be used if a completion item itself doesn't specify the value.  If a completion list specifi... -/
+structure CompletionItemDefaults where
+  commitCharacters : (Option (Array String)) := none
+  editRange : Json := Json.null
+  insertTextFormat : (Option InsertTextFormat) := none
+  insertTextMode : (Option InsertTextMode) := none
+  data : Json := Json.null
   deriving Inhabited
 
-instance : ToJson TypeDefinitionOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => [])
+instance : ToJson CompletionItemDefaults where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("data", toJson s.data) :: kvs
+    let kvs := (match s.insertTextMode with | some v => ("insertTextMode", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.insertTextFormat with | some v => ("insertTextFormat", toJson v) :: kvs | none => kvs)
+    let kvs := ("editRange", toJson s.editRange) :: kvs
+    let kvs := (match s.commitCharacters with | some v => ("commitCharacters", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson TypeDefinitionOptions where
+instance : FromJson CompletionItemDefaults where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    return { workDoneProgress }
+    let _obj ← json.getObj?
+    let commitCharacters : Option (Array String) := (_obj.find compare "commitCharacters").bind fun v => (fromJson? v).toOption
+    let editRange : Json := (_obj.find compare "editRange").getD Json.null
+    let insertTextFormat : Option InsertTextFormat := (_obj.find compare "insertTextFormat").bind fun v => (fromJson? v).toOption
+    let insertTextMode : Option InsertTextMode := (_obj.find compare "insertTextMode").bind fun v => (fromJson? v).toOption
+    let data : Json := (_obj.find compare "data").getD Json.null
+    return { commitCharacters, editRange, insertTextFormat, insertTextMode, data }
 
-structure DocumentColorOptions where
-  workDoneProgress : (Option Bool) := none
+/-- Represents a collection of {@link CompletionItem completion items} to be presented in the editor. -/
+structure CompletionList where
+  isIncomplete : Bool
+  itemDefaults : (Option CompletionItemDefaults) := none
+  applyKind : (Option CompletionItemApplyKinds) := none
+  items : Json
   deriving Inhabited
 
-instance : ToJson DocumentColorOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => [])
+instance : ToJson CompletionList where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("items", toJson s.items) :: kvs
+    let kvs := (match s.applyKind with | some v => ("applyKind", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.itemDefaults with | some v => ("itemDefaults", toJson v) :: kvs | none => kvs)
+    let kvs := ("isIncomplete", toJson s.isIncomplete) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DocumentColorOptions where
+instance : FromJson CompletionList where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    return { workDoneProgress }
+    let _obj ← json.getObj?
+    let isIncomplete : Bool ← match _obj.find compare "isIncomplete" with | some v => fromJson? v | none => throw "property not found: isIncomplete"
+    let itemDefaults : Option CompletionItemDefaults := (_obj.find compare "itemDefaults").bind fun v => (fromJson? v).toOption
+    let applyKind : Option CompletionItemApplyKinds := (_obj.find compare "applyKind").bind fun v => (fromJson? v).toOption
+    let items : Json := (_obj.find compare "items").getD Json.null
+    return { isIncomplete, itemDefaults, applyKind, items }
 
-structure FoldingRangeOptions where
-  workDoneProgress : (Option Bool) := none
+/-- Registration options for a {@link CompletionRequest}. -/
+structure CompletionRegistrationOptions where
+  documentSelector : (Option Json)
+  triggerCharacters : (Option (Array String)) := none
+  allCommitCharacters : (Option (Array String)) := none
+  resolveProvider : (Option Bool) := none
+  completionItem : (Option ServerCompletionItemOptions) := none
   deriving Inhabited
 
-instance : ToJson FoldingRangeOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => [])
+instance : ToJson CompletionRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.completionItem with | some v => ("completionItem", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.resolveProvider with | some v => ("resolveProvider", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.allCommitCharacters with | some v => ("allCommitCharacters", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.triggerCharacters with | some v => ("triggerCharacters", toJson v) :: kvs | none => kvs)
+    let kvs := ("documentSelector", toJson s.documentSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson FoldingRangeOptions where
+instance : FromJson CompletionRegistrationOptions where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    return { workDoneProgress }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    let triggerCharacters : Option (Array String) := (_obj.find compare "triggerCharacters").bind fun v => (fromJson? v).toOption
+    let allCommitCharacters : Option (Array String) := (_obj.find compare "allCommitCharacters").bind fun v => (fromJson? v).toOption
+    let resolveProvider : Option Bool := (_obj.find compare "resolveProvider").bind fun v => (fromJson? v).toOption
+    let completionItem : Option ServerCompletionItemOptions := (_obj.find compare "completionItem").bind fun v => (fromJson? v).toOption
+    return { documentSelector, triggerCharacters, allCommitCharacters, resolveProvider, completionItem }
 
-structure DeclarationOptions where
-  workDoneProgress : (Option Bool) := none
+/-- Parameters for a {@link HoverRequest}. -/
+structure HoverParams where
+  textDocument : TextDocumentIdentifier
+  position : Position
+  workDoneToken : (Option ProgressToken) := none
   deriving Inhabited
 
-instance : ToJson DeclarationOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => [])
+instance : ToJson HoverParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    let kvs := ("textDocument", toJson s.textDocument) :: ("position", toJson s.position) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DeclarationOptions where
+instance : FromJson HoverParams where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    return { workDoneProgress }
+    let _obj ← json.getObj?
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let position : Position ← match _obj.find compare "position" with | some v => fromJson? v | none => throw "property not found: position"
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    return { textDocument, position, workDoneToken }
 
-structure SelectionRangeOptions where
-  workDoneProgress : (Option Bool) := none
+/-- The result of a hover request. -/
+structure Hover where
+  contents : Json
+  range : (Option Range) := none
   deriving Inhabited
 
-instance : ToJson SelectionRangeOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => [])
+instance : ToJson Hover where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.range with | some v => ("range", toJson v) :: kvs | none => kvs)
+    let kvs := ("contents", toJson s.contents) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson SelectionRangeOptions where
+instance : FromJson Hover where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    return { workDoneProgress }
+    let _obj ← json.getObj?
+    let contents : Json := (_obj.find compare "contents").getD Json.null
+    let range : Option Range := (_obj.find compare "range").bind fun v => (fromJson? v).toOption
+    return { contents, range }
 
-/-- Call hierarchy options used during static registration.  @since 3.16.0 -/
-structure CallHierarchyOptions where
-  workDoneProgress : (Option Bool) := none
+/-- Registration options for a {@link HoverRequest}. -/
+structure HoverRegistrationOptions where
+  documentSelector : (Option Json)
   deriving Inhabited
 
-instance : ToJson CallHierarchyOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => [])
+instance : ToJson HoverRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("documentSelector", toJson s.documentSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson CallHierarchyOptions where
+instance : FromJson HoverRegistrationOptions where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    return { workDoneProgress }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    return { documentSelector }
 
-structure LinkedEditingRangeOptions where
-  workDoneProgress : (Option Bool) := none
+/-- Represents a parameter of a callable-signature. A parameter can have a label and a doc-comment. -/
+structure ParameterInformation where
+  label : Json
+  documentation : Json := Json.null
   deriving Inhabited
 
-instance : ToJson LinkedEditingRangeOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => [])
+instance : ToJson ParameterInformation where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("label", toJson s.label) :: ("documentation", toJson s.documentation) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson LinkedEditingRangeOptions where
+instance : FromJson ParameterInformation where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    return { workDoneProgress }
+    let _obj ← json.getObj?
+    let label : Json := (_obj.find compare "label").getD Json.null
+    let documentation : Json := (_obj.find compare "documentation").getD Json.null
+    return { label, documentation }
 
-structure MonikerOptions where
-  workDoneProgress : (Option Bool) := none
+/-- Represents the signature of something callable. A signature can have a label, like a function-name, a doc-comment, and a set of parameters. -/
+structure SignatureInformation where
+  label : String
+  documentation : Json := Json.null
+  parameters : (Option (Array ParameterInformation)) := none
+  activeParameter : (Option Nat) := none
   deriving Inhabited
 
-instance : ToJson MonikerOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => [])
+instance : ToJson SignatureInformation where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.activeParameter with | some v => ("activeParameter", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.parameters with | some v => ("parameters", toJson v) :: kvs | none => kvs)
+    let kvs := ("label", toJson s.label) :: ("documentation", toJson s.documentation) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson MonikerOptions where
+instance : FromJson SignatureInformation where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    return { workDoneProgress }
+    let _obj ← json.getObj?
+    let label : String ← match _obj.find compare "label" with | some v => fromJson? v | none => throw "property not found: label"
+    let documentation : Json := (_obj.find compare "documentation").getD Json.null
+    let parameters : Option (Array ParameterInformation) := (_obj.find compare "parameters").bind fun v => (fromJson? v).toOption
+    let activeParameter : Option Nat := (_obj.find compare "activeParameter").bind fun v => (fromJson? v).toOption
+    return { label, documentation, parameters, activeParameter }
 
-/-- Type hierarchy options used during static registration.  @since 3.17.0 -/
-structure TypeHierarchyOptions where
-  workDoneProgress : (Option Bool) := none
+/-- Signature help represents the signature of something callable. There can be multiple signature but only one active and only one active parameter. -/
+structure SignatureHelp where
+  signatures : (Array SignatureInformation)
+  activeSignature : (Option Nat) := none
+  activeParameter : (Option Nat) := none
   deriving Inhabited
 
-instance : ToJson TypeHierarchyOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => [])
+instance : ToJson SignatureHelp where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.activeParameter with | some v => ("activeParameter", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.activeSignature with | some v => ("activeSignature", toJson v) :: kvs | none => kvs)
+    let kvs := ("signatures", toJson s.signatures) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson TypeHierarchyOptions where
+instance : FromJson SignatureHelp where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    return { workDoneProgress }
+    let _obj ← json.getObj?
+    let signatures : (Array SignatureInformation) ← match _obj.find compare "signatures" with | some v => fromJson? v | none => throw "property not found: signatures"
+    let activeSignature : Option Nat := (_obj.find compare "activeSignature").bind fun v => (fromJson? v).toOption
+    let activeParameter : Option Nat := (_obj.find compare "activeParameter").bind fun v => (fromJson? v).toOption
+    return { signatures, activeSignature, activeParameter }
 
-/-- Inline value options used during static registration.  @since 3.17.0 -/
-structure InlineValueOptions where
-  workDoneProgress : (Option Bool) := none
+/-- Additional information about the context in which a signature help request was triggered.  @since 3.15.0 -/
+structure SignatureHelpContext where
+  triggerKind : SignatureHelpTriggerKind
+  triggerCharacter : (Option String) := none
+  isRetrigger : Bool
+  activeSignatureHelp : (Option SignatureHelp) := none
   deriving Inhabited
 
-instance : ToJson InlineValueOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => [])
+instance : ToJson SignatureHelpContext where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.activeSignatureHelp with | some v => ("activeSignatureHelp", toJson v) :: kvs | none => kvs)
+    let kvs := ("isRetrigger", toJson s.isRetrigger) :: kvs
+    let kvs := (match s.triggerCharacter with | some v => ("triggerCharacter", toJson v) :: kvs | none => kvs)
+    let kvs := ("triggerKind", toJson s.triggerKind) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson InlineValueOptions where
+instance : FromJson SignatureHelpContext where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    return { workDoneProgress }
+    let _obj ← json.getObj?
+    let triggerKind : SignatureHelpTriggerKind ← match _obj.find compare "triggerKind" with | some v => fromJson? v | none => throw "property not found: triggerKind"
+    let triggerCharacter : Option String := (_obj.find compare "triggerCharacter").bind fun v => (fromJson? v).toOption
+    let isRetrigger : Bool ← match _obj.find compare "isRetrigger" with | some v => fromJson? v | none => throw "property not found: isRetrigger"
+    let activeSignatureHelp : Option SignatureHelp := (_obj.find compare "activeSignatureHelp").bind fun v => (fromJson? v).toOption
+    return { triggerKind, triggerCharacter, isRetrigger, activeSignatureHelp }
 
-/-- Inlay hint options used during static registration.  @since 3.17.0 -/
-structure InlayHintOptions where
-  workDoneProgress : (Option Bool) := none
-  resolveProvider : (Option Bool) := none
+/-- Parameters for a {@link SignatureHelpRequest}. -/
+structure SignatureHelpParams where
+  textDocument : TextDocumentIdentifier
+  position : Position
+  workDoneToken : (Option ProgressToken) := none
+  context : (Option SignatureHelpContext) := none
   deriving Inhabited
 
-instance : ToJson InlayHintOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => []) ++
-    (match s.resolveProvider with | some v => [("resolveProvider", toJson v)] | none => [])
+instance : ToJson SignatureHelpParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.context with | some v => ("context", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    let kvs := ("textDocument", toJson s.textDocument) :: ("position", toJson s.position) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson InlayHintOptions where
+instance : FromJson SignatureHelpParams where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    let resolveProvider := (json.getObjValAs? Bool "resolveProvider").toOption
-    return { workDoneProgress, resolveProvider }
+    let _obj ← json.getObj?
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let position : Position ← match _obj.find compare "position" with | some v => fromJson? v | none => throw "property not found: position"
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let context : Option SignatureHelpContext := (_obj.find compare "context").bind fun v => (fromJson? v).toOption
+    return { textDocument, position, workDoneToken, context }
 
-/-- Diagnostic options.  @since 3.17.0 -/
-structure DiagnosticOptions where
-  workDoneProgress : (Option Bool) := none
-  identifier : (Option String) := none
-  interFileDependencies : Bool
-  workspaceDiagnostics : Bool
+/-- Registration options for a {@link SignatureHelpRequest}. -/
+structure SignatureHelpRegistrationOptions where
+  documentSelector : (Option Json)
+  triggerCharacters : (Option (Array String)) := none
+  retriggerCharacters : (Option (Array String)) := none
   deriving Inhabited
 
-instance : ToJson DiagnosticOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => []) ++
-    (match s.identifier with | some v => [("identifier", toJson v)] | none => []) ++
-    [("interFileDependencies", toJson s.interFileDependencies)] ++
-    [("workspaceDiagnostics", toJson s.workspaceDiagnostics)]
+instance : ToJson SignatureHelpRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.retriggerCharacters with | some v => ("retriggerCharacters", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.triggerCharacters with | some v => ("triggerCharacters", toJson v) :: kvs | none => kvs)
+    let kvs := ("documentSelector", toJson s.documentSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DiagnosticOptions where
+instance : FromJson SignatureHelpRegistrationOptions where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    let identifier := (json.getObjValAs? String "identifier").toOption
-    let interFileDependencies ← json.getObjValAs? Bool "interFileDependencies"
-    let workspaceDiagnostics ← json.getObjValAs? Bool "workspaceDiagnostics"
-    return { workDoneProgress, identifier, interFileDependencies, workspaceDiagnostics }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    let triggerCharacters : Option (Array String) := (_obj.find compare "triggerCharacters").bind fun v => (fromJson? v).toOption
+    let retriggerCharacters : Option (Array String) := (_obj.find compare "retriggerCharacters").bind fun v => (fromJson? v).toOption
+    return { documentSelector, triggerCharacters, retriggerCharacters }
 
-/-- Hover options. -/
-structure HoverOptions where
-  workDoneProgress : (Option Bool) := none
+/-- Parameters for a {@link DefinitionRequest}. -/
+structure DefinitionParams where
+  textDocument : TextDocumentIdentifier
+  position : Position
+  workDoneToken : (Option ProgressToken) := none
+  partialResultToken : (Option ProgressToken) := none
   deriving Inhabited
 
-instance : ToJson HoverOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => [])
+instance : ToJson DefinitionParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.partialResultToken with | some v => ("partialResultToken", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    let kvs := ("textDocument", toJson s.textDocument) :: ("position", toJson s.position) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson HoverOptions where
+instance : FromJson DefinitionParams where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    return { workDoneProgress }
+    let _obj ← json.getObj?
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let position : Position ← match _obj.find compare "position" with | some v => fromJson? v | none => throw "property not found: position"
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let partialResultToken : Option ProgressToken := (_obj.find compare "partialResultToken").bind fun v => (fromJson? v).toOption
+    return { textDocument, position, workDoneToken, partialResultToken }
 
-/-- Server Capabilities for a {@link SignatureHelpRequest}. -/
-structure SignatureHelpOptions where
-  workDoneProgress : (Option Bool) := none
-  triggerCharacters : (Option (Array String)) := none
-  retriggerCharacters : (Option (Array String)) := none
+/-- Registration options for a {@link DefinitionRequest}. -/
+structure DefinitionRegistrationOptions where
+  documentSelector : (Option Json)
   deriving Inhabited
 
-instance : ToJson SignatureHelpOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => []) ++
-    (match s.triggerCharacters with | some v => [("triggerCharacters", toJson v)] | none => []) ++
-    (match s.retriggerCharacters with | some v => [("retriggerCharacters", toJson v)] | none => [])
+instance : ToJson DefinitionRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("documentSelector", toJson s.documentSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson SignatureHelpOptions where
+instance : FromJson DefinitionRegistrationOptions where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    let triggerCharacters := (json.getObjValAs? (Array String) "triggerCharacters").toOption
-    let retriggerCharacters := (json.getObjValAs? (Array String) "retriggerCharacters").toOption
-    return { workDoneProgress, triggerCharacters, retriggerCharacters }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    return { documentSelector }
 
-/-- Server Capabilities for a {@link DefinitionRequest}. -/
-structure DefinitionOptions where
-  workDoneProgress : (Option Bool) := none
+/-- Value-object that contains additional information when requesting references. -/
+structure ReferenceContext where
+  includeDeclaration : Bool
   deriving Inhabited
 
-instance : ToJson DefinitionOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => [])
+instance : ToJson ReferenceContext where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("includeDeclaration", toJson s.includeDeclaration) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DefinitionOptions where
+instance : FromJson ReferenceContext where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    return { workDoneProgress }
+    let _obj ← json.getObj?
+    let includeDeclaration : Bool ← match _obj.find compare "includeDeclaration" with | some v => fromJson? v | none => throw "property not found: includeDeclaration"
+    return { includeDeclaration }
 
-/-- Reference options. -/
-structure ReferenceOptions where
-  workDoneProgress : (Option Bool) := none
+/-- Parameters for a {@link ReferencesRequest}. -/
+structure ReferenceParams where
+  textDocument : TextDocumentIdentifier
+  position : Position
+  workDoneToken : (Option ProgressToken) := none
+  partialResultToken : (Option ProgressToken) := none
+  context : ReferenceContext
   deriving Inhabited
 
-instance : ToJson ReferenceOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => [])
+instance : ToJson ReferenceParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("context", toJson s.context) :: kvs
+    let kvs := (match s.partialResultToken with | some v => ("partialResultToken", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    let kvs := ("textDocument", toJson s.textDocument) :: ("position", toJson s.position) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ReferenceOptions where
+instance : FromJson ReferenceParams where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    return { workDoneProgress }
+    let _obj ← json.getObj?
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let position : Position ← match _obj.find compare "position" with | some v => fromJson? v | none => throw "property not found: position"
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let partialResultToken : Option ProgressToken := (_obj.find compare "partialResultToken").bind fun v => (fromJson? v).toOption
+    let context : ReferenceContext ← match _obj.find compare "context" with | some v => fromJson? v | none => throw "property not found: context"
+    return { textDocument, position, workDoneToken, partialResultToken, context }
 
-/-- Provider options for a {@link DocumentHighlightRequest}. -/
-structure DocumentHighlightOptions where
-  workDoneProgress : (Option Bool) := none
+/-- Registration options for a {@link ReferencesRequest}. -/
+structure ReferenceRegistrationOptions where
+  documentSelector : (Option Json)
   deriving Inhabited
 
-instance : ToJson DocumentHighlightOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => [])
+instance : ToJson ReferenceRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("documentSelector", toJson s.documentSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DocumentHighlightOptions where
+instance : FromJson ReferenceRegistrationOptions where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    return { workDoneProgress }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    return { documentSelector }
 
-/-- Provider options for a {@link DocumentSymbolRequest}. -/
-structure DocumentSymbolOptions where
-  workDoneProgress : (Option Bool) := none
-  label : (Option String) := none
+/-- Parameters for a {@link DocumentHighlightRequest}. -/
+structure DocumentHighlightParams where
+  textDocument : TextDocumentIdentifier
+  position : Position
+  workDoneToken : (Option ProgressToken) := none
+  partialResultToken : (Option ProgressToken) := none
   deriving Inhabited
 
-instance : ToJson DocumentSymbolOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => []) ++
-    (match s.label with | some v => [("label", toJson v)] | none => [])
+instance : ToJson DocumentHighlightParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.partialResultToken with | some v => ("partialResultToken", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    let kvs := ("textDocument", toJson s.textDocument) :: ("position", toJson s.position) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DocumentSymbolOptions where
+instance : FromJson DocumentHighlightParams where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    let label := (json.getObjValAs? String "label").toOption
-    return { workDoneProgress, label }
+    let _obj ← json.getObj?
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let position : Position ← match _obj.find compare "position" with | some v => fromJson? v | none => throw "property not found: position"
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let partialResultToken : Option ProgressToken := (_obj.find compare "partialResultToken").bind fun v => (fromJson? v).toOption
+    return { textDocument, position, workDoneToken, partialResultToken }
 
-/-- Provider options for a {@link CodeActionRequest}. -/
-structure CodeActionOptions where
-  workDoneProgress : (Option Bool) := none
-  codeActionKinds : (Option (Array CodeActionKind)) := none
-  documentation : Json := Json.null
-  resolveProvider : (Option Bool) := none
+/-- A document highlight is a range inside a text document which deserves special attention. Usually a document highlight is visualized by changing the background color of its range. -/
+structure DocumentHighlight where
+  range : Range
+  kind : (Option DocumentHighlightKind) := none
   deriving Inhabited
 
-instance : ToJson CodeActionOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => []) ++
-    (match s.codeActionKinds with | some v => [("codeActionKinds", toJson v)] | none => []) ++
-    [("documentation", toJson s.documentation)] ++
-    (match s.resolveProvider with | some v => [("resolveProvider", toJson v)] | none => [])
+instance : ToJson DocumentHighlight where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.kind with | some v => ("kind", toJson v) :: kvs | none => kvs)
+    let kvs := ("range", toJson s.range) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson CodeActionOptions where
+instance : FromJson DocumentHighlight where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    let codeActionKinds := (json.getObjValAs? (Array CodeActionKind) "codeActionKinds").toOption
-    let documentation := json.getObjVal? "documentation" |>.toOption |>.getD Json.null
-    let resolveProvider := (json.getObjValAs? Bool "resolveProvider").toOption
-    return { workDoneProgress, codeActionKinds, documentation, resolveProvider }
+    let _obj ← json.getObj?
+    let range : Range ← match _obj.find compare "range" with | some v => fromJson? v | none => throw "property not found: range"
+    let kind : Option DocumentHighlightKind := (_obj.find compare "kind").bind fun v => (fromJson? v).toOption
+    return { range, kind }
 
-/-- Server capabilities for a {@link WorkspaceSymbolRequest}. -/
-structure WorkspaceSymbolOptions where
-  workDoneProgress : (Option Bool) := none
-  resolveProvider : (Option Bool) := none
+/-- Registration options for a {@link DocumentHighlightRequest}. -/
+structure DocumentHighlightRegistrationOptions where
+  documentSelector : (Option Json)
   deriving Inhabited
 
-instance : ToJson WorkspaceSymbolOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => []) ++
-    (match s.resolveProvider with | some v => [("resolveProvider", toJson v)] | none => [])
+instance : ToJson DocumentHighlightRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("documentSelector", toJson s.documentSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson WorkspaceSymbolOptions where
+instance : FromJson DocumentHighlightRegistrationOptions where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    let resolveProvider := (json.getObjValAs? Bool "resolveProvider").toOption
-    return { workDoneProgress, resolveProvider }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    return { documentSelector }
 
-/-- Code Lens provider options of a {@link CodeLensRequest}. -/
-structure CodeLensOptions where
-  workDoneProgress : (Option Bool) := none
-  resolveProvider : (Option Bool) := none
+/-- Parameters for a {@link DocumentSymbolRequest}. -/
+structure DocumentSymbolParams where
+  workDoneToken : (Option ProgressToken) := none
+  partialResultToken : (Option ProgressToken) := none
+  textDocument : TextDocumentIdentifier
   deriving Inhabited
 
-instance : ToJson CodeLensOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => []) ++
-    (match s.resolveProvider with | some v => [("resolveProvider", toJson v)] | none => [])
+instance : ToJson DocumentSymbolParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("textDocument", toJson s.textDocument) :: kvs
+    let kvs := (match s.partialResultToken with | some v => ("partialResultToken", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson CodeLensOptions where
+instance : FromJson DocumentSymbolParams where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    let resolveProvider := (json.getObjValAs? Bool "resolveProvider").toOption
-    return { workDoneProgress, resolveProvider }
+    let _obj ← json.getObj?
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let partialResultToken : Option ProgressToken := (_obj.find compare "partialResultToken").bind fun v => (fromJson? v).toOption
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    return { workDoneToken, partialResultToken, textDocument }
 
-/-- Provider options for a {@link DocumentLinkRequest}. -/
-structure DocumentLinkOptions where
-  workDoneProgress : (Option Bool) := none
-  resolveProvider : (Option Bool) := none
+/-- Represents information about programming constructs like variables, classes, interfaces etc. -/
+structure SymbolInformation where
+  name : String
+  kind : SymbolKind
+  tags : (Option (Array SymbolTag)) := none
+  containerName : (Option String) := none
+  deprecated : (Option Bool) := none
+  location : Location
   deriving Inhabited
 
-instance : ToJson DocumentLinkOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => []) ++
-    (match s.resolveProvider with | some v => [("resolveProvider", toJson v)] | none => [])
+instance : ToJson SymbolInformation where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("location", toJson s.location) :: kvs
+    let kvs := (match s.deprecated with | some v => ("deprecated", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.containerName with | some v => ("containerName", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.tags with | some v => ("tags", toJson v) :: kvs | none => kvs)
+    let kvs := ("name", toJson s.name) :: ("kind", toJson s.kind) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DocumentLinkOptions where
+instance : FromJson SymbolInformation where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    let resolveProvider := (json.getObjValAs? Bool "resolveProvider").toOption
-    return { workDoneProgress, resolveProvider }
+    let _obj ← json.getObj?
+    let name : String ← match _obj.find compare "name" with | some v => fromJson? v | none => throw "property not found: name"
+    let kind : SymbolKind ← match _obj.find compare "kind" with | some v => fromJson? v | none => throw "property not found: kind"
+    let tags : Option (Array SymbolTag) := (_obj.find compare "tags").bind fun v => (fromJson? v).toOption
+    let containerName : Option String := (_obj.find compare "containerName").bind fun v => (fromJson? v).toOption
+    let deprecated : Option Bool := (_obj.find compare "deprecated").bind fun v => (fromJson? v).toOption
+    let location : Location ← match _obj.find compare "location" with | some v => fromJson? v | none => throw "property not found: location"
+    return { name, kind, tags, containerName, deprecated, location }
 
-/-- Provider options for a {@link DocumentFormattingRequest}. -/
-structure DocumentFormattingOptions where
-  workDoneProgress : (Option Bool) := none
+/-- Represents programming constructs like variables, classes, interfaces etc. that appear in a document. Document symbols can be hierarchical and they have two ranges: one that encloses its definition and one that points to its most interesting range, e.g. the range of an identifier. -/
+structure DocumentSymbol where
+  name : String
+  detail : (Option String) := none
+  kind : SymbolKind
+  tags : (Option (Array SymbolTag)) := none
+  deprecated : (Option Bool) := none
+  range : Range
+  selectionRange : Range
+  children : (Option (Array DocumentSymbol)) := none
+  deriving Inhabited
+
+partial def DocumentSymbol.toJsonImpl (s : DocumentSymbol) : Json :=
+  letI : ToJson DocumentSymbol := ⟨DocumentSymbol.toJsonImpl⟩
+  let kvs : List (String × Json) := []
+  let kvs := (match s.children with | some v => ("children", toJson v) :: kvs | none => kvs)
+  let kvs := ("range", toJson s.range) :: ("selectionRange", toJson s.selectionRange) :: kvs
+  let kvs := (match s.deprecated with | some v => ("deprecated", toJson v) :: kvs | none => kvs)
+  let kvs := (match s.tags with | some v => ("tags", toJson v) :: kvs | none => kvs)
+  let kvs := ("kind", toJson s.kind) :: kvs
+  let kvs := (match s.detail with | some v => ("detail", toJson v) :: kvs | none => kvs)
+  let kvs := ("name", toJson s.name) :: kvs
+  Json.mkObj kvs
+
+instance : ToJson DocumentSymbol := ⟨DocumentSymbol.toJsonImpl⟩
+
+partial def DocumentSymbol.fromJsonImpl (json : Json) : Except String DocumentSymbol :=
+  letI : FromJson DocumentSymbol := ⟨DocumentSymbol.fromJsonImpl⟩
+  do
+    let _obj ← json.getObj?
+    let name : String ← match _obj.find compare "name" with | some v => fromJson? v | none => throw "property not found: name"
+    let detail : Option String := (_obj.find compare "detail").bind fun v => (fromJson? v).toOption
+    let kind : SymbolKind ← match _obj.find compare "kind" with | some v => fromJson? v | none => throw "property not found: kind"
+    let tags : Option (Array SymbolTag) := (_obj.find compare "tags").bind fun v => (fromJson? v).toOption
+    let deprecated : Option Bool := (_obj.find compare "deprecated").bind fun v => (fromJson? v).toOption
+    let range : Range ← match _obj.find compare "range" with | some v => fromJson? v | none => throw "property not found: range"
+    let selectionRange : Range ← match _obj.find compare "selectionRange" with | some v => fromJson? v | none => throw "property not found: selectionRange"
+    let children : Option (Array DocumentSymbol) := (_obj.find compare "children").bind fun v => (fromJson? v).toOption
+    return { name, detail, kind, tags, deprecated, range, selectionRange, children }
+
+instance : FromJson DocumentSymbol := ⟨DocumentSymbol.fromJsonImpl⟩
+
+/-- Registration options for a {@link DocumentSymbolRequest}. -/
+structure DocumentSymbolRegistrationOptions where
+  documentSelector : (Option Json)
+  label : (Option String) := none
   deriving Inhabited
 
-instance : ToJson DocumentFormattingOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => [])
+instance : ToJson DocumentSymbolRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.label with | some v => ("label", toJson v) :: kvs | none => kvs)
+    let kvs := ("documentSelector", toJson s.documentSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DocumentFormattingOptions where
+instance : FromJson DocumentSymbolRegistrationOptions where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    return { workDoneProgress }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    let label : Option String := (_obj.find compare "label").bind fun v => (fromJson? v).toOption
+    return { documentSelector, label }
 
-/-- Provider options for a {@link DocumentRangeFormattingRequest}. -/
-structure DocumentRangeFormattingOptions where
-  workDoneProgress : (Option Bool) := none
-  rangesSupport : (Option Bool) := none
+/-- Contains additional diagnostic information about the context in which a {@link CodeActionProvider.provideCodeActions code action} is run. -/
+structure CodeActionContext where
+  diagnostics : Json
+  only : (Option (Array CodeActionKind)) := none
+  triggerKind : (Option CodeActionTriggerKind) := none
   deriving Inhabited
 
-instance : ToJson DocumentRangeFormattingOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => []) ++
-    (match s.rangesSupport with | some v => [("rangesSupport", toJson v)] | none => [])
+instance : ToJson CodeActionContext where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.triggerKind with | some v => ("triggerKind", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.only with | some v => ("only", toJson v) :: kvs | none => kvs)
+    let kvs := ("diagnostics", toJson s.diagnostics) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DocumentRangeFormattingOptions where
+instance : FromJson CodeActionContext where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    let rangesSupport := (json.getObjValAs? Bool "rangesSupport").toOption
-    return { workDoneProgress, rangesSupport }
+    let _obj ← json.getObj?
+    let diagnostics : Json := (_obj.find compare "diagnostics").getD Json.null
+    let only : Option (Array CodeActionKind) := (_obj.find compare "only").bind fun v => (fromJson? v).toOption
+    let triggerKind : Option CodeActionTriggerKind := (_obj.find compare "triggerKind").bind fun v => (fromJson? v).toOption
+    return { diagnostics, only, triggerKind }
 
-/-- Provider options for a {@link RenameRequest}. -/
-structure RenameOptions where
-  workDoneProgress : (Option Bool) := none
-  prepareProvider : (Option Bool) := none
+/-- The parameters of a {@link CodeActionRequest}. -/
+structure CodeActionParams where
+  workDoneToken : (Option ProgressToken) := none
+  partialResultToken : (Option ProgressToken) := none
+  textDocument : TextDocumentIdentifier
+  range : Range
+  context : CodeActionContext
   deriving Inhabited
 
-instance : ToJson RenameOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => []) ++
-    (match s.prepareProvider with | some v => [("prepareProvider", toJson v)] | none => [])
+instance : ToJson CodeActionParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("textDocument", toJson s.textDocument) :: ("range", toJson s.range) :: ("context", toJson s.context) :: kvs
+    let kvs := (match s.partialResultToken with | some v => ("partialResultToken", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson RenameOptions where
+instance : FromJson CodeActionParams where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    let prepareProvider := (json.getObjValAs? Bool "prepareProvider").toOption
-    return { workDoneProgress, prepareProvider }
+    let _obj ← json.getObj?
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let partialResultToken : Option ProgressToken := (_obj.find compare "partialResultToken").bind fun v => (fromJson? v).toOption
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let range : Range ← match _obj.find compare "range" with | some v => fromJson? v | none => throw "property not found: range"
+    let context : CodeActionContext ← match _obj.find compare "context" with | some v => fromJson? v | none => throw "property not found: context"
+    return { workDoneToken, partialResultToken, textDocument, range, context }
 
-/-- The server capabilities of a {@link ExecuteCommandRequest}. -/
-structure ExecuteCommandOptions where
-  workDoneProgress : (Option Bool) := none
-  commands : (Array String)
+/-- Captures why the code action is currently disabled.  @since 3.18.0 -/
+structure CodeActionDisabled where
+  reason : String
   deriving Inhabited
 
-instance : ToJson ExecuteCommandOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => []) ++
-    [("commands", toJson s.commands)]
+instance : ToJson CodeActionDisabled where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("reason", toJson s.reason) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ExecuteCommandOptions where
+instance : FromJson CodeActionDisabled where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    let commands ← json.getObjValAs? (Array String) "commands"
-    return { workDoneProgress, commands }
+    let _obj ← json.getObj?
+    let reason : String ← match _obj.find compare "reason" with | some v => fromJson? v | none => throw "property not found: reason"
+    return { reason }
 
-/-- Describe options to be used when registered for text document change events. -/
-structure TextDocumentChangeRegistrationOptions where
-  documentSelector : (Option Json)
-  syncKind : TextDocumentSyncKind
+/-- A code action represents a change that can be performed in code, e.g. to fix a problem or to refactor code.  A CodeAction must set either `edit` and/or a `command`. If both are supplied, the `edit` is applied first, then the `command` is executed. -/
+structure CodeAction where
+  title : String
+  kind : (Option CodeActionKind) := none
+  diagnostics : Json := Json.null
+  isPreferred : (Option Bool) := none
+  disabled : (Option CodeActionDisabled) := none
+  edit : (Option WorkspaceEdit) := none
+  command : (Option Command) := none
+  data : Json := Json.null
+  tags : (Option (Array CodeActionTag)) := none
   deriving Inhabited
 
-instance : ToJson TextDocumentChangeRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)] ++
-    [("syncKind", toJson s.syncKind)]
+instance : ToJson CodeAction where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.tags with | some v => ("tags", toJson v) :: kvs | none => kvs)
+    let kvs := ("data", toJson s.data) :: kvs
+    let kvs := (match s.command with | some v => ("command", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.edit with | some v => ("edit", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.disabled with | some v => ("disabled", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.isPreferred with | some v => ("isPreferred", toJson v) :: kvs | none => kvs)
+    let kvs := ("diagnostics", toJson s.diagnostics) :: kvs
+    let kvs := (match s.kind with | some v => ("kind", toJson v) :: kvs | none => kvs)
+    let kvs := ("title", toJson s.title) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson TextDocumentChangeRegistrationOptions where
+instance : FromJson CodeAction where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    let syncKind ← json.getObjValAs? TextDocumentSyncKind "syncKind"
-    return { documentSelector, syncKind }
+    let _obj ← json.getObj?
+    let title : String ← match _obj.find compare "title" with | some v => fromJson? v | none => throw "property not found: title"
+    let kind : Option CodeActionKind := (_obj.find compare "kind").bind fun v => (fromJson? v).toOption
+    let diagnostics : Json := (_obj.find compare "diagnostics").getD Json.null
+    let isPreferred : Option Bool := (_obj.find compare "isPreferred").bind fun v => (fromJson? v).toOption
+    let disabled : Option CodeActionDisabled := (_obj.find compare "disabled").bind fun v => (fromJson? v).toOption
+    let edit : Option WorkspaceEdit := (_obj.find compare "edit").bind fun v => (fromJson? v).toOption
+    let command : Option Command := (_obj.find compare "command").bind fun v => (fromJson? v).toOption
+    let data : Json := (_obj.find compare "data").getD Json.null
+    let tags : Option (Array CodeActionTag) := (_obj.find compare "tags").bind fun v => (fromJson? v).toOption
+    return { title, kind, diagnostics, isPreferred, disabled, edit, command, data, tags }
 
-structure ShowMessageRequestParams where
-  «type» : MessageType
-  message : String
-  actions : (Option (Array MessageActionItem)) := none
+/-- Registration options for a {@link CodeActionRequest}. -/
+structure CodeActionRegistrationOptions where
+  documentSelector : (Option Json)
+  codeActionKinds : (Option (Array CodeActionKind)) := none
+  documentation : Json := Json.null
+  resolveProvider : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson ShowMessageRequestParams where
-  toJson s := Json.mkObj <|
-    [("type", toJson s.«type»)] ++
-    [("message", toJson s.message)] ++
-    (match s.actions with | some v => [("actions", toJson v)] | none => [])
+instance : ToJson CodeActionRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.resolveProvider with | some v => ("resolveProvider", toJson v) :: kvs | none => kvs)
+    let kvs := ("documentation", toJson s.documentation) :: kvs
+    let kvs := (match s.codeActionKinds with | some v => ("codeActionKinds", toJson v) :: kvs | none => kvs)
+    let kvs := ("documentSelector", toJson s.documentSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ShowMessageRequestParams where
+instance : FromJson CodeActionRegistrationOptions where
   fromJson? json := do
-    let «type» ← json.getObjValAs? MessageType "type"
-    let message ← json.getObjValAs? String "message"
-    let actions := (json.getObjValAs? (Array MessageActionItem) "actions").toOption
-    return { «type», message, actions }
-
-/-- The parameters of a {@link ExecuteCommandRequest}. -/
-structure ExecuteCommandParams where
-  workDoneToken : (Option ProgressToken) := none
-  command : String
-  arguments : Json := Json.null
-  deriving Inhabited
-
-instance : ToJson ExecuteCommandParams where
-  toJson s := Json.mkObj <|
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    [("command", toJson s.command)] ++
-    [("arguments", toJson s.arguments)]
-
-instance : FromJson ExecuteCommandParams where
-  fromJson? json := do
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let command ← json.getObjValAs? String "command"
-    let arguments := json.getObjVal? "arguments" |>.toOption |>.getD Json.null
-    return { workDoneToken, command, arguments }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    let codeActionKinds : Option (Array CodeActionKind) := (_obj.find compare "codeActionKinds").bind fun v => (fromJson? v).toOption
+    let documentation : Json := (_obj.find compare "documentation").getD Json.null
+    let resolveProvider : Option Bool := (_obj.find compare "resolveProvider").bind fun v => (fromJson? v).toOption
+    return { documentSelector, codeActionKinds, documentation, resolveProvider }
 
 /-- The parameters of a {@link WorkspaceSymbolRequest}. -/
 structure WorkspaceSymbolParams where
@@ -4226,816 +5279,951 @@ structure WorkspaceSymbolParams where
   deriving Inhabited
 
 instance : ToJson WorkspaceSymbolParams where
-  toJson s := Json.mkObj <|
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    (match s.partialResultToken with | some v => [("partialResultToken", toJson v)] | none => []) ++
-    [("query", toJson s.query)]
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("query", toJson s.query) :: kvs
+    let kvs := (match s.partialResultToken with | some v => ("partialResultToken", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
 instance : FromJson WorkspaceSymbolParams where
   fromJson? json := do
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let partialResultToken := (json.getObjValAs? ProgressToken "partialResultToken").toOption
-    let query ← json.getObjValAs? String "query"
+    let _obj ← json.getObj?
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let partialResultToken : Option ProgressToken := (_obj.find compare "partialResultToken").bind fun v => (fromJson? v).toOption
+    let query : String ← match _obj.find compare "query" with | some v => fromJson? v | none => throw "property not found: query"
     return { workDoneToken, partialResultToken, query }
 
-/-- The parameters of a configuration request. -/
-structure ConfigurationParams where
-  items : (Array ConfigurationItem)
+/-- A special workspace symbol that supports locations without a range.  See also SymbolInformation.  @since 3.17.0 -/
+structure WorkspaceSymbol where
+  name : String
+  kind : SymbolKind
+  tags : (Option (Array SymbolTag)) := none
+  containerName : (Option String) := none
+  location : Json
+  data : Json := Json.null
   deriving Inhabited
 
-instance : ToJson ConfigurationParams where
-  toJson s := Json.mkObj <|
-    [("items", toJson s.items)]
+instance : ToJson WorkspaceSymbol where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("location", toJson s.location) :: ("data", toJson s.data) :: kvs
+    let kvs := (match s.containerName with | some v => ("containerName", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.tags with | some v => ("tags", toJson v) :: kvs | none => kvs)
+    let kvs := ("name", toJson s.name) :: ("kind", toJson s.kind) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ConfigurationParams where
+instance : FromJson WorkspaceSymbol where
   fromJson? json := do
-    let items ← json.getObjValAs? (Array ConfigurationItem) "items"
-    return { items }
+    let _obj ← json.getObj?
+    let name : String ← match _obj.find compare "name" with | some v => fromJson? v | none => throw "property not found: name"
+    let kind : SymbolKind ← match _obj.find compare "kind" with | some v => fromJson? v | none => throw "property not found: kind"
+    let tags : Option (Array SymbolTag) := (_obj.find compare "tags").bind fun v => (fromJson? v).toOption
+    let containerName : Option String := (_obj.find compare "containerName").bind fun v => (fromJson? v).toOption
+    let location : Json := (_obj.find compare "location").getD Json.null
+    let data : Json := (_obj.find compare "data").getD Json.null
+    return { name, kind, tags, containerName, location, data }
 
-/-- Parameters for a {@link DocumentColorRequest}. -/
-structure DocumentColorParams where
-  workDoneToken : (Option ProgressToken) := none
-  partialResultToken : (Option ProgressToken) := none
-  textDocument : TextDocumentIdentifier
+/-- Registration options for a {@link WorkspaceSymbolRequest}. -/
+structure WorkspaceSymbolRegistrationOptions where
+  resolveProvider : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson DocumentColorParams where
-  toJson s := Json.mkObj <|
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    (match s.partialResultToken with | some v => [("partialResultToken", toJson v)] | none => []) ++
-    [("textDocument", toJson s.textDocument)]
+instance : ToJson WorkspaceSymbolRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.resolveProvider with | some v => ("resolveProvider", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson DocumentColorParams where
+instance : FromJson WorkspaceSymbolRegistrationOptions where
   fromJson? json := do
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let partialResultToken := (json.getObjValAs? ProgressToken "partialResultToken").toOption
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    return { workDoneToken, partialResultToken, textDocument }
+    let _obj ← json.getObj?
+    let resolveProvider : Option Bool := (_obj.find compare "resolveProvider").bind fun v => (fromJson? v).toOption
+    return { resolveProvider }
 
-/-- Parameters for a {@link FoldingRangeRequest}. -/
-structure FoldingRangeParams where
+/-- The parameters of a {@link CodeLensRequest}. -/
+structure CodeLensParams where
   workDoneToken : (Option ProgressToken) := none
   partialResultToken : (Option ProgressToken) := none
   textDocument : TextDocumentIdentifier
   deriving Inhabited
 
-instance : ToJson FoldingRangeParams where
-  toJson s := Json.mkObj <|
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    (match s.partialResultToken with | some v => [("partialResultToken", toJson v)] | none => []) ++
-    [("textDocument", toJson s.textDocument)]
+instance : ToJson CodeLensParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("textDocument", toJson s.textDocument) :: kvs
+    let kvs := (match s.partialResultToken with | some v => ("partialResultToken", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson FoldingRangeParams where
+instance : FromJson CodeLensParams where
   fromJson? json := do
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let partialResultToken := (json.getObjValAs? ProgressToken "partialResultToken").toOption
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
+    let _obj ← json.getObj?
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let partialResultToken : Option ProgressToken := (_obj.find compare "partialResultToken").bind fun v => (fromJson? v).toOption
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
     return { workDoneToken, partialResultToken, textDocument }
 
-/-- @since 3.16.0 -/
-structure SemanticTokensParams where
-  workDoneToken : (Option ProgressToken) := none
-  partialResultToken : (Option ProgressToken) := none
-  textDocument : TextDocumentIdentifier
+/-- A code lens represents a {@link Command command} that should be shown along with source text, like the number of references, a way to run tests, etc.  A code lens is _unresolved_ when no command is associated to it. For performance reasons the creation of a code lens and resolving should be done in ... -/
+structure CodeLens where
+  range : Range
+  command : (Option Command) := none
+  data : Json := Json.null
   deriving Inhabited
 
-instance : ToJson SemanticTokensParams where
-  toJson s := Json.mkObj <|
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    (match s.partialResultToken with | some v => [("partialResultToken", toJson v)] | none => []) ++
-    [("textDocument", toJson s.textDocument)]
+instance : ToJson CodeLens where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("data", toJson s.data) :: kvs
+    let kvs := (match s.command with | some v => ("command", toJson v) :: kvs | none => kvs)
+    let kvs := ("range", toJson s.range) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson SemanticTokensParams where
+instance : FromJson CodeLens where
   fromJson? json := do
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let partialResultToken := (json.getObjValAs? ProgressToken "partialResultToken").toOption
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    return { workDoneToken, partialResultToken, textDocument }
+    let _obj ← json.getObj?
+    let range : Range ← match _obj.find compare "range" with | some v => fromJson? v | none => throw "property not found: range"
+    let command : Option Command := (_obj.find compare "command").bind fun v => (fromJson? v).toOption
+    let data : Json := (_obj.find compare "data").getD Json.null
+    return { range, command, data }
 
-/-- @since 3.16.0 -/
-structure SemanticTokensDeltaParams where
-  workDoneToken : (Option ProgressToken) := none
-  partialResultToken : (Option ProgressToken) := none
-  textDocument : TextDocumentIdentifier
-  previousResultId : String
+/-- Registration options for a {@link CodeLensRequest}. -/
+structure CodeLensRegistrationOptions where
+  documentSelector : (Option Json)
+  resolveProvider : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson SemanticTokensDeltaParams where
-  toJson s := Json.mkObj <|
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    (match s.partialResultToken with | some v => [("partialResultToken", toJson v)] | none => []) ++
-    [("textDocument", toJson s.textDocument)] ++
-    [("previousResultId", toJson s.previousResultId)]
+instance : ToJson CodeLensRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.resolveProvider with | some v => ("resolveProvider", toJson v) :: kvs | none => kvs)
+    let kvs := ("documentSelector", toJson s.documentSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson SemanticTokensDeltaParams where
+instance : FromJson CodeLensRegistrationOptions where
   fromJson? json := do
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let partialResultToken := (json.getObjValAs? ProgressToken "partialResultToken").toOption
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let previousResultId ← json.getObjValAs? String "previousResultId"
-    return { workDoneToken, partialResultToken, textDocument, previousResultId }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    let resolveProvider : Option Bool := (_obj.find compare "resolveProvider").bind fun v => (fromJson? v).toOption
+    return { documentSelector, resolveProvider }
 
-/-- Parameters of the document diagnostic request.  @since 3.17.0 -/
-structure DocumentDiagnosticParams where
+/-- The parameters of a {@link DocumentLinkRequest}. -/
+structure DocumentLinkParams where
   workDoneToken : (Option ProgressToken) := none
   partialResultToken : (Option ProgressToken) := none
   textDocument : TextDocumentIdentifier
-  identifier : (Option String) := none
-  previousResultId : (Option String) := none
   deriving Inhabited
 
-instance : ToJson DocumentDiagnosticParams where
-  toJson s := Json.mkObj <|
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    (match s.partialResultToken with | some v => [("partialResultToken", toJson v)] | none => []) ++
-    [("textDocument", toJson s.textDocument)] ++
-    (match s.identifier with | some v => [("identifier", toJson v)] | none => []) ++
-    (match s.previousResultId with | some v => [("previousResultId", toJson v)] | none => [])
+instance : ToJson DocumentLinkParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("textDocument", toJson s.textDocument) :: kvs
+    let kvs := (match s.partialResultToken with | some v => ("partialResultToken", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson DocumentDiagnosticParams where
+instance : FromJson DocumentLinkParams where
   fromJson? json := do
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let partialResultToken := (json.getObjValAs? ProgressToken "partialResultToken").toOption
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let identifier := (json.getObjValAs? String "identifier").toOption
-    let previousResultId := (json.getObjValAs? String "previousResultId").toOption
-    return { workDoneToken, partialResultToken, textDocument, identifier, previousResultId }
+    let _obj ← json.getObj?
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let partialResultToken : Option ProgressToken := (_obj.find compare "partialResultToken").bind fun v => (fromJson? v).toOption
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    return { workDoneToken, partialResultToken, textDocument }
 
-/-- The parameters sent in a close text document notification -/
-structure DidCloseTextDocumentParams where
-  textDocument : TextDocumentIdentifier
+/-- A document link is a range in a text document that links to an internal or external resource, like another text document or a web site. -/
+structure DocumentLink where
+  range : Range
+  target : (Option String) := none
+  tooltip : (Option String) := none
+  data : Json := Json.null
   deriving Inhabited
 
-instance : ToJson DidCloseTextDocumentParams where
-  toJson s := Json.mkObj <|
-    [("textDocument", toJson s.textDocument)]
+instance : ToJson DocumentLink where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("data", toJson s.data) :: kvs
+    let kvs := (match s.tooltip with | some v => ("tooltip", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.target with | some v => ("target", toJson v) :: kvs | none => kvs)
+    let kvs := ("range", toJson s.range) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DidCloseTextDocumentParams where
+instance : FromJson DocumentLink where
   fromJson? json := do
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    return { textDocument }
+    let _obj ← json.getObj?
+    let range : Range ← match _obj.find compare "range" with | some v => fromJson? v | none => throw "property not found: range"
+    let target : Option String := (_obj.find compare "target").bind fun v => (fromJson? v).toOption
+    let tooltip : Option String := (_obj.find compare "tooltip").bind fun v => (fromJson? v).toOption
+    let data : Json := (_obj.find compare "data").getD Json.null
+    return { range, target, tooltip, data }
 
-/-- The parameters sent in a save text document notification -/
-structure DidSaveTextDocumentParams where
-  textDocument : TextDocumentIdentifier
-  text : (Option String) := none
+/-- Registration options for a {@link DocumentLinkRequest}. -/
+structure DocumentLinkRegistrationOptions where
+  documentSelector : (Option Json)
+  resolveProvider : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson DidSaveTextDocumentParams where
-  toJson s := Json.mkObj <|
-    [("textDocument", toJson s.textDocument)] ++
-    (match s.text with | some v => [("text", toJson v)] | none => [])
+instance : ToJson DocumentLinkRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.resolveProvider with | some v => ("resolveProvider", toJson v) :: kvs | none => kvs)
+    let kvs := ("documentSelector", toJson s.documentSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DidSaveTextDocumentParams where
+instance : FromJson DocumentLinkRegistrationOptions where
   fromJson? json := do
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let text := (json.getObjValAs? String "text").toOption
-    return { textDocument, text }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    let resolveProvider : Option Bool := (_obj.find compare "resolveProvider").bind fun v => (fromJson? v).toOption
+    return { documentSelector, resolveProvider }
 
-/-- The parameters sent in a will save text document notification. -/
-structure WillSaveTextDocumentParams where
-  textDocument : TextDocumentIdentifier
-  reason : TextDocumentSaveReason
+/-- Value-object describing what options formatting should use. -/
+structure FormattingOptions where
+  tabSize : Nat
+  insertSpaces : Bool
+  trimTrailingWhitespace : (Option Bool) := none
+  insertFinalNewline : (Option Bool) := none
+  trimFinalNewlines : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson WillSaveTextDocumentParams where
-  toJson s := Json.mkObj <|
-    [("textDocument", toJson s.textDocument)] ++
-    [("reason", toJson s.reason)]
+instance : ToJson FormattingOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.trimFinalNewlines with | some v => ("trimFinalNewlines", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.insertFinalNewline with | some v => ("insertFinalNewline", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.trimTrailingWhitespace with | some v => ("trimTrailingWhitespace", toJson v) :: kvs | none => kvs)
+    let kvs := ("tabSize", toJson s.tabSize) :: ("insertSpaces", toJson s.insertSpaces) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson WillSaveTextDocumentParams where
+instance : FromJson FormattingOptions where
   fromJson? json := do
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let reason ← json.getObjValAs? TextDocumentSaveReason "reason"
-    return { textDocument, reason }
+    let _obj ← json.getObj?
+    let tabSize : Nat ← match _obj.find compare "tabSize" with | some v => fromJson? v | none => throw "property not found: tabSize"
+    let insertSpaces : Bool ← match _obj.find compare "insertSpaces" with | some v => fromJson? v | none => throw "property not found: insertSpaces"
+    let trimTrailingWhitespace : Option Bool := (_obj.find compare "trimTrailingWhitespace").bind fun v => (fromJson? v).toOption
+    let insertFinalNewline : Option Bool := (_obj.find compare "insertFinalNewline").bind fun v => (fromJson? v).toOption
+    let trimFinalNewlines : Option Bool := (_obj.find compare "trimFinalNewlines").bind fun v => (fromJson? v).toOption
+    return { tabSize, insertSpaces, trimTrailingWhitespace, insertFinalNewline, trimFinalNewlines }
 
-/-- Parameters for a {@link DocumentSymbolRequest}. -/
-structure DocumentSymbolParams where
+/-- The parameters of a {@link DocumentFormattingRequest}. -/
+structure DocumentFormattingParams where
   workDoneToken : (Option ProgressToken) := none
-  partialResultToken : (Option ProgressToken) := none
   textDocument : TextDocumentIdentifier
+  options : FormattingOptions
   deriving Inhabited
 
-instance : ToJson DocumentSymbolParams where
-  toJson s := Json.mkObj <|
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    (match s.partialResultToken with | some v => [("partialResultToken", toJson v)] | none => []) ++
-    [("textDocument", toJson s.textDocument)]
+instance : ToJson DocumentFormattingParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("textDocument", toJson s.textDocument) :: ("options", toJson s.options) :: kvs
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson DocumentSymbolParams where
+instance : FromJson DocumentFormattingParams where
   fromJson? json := do
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let partialResultToken := (json.getObjValAs? ProgressToken "partialResultToken").toOption
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    return { workDoneToken, partialResultToken, textDocument }
+    let _obj ← json.getObj?
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let options : FormattingOptions ← match _obj.find compare "options" with | some v => fromJson? v | none => throw "property not found: options"
+    return { workDoneToken, textDocument, options }
 
-/-- The parameters of a {@link CodeLensRequest}. -/
-structure CodeLensParams where
-  workDoneToken : (Option ProgressToken) := none
-  partialResultToken : (Option ProgressToken) := none
-  textDocument : TextDocumentIdentifier
+/-- Registration options for a {@link DocumentFormattingRequest}. -/
+structure DocumentFormattingRegistrationOptions where
+  documentSelector : (Option Json)
   deriving Inhabited
 
-instance : ToJson CodeLensParams where
-  toJson s := Json.mkObj <|
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    (match s.partialResultToken with | some v => [("partialResultToken", toJson v)] | none => []) ++
-    [("textDocument", toJson s.textDocument)]
+instance : ToJson DocumentFormattingRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("documentSelector", toJson s.documentSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson CodeLensParams where
+instance : FromJson DocumentFormattingRegistrationOptions where
   fromJson? json := do
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let partialResultToken := (json.getObjValAs? ProgressToken "partialResultToken").toOption
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    return { workDoneToken, partialResultToken, textDocument }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    return { documentSelector }
 
-/-- The parameters of a {@link DocumentLinkRequest}. -/
-structure DocumentLinkParams where
+/-- The parameters of a {@link DocumentRangeFormattingRequest}. -/
+structure DocumentRangeFormattingParams where
   workDoneToken : (Option ProgressToken) := none
-  partialResultToken : (Option ProgressToken) := none
   textDocument : TextDocumentIdentifier
+  range : Range
+  options : FormattingOptions
   deriving Inhabited
 
-instance : ToJson DocumentLinkParams where
-  toJson s := Json.mkObj <|
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    (match s.partialResultToken with | some v => [("partialResultToken", toJson v)] | none => []) ++
-    [("textDocument", toJson s.textDocument)]
+instance : ToJson DocumentRangeFormattingParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("textDocument", toJson s.textDocument) :: ("range", toJson s.range) :: ("options", toJson s.options) :: kvs
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson DocumentLinkParams where
+instance : FromJson DocumentRangeFormattingParams where
   fromJson? json := do
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let partialResultToken := (json.getObjValAs? ProgressToken "partialResultToken").toOption
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    return { workDoneToken, partialResultToken, textDocument }
+    let _obj ← json.getObj?
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let range : Range ← match _obj.find compare "range" with | some v => fromJson? v | none => throw "property not found: range"
+    let options : FormattingOptions ← match _obj.find compare "options" with | some v => fromJson? v | none => throw "property not found: options"
+    return { workDoneToken, textDocument, range, options }
 
-/-- A text document identifier to denote a specific version of a text document. -/
-structure VersionedTextDocumentIdentifier where
-  uri : String
-  version : Int
+/-- Registration options for a {@link DocumentRangeFormattingRequest}. -/
+structure DocumentRangeFormattingRegistrationOptions where
+  documentSelector : (Option Json)
+  rangesSupport : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson VersionedTextDocumentIdentifier where
-  toJson s := Json.mkObj <|
-    [("uri", toJson s.uri)] ++
-    [("version", toJson s.version)]
+instance : ToJson DocumentRangeFormattingRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.rangesSupport with | some v => ("rangesSupport", toJson v) :: kvs | none => kvs)
+    let kvs := ("documentSelector", toJson s.documentSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson VersionedTextDocumentIdentifier where
+instance : FromJson DocumentRangeFormattingRegistrationOptions where
   fromJson? json := do
-    let uri ← json.getObjValAs? String "uri"
-    let version ← json.getObjValAs? Int "version"
-    return { uri, version }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    let rangesSupport : Option Bool := (_obj.find compare "rangesSupport").bind fun v => (fromJson? v).toOption
+    return { documentSelector, rangesSupport }
 
-/-- A text document identifier to optionally denote a specific version of a text document. -/
-structure OptionalVersionedTextDocumentIdentifier where
-  uri : String
-  version : (Option Int)
+/-- The parameters of a {@link DocumentOnTypeFormattingRequest}. -/
+structure DocumentOnTypeFormattingParams where
+  textDocument : TextDocumentIdentifier
+  position : Position
+  ch : String
+  options : FormattingOptions
   deriving Inhabited
 
-instance : ToJson OptionalVersionedTextDocumentIdentifier where
-  toJson s := Json.mkObj <|
-    [("uri", toJson s.uri)] ++
-    [("version", toJson s.version)]
+instance : ToJson DocumentOnTypeFormattingParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("textDocument", toJson s.textDocument) :: ("position", toJson s.position) :: ("ch", toJson s.ch) :: ("options", toJson s.options) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson OptionalVersionedTextDocumentIdentifier where
+instance : FromJson DocumentOnTypeFormattingParams where
   fromJson? json := do
-    let uri ← json.getObjValAs? String "uri"
-    let version ← json.getObjValAs? (Option Int) "version"
-    return { uri, version }
+    let _obj ← json.getObj?
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let position : Position ← match _obj.find compare "position" with | some v => fromJson? v | none => throw "property not found: position"
+    let ch : String ← match _obj.find compare "ch" with | some v => fromJson? v | none => throw "property not found: ch"
+    let options : FormattingOptions ← match _obj.find compare "options" with | some v => fromJson? v | none => throw "property not found: options"
+    return { textDocument, position, ch, options }
 
-/-- A parameter literal used in selection range requests. -/
-structure SelectionRangeParams where
-  workDoneToken : (Option ProgressToken) := none
-  partialResultToken : (Option ProgressToken) := none
-  textDocument : TextDocumentIdentifier
-  positions : (Array Position)
+/-- Registration options for a {@link DocumentOnTypeFormattingRequest}. -/
+structure DocumentOnTypeFormattingRegistrationOptions where
+  documentSelector : (Option Json)
+  firstTriggerCharacter : String
+  moreTriggerCharacter : (Option (Array String)) := none
   deriving Inhabited
 
-instance : ToJson SelectionRangeParams where
-  toJson s := Json.mkObj <|
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    (match s.partialResultToken with | some v => [("partialResultToken", toJson v)] | none => []) ++
-    [("textDocument", toJson s.textDocument)] ++
-    [("positions", toJson s.positions)]
+instance : ToJson DocumentOnTypeFormattingRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.moreTriggerCharacter with | some v => ("moreTriggerCharacter", toJson v) :: kvs | none => kvs)
+    let kvs := ("documentSelector", toJson s.documentSelector) :: ("firstTriggerCharacter", toJson s.firstTriggerCharacter) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson SelectionRangeParams where
+instance : FromJson DocumentOnTypeFormattingRegistrationOptions where
   fromJson? json := do
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let partialResultToken := (json.getObjValAs? ProgressToken "partialResultToken").toOption
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let positions ← json.getObjValAs? (Array Position) "positions"
-    return { workDoneToken, partialResultToken, textDocument, positions }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    let firstTriggerCharacter : String ← match _obj.find compare "firstTriggerCharacter" with | some v => fromJson? v | none => throw "property not found: firstTriggerCharacter"
+    let moreTriggerCharacter : Option (Array String) := (_obj.find compare "moreTriggerCharacter").bind fun v => (fromJson? v).toOption
+    return { documentSelector, firstTriggerCharacter, moreTriggerCharacter }
 
-/-- A parameter literal used in requests to pass a text document and a position inside that document. -/
-structure TextDocumentPositionParams where
+/-- The parameters of a {@link RenameRequest}. -/
+structure RenameParams where
   textDocument : TextDocumentIdentifier
   position : Position
+  workDoneToken : (Option ProgressToken) := none
+  newName : String
   deriving Inhabited
 
-instance : ToJson TextDocumentPositionParams where
-  toJson s := Json.mkObj <|
-    [("textDocument", toJson s.textDocument)] ++
-    [("position", toJson s.position)]
+instance : ToJson RenameParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("newName", toJson s.newName) :: kvs
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    let kvs := ("textDocument", toJson s.textDocument) :: ("position", toJson s.position) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson TextDocumentPositionParams where
+instance : FromJson RenameParams where
   fromJson? json := do
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let position ← json.getObjValAs? Position "position"
-    return { textDocument, position }
+    let _obj ← json.getObj?
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let position : Position ← match _obj.find compare "position" with | some v => fromJson? v | none => throw "property not found: position"
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let newName : String ← match _obj.find compare "newName" with | some v => fromJson? v | none => throw "property not found: newName"
+    return { textDocument, position, workDoneToken, newName }
 
-/-- A range in a text document expressed as (zero-based) start and end positions.  If you want to specify a range that contains a line including the line ending character(s) then use an end position denoting the start of the next line. For example: ```ts {     start: { line: 5, character: 23 }     end :... -/
-structure Range where
-  start : Position
-  «end» : Position
+/-- Registration options for a {@link RenameRequest}. -/
+structure RenameRegistrationOptions where
+  documentSelector : (Option Json)
+  prepareProvider : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson Range where
-  toJson s := Json.mkObj <|
-    [("start", toJson s.start)] ++
-    [("end", toJson s.«end»)]
+instance : ToJson RenameRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.prepareProvider with | some v => ("prepareProvider", toJson v) :: kvs | none => kvs)
+    let kvs := ("documentSelector", toJson s.documentSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson Range where
+instance : FromJson RenameRegistrationOptions where
   fromJson? json := do
-    let start ← json.getObjValAs? Position "start"
-    let «end» ← json.getObjValAs? Position "end"
-    return { start, «end» }
+    let _obj ← json.getObj?
+    let documentSelector : (Option Json) ← match _obj.find compare "documentSelector" with | some v => fromJson? v | none => throw "property not found: documentSelector"
+    let prepareProvider : Option Bool := (_obj.find compare "prepareProvider").bind fun v => (fromJson? v).toOption
+    return { documentSelector, prepareProvider }
 
-/-- @since 3.16.0 -/
-structure SemanticTokensDelta where
-  resultId : (Option String) := none
-  edits : (Array SemanticTokensEdit)
+structure PrepareRenameParams where
+  textDocument : TextDocumentIdentifier
+  position : Position
+  workDoneToken : (Option ProgressToken) := none
   deriving Inhabited
 
-instance : ToJson SemanticTokensDelta where
-  toJson s := Json.mkObj <|
-    (match s.resultId with | some v => [("resultId", toJson v)] | none => []) ++
-    [("edits", toJson s.edits)]
+instance : ToJson PrepareRenameParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    let kvs := ("textDocument", toJson s.textDocument) :: ("position", toJson s.position) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson SemanticTokensDelta where
+instance : FromJson PrepareRenameParams where
   fromJson? json := do
-    let resultId := (json.getObjValAs? String "resultId").toOption
-    let edits ← json.getObjValAs? (Array SemanticTokensEdit) "edits"
-    return { resultId, edits }
+    let _obj ← json.getObj?
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let position : Position ← match _obj.find compare "position" with | some v => fromJson? v | none => throw "property not found: position"
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    return { textDocument, position, workDoneToken }
 
-/-- @since 3.16.0 -/
-structure SemanticTokensDeltaPartialResult where
-  edits : (Array SemanticTokensEdit)
+/-- The parameters of a {@link ExecuteCommandRequest}. -/
+structure ExecuteCommandParams where
+  workDoneToken : (Option ProgressToken) := none
+  command : String
+  arguments : Json := Json.null
   deriving Inhabited
 
-instance : ToJson SemanticTokensDeltaPartialResult where
-  toJson s := Json.mkObj <|
-    [("edits", toJson s.edits)]
+instance : ToJson ExecuteCommandParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("command", toJson s.command) :: ("arguments", toJson s.arguments) :: kvs
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson SemanticTokensDeltaPartialResult where
+instance : FromJson ExecuteCommandParams where
   fromJson? json := do
-    let edits ← json.getObjValAs? (Array SemanticTokensEdit) "edits"
-    return { edits }
+    let _obj ← json.getObj?
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let command : String ← match _obj.find compare "command" with | some v => fromJson? v | none => throw "property not found: command"
+    let arguments : Json := (_obj.find compare "arguments").getD Json.null
+    return { workDoneToken, command, arguments }
 
-/-- The parameters sent in notifications/requests for user-initiated creation of files.  @since 3.16.0 -/
-structure CreateFilesParams where
-  files : (Array FileCreate)
+/-- Registration options for a {@link ExecuteCommandRequest}. -/
+structure ExecuteCommandRegistrationOptions where
+  commands : (Array String)
   deriving Inhabited
 
-instance : ToJson CreateFilesParams where
-  toJson s := Json.mkObj <|
-    [("files", toJson s.files)]
+instance : ToJson ExecuteCommandRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("commands", toJson s.commands) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson CreateFilesParams where
+instance : FromJson ExecuteCommandRegistrationOptions where
   fromJson? json := do
-    let files ← json.getObjValAs? (Array FileCreate) "files"
-    return { files }
+    let _obj ← json.getObj?
+    let commands : (Array String) ← match _obj.find compare "commands" with | some v => fromJson? v | none => throw "property not found: commands"
+    return { commands }
 
-/-- The options to register for file operations.  @since 3.16.0 -/
-structure FileOperationRegistrationOptions where
-  filters : (Array FileOperationFilter)
+/-- The parameters passed via an apply workspace edit request. -/
+structure ApplyWorkspaceEditParams where
+  label : (Option String) := none
+  edit : WorkspaceEdit
+  metadata : Json := Json.null
   deriving Inhabited
 
-instance : ToJson FileOperationRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("filters", toJson s.filters)]
+instance : ToJson ApplyWorkspaceEditParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("edit", toJson s.edit) :: ("metadata", toJson s.metadata) :: kvs
+    let kvs := (match s.label with | some v => ("label", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson FileOperationRegistrationOptions where
+instance : FromJson ApplyWorkspaceEditParams where
   fromJson? json := do
-    let filters ← json.getObjValAs? (Array FileOperationFilter) "filters"
-    return { filters }
+    let _obj ← json.getObj?
+    let label : Option String := (_obj.find compare "label").bind fun v => (fromJson? v).toOption
+    let edit : WorkspaceEdit ← match _obj.find compare "edit" with | some v => fromJson? v | none => throw "property not found: edit"
+    let metadata : Json := (_obj.find compare "metadata").getD Json.null
+    return { label, edit, metadata }
 
-/-- The parameters sent in notifications/requests for user-initiated renames of files.  @since 3.16.0 -/
-structure RenameFilesParams where
-  files : (Array FileRename)
+/-- The result returned from the apply workspace edit request.  @since 3.17 renamed from ApplyWorkspaceEditResponse -/
+structure ApplyWorkspaceEditResult where
+  applied : Bool
+  failureReason : (Option String) := none
+  failedChange : (Option Nat) := none
   deriving Inhabited
 
-instance : ToJson RenameFilesParams where
-  toJson s := Json.mkObj <|
-    [("files", toJson s.files)]
+instance : ToJson ApplyWorkspaceEditResult where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.failedChange with | some v => ("failedChange", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.failureReason with | some v => ("failureReason", toJson v) :: kvs | none => kvs)
+    let kvs := ("applied", toJson s.applied) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson RenameFilesParams where
+instance : FromJson ApplyWorkspaceEditResult where
   fromJson? json := do
-    let files ← json.getObjValAs? (Array FileRename) "files"
-    return { files }
+    let _obj ← json.getObj?
+    let applied : Bool ← match _obj.find compare "applied" with | some v => fromJson? v | none => throw "property not found: applied"
+    let failureReason : Option String := (_obj.find compare "failureReason").bind fun v => (fromJson? v).toOption
+    let failedChange : Option Nat := (_obj.find compare "failedChange").bind fun v => (fromJson? v).toOption
+    return { applied, failureReason, failedChange }
 
-/-- The parameters sent in notifications/requests for user-initiated deletes of files.  @since 3.16.0 -/
-structure DeleteFilesParams where
-  files : (Array FileDelete)
+structure WorkDoneProgressBegin where
+  kind : String
+  title : String
+  cancellable : (Option Bool) := none
+  message : (Option String) := none
+  percentage : (Option Nat) := none
   deriving Inhabited
 
-instance : ToJson DeleteFilesParams where
-  toJson s := Json.mkObj <|
-    [("files", toJson s.files)]
+instance : ToJson WorkDoneProgressBegin where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.percentage with | some v => ("percentage", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.message with | some v => ("message", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.cancellable with | some v => ("cancellable", toJson v) :: kvs | none => kvs)
+    let kvs := ("kind", toJson s.kind) :: ("title", toJson s.title) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DeleteFilesParams where
+instance : FromJson WorkDoneProgressBegin where
   fromJson? json := do
-    let files ← json.getObjValAs? (Array FileDelete) "files"
-    return { files }
+    let _obj ← json.getObj?
+    let kind : String ← match _obj.find compare "kind" with | some v => fromJson? v | none => throw "property not found: kind"
+    let title : String ← match _obj.find compare "title" with | some v => fromJson? v | none => throw "property not found: title"
+    let cancellable : Option Bool := (_obj.find compare "cancellable").bind fun v => (fromJson? v).toOption
+    let message : Option String := (_obj.find compare "message").bind fun v => (fromJson? v).toOption
+    let percentage : Option Nat := (_obj.find compare "percentage").bind fun v => (fromJson? v).toOption
+    return { kind, title, cancellable, message, percentage }
 
-/-- Represents a parameter of a callable-signature. A parameter can have a label and a doc-comment. -/
-structure ParameterInformation where
-  label : Json
-  documentation : Json := Json.null
+structure WorkDoneProgressReport where
+  kind : String
+  cancellable : (Option Bool) := none
+  message : (Option String) := none
+  percentage : (Option Nat) := none
   deriving Inhabited
 
-instance : ToJson ParameterInformation where
-  toJson s := Json.mkObj <|
-    [("label", toJson s.label)] ++
-    [("documentation", toJson s.documentation)]
+instance : ToJson WorkDoneProgressReport where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.percentage with | some v => ("percentage", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.message with | some v => ("message", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.cancellable with | some v => ("cancellable", toJson v) :: kvs | none => kvs)
+    let kvs := ("kind", toJson s.kind) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ParameterInformation where
+instance : FromJson WorkDoneProgressReport where
   fromJson? json := do
-    let label := json.getObjVal? "label" |>.toOption |>.getD Json.null
-    let documentation := json.getObjVal? "documentation" |>.toOption |>.getD Json.null
-    return { label, documentation }
+    let _obj ← json.getObj?
+    let kind : String ← match _obj.find compare "kind" with | some v => fromJson? v | none => throw "property not found: kind"
+    let cancellable : Option Bool := (_obj.find compare "cancellable").bind fun v => (fromJson? v).toOption
+    let message : Option String := (_obj.find compare "message").bind fun v => (fromJson? v).toOption
+    let percentage : Option Nat := (_obj.find compare "percentage").bind fun v => (fromJson? v).toOption
+    return { kind, cancellable, message, percentage }
 
-/-- A full document diagnostic report for a workspace diagnostic result.  @since 3.17.0 -/
-structure WorkspaceFullDocumentDiagnosticReport where
+structure WorkDoneProgressEnd where
   kind : String
-  resultId : (Option String) := none
-  items : Json
-  uri : String
-  version : (Option Int)
+  message : (Option String) := none
   deriving Inhabited
 
-instance : ToJson WorkspaceFullDocumentDiagnosticReport where
-  toJson s := Json.mkObj <|
-    [("kind", toJson s.kind)] ++
-    (match s.resultId with | some v => [("resultId", toJson v)] | none => []) ++
-    [("items", toJson s.items)] ++
-    [("uri", toJson s.uri)] ++
-    [("version", toJson s.version)]
+instance : ToJson WorkDoneProgressEnd where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.message with | some v => ("message", toJson v) :: kvs | none => kvs)
+    let kvs := ("kind", toJson s.kind) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson WorkspaceFullDocumentDiagnosticReport where
+instance : FromJson WorkDoneProgressEnd where
   fromJson? json := do
-    let kind ← json.getObjValAs? String "kind"
-    let resultId := (json.getObjValAs? String "resultId").toOption
-    let items := json.getObjVal? "items" |>.toOption |>.getD Json.null
-    let uri ← json.getObjValAs? String "uri"
-    let version ← json.getObjValAs? (Option Int) "version"
-    return { kind, resultId, items, uri, version }
+    let _obj ← json.getObj?
+    let kind : String ← match _obj.find compare "kind" with | some v => fromJson? v | none => throw "property not found: kind"
+    let message : Option String := (_obj.find compare "message").bind fun v => (fromJson? v).toOption
+    return { kind, message }
 
-/-- A partial result for a document diagnostic report.  @since 3.17.0 -/
-structure DocumentDiagnosticReportPartialResult where
-  relatedDocuments : Json
+structure SetTraceParams where
+  value : TraceValue
   deriving Inhabited
 
-instance : ToJson DocumentDiagnosticReportPartialResult where
-  toJson s := Json.mkObj <|
-    [("relatedDocuments", toJson s.relatedDocuments)]
+instance : ToJson SetTraceParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("value", toJson s.value) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DocumentDiagnosticReportPartialResult where
+instance : FromJson SetTraceParams where
   fromJson? json := do
-    let relatedDocuments := json.getObjVal? "relatedDocuments" |>.toOption |>.getD Json.null
-    return { relatedDocuments }
+    let _obj ← json.getObj?
+    let value : TraceValue ← match _obj.find compare "value" with | some v => fromJson? v | none => throw "property not found: value"
+    return { value }
 
-/-- A full diagnostic report with a set of related documents.  @since 3.17.0 -/
-structure RelatedFullDocumentDiagnosticReport where
-  kind : String
-  resultId : (Option String) := none
-  items : Json
-  relatedDocuments : Json := Json.null
+structure LogTraceParams where
+  message : String
+  verbose : (Option String) := none
   deriving Inhabited
 
-instance : ToJson RelatedFullDocumentDiagnosticReport where
-  toJson s := Json.mkObj <|
-    [("kind", toJson s.kind)] ++
-    (match s.resultId with | some v => [("resultId", toJson v)] | none => []) ++
-    [("items", toJson s.items)] ++
-    [("relatedDocuments", toJson s.relatedDocuments)]
+instance : ToJson LogTraceParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.verbose with | some v => ("verbose", toJson v) :: kvs | none => kvs)
+    let kvs := ("message", toJson s.message) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson RelatedFullDocumentDiagnosticReport where
+instance : FromJson LogTraceParams where
   fromJson? json := do
-    let kind ← json.getObjValAs? String "kind"
-    let resultId := (json.getObjValAs? String "resultId").toOption
-    let items := json.getObjVal? "items" |>.toOption |>.getD Json.null
-    let relatedDocuments := json.getObjVal? "relatedDocuments" |>.toOption |>.getD Json.null
-    return { kind, resultId, items, relatedDocuments }
+    let _obj ← json.getObj?
+    let message : String ← match _obj.find compare "message" with | some v => fromJson? v | none => throw "property not found: message"
+    let verbose : Option String := (_obj.find compare "verbose").bind fun v => (fromJson? v).toOption
+    return { message, verbose }
 
-/-- An unchanged diagnostic report with a set of related documents.  @since 3.17.0 -/
-structure RelatedUnchangedDocumentDiagnosticReport where
-  kind : String
-  resultId : String
-  relatedDocuments : Json := Json.null
+structure CancelParams where
+  id : Json
   deriving Inhabited
 
-instance : ToJson RelatedUnchangedDocumentDiagnosticReport where
-  toJson s := Json.mkObj <|
-    [("kind", toJson s.kind)] ++
-    [("resultId", toJson s.resultId)] ++
-    [("relatedDocuments", toJson s.relatedDocuments)]
+instance : ToJson CancelParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("id", toJson s.id) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson RelatedUnchangedDocumentDiagnosticReport where
+instance : FromJson CancelParams where
   fromJson? json := do
-    let kind ← json.getObjValAs? String "kind"
-    let resultId ← json.getObjValAs? String "resultId"
-    let relatedDocuments := json.getObjVal? "relatedDocuments" |>.toOption |>.getD Json.null
-    return { kind, resultId, relatedDocuments }
+    let _obj ← json.getObj?
+    let id : Json := (_obj.find compare "id").getD Json.null
+    return { id }
 
-/-- An unchanged document diagnostic report for a workspace diagnostic result.  @since 3.17.0 -/
-structure WorkspaceUnchangedDocumentDiagnosticReport where
-  kind : String
-  resultId : String
-  uri : String
-  version : (Option Int)
+structure ProgressParams where
+  token : ProgressToken
+  value : Json
   deriving Inhabited
 
-instance : ToJson WorkspaceUnchangedDocumentDiagnosticReport where
-  toJson s := Json.mkObj <|
-    [("kind", toJson s.kind)] ++
-    [("resultId", toJson s.resultId)] ++
-    [("uri", toJson s.uri)] ++
-    [("version", toJson s.version)]
+instance : ToJson ProgressParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("token", toJson s.token) :: ("value", toJson s.value) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson WorkspaceUnchangedDocumentDiagnosticReport where
+instance : FromJson ProgressParams where
   fromJson? json := do
-    let kind ← json.getObjValAs? String "kind"
-    let resultId ← json.getObjValAs? String "resultId"
-    let uri ← json.getObjValAs? String "uri"
-    let version ← json.getObjValAs? (Option Int) "version"
-    return { kind, resultId, uri, version }
+    let _obj ← json.getObj?
+    let token : ProgressToken ← match _obj.find compare "token" with | some v => fromJson? v | none => throw "property not found: token"
+    let value : Json := (_obj.find compare "value").getD Json.null
+    return { token, value }
 
-/-- Parameters of the workspace diagnostic request.  @since 3.17.0 -/
-structure WorkspaceDiagnosticParams where
-  workDoneToken : (Option ProgressToken) := none
-  partialResultToken : (Option ProgressToken) := none
-  identifier : (Option String) := none
-  previousResultIds : (Array PreviousResultId)
+/-- A parameter literal used in requests to pass a text document and a position inside that document. -/
+structure TextDocumentPositionParams where
+  textDocument : TextDocumentIdentifier
+  position : Position
   deriving Inhabited
 
-instance : ToJson WorkspaceDiagnosticParams where
-  toJson s := Json.mkObj <|
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    (match s.partialResultToken with | some v => [("partialResultToken", toJson v)] | none => []) ++
-    (match s.identifier with | some v => [("identifier", toJson v)] | none => []) ++
-    [("previousResultIds", toJson s.previousResultIds)]
+instance : ToJson TextDocumentPositionParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("textDocument", toJson s.textDocument) :: ("position", toJson s.position) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson WorkspaceDiagnosticParams where
+instance : FromJson TextDocumentPositionParams where
   fromJson? json := do
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let partialResultToken := (json.getObjValAs? ProgressToken "partialResultToken").toOption
-    let identifier := (json.getObjValAs? String "identifier").toOption
-    let previousResultIds ← json.getObjValAs? (Array PreviousResultId) "previousResultIds"
-    return { workDoneToken, partialResultToken, identifier, previousResultIds }
+    let _obj ← json.getObj?
+    let textDocument : TextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let position : Position ← match _obj.find compare "position" with | some v => fromJson? v | none => throw "property not found: position"
+    return { textDocument, position }
 
-/-- The params sent in an open notebook document notification.  @since 3.17.0 -/
-structure DidOpenNotebookDocumentParams where
-  notebookDocument : NotebookDocument
-  cellTextDocuments : (Array TextDocumentItem)
+structure WorkDoneProgressParams where
+  workDoneToken : (Option ProgressToken) := none
   deriving Inhabited
 
-instance : ToJson DidOpenNotebookDocumentParams where
-  toJson s := Json.mkObj <|
-    [("notebookDocument", toJson s.notebookDocument)] ++
-    [("cellTextDocuments", toJson s.cellTextDocuments)]
+instance : ToJson WorkDoneProgressParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson DidOpenNotebookDocumentParams where
+instance : FromJson WorkDoneProgressParams where
   fromJson? json := do
-    let notebookDocument ← json.getObjValAs? NotebookDocument "notebookDocument"
-    let cellTextDocuments ← json.getObjValAs? (Array TextDocumentItem) "cellTextDocuments"
-    return { notebookDocument, cellTextDocuments }
+    let _obj ← json.getObj?
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    return { workDoneToken }
 
-/-- The parameters sent in an open text document notification -/
-structure DidOpenTextDocumentParams where
-  textDocument : TextDocumentItem
+structure PartialResultParams where
+  partialResultToken : (Option ProgressToken) := none
   deriving Inhabited
 
-instance : ToJson DidOpenTextDocumentParams where
-  toJson s := Json.mkObj <|
-    [("textDocument", toJson s.textDocument)]
+instance : ToJson PartialResultParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.partialResultToken with | some v => ("partialResultToken", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson DidOpenTextDocumentParams where
+instance : FromJson PartialResultParams where
   fromJson? json := do
-    let textDocument ← json.getObjValAs? TextDocumentItem "textDocument"
-    return { textDocument }
+    let _obj ← json.getObj?
+    let partialResultToken : Option ProgressToken := (_obj.find compare "partialResultToken").bind fun v => (fromJson? v).toOption
+    return { partialResultToken }
 
-/-- The params sent in a save notebook document notification.  @since 3.17.0 -/
-structure DidSaveNotebookDocumentParams where
-  notebookDocument : NotebookDocumentIdentifier
+/-- Represents the connection of two locations. Provides additional metadata over normal {@link Location locations}, including an origin range. -/
+structure LocationLink where
+  originSelectionRange : (Option Range) := none
+  targetUri : String
+  targetRange : Range
+  targetSelectionRange : Range
   deriving Inhabited
 
-instance : ToJson DidSaveNotebookDocumentParams where
-  toJson s := Json.mkObj <|
-    [("notebookDocument", toJson s.notebookDocument)]
+instance : ToJson LocationLink where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("targetUri", toJson s.targetUri) :: ("targetRange", toJson s.targetRange) :: ("targetSelectionRange", toJson s.targetSelectionRange) :: kvs
+    let kvs := (match s.originSelectionRange with | some v => ("originSelectionRange", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson DidSaveNotebookDocumentParams where
+instance : FromJson LocationLink where
   fromJson? json := do
-    let notebookDocument ← json.getObjValAs? NotebookDocumentIdentifier "notebookDocument"
-    return { notebookDocument }
+    let _obj ← json.getObj?
+    let originSelectionRange : Option Range := (_obj.find compare "originSelectionRange").bind fun v => (fromJson? v).toOption
+    let targetUri : String ← match _obj.find compare "targetUri" with | some v => fromJson? v | none => throw "property not found: targetUri"
+    let targetRange : Range ← match _obj.find compare "targetRange" with | some v => fromJson? v | none => throw "property not found: targetRange"
+    let targetSelectionRange : Range ← match _obj.find compare "targetSelectionRange" with | some v => fromJson? v | none => throw "property not found: targetSelectionRange"
+    return { originSelectionRange, targetUri, targetRange, targetSelectionRange }
 
-/-- The params sent in a close notebook document notification.  @since 3.17.0 -/
-structure DidCloseNotebookDocumentParams where
-  notebookDocument : NotebookDocumentIdentifier
-  cellTextDocuments : (Array TextDocumentIdentifier)
+structure ImplementationOptions where
+  workDoneProgress : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson DidCloseNotebookDocumentParams where
-  toJson s := Json.mkObj <|
-    [("notebookDocument", toJson s.notebookDocument)] ++
-    [("cellTextDocuments", toJson s.cellTextDocuments)]
+instance : ToJson ImplementationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson DidCloseNotebookDocumentParams where
+instance : FromJson ImplementationOptions where
   fromJson? json := do
-    let notebookDocument ← json.getObjValAs? NotebookDocumentIdentifier "notebookDocument"
-    let cellTextDocuments ← json.getObjValAs? (Array TextDocumentIdentifier) "cellTextDocuments"
-    return { notebookDocument, cellTextDocuments }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    return { workDoneProgress }
 
-structure RegistrationParams where
-  registrations : (Array Registration)
+/-- Static registration options to be returned in the initialize request. -/
+structure StaticRegistrationOptions where
+  id : (Option String) := none
   deriving Inhabited
 
-instance : ToJson RegistrationParams where
-  toJson s := Json.mkObj <|
-    [("registrations", toJson s.registrations)]
+instance : ToJson StaticRegistrationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.id with | some v => ("id", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson RegistrationParams where
+instance : FromJson StaticRegistrationOptions where
   fromJson? json := do
-    let registrations ← json.getObjValAs? (Array Registration) "registrations"
-    return { registrations }
+    let _obj ← json.getObj?
+    let id : Option String := (_obj.find compare "id").bind fun v => (fromJson? v).toOption
+    return { id }
 
-structure UnregistrationParams where
-  unregisterations : (Array Unregistration)
+structure TypeDefinitionOptions where
+  workDoneProgress : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson UnregistrationParams where
-  toJson s := Json.mkObj <|
-    [("unregisterations", toJson s.unregisterations)]
+instance : ToJson TypeDefinitionOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson UnregistrationParams where
+instance : FromJson TypeDefinitionOptions where
   fromJson? json := do
-    let unregisterations ← json.getObjValAs? (Array Unregistration) "unregisterations"
-    return { unregisterations }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    return { workDoneProgress }
 
-/-- Save registration options. -/
-structure TextDocumentSaveRegistrationOptions where
-  documentSelector : (Option Json)
-  includeText : (Option Bool) := none
+structure DocumentColorOptions where
+  workDoneProgress : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson TextDocumentSaveRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)] ++
-    (match s.includeText with | some v => [("includeText", toJson v)] | none => [])
+instance : ToJson DocumentColorOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson TextDocumentSaveRegistrationOptions where
+instance : FromJson DocumentColorOptions where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    let includeText := (json.getObjValAs? Bool "includeText").toOption
-    return { documentSelector, includeText }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    return { workDoneProgress }
 
-structure TextDocumentSyncOptions where
-  openClose : (Option Bool) := none
-  change : (Option TextDocumentSyncKind) := none
-  willSave : (Option Bool) := none
-  willSaveWaitUntil : (Option Bool) := none
-  save : Json := Json.null
+structure FoldingRangeOptions where
+  workDoneProgress : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson TextDocumentSyncOptions where
-  toJson s := Json.mkObj <|
-    (match s.openClose with | some v => [("openClose", toJson v)] | none => []) ++
-    (match s.change with | some v => [("change", toJson v)] | none => []) ++
-    (match s.willSave with | some v => [("willSave", toJson v)] | none => []) ++
-    (match s.willSaveWaitUntil with | some v => [("willSaveWaitUntil", toJson v)] | none => []) ++
-    [("save", toJson s.save)]
+instance : ToJson FoldingRangeOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson TextDocumentSyncOptions where
+instance : FromJson FoldingRangeOptions where
   fromJson? json := do
-    let openClose := (json.getObjValAs? Bool "openClose").toOption
-    let change := (json.getObjValAs? TextDocumentSyncKind "change").toOption
-    let willSave := (json.getObjValAs? Bool "willSave").toOption
-    let willSaveWaitUntil := (json.getObjValAs? Bool "willSaveWaitUntil").toOption
-    let save := json.getObjVal? "save" |>.toOption |>.getD Json.null
-    return { openClose, change, willSave, willSaveWaitUntil, save }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    return { workDoneProgress }
 
-/-- The watched files change notification's parameters. -/
-structure DidChangeWatchedFilesParams where
-  changes : (Array FileEvent)
+structure DeclarationOptions where
+  workDoneProgress : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson DidChangeWatchedFilesParams where
-  toJson s := Json.mkObj <|
-    [("changes", toJson s.changes)]
+instance : ToJson DeclarationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson DidChangeWatchedFilesParams where
+instance : FromJson DeclarationOptions where
   fromJson? json := do
-    let changes ← json.getObjValAs? (Array FileEvent) "changes"
-    return { changes }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    return { workDoneProgress }
 
-/-- Describe options to be used when registered for text document change events. -/
-structure DidChangeWatchedFilesRegistrationOptions where
-  watchers : (Array FileSystemWatcher)
+structure SelectionRangeOptions where
+  workDoneProgress : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson DidChangeWatchedFilesRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("watchers", toJson s.watchers)]
+instance : ToJson SelectionRangeOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson DidChangeWatchedFilesRegistrationOptions where
+instance : FromJson SelectionRangeOptions where
   fromJson? json := do
-    let watchers ← json.getObjValAs? (Array FileSystemWatcher) "watchers"
-    return { watchers }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    return { workDoneProgress }
 
-/-- The parameters of a {@link DocumentFormattingRequest}. -/
-structure DocumentFormattingParams where
-  workDoneToken : (Option ProgressToken) := none
-  textDocument : TextDocumentIdentifier
-  options : FormattingOptions
+/-- Call hierarchy options used during static registration.  @since 3.16.0 -/
+structure CallHierarchyOptions where
+  workDoneProgress : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson DocumentFormattingParams where
-  toJson s := Json.mkObj <|
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    [("textDocument", toJson s.textDocument)] ++
-    [("options", toJson s.options)]
+instance : ToJson CallHierarchyOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson DocumentFormattingParams where
+instance : FromJson CallHierarchyOptions where
   fromJson? json := do
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let options ← json.getObjValAs? FormattingOptions "options"
-    return { workDoneToken, textDocument, options }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    return { workDoneProgress }
 
-/-- The parameters of a {@link DocumentOnTypeFormattingRequest}. -/
-structure DocumentOnTypeFormattingParams where
-  textDocument : TextDocumentIdentifier
-  position : Position
-  ch : String
-  options : FormattingOptions
+/-- @since 3.16.0 -/
+structure SemanticTokensOptions where
+  workDoneProgress : (Option Bool) := none
+  legend : SemanticTokensLegend
+  range : Json := Json.null
+  full : Json := Json.null
   deriving Inhabited
 
-instance : ToJson DocumentOnTypeFormattingParams where
-  toJson s := Json.mkObj <|
-    [("textDocument", toJson s.textDocument)] ++
-    [("position", toJson s.position)] ++
-    [("ch", toJson s.ch)] ++
-    [("options", toJson s.options)]
+instance : ToJson SemanticTokensOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("legend", toJson s.legend) :: ("range", toJson s.range) :: ("full", toJson s.full) :: kvs
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson DocumentOnTypeFormattingParams where
+instance : FromJson SemanticTokensOptions where
   fromJson? json := do
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let position ← json.getObjValAs? Position "position"
-    let ch ← json.getObjValAs? String "ch"
-    let options ← json.getObjValAs? FormattingOptions "options"
-    return { textDocument, position, ch, options }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    let legend : SemanticTokensLegend ← match _obj.find compare "legend" with | some v => fromJson? v | none => throw "property not found: legend"
+    let range : Json := (_obj.find compare "range").getD Json.null
+    let full : Json := (_obj.find compare "full").getD Json.null
+    return { workDoneProgress, legend, range, full }
 
-/-- Registration options for a {@link DocumentOnTypeFormattingRequest}. -/
-structure DocumentOnTypeFormattingRegistrationOptions where
-  documentSelector : (Option Json)
-  firstTriggerCharacter : String
-  moreTriggerCharacter : (Option (Array String)) := none
+structure LinkedEditingRangeOptions where
+  workDoneProgress : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson DocumentOnTypeFormattingRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)] ++
-    [("firstTriggerCharacter", toJson s.firstTriggerCharacter)] ++
-    (match s.moreTriggerCharacter with | some v => [("moreTriggerCharacter", toJson v)] | none => [])
+instance : ToJson LinkedEditingRangeOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson DocumentOnTypeFormattingRegistrationOptions where
+instance : FromJson LinkedEditingRangeOptions where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    let firstTriggerCharacter ← json.getObjValAs? String "firstTriggerCharacter"
-    let moreTriggerCharacter := (json.getObjValAs? (Array String) "moreTriggerCharacter").toOption
-    return { documentSelector, firstTriggerCharacter, moreTriggerCharacter }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    return { workDoneProgress }
 
-/-- @since 3.16.0 -/
-structure SemanticTokensOptions where
-  workDoneProgress : (Option Bool) := none
-  legend : SemanticTokensLegend
-  range : Json := Json.null
-  full : Json := Json.null
+/-- A text document identifier to optionally denote a specific version of a text document. -/
+structure OptionalVersionedTextDocumentIdentifier where
+  uri : String
+  version : (Option Int)
   deriving Inhabited
 
-instance : ToJson SemanticTokensOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => []) ++
-    [("legend", toJson s.legend)] ++
-    [("range", toJson s.range)] ++
-    [("full", toJson s.full)]
+instance : ToJson OptionalVersionedTextDocumentIdentifier where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("uri", toJson s.uri) :: ("version", toJson s.version) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson SemanticTokensOptions where
+instance : FromJson OptionalVersionedTextDocumentIdentifier where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    let legend ← json.getObjValAs? SemanticTokensLegend "legend"
-    let range := json.getObjVal? "range" |>.toOption |>.getD Json.null
-    let full := json.getObjVal? "full" |>.toOption |>.getD Json.null
-    return { workDoneProgress, legend, range, full }
+    let _obj ← json.getObj?
+    let uri : String ← match _obj.find compare "uri" with | some v => fromJson? v | none => throw "property not found: uri"
+    let version : (Option Int) ← match _obj.find compare "version" with | some v => fromJson? v | none => throw "property not found: version"
+    return { uri, version }
+
+/-- Describes textual changes on a text document. A TextDocumentEdit describes all changes on a document version Si and after they are applied move the document to version Si+1. So the creator of a TextDocumentEdit doesn't need to sort the array of edits or do any kind of ordering. However the edits mus... -/
+structure TextDocumentEdit where
+  textDocument : OptionalVersionedTextDocumentIdentifier
+  edits : Json
+  deriving Inhabited
+
+instance : ToJson TextDocumentEdit where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("textDocument", toJson s.textDocument) :: ("edits", toJson s.edits) :: kvs
+    Json.mkObj kvs
+
+instance : FromJson TextDocumentEdit where
+  fromJson? json := do
+    let _obj ← json.getObj?
+    let textDocument : OptionalVersionedTextDocumentIdentifier ← match _obj.find compare "textDocument" with | some v => fromJson? v | none => throw "property not found: textDocument"
+    let edits : Json := (_obj.find compare "edits").getD Json.null
+    return { textDocument, edits }
+
+/-- Options to create a file. -/
+structure CreateFileOptions where
+  overwrite : (Option Bool) := none
+  ignoreIfExists : (Option Bool) := none
+  deriving Inhabited
+
+instance : ToJson CreateFileOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.ignoreIfExists with | some v => ("ignoreIfExists", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.overwrite with | some v => ("overwrite", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
+
+instance : FromJson CreateFileOptions where
+  fromJson? json := do
+    let _obj ← json.getObj?
+    let overwrite : Option Bool := (_obj.find compare "overwrite").bind fun v => (fromJson? v).toOption
+    let ignoreIfExists : Option Bool := (_obj.find compare "ignoreIfExists").bind fun v => (fromJson? v).toOption
+    return { overwrite, ignoreIfExists }
 
 /-- Create file operation. -/
 structure CreateFile where
@@ -5046,20 +6234,43 @@ structure CreateFile where
   deriving Inhabited
 
 instance : ToJson CreateFile where
-  toJson s := Json.mkObj <|
-    [("kind", toJson s.kind)] ++
-    (match s.annotationId with | some v => [("annotationId", toJson v)] | none => []) ++
-    [("uri", toJson s.uri)] ++
-    (match s.options with | some v => [("options", toJson v)] | none => [])
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.options with | some v => ("options", toJson v) :: kvs | none => kvs)
+    let kvs := ("uri", toJson s.uri) :: kvs
+    let kvs := (match s.annotationId with | some v => ("annotationId", toJson v) :: kvs | none => kvs)
+    let kvs := ("kind", toJson s.kind) :: kvs
+    Json.mkObj kvs
 
 instance : FromJson CreateFile where
   fromJson? json := do
-    let kind ← json.getObjValAs? String "kind"
-    let annotationId := (json.getObjValAs? ChangeAnnotationIdentifier "annotationId").toOption
-    let uri ← json.getObjValAs? String "uri"
-    let options := (json.getObjValAs? CreateFileOptions "options").toOption
+    let _obj ← json.getObj?
+    let kind : String ← match _obj.find compare "kind" with | some v => fromJson? v | none => throw "property not found: kind"
+    let annotationId : Option ChangeAnnotationIdentifier := (_obj.find compare "annotationId").bind fun v => (fromJson? v).toOption
+    let uri : String ← match _obj.find compare "uri" with | some v => fromJson? v | none => throw "property not found: uri"
+    let options : Option CreateFileOptions := (_obj.find compare "options").bind fun v => (fromJson? v).toOption
     return { kind, annotationId, uri, options }
 
+/-- Rename file options -/
+structure RenameFileOptions where
+  overwrite : (Option Bool) := none
+  ignoreIfExists : (Option Bool) := none
+  deriving Inhabited
+
+instance : ToJson RenameFileOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.ignoreIfExists with | some v => ("ignoreIfExists", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.overwrite with | some v => ("overwrite", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
+
+instance : FromJson RenameFileOptions where
+  fromJson? json := do
+    let _obj ← json.getObj?
+    let overwrite : Option Bool := (_obj.find compare "overwrite").bind fun v => (fromJson? v).toOption
+    let ignoreIfExists : Option Bool := (_obj.find compare "ignoreIfExists").bind fun v => (fromJson? v).toOption
+    return { overwrite, ignoreIfExists }
+
 /-- Rename file operation -/
 structure RenameFile where
   kind : String
@@ -5070,22 +6281,44 @@ structure RenameFile where
   deriving Inhabited
 
 instance : ToJson RenameFile where
-  toJson s := Json.mkObj <|
-    [("kind", toJson s.kind)] ++
-    (match s.annotationId with | some v => [("annotationId", toJson v)] | none => []) ++
-    [("oldUri", toJson s.oldUri)] ++
-    [("newUri", toJson s.newUri)] ++
-    (match s.options with | some v => [("options", toJson v)] | none => [])
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.options with | some v => ("options", toJson v) :: kvs | none => kvs)
+    let kvs := ("oldUri", toJson s.oldUri) :: ("newUri", toJson s.newUri) :: kvs
+    let kvs := (match s.annotationId with | some v => ("annotationId", toJson v) :: kvs | none => kvs)
+    let kvs := ("kind", toJson s.kind) :: kvs
+    Json.mkObj kvs
 
 instance : FromJson RenameFile where
   fromJson? json := do
-    let kind ← json.getObjValAs? String "kind"
-    let annotationId := (json.getObjValAs? ChangeAnnotationIdentifier "annotationId").toOption
-    let oldUri ← json.getObjValAs? String "oldUri"
-    let newUri ← json.getObjValAs? String "newUri"
-    let options := (json.getObjValAs? RenameFileOptions "options").toOption
+    let _obj ← json.getObj?
+    let kind : String ← match _obj.find compare "kind" with | some v => fromJson? v | none => throw "property not found: kind"
+    let annotationId : Option ChangeAnnotationIdentifier := (_obj.find compare "annotationId").bind fun v => (fromJson? v).toOption
+    let oldUri : String ← match _obj.find compare "oldUri" with | some v => fromJson? v | none => throw "property not found: oldUri"
+    let newUri : String ← match _obj.find compare "newUri" with | some v => fromJson? v | none => throw "property not found: newUri"
+    let options : Option RenameFileOptions := (_obj.find compare "options").bind fun v => (fromJson? v).toOption
     return { kind, annotationId, oldUri, newUri, options }
 
+/-- Delete file options -/
+structure DeleteFileOptions where
+  recursive : (Option Bool) := none
+  ignoreIfNotExists : (Option Bool) := none
+  deriving Inhabited
+
+instance : ToJson DeleteFileOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.ignoreIfNotExists with | some v => ("ignoreIfNotExists", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.recursive with | some v => ("recursive", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
+
+instance : FromJson DeleteFileOptions where
+  fromJson? json := do
+    let _obj ← json.getObj?
+    let recursive : Option Bool := (_obj.find compare "recursive").bind fun v => (fromJson? v).toOption
+    let ignoreIfNotExists : Option Bool := (_obj.find compare "ignoreIfNotExists").bind fun v => (fromJson? v).toOption
+    return { recursive, ignoreIfNotExists }
+
 /-- Delete file operation -/
 structure DeleteFile where
   kind : String
@@ -5095,3274 +6328,3013 @@ structure DeleteFile where
   deriving Inhabited
 
 instance : ToJson DeleteFile where
-  toJson s := Json.mkObj <|
-    [("kind", toJson s.kind)] ++
-    (match s.annotationId with | some v => [("annotationId", toJson v)] | none => []) ++
-    [("uri", toJson s.uri)] ++
-    (match s.options with | some v => [("options", toJson v)] | none => [])
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.options with | some v => ("options", toJson v) :: kvs | none => kvs)
+    let kvs := ("uri", toJson s.uri) :: kvs
+    let kvs := (match s.annotationId with | some v => ("annotationId", toJson v) :: kvs | none => kvs)
+    let kvs := ("kind", toJson s.kind) :: kvs
+    Json.mkObj kvs
 
 instance : FromJson DeleteFile where
   fromJson? json := do
-    let kind ← json.getObjValAs? String "kind"
-    let annotationId := (json.getObjValAs? ChangeAnnotationIdentifier "annotationId").toOption
-    let uri ← json.getObjValAs? String "uri"
-    let options := (json.getObjValAs? DeleteFileOptions "options").toOption
+    let _obj ← json.getObj?
+    let kind : String ← match _obj.find compare "kind" with | some v => fromJson? v | none => throw "property not found: kind"
+    let annotationId : Option ChangeAnnotationIdentifier := (_obj.find compare "annotationId").bind fun v => (fromJson? v).toOption
+    let uri : String ← match _obj.find compare "uri" with | some v => fromJson? v | none => throw "property not found: uri"
+    let options : Option DeleteFileOptions := (_obj.find compare "options").bind fun v => (fromJson? v).toOption
     return { kind, annotationId, uri, options }
 
-/-- The initialize parameters -/
-structure _InitializeParams where
-  workDoneToken : (Option ProgressToken) := none
-  processId : (Option Int)
-  clientInfo : (Option ClientInfo) := none
-  locale : (Option String) := none
-  rootPath : (Option String) := none
-  rootUri : (Option String)
-  capabilities : Json
-  initializationOptions : Json := Json.null
-  trace : (Option TraceValue) := none
+/-- Additional information that describes document changes.  @since 3.16.0 -/
+structure ChangeAnnotation where
+  label : String
+  needsConfirmation : (Option Bool) := none
+  description : (Option String) := none
   deriving Inhabited
 
-instance : ToJson _InitializeParams where
-  toJson s := Json.mkObj <|
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    [("processId", toJson s.processId)] ++
-    (match s.clientInfo with | some v => [("clientInfo", toJson v)] | none => []) ++
-    (match s.locale with | some v => [("locale", toJson v)] | none => []) ++
-    (match s.rootPath with | some v => [("rootPath", toJson v)] | none => []) ++
-    [("rootUri", toJson s.rootUri)] ++
-    [("capabilities", toJson s.capabilities)] ++
-    [("initializationOptions", toJson s.initializationOptions)] ++
-    (match s.trace with | some v => [("trace", toJson v)] | none => [])
+instance : ToJson ChangeAnnotation where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.description with | some v => ("description", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.needsConfirmation with | some v => ("needsConfirmation", toJson v) :: kvs | none => kvs)
+    let kvs := ("label", toJson s.label) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson _InitializeParams where
+instance : FromJson ChangeAnnotation where
   fromJson? json := do
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let processId ← json.getObjValAs? (Option Int) "processId"
-    let clientInfo := (json.getObjValAs? ClientInfo "clientInfo").toOption
-    let locale := (json.getObjValAs? String "locale").toOption
-    let rootPath := (json.getObjValAs? String "rootPath").toOption
-    let rootUri ← json.getObjValAs? (Option String) "rootUri"
-    let capabilities := json.getObjVal? "capabilities" |>.toOption |>.getD Json.null
-    let initializationOptions := json.getObjVal? "initializationOptions" |>.toOption |>.getD Json.null
-    let trace := (json.getObjValAs? TraceValue "trace").toOption
-    return { workDoneToken, processId, clientInfo, locale, rootPath, rootUri, capabilities, initializationOptions, trace }
+    let _obj ← json.getObj?
+    let label : String ← match _obj.find compare "label" with | some v => fromJson? v | none => throw "property not found: label"
+    let needsConfirmation : Option Bool := (_obj.find compare "needsConfirmation").bind fun v => (fromJson? v).toOption
+    let description : Option String := (_obj.find compare "description").bind fun v => (fromJson? v).toOption
+    return { label, needsConfirmation, description }
 
-/-- Completion options. -/
-structure CompletionOptions where
+structure MonikerOptions where
   workDoneProgress : (Option Bool) := none
-  triggerCharacters : (Option (Array String)) := none
-  allCommitCharacters : (Option (Array String)) := none
-  resolveProvider : (Option Bool) := none
-  completionItem : (Option ServerCompletionItemOptions) := none
   deriving Inhabited
 
-instance : ToJson CompletionOptions where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => []) ++
-    (match s.triggerCharacters with | some v => [("triggerCharacters", toJson v)] | none => []) ++
-    (match s.allCommitCharacters with | some v => [("allCommitCharacters", toJson v)] | none => []) ++
-    (match s.resolveProvider with | some v => [("resolveProvider", toJson v)] | none => []) ++
-    (match s.completionItem with | some v => [("completionItem", toJson v)] | none => [])
+instance : ToJson MonikerOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson CompletionOptions where
+instance : FromJson MonikerOptions where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    let triggerCharacters := (json.getObjValAs? (Array String) "triggerCharacters").toOption
-    let allCommitCharacters := (json.getObjValAs? (Array String) "allCommitCharacters").toOption
-    let resolveProvider := (json.getObjValAs? Bool "resolveProvider").toOption
-    let completionItem := (json.getObjValAs? ServerCompletionItemOptions "completionItem").toOption
-    return { workDoneProgress, triggerCharacters, allCommitCharacters, resolveProvider, completionItem }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    return { workDoneProgress }
 
-/-- A pattern to describe in which file operation requests or notifications the server is interested in receiving.  @since 3.16.0 -/
-structure FileOperationPattern where
-  glob : String
-  «matches» : (Option FileOperationPatternKind) := none
-  options : (Option FileOperationPatternOptions) := none
+/-- Type hierarchy options used during static registration.  @since 3.17.0 -/
+structure TypeHierarchyOptions where
+  workDoneProgress : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson FileOperationPattern where
-  toJson s := Json.mkObj <|
-    [("glob", toJson s.glob)] ++
-    (match s.«matches» with | some v => [("matches", toJson v)] | none => []) ++
-    (match s.options with | some v => [("options", toJson v)] | none => [])
+instance : ToJson TypeHierarchyOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson FileOperationPattern where
+instance : FromJson TypeHierarchyOptions where
   fromJson? json := do
-    let glob ← json.getObjValAs? String "glob"
-    let «matches» := (json.getObjValAs? FileOperationPatternKind "matches").toOption
-    let options := (json.getObjValAs? FileOperationPatternOptions "options").toOption
-    return { glob, «matches», options }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    return { workDoneProgress }
 
-/-- A notebook cell.  A cell's document URI must be unique across ALL notebook cells and can therefore be used to uniquely identify a notebook cell or the cell's text document.  @since 3.17.0 -/
-structure NotebookCell where
-  kind : NotebookCellKind
-  document : String
-  metadata : Json := Json.null
-  executionSummary : (Option ExecutionSummary) := none
+/-- Provide inline value as text.  @since 3.17.0 -/
+structure InlineValueText where
+  range : Range
+  text : String
   deriving Inhabited
 
-instance : ToJson NotebookCell where
-  toJson s := Json.mkObj <|
-    [("kind", toJson s.kind)] ++
-    [("document", toJson s.document)] ++
-    [("metadata", toJson s.metadata)] ++
-    (match s.executionSummary with | some v => [("executionSummary", toJson v)] | none => [])
+instance : ToJson InlineValueText where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("range", toJson s.range) :: ("text", toJson s.text) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson NotebookCell where
+instance : FromJson InlineValueText where
   fromJson? json := do
-    let kind ← json.getObjValAs? NotebookCellKind "kind"
-    let document ← json.getObjValAs? String "document"
-    let metadata := json.getObjVal? "metadata" |>.toOption |>.getD Json.null
-    let executionSummary := (json.getObjValAs? ExecutionSummary "executionSummary").toOption
-    return { kind, document, metadata, executionSummary }
+    let _obj ← json.getObj?
+    let range : Range ← match _obj.find compare "range" with | some v => fromJson? v | none => throw "property not found: range"
+    let text : String ← match _obj.find compare "text" with | some v => fromJson? v | none => throw "property not found: text"
+    return { range, text }
 
-/-- @since 3.18.0 -/
-structure NotebookDocumentFilterWithNotebook where
-  notebook : Json
-  cells : (Option (Array NotebookCellLanguage)) := none
+/-- Provide inline value through a variable lookup. If only a range is specified, the variable name will be extracted from the underlying document. An optional variable name can be used to override the extracted name.  @since 3.17.0 -/
+structure InlineValueVariableLookup where
+  range : Range
+  variableName : (Option String) := none
+  caseSensitiveLookup : Bool
   deriving Inhabited
 
-instance : ToJson NotebookDocumentFilterWithNotebook where
-  toJson s := Json.mkObj <|
-    [("notebook", toJson s.notebook)] ++
-    (match s.cells with | some v => [("cells", toJson v)] | none => [])
+instance : ToJson InlineValueVariableLookup where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("caseSensitiveLookup", toJson s.caseSensitiveLookup) :: kvs
+    let kvs := (match s.variableName with | some v => ("variableName", toJson v) :: kvs | none => kvs)
+    let kvs := ("range", toJson s.range) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson NotebookDocumentFilterWithNotebook where
+instance : FromJson InlineValueVariableLookup where
   fromJson? json := do
-    let notebook := json.getObjVal? "notebook" |>.toOption |>.getD Json.null
-    let cells := (json.getObjValAs? (Array NotebookCellLanguage) "cells").toOption
-    return { notebook, cells }
+    let _obj ← json.getObj?
+    let range : Range ← match _obj.find compare "range" with | some v => fromJson? v | none => throw "property not found: range"
+    let variableName : Option String := (_obj.find compare "variableName").bind fun v => (fromJson? v).toOption
+    let caseSensitiveLookup : Bool ← match _obj.find compare "caseSensitiveLookup" with | some v => fromJson? v | none => throw "property not found: caseSensitiveLookup"
+    return { range, variableName, caseSensitiveLookup }
 
-/-- @since 3.18.0 -/
-structure NotebookDocumentFilterWithCells where
-  notebook : Json := Json.null
-  cells : (Array NotebookCellLanguage)
+/-- Provide an inline value through an expression evaluation. If only a range is specified, the expression will be extracted from the underlying document. An optional expression can be used to override the extracted expression.  @since 3.17.0 -/
+structure InlineValueEvaluatableExpression where
+  range : Range
+  expression : (Option String) := none
   deriving Inhabited
 
-instance : ToJson NotebookDocumentFilterWithCells where
-  toJson s := Json.mkObj <|
-    [("notebook", toJson s.notebook)] ++
-    [("cells", toJson s.cells)]
+instance : ToJson InlineValueEvaluatableExpression where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.expression with | some v => ("expression", toJson v) :: kvs | none => kvs)
+    let kvs := ("range", toJson s.range) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson NotebookDocumentFilterWithCells where
+instance : FromJson InlineValueEvaluatableExpression where
   fromJson? json := do
-    let notebook := json.getObjVal? "notebook" |>.toOption |>.getD Json.null
-    let cells ← json.getObjValAs? (Array NotebookCellLanguage) "cells"
-    return { notebook, cells }
+    let _obj ← json.getObj?
+    let range : Range ← match _obj.find compare "range" with | some v => fromJson? v | none => throw "property not found: range"
+    let expression : Option String := (_obj.find compare "expression").bind fun v => (fromJson? v).toOption
+    return { range, expression }
 
-/-- Structural changes to cells in a notebook document.  @since 3.18.0 -/
-structure NotebookDocumentCellChangeStructure where
-  array : NotebookCellArrayChange
-  didOpen : (Option (Array TextDocumentItem)) := none
-  didClose : (Option (Array TextDocumentIdentifier)) := none
+/-- Inline value options used during static registration.  @since 3.17.0 -/
+structure InlineValueOptions where
+  workDoneProgress : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson NotebookDocumentCellChangeStructure where
-  toJson s := Json.mkObj <|
-    [("array", toJson s.array)] ++
-    (match s.didOpen with | some v => [("didOpen", toJson v)] | none => []) ++
-    (match s.didClose with | some v => [("didClose", toJson v)] | none => [])
+instance : ToJson InlineValueOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson NotebookDocumentCellChangeStructure where
+instance : FromJson InlineValueOptions where
   fromJson? json := do
-    let array ← json.getObjValAs? NotebookCellArrayChange "array"
-    let didOpen := (json.getObjValAs? (Array TextDocumentItem) "didOpen").toOption
-    let didClose := (json.getObjValAs? (Array TextDocumentIdentifier) "didClose").toOption
-    return { array, didOpen, didClose }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    return { workDoneProgress }
 
-/-- Capabilities specific to the notebook document support.  @since 3.17.0 -/
-structure NotebookDocumentClientCapabilities where
-  synchronization : NotebookDocumentSyncClientCapabilities
+/-- An inlay hint label part allows for interactive and composite labels of inlay hints.  @since 3.17.0 -/
+structure InlayHintLabelPart where
+  value : String
+  tooltip : Json := Json.null
+  location : (Option Location) := none
+  command : (Option Command) := none
   deriving Inhabited
 
-instance : ToJson NotebookDocumentClientCapabilities where
-  toJson s := Json.mkObj <|
-    [("synchronization", toJson s.synchronization)]
+instance : ToJson InlayHintLabelPart where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.command with | some v => ("command", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.location with | some v => ("location", toJson v) :: kvs | none => kvs)
+    let kvs := ("value", toJson s.value) :: ("tooltip", toJson s.tooltip) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson NotebookDocumentClientCapabilities where
+instance : FromJson InlayHintLabelPart where
   fromJson? json := do
-    let synchronization ← json.getObjValAs? NotebookDocumentSyncClientCapabilities "synchronization"
-    return { synchronization }
+    let _obj ← json.getObj?
+    let value : String ← match _obj.find compare "value" with | some v => fromJson? v | none => throw "property not found: value"
+    let tooltip : Json := (_obj.find compare "tooltip").getD Json.null
+    let location : Option Location := (_obj.find compare "location").bind fun v => (fromJson? v).toOption
+    let command : Option Command := (_obj.find compare "command").bind fun v => (fromJson? v).toOption
+    return { value, tooltip, location, command }
 
-/-- General client capabilities.  @since 3.16.0 -/
-structure GeneralClientCapabilities where
-  staleRequestSupport : (Option StaleRequestSupportOptions) := none
-  regularExpressions : (Option RegularExpressionsClientCapabilities) := none
-  markdown : (Option MarkdownClientCapabilities) := none
-  positionEncodings : (Option (Array PositionEncodingKind)) := none
+/-- A `MarkupContent` literal represents a string value which content is interpreted base on its kind flag. Currently the protocol supports `plaintext` and `markdown` as markup kinds.  If the kind is `markdown` then the value can contain fenced code blocks like in GitHub issues. See https://help.github.... -/
+structure MarkupContent where
+  kind : MarkupKind
+  value : String
   deriving Inhabited
 
-instance : ToJson GeneralClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.staleRequestSupport with | some v => [("staleRequestSupport", toJson v)] | none => []) ++
-    (match s.regularExpressions with | some v => [("regularExpressions", toJson v)] | none => []) ++
-    (match s.markdown with | some v => [("markdown", toJson v)] | none => []) ++
-    (match s.positionEncodings with | some v => [("positionEncodings", toJson v)] | none => [])
+instance : ToJson MarkupContent where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("kind", toJson s.kind) :: ("value", toJson s.value) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson GeneralClientCapabilities where
+instance : FromJson MarkupContent where
   fromJson? json := do
-    let staleRequestSupport := (json.getObjValAs? StaleRequestSupportOptions "staleRequestSupport").toOption
-    let regularExpressions := (json.getObjValAs? RegularExpressionsClientCapabilities "regularExpressions").toOption
-    let markdown := (json.getObjValAs? MarkdownClientCapabilities "markdown").toOption
-    let positionEncodings := (json.getObjValAs? (Array PositionEncodingKind) "positionEncodings").toOption
-    return { staleRequestSupport, regularExpressions, markdown, positionEncodings }
+    let _obj ← json.getObj?
+    let kind : MarkupKind ← match _obj.find compare "kind" with | some v => fromJson? v | none => throw "property not found: kind"
+    let value : String ← match _obj.find compare "value" with | some v => fromJson? v | none => throw "property not found: value"
+    return { kind, value }
 
-structure WorkspaceEditClientCapabilities where
-  documentChanges : (Option Bool) := none
-  resourceOperations : (Option (Array ResourceOperationKind)) := none
-  failureHandling : (Option FailureHandlingKind) := none
-  normalizesLineEndings : (Option Bool) := none
-  changeAnnotationSupport : (Option ChangeAnnotationsSupportOptions) := none
-  metadataSupport : (Option Bool) := none
-  snippetEditSupport : (Option Bool) := none
+/-- Inlay hint options used during static registration.  @since 3.17.0 -/
+structure InlayHintOptions where
+  workDoneProgress : (Option Bool) := none
+  resolveProvider : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson WorkspaceEditClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.documentChanges with | some v => [("documentChanges", toJson v)] | none => []) ++
-    (match s.resourceOperations with | some v => [("resourceOperations", toJson v)] | none => []) ++
-    (match s.failureHandling with | some v => [("failureHandling", toJson v)] | none => []) ++
-    (match s.normalizesLineEndings with | some v => [("normalizesLineEndings", toJson v)] | none => []) ++
-    (match s.changeAnnotationSupport with | some v => [("changeAnnotationSupport", toJson v)] | none => []) ++
-    (match s.metadataSupport with | some v => [("metadataSupport", toJson v)] | none => []) ++
-    (match s.snippetEditSupport with | some v => [("snippetEditSupport", toJson v)] | none => [])
+instance : ToJson InlayHintOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.resolveProvider with | some v => ("resolveProvider", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson WorkspaceEditClientCapabilities where
+instance : FromJson InlayHintOptions where
   fromJson? json := do
-    let documentChanges := (json.getObjValAs? Bool "documentChanges").toOption
-    let resourceOperations := (json.getObjValAs? (Array ResourceOperationKind) "resourceOperations").toOption
-    let failureHandling := (json.getObjValAs? FailureHandlingKind "failureHandling").toOption
-    let normalizesLineEndings := (json.getObjValAs? Bool "normalizesLineEndings").toOption
-    let changeAnnotationSupport := (json.getObjValAs? ChangeAnnotationsSupportOptions "changeAnnotationSupport").toOption
-    let metadataSupport := (json.getObjValAs? Bool "metadataSupport").toOption
-    let snippetEditSupport := (json.getObjValAs? Bool "snippetEditSupport").toOption
-    return { documentChanges, resourceOperations, failureHandling, normalizesLineEndings, changeAnnotationSupport, metadataSupport, snippetEditSupport }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    let resolveProvider : Option Bool := (_obj.find compare "resolveProvider").bind fun v => (fromJson? v).toOption
+    return { workDoneProgress, resolveProvider }
 
-/-- Client Capabilities for a {@link DocumentSymbolRequest}. -/
-structure DocumentSymbolClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
-  symbolKind : (Option ClientSymbolKindOptions) := none
-  hierarchicalDocumentSymbolSupport : (Option Bool) := none
-  tagSupport : (Option ClientSymbolTagOptions) := none
-  labelSupport : (Option Bool) := none
+/-- A full diagnostic report with a set of related documents.  @since 3.17.0 -/
+structure RelatedFullDocumentDiagnosticReport where
+  kind : String
+  resultId : (Option String) := none
+  items : Json
+  relatedDocuments : Json := Json.null
   deriving Inhabited
 
-instance : ToJson DocumentSymbolClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => []) ++
-    (match s.symbolKind with | some v => [("symbolKind", toJson v)] | none => []) ++
-    (match s.hierarchicalDocumentSymbolSupport with | some v => [("hierarchicalDocumentSymbolSupport", toJson v)] | none => []) ++
-    (match s.tagSupport with | some v => [("tagSupport", toJson v)] | none => []) ++
-    (match s.labelSupport with | some v => [("labelSupport", toJson v)] | none => [])
+instance : ToJson RelatedFullDocumentDiagnosticReport where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("items", toJson s.items) :: ("relatedDocuments", toJson s.relatedDocuments) :: kvs
+    let kvs := (match s.resultId with | some v => ("resultId", toJson v) :: kvs | none => kvs)
+    let kvs := ("kind", toJson s.kind) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DocumentSymbolClientCapabilities where
+instance : FromJson RelatedFullDocumentDiagnosticReport where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    let symbolKind := (json.getObjValAs? ClientSymbolKindOptions "symbolKind").toOption
-    let hierarchicalDocumentSymbolSupport := (json.getObjValAs? Bool "hierarchicalDocumentSymbolSupport").toOption
-    let tagSupport := (json.getObjValAs? ClientSymbolTagOptions "tagSupport").toOption
-    let labelSupport := (json.getObjValAs? Bool "labelSupport").toOption
-    return { dynamicRegistration, symbolKind, hierarchicalDocumentSymbolSupport, tagSupport, labelSupport }
+    let _obj ← json.getObj?
+    let kind : String ← match _obj.find compare "kind" with | some v => fromJson? v | none => throw "property not found: kind"
+    let resultId : Option String := (_obj.find compare "resultId").bind fun v => (fromJson? v).toOption
+    let items : Json := (_obj.find compare "items").getD Json.null
+    let relatedDocuments : Json := (_obj.find compare "relatedDocuments").getD Json.null
+    return { kind, resultId, items, relatedDocuments }
 
-/-- Client capabilities for a {@link WorkspaceSymbolRequest}. -/
-structure WorkspaceSymbolClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
-  symbolKind : (Option ClientSymbolKindOptions) := none
-  tagSupport : (Option ClientSymbolTagOptions) := none
-  resolveSupport : (Option ClientSymbolResolveOptions) := none
+/-- An unchanged diagnostic report with a set of related documents.  @since 3.17.0 -/
+structure RelatedUnchangedDocumentDiagnosticReport where
+  kind : String
+  resultId : String
+  relatedDocuments : Json := Json.null
   deriving Inhabited
 
-instance : ToJson WorkspaceSymbolClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => []) ++
-    (match s.symbolKind with | some v => [("symbolKind", toJson v)] | none => []) ++
-    (match s.tagSupport with | some v => [("tagSupport", toJson v)] | none => []) ++
-    (match s.resolveSupport with | some v => [("resolveSupport", toJson v)] | none => [])
+instance : ToJson RelatedUnchangedDocumentDiagnosticReport where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("kind", toJson s.kind) :: ("resultId", toJson s.resultId) :: ("relatedDocuments", toJson s.relatedDocuments) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson WorkspaceSymbolClientCapabilities where
+instance : FromJson RelatedUnchangedDocumentDiagnosticReport where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    let symbolKind := (json.getObjValAs? ClientSymbolKindOptions "symbolKind").toOption
-    let tagSupport := (json.getObjValAs? ClientSymbolTagOptions "tagSupport").toOption
-    let resolveSupport := (json.getObjValAs? ClientSymbolResolveOptions "resolveSupport").toOption
-    return { dynamicRegistration, symbolKind, tagSupport, resolveSupport }
+    let _obj ← json.getObj?
+    let kind : String ← match _obj.find compare "kind" with | some v => fromJson? v | none => throw "property not found: kind"
+    let resultId : String ← match _obj.find compare "resultId" with | some v => fromJson? v | none => throw "property not found: resultId"
+    let relatedDocuments : Json := (_obj.find compare "relatedDocuments").getD Json.null
+    return { kind, resultId, relatedDocuments }
 
-/-- The client capabilities  of a {@link CodeLensRequest}. -/
-structure CodeLensClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
-  resolveSupport : (Option ClientCodeLensResolveOptions) := none
+/-- A diagnostic report with a full set of problems.  @since 3.17.0 -/
+structure FullDocumentDiagnosticReport where
+  kind : String
+  resultId : (Option String) := none
+  items : Json
   deriving Inhabited
 
-instance : ToJson CodeLensClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => []) ++
-    (match s.resolveSupport with | some v => [("resolveSupport", toJson v)] | none => [])
+instance : ToJson FullDocumentDiagnosticReport where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("items", toJson s.items) :: kvs
+    let kvs := (match s.resultId with | some v => ("resultId", toJson v) :: kvs | none => kvs)
+    let kvs := ("kind", toJson s.kind) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson CodeLensClientCapabilities where
+instance : FromJson FullDocumentDiagnosticReport where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    let resolveSupport := (json.getObjValAs? ClientCodeLensResolveOptions "resolveSupport").toOption
-    return { dynamicRegistration, resolveSupport }
+    let _obj ← json.getObj?
+    let kind : String ← match _obj.find compare "kind" with | some v => fromJson? v | none => throw "property not found: kind"
+    let resultId : Option String := (_obj.find compare "resultId").bind fun v => (fromJson? v).toOption
+    let items : Json := (_obj.find compare "items").getD Json.null
+    return { kind, resultId, items }
 
-structure FoldingRangeClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
-  rangeLimit : (Option Nat) := none
-  lineFoldingOnly : (Option Bool) := none
-  foldingRangeKind : (Option ClientFoldingRangeKindOptions) := none
-  foldingRange : (Option ClientFoldingRangeOptions) := none
+/-- A diagnostic report indicating that the last returned report is still accurate.  @since 3.17.0 -/
+structure UnchangedDocumentDiagnosticReport where
+  kind : String
+  resultId : String
   deriving Inhabited
 
-instance : ToJson FoldingRangeClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => []) ++
-    (match s.rangeLimit with | some v => [("rangeLimit", toJson v)] | none => []) ++
-    (match s.lineFoldingOnly with | some v => [("lineFoldingOnly", toJson v)] | none => []) ++
-    (match s.foldingRangeKind with | some v => [("foldingRangeKind", toJson v)] | none => []) ++
-    (match s.foldingRange with | some v => [("foldingRange", toJson v)] | none => [])
+instance : ToJson UnchangedDocumentDiagnosticReport where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("kind", toJson s.kind) :: ("resultId", toJson s.resultId) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson FoldingRangeClientCapabilities where
+instance : FromJson UnchangedDocumentDiagnosticReport where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    let rangeLimit := (json.getObjValAs? Nat "rangeLimit").toOption
-    let lineFoldingOnly := (json.getObjValAs? Bool "lineFoldingOnly").toOption
-    let foldingRangeKind := (json.getObjValAs? ClientFoldingRangeKindOptions "foldingRangeKind").toOption
-    let foldingRange := (json.getObjValAs? ClientFoldingRangeOptions "foldingRange").toOption
-    return { dynamicRegistration, rangeLimit, lineFoldingOnly, foldingRangeKind, foldingRange }
+    let _obj ← json.getObj?
+    let kind : String ← match _obj.find compare "kind" with | some v => fromJson? v | none => throw "property not found: kind"
+    let resultId : String ← match _obj.find compare "resultId" with | some v => fromJson? v | none => throw "property not found: resultId"
+    return { kind, resultId }
 
-/-- Inlay hint client capabilities.  @since 3.17.0 -/
-structure InlayHintClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
-  resolveSupport : (Option ClientInlayHintResolveOptions) := none
+/-- Diagnostic options.  @since 3.17.0 -/
+structure DiagnosticOptions where
+  workDoneProgress : (Option Bool) := none
+  identifier : (Option String) := none
+  interFileDependencies : Bool
+  workspaceDiagnostics : Bool
   deriving Inhabited
 
-instance : ToJson InlayHintClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => []) ++
-    (match s.resolveSupport with | some v => [("resolveSupport", toJson v)] | none => [])
+instance : ToJson DiagnosticOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("interFileDependencies", toJson s.interFileDependencies) :: ("workspaceDiagnostics", toJson s.workspaceDiagnostics) :: kvs
+    let kvs := (match s.identifier with | some v => ("identifier", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson InlayHintClientCapabilities where
+instance : FromJson DiagnosticOptions where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    let resolveSupport := (json.getObjValAs? ClientInlayHintResolveOptions "resolveSupport").toOption
-    return { dynamicRegistration, resolveSupport }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    let identifier : Option String := (_obj.find compare "identifier").bind fun v => (fromJson? v).toOption
+    let interFileDependencies : Bool ← match _obj.find compare "interFileDependencies" with | some v => fromJson? v | none => throw "property not found: interFileDependencies"
+    let workspaceDiagnostics : Bool ← match _obj.find compare "workspaceDiagnostics" with | some v => fromJson? v | none => throw "property not found: workspaceDiagnostics"
+    return { workDoneProgress, identifier, interFileDependencies, workspaceDiagnostics }
 
-/-- Show message request client capabilities -/
-structure ShowMessageRequestClientCapabilities where
-  messageActionItem : (Option ClientShowMessageActionItemOptions) := none
+/-- Options specific to a notebook plus its cells to be synced to the server.  If a selector provides a notebook document filter but no cell selector all cells of a matching notebook document will be synced.  If a selector provides no notebook document filter but only a cell selector all notebook docume... -/
+structure NotebookDocumentSyncOptions where
+  notebookSelector : Json
+  save : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson ShowMessageRequestClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.messageActionItem with | some v => [("messageActionItem", toJson v)] | none => [])
+instance : ToJson NotebookDocumentSyncOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.save with | some v => ("save", toJson v) :: kvs | none => kvs)
+    let kvs := ("notebookSelector", toJson s.notebookSelector) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ShowMessageRequestClientCapabilities where
+instance : FromJson NotebookDocumentSyncOptions where
   fromJson? json := do
-    let messageActionItem := (json.getObjValAs? ClientShowMessageActionItemOptions "messageActionItem").toOption
-    return { messageActionItem }
+    let _obj ← json.getObj?
+    let notebookSelector : Json := (_obj.find compare "notebookSelector").getD Json.null
+    let save : Option Bool := (_obj.find compare "save").bind fun v => (fromJson? v).toOption
+    return { notebookSelector, save }
 
-/-- @since 3.18.0 -/
-structure ClientCompletionItemOptions where
-  snippetSupport : (Option Bool) := none
-  commitCharactersSupport : (Option Bool) := none
-  documentationFormat : (Option (Array MarkupKind)) := none
-  deprecatedSupport : (Option Bool) := none
-  preselectSupport : (Option Bool) := none
-  tagSupport : (Option CompletionItemTagOptions) := none
-  insertReplaceSupport : (Option Bool) := none
-  resolveSupport : (Option ClientCompletionItemResolveOptions) := none
-  insertTextModeSupport : (Option ClientCompletionItemInsertTextModeOptions) := none
-  labelDetailsSupport : (Option Bool) := none
+/-- The initialize parameters -/
+structure _InitializeParams where
+  workDoneToken : (Option ProgressToken) := none
+  processId : (Option Int)
+  clientInfo : (Option ClientInfo) := none
+  locale : (Option String) := none
+  rootPath : (Option String) := none
+  rootUri : (Option String)
+  capabilities : Json
+  initializationOptions : Json := Json.null
+  trace : (Option TraceValue) := none
   deriving Inhabited
 
-instance : ToJson ClientCompletionItemOptions where
-  toJson s := Json.mkObj <|
-    (match s.snippetSupport with | some v => [("snippetSupport", toJson v)] | none => []) ++
-    (match s.commitCharactersSupport with | some v => [("commitCharactersSupport", toJson v)] | none => []) ++
-    (match s.documentationFormat with | some v => [("documentationFormat", toJson v)] | none => []) ++
-    (match s.deprecatedSupport with | some v => [("deprecatedSupport", toJson v)] | none => []) ++
-    (match s.preselectSupport with | some v => [("preselectSupport", toJson v)] | none => []) ++
-    (match s.tagSupport with | some v => [("tagSupport", toJson v)] | none => []) ++
-    (match s.insertReplaceSupport with | some v => [("insertReplaceSupport", toJson v)] | none => []) ++
-    (match s.resolveSupport with | some v => [("resolveSupport", toJson v)] | none => []) ++
-    (match s.insertTextModeSupport with | some v => [("insertTextModeSupport", toJson v)] | none => []) ++
-    (match s.labelDetailsSupport with | some v => [("labelDetailsSupport", toJson v)] | none => [])
+instance : ToJson _InitializeParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.trace with | some v => ("trace", toJson v) :: kvs | none => kvs)
+    let kvs := ("rootUri", toJson s.rootUri) :: ("capabilities", toJson s.capabilities) :: ("initializationOptions", toJson s.initializationOptions) :: kvs
+    let kvs := (match s.rootPath with | some v => ("rootPath", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.locale with | some v => ("locale", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.clientInfo with | some v => ("clientInfo", toJson v) :: kvs | none => kvs)
+    let kvs := ("processId", toJson s.processId) :: kvs
+    let kvs := (match s.workDoneToken with | some v => ("workDoneToken", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson ClientCompletionItemOptions where
+instance : FromJson _InitializeParams where
   fromJson? json := do
-    let snippetSupport := (json.getObjValAs? Bool "snippetSupport").toOption
-    let commitCharactersSupport := (json.getObjValAs? Bool "commitCharactersSupport").toOption
-    let documentationFormat := (json.getObjValAs? (Array MarkupKind) "documentationFormat").toOption
-    let deprecatedSupport := (json.getObjValAs? Bool "deprecatedSupport").toOption
-    let preselectSupport := (json.getObjValAs? Bool "preselectSupport").toOption
-    let tagSupport := (json.getObjValAs? CompletionItemTagOptions "tagSupport").toOption
-    let insertReplaceSupport := (json.getObjValAs? Bool "insertReplaceSupport").toOption
-    let resolveSupport := (json.getObjValAs? ClientCompletionItemResolveOptions "resolveSupport").toOption
-    let insertTextModeSupport := (json.getObjValAs? ClientCompletionItemInsertTextModeOptions "insertTextModeSupport").toOption
-    let labelDetailsSupport := (json.getObjValAs? Bool "labelDetailsSupport").toOption
-    return { snippetSupport, commitCharactersSupport, documentationFormat, deprecatedSupport, preselectSupport, tagSupport, insertReplaceSupport, resolveSupport, insertTextModeSupport, labelDetailsSupport }
+    let _obj ← json.getObj?
+    let workDoneToken : Option ProgressToken := (_obj.find compare "workDoneToken").bind fun v => (fromJson? v).toOption
+    let processId : (Option Int) ← match _obj.find compare "processId" with | some v => fromJson? v | none => throw "property not found: processId"
+    let clientInfo : Option ClientInfo := (_obj.find compare "clientInfo").bind fun v => (fromJson? v).toOption
+    let locale : Option String := (_obj.find compare "locale").bind fun v => (fromJson? v).toOption
+    let rootPath : Option String := (_obj.find compare "rootPath").bind fun v => (fromJson? v).toOption
+    let rootUri : (Option String) ← match _obj.find compare "rootUri" with | some v => fromJson? v | none => throw "property not found: rootUri"
+    let capabilities : Json := (_obj.find compare "capabilities").getD Json.null
+    let initializationOptions : Json := (_obj.find compare "initializationOptions").getD Json.null
+    let trace : Option TraceValue := (_obj.find compare "trace").bind fun v => (fromJson? v).toOption
+    return { workDoneToken, processId, clientInfo, locale, rootPath, rootUri, capabilities, initializationOptions, trace }
 
-/-- @since 3.18.0 -/
-structure ClientSignatureInformationOptions where
-  documentationFormat : (Option (Array MarkupKind)) := none
-  parameterInformation : (Option ClientSignatureParameterInformationOptions) := none
-  activeParameterSupport : (Option Bool) := none
-  noActiveParameterSupport : (Option Bool) := none
+structure WorkspaceFoldersInitializeParams where
+  workspaceFolders : (Option (Array WorkspaceFolder)) := none
   deriving Inhabited
 
-instance : ToJson ClientSignatureInformationOptions where
-  toJson s := Json.mkObj <|
-    (match s.documentationFormat with | some v => [("documentationFormat", toJson v)] | none => []) ++
-    (match s.parameterInformation with | some v => [("parameterInformation", toJson v)] | none => []) ++
-    (match s.activeParameterSupport with | some v => [("activeParameterSupport", toJson v)] | none => []) ++
-    (match s.noActiveParameterSupport with | some v => [("noActiveParameterSupport", toJson v)] | none => [])
+instance : ToJson WorkspaceFoldersInitializeParams where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.workspaceFolders with | some v => ("workspaceFolders", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson ClientSignatureInformationOptions where
+instance : FromJson WorkspaceFoldersInitializeParams where
   fromJson? json := do
-    let documentationFormat := (json.getObjValAs? (Array MarkupKind) "documentationFormat").toOption
-    let parameterInformation := (json.getObjValAs? ClientSignatureParameterInformationOptions "parameterInformation").toOption
-    let activeParameterSupport := (json.getObjValAs? Bool "activeParameterSupport").toOption
-    let noActiveParameterSupport := (json.getObjValAs? Bool "noActiveParameterSupport").toOption
-    return { documentationFormat, parameterInformation, activeParameterSupport, noActiveParameterSupport }
+    let _obj ← json.getObj?
+    let workspaceFolders : Option (Array WorkspaceFolder) := (_obj.find compare "workspaceFolders").bind fun v => (fromJson? v).toOption
+    return { workspaceFolders }
 
-/-- @since 3.18.0 -/
-structure ClientCodeActionLiteralOptions where
-  codeActionKind : ClientCodeActionKindOptions
+/-- Save options. -/
+structure SaveOptions where
+  includeText : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson ClientCodeActionLiteralOptions where
-  toJson s := Json.mkObj <|
-    [("codeActionKind", toJson s.codeActionKind)]
+instance : ToJson SaveOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.includeText with | some v => ("includeText", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson ClientCodeActionLiteralOptions where
+instance : FromJson SaveOptions where
   fromJson? json := do
-    let codeActionKind ← json.getObjValAs? ClientCodeActionKindOptions "codeActionKind"
-    return { codeActionKind }
+    let _obj ← json.getObj?
+    let includeText : Option Bool := (_obj.find compare "includeText").bind fun v => (fromJson? v).toOption
+    return { includeText }
 
-/-- General diagnostics capabilities for pull and push model. -/
-structure DiagnosticsCapabilities where
-  relatedInformation : (Option Bool) := none
-  tagSupport : (Option ClientDiagnosticsTagOptions) := none
-  codeDescriptionSupport : (Option Bool) := none
-  dataSupport : (Option Bool) := none
+/-- Structure to capture a description for an error code.  @since 3.16.0 -/
+structure CodeDescription where
+  href : String
   deriving Inhabited
 
-instance : ToJson DiagnosticsCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.relatedInformation with | some v => [("relatedInformation", toJson v)] | none => []) ++
-    (match s.tagSupport with | some v => [("tagSupport", toJson v)] | none => []) ++
-    (match s.codeDescriptionSupport with | some v => [("codeDescriptionSupport", toJson v)] | none => []) ++
-    (match s.dataSupport with | some v => [("dataSupport", toJson v)] | none => [])
+instance : ToJson CodeDescription where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("href", toJson s.href) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DiagnosticsCapabilities where
+instance : FromJson CodeDescription where
   fromJson? json := do
-    let relatedInformation := (json.getObjValAs? Bool "relatedInformation").toOption
-    let tagSupport := (json.getObjValAs? ClientDiagnosticsTagOptions "tagSupport").toOption
-    let codeDescriptionSupport := (json.getObjValAs? Bool "codeDescriptionSupport").toOption
-    let dataSupport := (json.getObjValAs? Bool "dataSupport").toOption
-    return { relatedInformation, tagSupport, codeDescriptionSupport, dataSupport }
+    let _obj ← json.getObj?
+    let href : String ← match _obj.find compare "href" with | some v => fromJson? v | none => throw "property not found: href"
+    return { href }
 
-/-- @since 3.18.0 -/
-structure ClientSemanticTokensRequestOptions where
-  range : Json := Json.null
-  full : Json := Json.null
+/-- Represents a related message and source code location for a diagnostic. This should be used to point to code locations that cause or related to a diagnostics, e.g when duplicating a symbol in a scope. -/
+structure DiagnosticRelatedInformation where
+  location : Location
+  message : String
   deriving Inhabited
 
-instance : ToJson ClientSemanticTokensRequestOptions where
-  toJson s := Json.mkObj <|
-    [("range", toJson s.range)] ++
-    [("full", toJson s.full)]
+instance : ToJson DiagnosticRelatedInformation where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("location", toJson s.location) :: ("message", toJson s.message) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ClientSemanticTokensRequestOptions where
+instance : FromJson DiagnosticRelatedInformation where
   fromJson? json := do
-    let range := json.getObjVal? "range" |>.toOption |>.getD Json.null
-    let full := json.getObjVal? "full" |>.toOption |>.getD Json.null
-    return { range, full }
+    let _obj ← json.getObj?
+    let location : Location ← match _obj.find compare "location" with | some v => fromJson? v | none => throw "property not found: location"
+    let message : String ← match _obj.find compare "message" with | some v => fromJson? v | none => throw "property not found: message"
+    return { location, message }
 
-/-- The parameters of a `workspace/didChangeWorkspaceFolders` notification. -/
-structure DidChangeWorkspaceFoldersParams where
-  event : WorkspaceFoldersChangeEvent
+/-- Represents a diagnostic, such as a compiler error or warning. Diagnostic objects are only valid in the scope of a resource. -/
+structure Diagnostic where
+  range : Range
+  severity : (Option DiagnosticSeverity) := none
+  code : Json := Json.null
+  codeDescription : (Option CodeDescription) := none
+  source : (Option String) := none
+  message : String
+  tags : (Option (Array DiagnosticTag)) := none
+  relatedInformation : (Option (Array DiagnosticRelatedInformation)) := none
+  data : Json := Json.null
   deriving Inhabited
 
-instance : ToJson DidChangeWorkspaceFoldersParams where
-  toJson s := Json.mkObj <|
-    [("event", toJson s.event)]
+instance : ToJson Diagnostic where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("data", toJson s.data) :: kvs
+    let kvs := (match s.relatedInformation with | some v => ("relatedInformation", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.tags with | some v => ("tags", toJson v) :: kvs | none => kvs)
+    let kvs := ("message", toJson s.message) :: kvs
+    let kvs := (match s.source with | some v => ("source", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.codeDescription with | some v => ("codeDescription", toJson v) :: kvs | none => kvs)
+    let kvs := ("code", toJson s.code) :: kvs
+    let kvs := (match s.severity with | some v => ("severity", toJson v) :: kvs | none => kvs)
+    let kvs := ("range", toJson s.range) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DidChangeWorkspaceFoldersParams where
+instance : FromJson Diagnostic where
   fromJson? json := do
-    let event ← json.getObjValAs? WorkspaceFoldersChangeEvent "event"
-    return { event }
-
-structure ImplementationRegistrationOptions where
-  documentSelector : (Option Json)
-  id : (Option String) := none
-  deriving Inhabited
+    let _obj ← json.getObj?
+    let range : Range ← match _obj.find compare "range" with | some v => fromJson? v | none => throw "property not found: range"
+    let severity : Option DiagnosticSeverity := (_obj.find compare "severity").bind fun v => (fromJson? v).toOption
+    let code : Json := (_obj.find compare "code").getD Json.null
+    let codeDescription : Option CodeDescription := (_obj.find compare "codeDescription").bind fun v => (fromJson? v).toOption
+    let source : Option String := (_obj.find compare "source").bind fun v => (fromJson? v).toOption
+    let message : String ← match _obj.find compare "message" with | some v => fromJson? v | none => throw "property not found: message"
+    let tags : Option (Array DiagnosticTag) := (_obj.find compare "tags").bind fun v => (fromJson? v).toOption
+    let relatedInformation : Option (Array DiagnosticRelatedInformation) := (_obj.find compare "relatedInformation").bind fun v => (fromJson? v).toOption
+    let data : Json := (_obj.find compare "data").getD Json.null
+    return { range, severity, code, codeDescription, source, message, tags, relatedInformation, data }
 
-instance : ToJson ImplementationRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)] ++
-    (match s.id with | some v => [("id", toJson v)] | none => [])
+/-- A special text edit to provide an insert and a replace operation.  @since 3.16.0 -/
+structure InsertReplaceEdit where
+  newText : String
+  insert : Range
+  replace : Range
+  deriving Inhabited
 
-instance : FromJson ImplementationRegistrationOptions where
+instance : ToJson InsertReplaceEdit where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("newText", toJson s.newText) :: ("insert", toJson s.insert) :: ("replace", toJson s.replace) :: kvs
+    Json.mkObj kvs
+
+instance : FromJson InsertReplaceEdit where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    let id := (json.getObjValAs? String "id").toOption
-    return { documentSelector, id }
+    let _obj ← json.getObj?
+    let newText : String ← match _obj.find compare "newText" with | some v => fromJson? v | none => throw "property not found: newText"
+    let insert : Range ← match _obj.find compare "insert" with | some v => fromJson? v | none => throw "property not found: insert"
+    let replace : Range ← match _obj.find compare "replace" with | some v => fromJson? v | none => throw "property not found: replace"
+    return { newText, insert, replace }
 
-structure TypeDefinitionRegistrationOptions where
-  documentSelector : (Option Json)
-  id : (Option String) := none
+/-- Hover options. -/
+structure HoverOptions where
+  workDoneProgress : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson TypeDefinitionRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)] ++
-    (match s.id with | some v => [("id", toJson v)] | none => [])
+instance : ToJson HoverOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson TypeDefinitionRegistrationOptions where
+instance : FromJson HoverOptions where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    let id := (json.getObjValAs? String "id").toOption
-    return { documentSelector, id }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    return { workDoneProgress }
 
-structure DocumentColorRegistrationOptions where
-  documentSelector : (Option Json)
-  id : (Option String) := none
+/-- Server Capabilities for a {@link DefinitionRequest}. -/
+structure DefinitionOptions where
+  workDoneProgress : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson DocumentColorRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)] ++
-    (match s.id with | some v => [("id", toJson v)] | none => [])
+instance : ToJson DefinitionOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson DocumentColorRegistrationOptions where
+instance : FromJson DefinitionOptions where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    let id := (json.getObjValAs? String "id").toOption
-    return { documentSelector, id }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    return { workDoneProgress }
 
-structure FoldingRangeRegistrationOptions where
-  documentSelector : (Option Json)
-  id : (Option String) := none
+/-- Reference options. -/
+structure ReferenceOptions where
+  workDoneProgress : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson FoldingRangeRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)] ++
-    (match s.id with | some v => [("id", toJson v)] | none => [])
+instance : ToJson ReferenceOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson FoldingRangeRegistrationOptions where
+instance : FromJson ReferenceOptions where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    let id := (json.getObjValAs? String "id").toOption
-    return { documentSelector, id }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    return { workDoneProgress }
 
-structure DeclarationRegistrationOptions where
-  documentSelector : (Option Json)
-  id : (Option String) := none
+/-- Provider options for a {@link DocumentHighlightRequest}. -/
+structure DocumentHighlightOptions where
+  workDoneProgress : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson DeclarationRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)] ++
-    (match s.id with | some v => [("id", toJson v)] | none => [])
+instance : ToJson DocumentHighlightOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson DeclarationRegistrationOptions where
+instance : FromJson DocumentHighlightOptions where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    let id := (json.getObjValAs? String "id").toOption
-    return { documentSelector, id }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    return { workDoneProgress }
 
-structure SelectionRangeRegistrationOptions where
-  documentSelector : (Option Json)
-  id : (Option String) := none
+/-- A base for all symbol information. -/
+structure BaseSymbolInformation where
+  name : String
+  kind : SymbolKind
+  tags : (Option (Array SymbolTag)) := none
+  containerName : (Option String) := none
   deriving Inhabited
 
-instance : ToJson SelectionRangeRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)] ++
-    (match s.id with | some v => [("id", toJson v)] | none => [])
+instance : ToJson BaseSymbolInformation where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.containerName with | some v => ("containerName", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.tags with | some v => ("tags", toJson v) :: kvs | none => kvs)
+    let kvs := ("name", toJson s.name) :: ("kind", toJson s.kind) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson SelectionRangeRegistrationOptions where
+instance : FromJson BaseSymbolInformation where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    let id := (json.getObjValAs? String "id").toOption
-    return { documentSelector, id }
+    let _obj ← json.getObj?
+    let name : String ← match _obj.find compare "name" with | some v => fromJson? v | none => throw "property not found: name"
+    let kind : SymbolKind ← match _obj.find compare "kind" with | some v => fromJson? v | none => throw "property not found: kind"
+    let tags : Option (Array SymbolTag) := (_obj.find compare "tags").bind fun v => (fromJson? v).toOption
+    let containerName : Option String := (_obj.find compare "containerName").bind fun v => (fromJson? v).toOption
+    return { name, kind, tags, containerName }
 
-/-- Call hierarchy options used during static or dynamic registration.  @since 3.16.0 -/
-structure CallHierarchyRegistrationOptions where
-  documentSelector : (Option Json)
-  id : (Option String) := none
+/-- Provider options for a {@link DocumentSymbolRequest}. -/
+structure DocumentSymbolOptions where
+  workDoneProgress : (Option Bool) := none
+  label : (Option String) := none
   deriving Inhabited
 
-instance : ToJson CallHierarchyRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)] ++
-    (match s.id with | some v => [("id", toJson v)] | none => [])
+instance : ToJson DocumentSymbolOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.label with | some v => ("label", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson CallHierarchyRegistrationOptions where
+instance : FromJson DocumentSymbolOptions where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    let id := (json.getObjValAs? String "id").toOption
-    return { documentSelector, id }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    let label : Option String := (_obj.find compare "label").bind fun v => (fromJson? v).toOption
+    return { workDoneProgress, label }
 
-structure LinkedEditingRangeRegistrationOptions where
-  documentSelector : (Option Json)
-  id : (Option String) := none
+/-- Provider options for a {@link CodeActionRequest}. -/
+structure CodeActionOptions where
+  workDoneProgress : (Option Bool) := none
+  codeActionKinds : (Option (Array CodeActionKind)) := none
+  documentation : Json := Json.null
+  resolveProvider : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson LinkedEditingRangeRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)] ++
-    (match s.id with | some v => [("id", toJson v)] | none => [])
+instance : ToJson CodeActionOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.resolveProvider with | some v => ("resolveProvider", toJson v) :: kvs | none => kvs)
+    let kvs := ("documentation", toJson s.documentation) :: kvs
+    let kvs := (match s.codeActionKinds with | some v => ("codeActionKinds", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson LinkedEditingRangeRegistrationOptions where
+instance : FromJson CodeActionOptions where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    let id := (json.getObjValAs? String "id").toOption
-    return { documentSelector, id }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    let codeActionKinds : Option (Array CodeActionKind) := (_obj.find compare "codeActionKinds").bind fun v => (fromJson? v).toOption
+    let documentation : Json := (_obj.find compare "documentation").getD Json.null
+    let resolveProvider : Option Bool := (_obj.find compare "resolveProvider").bind fun v => (fromJson? v).toOption
+    return { workDoneProgress, codeActionKinds, documentation, resolveProvider }
 
-structure MonikerRegistrationOptions where
-  documentSelector : (Option Json)
+/-- Location with only uri and does not include range.  @since 3.18.0 -/
+structure LocationUriOnly where
+  uri : String
   deriving Inhabited
 
-instance : ToJson MonikerRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)]
+instance : ToJson LocationUriOnly where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("uri", toJson s.uri) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson MonikerRegistrationOptions where
+instance : FromJson LocationUriOnly where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    return { documentSelector }
+    let _obj ← json.getObj?
+    let uri : String ← match _obj.find compare "uri" with | some v => fromJson? v | none => throw "property not found: uri"
+    return { uri }
 
-/-- Type hierarchy options used during static or dynamic registration.  @since 3.17.0 -/
-structure TypeHierarchyRegistrationOptions where
-  documentSelector : (Option Json)
-  id : (Option String) := none
+/-- Server capabilities for a {@link WorkspaceSymbolRequest}. -/
+structure WorkspaceSymbolOptions where
+  workDoneProgress : (Option Bool) := none
+  resolveProvider : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson TypeHierarchyRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)] ++
-    (match s.id with | some v => [("id", toJson v)] | none => [])
+instance : ToJson WorkspaceSymbolOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.resolveProvider with | some v => ("resolveProvider", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson TypeHierarchyRegistrationOptions where
+instance : FromJson WorkspaceSymbolOptions where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    let id := (json.getObjValAs? String "id").toOption
-    return { documentSelector, id }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    let resolveProvider : Option Bool := (_obj.find compare "resolveProvider").bind fun v => (fromJson? v).toOption
+    return { workDoneProgress, resolveProvider }
 
-/-- Inline value options used during static or dynamic registration.  @since 3.17.0 -/
-structure InlineValueRegistrationOptions where
-  documentSelector : (Option Json)
-  id : (Option String) := none
+/-- Provider options for a {@link DocumentFormattingRequest}. -/
+structure DocumentFormattingOptions where
+  workDoneProgress : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson InlineValueRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)] ++
-    (match s.id with | some v => [("id", toJson v)] | none => [])
+instance : ToJson DocumentFormattingOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson InlineValueRegistrationOptions where
+instance : FromJson DocumentFormattingOptions where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    let id := (json.getObjValAs? String "id").toOption
-    return { documentSelector, id }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    return { workDoneProgress }
 
-/-- Inlay hint options used during static or dynamic registration.  @since 3.17.0 -/
-structure InlayHintRegistrationOptions where
-  resolveProvider : (Option Bool) := none
-  documentSelector : (Option Json)
-  id : (Option String) := none
+/-- Provider options for a {@link DocumentRangeFormattingRequest}. -/
+structure DocumentRangeFormattingOptions where
+  workDoneProgress : (Option Bool) := none
+  rangesSupport : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson InlayHintRegistrationOptions where
-  toJson s := Json.mkObj <|
-    (match s.resolveProvider with | some v => [("resolveProvider", toJson v)] | none => []) ++
-    [("documentSelector", toJson s.documentSelector)] ++
-    (match s.id with | some v => [("id", toJson v)] | none => [])
+instance : ToJson DocumentRangeFormattingOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.rangesSupport with | some v => ("rangesSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson InlayHintRegistrationOptions where
+instance : FromJson DocumentRangeFormattingOptions where
   fromJson? json := do
-    let resolveProvider := (json.getObjValAs? Bool "resolveProvider").toOption
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    let id := (json.getObjValAs? String "id").toOption
-    return { resolveProvider, documentSelector, id }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    let rangesSupport : Option Bool := (_obj.find compare "rangesSupport").bind fun v => (fromJson? v).toOption
+    return { workDoneProgress, rangesSupport }
 
-/-- Diagnostic registration options.  @since 3.17.0 -/
-structure DiagnosticRegistrationOptions where
-  documentSelector : (Option Json)
-  identifier : (Option String) := none
-  interFileDependencies : Bool
-  workspaceDiagnostics : Bool
-  id : (Option String) := none
+/-- Provider options for a {@link RenameRequest}. -/
+structure RenameOptions where
+  workDoneProgress : (Option Bool) := none
+  prepareProvider : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson DiagnosticRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)] ++
-    (match s.identifier with | some v => [("identifier", toJson v)] | none => []) ++
-    [("interFileDependencies", toJson s.interFileDependencies)] ++
-    [("workspaceDiagnostics", toJson s.workspaceDiagnostics)] ++
-    (match s.id with | some v => [("id", toJson v)] | none => [])
+instance : ToJson RenameOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.prepareProvider with | some v => ("prepareProvider", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson DiagnosticRegistrationOptions where
+instance : FromJson RenameOptions where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    let identifier := (json.getObjValAs? String "identifier").toOption
-    let interFileDependencies ← json.getObjValAs? Bool "interFileDependencies"
-    let workspaceDiagnostics ← json.getObjValAs? Bool "workspaceDiagnostics"
-    let id := (json.getObjValAs? String "id").toOption
-    return { documentSelector, identifier, interFileDependencies, workspaceDiagnostics, id }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    let prepareProvider : Option Bool := (_obj.find compare "prepareProvider").bind fun v => (fromJson? v).toOption
+    return { workDoneProgress, prepareProvider }
 
-/-- Registration options for a {@link HoverRequest}. -/
-structure HoverRegistrationOptions where
-  documentSelector : (Option Json)
+/-- @since 3.18.0 -/
+structure PrepareRenamePlaceholder where
+  range : Range
+  placeholder : String
   deriving Inhabited
 
-instance : ToJson HoverRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)]
+instance : ToJson PrepareRenamePlaceholder where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("range", toJson s.range) :: ("placeholder", toJson s.placeholder) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson HoverRegistrationOptions where
+instance : FromJson PrepareRenamePlaceholder where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    return { documentSelector }
+    let _obj ← json.getObj?
+    let range : Range ← match _obj.find compare "range" with | some v => fromJson? v | none => throw "property not found: range"
+    let placeholder : String ← match _obj.find compare "placeholder" with | some v => fromJson? v | none => throw "property not found: placeholder"
+    return { range, placeholder }
 
-/-- Registration options for a {@link SignatureHelpRequest}. -/
-structure SignatureHelpRegistrationOptions where
-  documentSelector : (Option Json)
-  triggerCharacters : (Option (Array String)) := none
-  retriggerCharacters : (Option (Array String)) := none
+/-- @since 3.18.0 -/
+structure PrepareRenameDefaultBehavior where
+  defaultBehavior : Bool
   deriving Inhabited
 
-instance : ToJson SignatureHelpRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)] ++
-    (match s.triggerCharacters with | some v => [("triggerCharacters", toJson v)] | none => []) ++
-    (match s.retriggerCharacters with | some v => [("retriggerCharacters", toJson v)] | none => [])
+instance : ToJson PrepareRenameDefaultBehavior where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("defaultBehavior", toJson s.defaultBehavior) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson SignatureHelpRegistrationOptions where
+instance : FromJson PrepareRenameDefaultBehavior where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    let triggerCharacters := (json.getObjValAs? (Array String) "triggerCharacters").toOption
-    let retriggerCharacters := (json.getObjValAs? (Array String) "retriggerCharacters").toOption
-    return { documentSelector, triggerCharacters, retriggerCharacters }
+    let _obj ← json.getObj?
+    let defaultBehavior : Bool ← match _obj.find compare "defaultBehavior" with | some v => fromJson? v | none => throw "property not found: defaultBehavior"
+    return { defaultBehavior }
 
-/-- Registration options for a {@link DefinitionRequest}. -/
-structure DefinitionRegistrationOptions where
-  documentSelector : (Option Json)
+/-- Semantic tokens options to support deltas for full documents  @since 3.18.0 -/
+structure SemanticTokensFullDelta where
+  delta : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson DefinitionRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)]
+instance : ToJson SemanticTokensFullDelta where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.delta with | some v => ("delta", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson DefinitionRegistrationOptions where
+instance : FromJson SemanticTokensFullDelta where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    return { documentSelector }
+    let _obj ← json.getObj?
+    let delta : Option Bool := (_obj.find compare "delta").bind fun v => (fromJson? v).toOption
+    return { delta }
 
-/-- Registration options for a {@link ReferencesRequest}. -/
-structure ReferenceRegistrationOptions where
-  documentSelector : (Option Json)
+/-- A special text edit with an additional change annotation.  @since 3.16.0. -/
+structure AnnotatedTextEdit where
+  range : Range
+  newText : String
+  annotationId : ChangeAnnotationIdentifier
   deriving Inhabited
 
-instance : ToJson ReferenceRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)]
+instance : ToJson AnnotatedTextEdit where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("range", toJson s.range) :: ("newText", toJson s.newText) :: ("annotationId", toJson s.annotationId) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ReferenceRegistrationOptions where
+instance : FromJson AnnotatedTextEdit where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    return { documentSelector }
+    let _obj ← json.getObj?
+    let range : Range ← match _obj.find compare "range" with | some v => fromJson? v | none => throw "property not found: range"
+    let newText : String ← match _obj.find compare "newText" with | some v => fromJson? v | none => throw "property not found: newText"
+    let annotationId : ChangeAnnotationIdentifier ← match _obj.find compare "annotationId" with | some v => fromJson? v | none => throw "property not found: annotationId"
+    return { range, newText, annotationId }
 
-/-- Registration options for a {@link DocumentHighlightRequest}. -/
-structure DocumentHighlightRegistrationOptions where
-  documentSelector : (Option Json)
+/-- A generic resource operation. -/
+structure ResourceOperation where
+  kind : String
+  annotationId : (Option ChangeAnnotationIdentifier) := none
   deriving Inhabited
 
-instance : ToJson DocumentHighlightRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)]
+instance : ToJson ResourceOperation where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.annotationId with | some v => ("annotationId", toJson v) :: kvs | none => kvs)
+    let kvs := ("kind", toJson s.kind) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DocumentHighlightRegistrationOptions where
+instance : FromJson ResourceOperation where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    return { documentSelector }
+    let _obj ← json.getObj?
+    let kind : String ← match _obj.find compare "kind" with | some v => fromJson? v | none => throw "property not found: kind"
+    let annotationId : Option ChangeAnnotationIdentifier := (_obj.find compare "annotationId").bind fun v => (fromJson? v).toOption
+    return { kind, annotationId }
 
-/-- Registration options for a {@link DocumentSymbolRequest}. -/
-structure DocumentSymbolRegistrationOptions where
-  documentSelector : (Option Json)
-  label : (Option String) := none
+/-- A full document diagnostic report for a workspace diagnostic result.  @since 3.17.0 -/
+structure WorkspaceFullDocumentDiagnosticReport where
+  kind : String
+  resultId : (Option String) := none
+  items : Json
+  uri : String
+  version : (Option Int)
   deriving Inhabited
 
-instance : ToJson DocumentSymbolRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)] ++
-    (match s.label with | some v => [("label", toJson v)] | none => [])
+instance : ToJson WorkspaceFullDocumentDiagnosticReport where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("items", toJson s.items) :: ("uri", toJson s.uri) :: ("version", toJson s.version) :: kvs
+    let kvs := (match s.resultId with | some v => ("resultId", toJson v) :: kvs | none => kvs)
+    let kvs := ("kind", toJson s.kind) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DocumentSymbolRegistrationOptions where
+instance : FromJson WorkspaceFullDocumentDiagnosticReport where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    let label := (json.getObjValAs? String "label").toOption
-    return { documentSelector, label }
+    let _obj ← json.getObj?
+    let kind : String ← match _obj.find compare "kind" with | some v => fromJson? v | none => throw "property not found: kind"
+    let resultId : Option String := (_obj.find compare "resultId").bind fun v => (fromJson? v).toOption
+    let items : Json := (_obj.find compare "items").getD Json.null
+    let uri : String ← match _obj.find compare "uri" with | some v => fromJson? v | none => throw "property not found: uri"
+    let version : (Option Int) ← match _obj.find compare "version" with | some v => fromJson? v | none => throw "property not found: version"
+    return { kind, resultId, items, uri, version }
 
-/-- Registration options for a {@link CodeActionRequest}. -/
-structure CodeActionRegistrationOptions where
-  documentSelector : (Option Json)
-  codeActionKinds : (Option (Array CodeActionKind)) := none
-  documentation : Json := Json.null
-  resolveProvider : (Option Bool) := none
+/-- An unchanged document diagnostic report for a workspace diagnostic result.  @since 3.17.0 -/
+structure WorkspaceUnchangedDocumentDiagnosticReport where
+  kind : String
+  resultId : String
+  uri : String
+  version : (Option Int)
   deriving Inhabited
 
-instance : ToJson CodeActionRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)] ++
-    (match s.codeActionKinds with | some v => [("codeActionKinds", toJson v)] | none => []) ++
-    [("documentation", toJson s.documentation)] ++
-    (match s.resolveProvider with | some v => [("resolveProvider", toJson v)] | none => [])
+instance : ToJson WorkspaceUnchangedDocumentDiagnosticReport where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("kind", toJson s.kind) :: ("resultId", toJson s.resultId) :: ("uri", toJson s.uri) :: ("version", toJson s.version) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson CodeActionRegistrationOptions where
+instance : FromJson WorkspaceUnchangedDocumentDiagnosticReport where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    let codeActionKinds := (json.getObjValAs? (Array CodeActionKind) "codeActionKinds").toOption
-    let documentation := json.getObjVal? "documentation" |>.toOption |>.getD Json.null
-    let resolveProvider := (json.getObjValAs? Bool "resolveProvider").toOption
-    return { documentSelector, codeActionKinds, documentation, resolveProvider }
+    let _obj ← json.getObj?
+    let kind : String ← match _obj.find compare "kind" with | some v => fromJson? v | none => throw "property not found: kind"
+    let resultId : String ← match _obj.find compare "resultId" with | some v => fromJson? v | none => throw "property not found: resultId"
+    let uri : String ← match _obj.find compare "uri" with | some v => fromJson? v | none => throw "property not found: uri"
+    let version : (Option Int) ← match _obj.find compare "version" with | some v => fromJson? v | none => throw "property not found: version"
+    return { kind, resultId, uri, version }
 
-/-- Registration options for a {@link WorkspaceSymbolRequest}. -/
-structure WorkspaceSymbolRegistrationOptions where
-  resolveProvider : (Option Bool) := none
+/-- @since 3.18.0 -/
+structure NotebookCellLanguage where
+  language : String
   deriving Inhabited
 
-instance : ToJson WorkspaceSymbolRegistrationOptions where
-  toJson s := Json.mkObj <|
-    (match s.resolveProvider with | some v => [("resolveProvider", toJson v)] | none => [])
+instance : ToJson NotebookCellLanguage where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("language", toJson s.language) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson WorkspaceSymbolRegistrationOptions where
+instance : FromJson NotebookCellLanguage where
   fromJson? json := do
-    let resolveProvider := (json.getObjValAs? Bool "resolveProvider").toOption
-    return { resolveProvider }
+    let _obj ← json.getObj?
+    let language : String ← match _obj.find compare "language" with | some v => fromJson? v | none => throw "property not found: language"
+    return { language }
 
-/-- Registration options for a {@link CodeLensRequest}. -/
-structure CodeLensRegistrationOptions where
-  documentSelector : (Option Json)
-  resolveProvider : (Option Bool) := none
+/-- @since 3.18.0 -/
+structure NotebookDocumentFilterWithNotebook where
+  notebook : Json
+  cells : (Option (Array NotebookCellLanguage)) := none
   deriving Inhabited
 
-instance : ToJson CodeLensRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)] ++
-    (match s.resolveProvider with | some v => [("resolveProvider", toJson v)] | none => [])
+instance : ToJson NotebookDocumentFilterWithNotebook where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.cells with | some v => ("cells", toJson v) :: kvs | none => kvs)
+    let kvs := ("notebook", toJson s.notebook) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson CodeLensRegistrationOptions where
+instance : FromJson NotebookDocumentFilterWithNotebook where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    let resolveProvider := (json.getObjValAs? Bool "resolveProvider").toOption
-    return { documentSelector, resolveProvider }
+    let _obj ← json.getObj?
+    let notebook : Json := (_obj.find compare "notebook").getD Json.null
+    let cells : Option (Array NotebookCellLanguage) := (_obj.find compare "cells").bind fun v => (fromJson? v).toOption
+    return { notebook, cells }
 
-/-- Registration options for a {@link DocumentLinkRequest}. -/
-structure DocumentLinkRegistrationOptions where
-  documentSelector : (Option Json)
-  resolveProvider : (Option Bool) := none
+/-- @since 3.18.0 -/
+structure NotebookDocumentFilterWithCells where
+  notebook : Json := Json.null
+  cells : (Array NotebookCellLanguage)
   deriving Inhabited
 
-instance : ToJson DocumentLinkRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)] ++
-    (match s.resolveProvider with | some v => [("resolveProvider", toJson v)] | none => [])
+instance : ToJson NotebookDocumentFilterWithCells where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("notebook", toJson s.notebook) :: ("cells", toJson s.cells) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DocumentLinkRegistrationOptions where
+instance : FromJson NotebookDocumentFilterWithCells where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    let resolveProvider := (json.getObjValAs? Bool "resolveProvider").toOption
-    return { documentSelector, resolveProvider }
+    let _obj ← json.getObj?
+    let notebook : Json := (_obj.find compare "notebook").getD Json.null
+    let cells : (Array NotebookCellLanguage) ← match _obj.find compare "cells" with | some v => fromJson? v | none => throw "property not found: cells"
+    return { notebook, cells }
 
-/-- Registration options for a {@link DocumentFormattingRequest}. -/
-structure DocumentFormattingRegistrationOptions where
-  documentSelector : (Option Json)
+/-- Client capabilities specific to the used markdown parser.  @since 3.16.0 -/
+structure MarkdownClientCapabilities where
+  parser : String
+  version : (Option String) := none
+  allowedTags : (Option (Array String)) := none
   deriving Inhabited
 
-instance : ToJson DocumentFormattingRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)]
+instance : ToJson MarkdownClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.allowedTags with | some v => ("allowedTags", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.version with | some v => ("version", toJson v) :: kvs | none => kvs)
+    let kvs := ("parser", toJson s.parser) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DocumentFormattingRegistrationOptions where
+instance : FromJson MarkdownClientCapabilities where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    return { documentSelector }
+    let _obj ← json.getObj?
+    let parser : String ← match _obj.find compare "parser" with | some v => fromJson? v | none => throw "property not found: parser"
+    let version : Option String := (_obj.find compare "version").bind fun v => (fromJson? v).toOption
+    let allowedTags : Option (Array String) := (_obj.find compare "allowedTags").bind fun v => (fromJson? v).toOption
+    return { parser, version, allowedTags }
 
-/-- Registration options for a {@link DocumentRangeFormattingRequest}. -/
-structure DocumentRangeFormattingRegistrationOptions where
-  documentSelector : (Option Json)
-  rangesSupport : (Option Bool) := none
+/-- Client capabilities specific to regular expressions.  @since 3.16.0 -/
+structure RegularExpressionsClientCapabilities where
+  engine : RegularExpressionEngineKind
+  version : (Option String) := none
   deriving Inhabited
 
-instance : ToJson DocumentRangeFormattingRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)] ++
-    (match s.rangesSupport with | some v => [("rangesSupport", toJson v)] | none => [])
+instance : ToJson RegularExpressionsClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.version with | some v => ("version", toJson v) :: kvs | none => kvs)
+    let kvs := ("engine", toJson s.engine) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DocumentRangeFormattingRegistrationOptions where
+instance : FromJson RegularExpressionsClientCapabilities where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    let rangesSupport := (json.getObjValAs? Bool "rangesSupport").toOption
-    return { documentSelector, rangesSupport }
+    let _obj ← json.getObj?
+    let engine : RegularExpressionEngineKind ← match _obj.find compare "engine" with | some v => fromJson? v | none => throw "property not found: engine"
+    let version : Option String := (_obj.find compare "version").bind fun v => (fromJson? v).toOption
+    return { engine, version }
 
-/-- Registration options for a {@link RenameRequest}. -/
-structure RenameRegistrationOptions where
-  documentSelector : (Option Json)
-  prepareProvider : (Option Bool) := none
+/-- @since 3.18.0 -/
+structure StaleRequestSupportOptions where
+  cancel : Bool
+  retryOnContentModified : (Array String)
   deriving Inhabited
 
-instance : ToJson RenameRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)] ++
-    (match s.prepareProvider with | some v => [("prepareProvider", toJson v)] | none => [])
+instance : ToJson StaleRequestSupportOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("cancel", toJson s.cancel) :: ("retryOnContentModified", toJson s.retryOnContentModified) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson RenameRegistrationOptions where
+instance : FromJson StaleRequestSupportOptions where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    let prepareProvider := (json.getObjValAs? Bool "prepareProvider").toOption
-    return { documentSelector, prepareProvider }
+    let _obj ← json.getObj?
+    let cancel : Bool ← match _obj.find compare "cancel" with | some v => fromJson? v | none => throw "property not found: cancel"
+    let retryOnContentModified : (Array String) ← match _obj.find compare "retryOnContentModified" with | some v => fromJson? v | none => throw "property not found: retryOnContentModified"
+    return { cancel, retryOnContentModified }
 
-/-- Registration options for a {@link ExecuteCommandRequest}. -/
-structure ExecuteCommandRegistrationOptions where
-  commands : (Array String)
+/-- General client capabilities.  @since 3.16.0 -/
+structure GeneralClientCapabilities where
+  staleRequestSupport : (Option StaleRequestSupportOptions) := none
+  regularExpressions : (Option RegularExpressionsClientCapabilities) := none
+  markdown : (Option MarkdownClientCapabilities) := none
+  positionEncodings : (Option (Array PositionEncodingKind)) := none
   deriving Inhabited
 
-instance : ToJson ExecuteCommandRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("commands", toJson s.commands)]
+instance : ToJson GeneralClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.positionEncodings with | some v => ("positionEncodings", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.markdown with | some v => ("markdown", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.regularExpressions with | some v => ("regularExpressions", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.staleRequestSupport with | some v => ("staleRequestSupport", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson ExecuteCommandRegistrationOptions where
+instance : FromJson GeneralClientCapabilities where
   fromJson? json := do
-    let commands ← json.getObjValAs? (Array String) "commands"
-    return { commands }
+    let _obj ← json.getObj?
+    let staleRequestSupport : Option StaleRequestSupportOptions := (_obj.find compare "staleRequestSupport").bind fun v => (fromJson? v).toOption
+    let regularExpressions : Option RegularExpressionsClientCapabilities := (_obj.find compare "regularExpressions").bind fun v => (fromJson? v).toOption
+    let markdown : Option MarkdownClientCapabilities := (_obj.find compare "markdown").bind fun v => (fromJson? v).toOption
+    let positionEncodings : Option (Array PositionEncodingKind) := (_obj.find compare "positionEncodings").bind fun v => (fromJson? v).toOption
+    return { staleRequestSupport, regularExpressions, markdown, positionEncodings }
 
-/-- The change text document notification's parameters. -/
-structure DidChangeTextDocumentParams where
-  textDocument : VersionedTextDocumentIdentifier
-  contentChanges : (Array TextDocumentContentChangeEvent)
+/-- Notebook specific client capabilities.  @since 3.17.0 -/
+structure NotebookDocumentSyncClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
+  executionSummarySupport : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson DidChangeTextDocumentParams where
-  toJson s := Json.mkObj <|
-    [("textDocument", toJson s.textDocument)] ++
-    [("contentChanges", toJson s.contentChanges)]
+instance : ToJson NotebookDocumentSyncClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.executionSummarySupport with | some v => ("executionSummarySupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson DidChangeTextDocumentParams where
+instance : FromJson NotebookDocumentSyncClientCapabilities where
   fromJson? json := do
-    let textDocument ← json.getObjValAs? VersionedTextDocumentIdentifier "textDocument"
-    let contentChanges ← json.getObjValAs? (Array TextDocumentContentChangeEvent) "contentChanges"
-    return { textDocument, contentChanges }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    let executionSummarySupport : Option Bool := (_obj.find compare "executionSummarySupport").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration, executionSummarySupport }
 
-/-- Content changes to a cell in a notebook document.  @since 3.18.0 -/
-structure NotebookDocumentCellContentChanges where
-  document : VersionedTextDocumentIdentifier
-  changes : (Array TextDocumentContentChangeEvent)
+/-- Capabilities specific to the notebook document support.  @since 3.17.0 -/
+structure NotebookDocumentClientCapabilities where
+  synchronization : NotebookDocumentSyncClientCapabilities
   deriving Inhabited
 
-instance : ToJson NotebookDocumentCellContentChanges where
-  toJson s := Json.mkObj <|
-    [("document", toJson s.document)] ++
-    [("changes", toJson s.changes)]
+instance : ToJson NotebookDocumentClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("synchronization", toJson s.synchronization) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson NotebookDocumentCellContentChanges where
+instance : FromJson NotebookDocumentClientCapabilities where
   fromJson? json := do
-    let document ← json.getObjValAs? VersionedTextDocumentIdentifier "document"
-    let changes ← json.getObjValAs? (Array TextDocumentContentChangeEvent) "changes"
-    return { document, changes }
+    let _obj ← json.getObj?
+    let synchronization : NotebookDocumentSyncClientCapabilities ← match _obj.find compare "synchronization" with | some v => fromJson? v | none => throw "property not found: synchronization"
+    return { synchronization }
 
-structure ImplementationParams where
-  textDocument : TextDocumentIdentifier
-  position : Position
-  workDoneToken : (Option ProgressToken) := none
-  partialResultToken : (Option ProgressToken) := none
+/-- @since 3.16.0 -/
+structure CallHierarchyClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson ImplementationParams where
-  toJson s := Json.mkObj <|
-    [("textDocument", toJson s.textDocument)] ++
-    [("position", toJson s.position)] ++
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    (match s.partialResultToken with | some v => [("partialResultToken", toJson v)] | none => [])
+instance : ToJson CallHierarchyClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson ImplementationParams where
+instance : FromJson CallHierarchyClientCapabilities where
   fromJson? json := do
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let position ← json.getObjValAs? Position "position"
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let partialResultToken := (json.getObjValAs? ProgressToken "partialResultToken").toOption
-    return { textDocument, position, workDoneToken, partialResultToken }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration }
 
-structure TypeDefinitionParams where
-  textDocument : TextDocumentIdentifier
-  position : Position
-  workDoneToken : (Option ProgressToken) := none
-  partialResultToken : (Option ProgressToken) := none
+/-- @since 3.18.0 -/
+structure ClientCodeActionKindOptions where
+  valueSet : (Array CodeActionKind)
   deriving Inhabited
 
-instance : ToJson TypeDefinitionParams where
-  toJson s := Json.mkObj <|
-    [("textDocument", toJson s.textDocument)] ++
-    [("position", toJson s.position)] ++
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    (match s.partialResultToken with | some v => [("partialResultToken", toJson v)] | none => [])
+instance : ToJson ClientCodeActionKindOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("valueSet", toJson s.valueSet) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson TypeDefinitionParams where
+instance : FromJson ClientCodeActionKindOptions where
   fromJson? json := do
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let position ← json.getObjValAs? Position "position"
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let partialResultToken := (json.getObjValAs? ProgressToken "partialResultToken").toOption
-    return { textDocument, position, workDoneToken, partialResultToken }
+    let _obj ← json.getObj?
+    let valueSet : (Array CodeActionKind) ← match _obj.find compare "valueSet" with | some v => fromJson? v | none => throw "property not found: valueSet"
+    return { valueSet }
 
-structure DeclarationParams where
-  textDocument : TextDocumentIdentifier
-  position : Position
-  workDoneToken : (Option ProgressToken) := none
-  partialResultToken : (Option ProgressToken) := none
+/-- @since 3.18.0 -/
+structure ClientCodeActionLiteralOptions where
+  codeActionKind : ClientCodeActionKindOptions
   deriving Inhabited
 
-instance : ToJson DeclarationParams where
-  toJson s := Json.mkObj <|
-    [("textDocument", toJson s.textDocument)] ++
-    [("position", toJson s.position)] ++
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    (match s.partialResultToken with | some v => [("partialResultToken", toJson v)] | none => [])
+instance : ToJson ClientCodeActionLiteralOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("codeActionKind", toJson s.codeActionKind) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DeclarationParams where
+instance : FromJson ClientCodeActionLiteralOptions where
   fromJson? json := do
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let position ← json.getObjValAs? Position "position"
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let partialResultToken := (json.getObjValAs? ProgressToken "partialResultToken").toOption
-    return { textDocument, position, workDoneToken, partialResultToken }
+    let _obj ← json.getObj?
+    let codeActionKind : ClientCodeActionKindOptions ← match _obj.find compare "codeActionKind" with | some v => fromJson? v | none => throw "property not found: codeActionKind"
+    return { codeActionKind }
 
-/-- The parameter of a `textDocument/prepareCallHierarchy` request.  @since 3.16.0 -/
-structure CallHierarchyPrepareParams where
-  textDocument : TextDocumentIdentifier
-  position : Position
-  workDoneToken : (Option ProgressToken) := none
+/-- @since 3.18.0 -/
+structure ClientCodeActionResolveOptions where
+  properties : (Array String)
   deriving Inhabited
 
-instance : ToJson CallHierarchyPrepareParams where
-  toJson s := Json.mkObj <|
-    [("textDocument", toJson s.textDocument)] ++
-    [("position", toJson s.position)] ++
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => [])
+instance : ToJson ClientCodeActionResolveOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("properties", toJson s.properties) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson CallHierarchyPrepareParams where
+instance : FromJson ClientCodeActionResolveOptions where
   fromJson? json := do
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let position ← json.getObjValAs? Position "position"
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    return { textDocument, position, workDoneToken }
+    let _obj ← json.getObj?
+    let properties : (Array String) ← match _obj.find compare "properties" with | some v => fromJson? v | none => throw "property not found: properties"
+    return { properties }
 
-structure LinkedEditingRangeParams where
-  textDocument : TextDocumentIdentifier
-  position : Position
-  workDoneToken : (Option ProgressToken) := none
+/-- @since 3.18.0 - proposed -/
+structure CodeActionTagOptions where
+  valueSet : (Array CodeActionTag)
   deriving Inhabited
 
-instance : ToJson LinkedEditingRangeParams where
-  toJson s := Json.mkObj <|
-    [("textDocument", toJson s.textDocument)] ++
-    [("position", toJson s.position)] ++
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => [])
+instance : ToJson CodeActionTagOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("valueSet", toJson s.valueSet) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson LinkedEditingRangeParams where
+instance : FromJson CodeActionTagOptions where
   fromJson? json := do
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let position ← json.getObjValAs? Position "position"
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    return { textDocument, position, workDoneToken }
+    let _obj ← json.getObj?
+    let valueSet : (Array CodeActionTag) ← match _obj.find compare "valueSet" with | some v => fromJson? v | none => throw "property not found: valueSet"
+    return { valueSet }
 
-structure MonikerParams where
-  textDocument : TextDocumentIdentifier
-  position : Position
-  workDoneToken : (Option ProgressToken) := none
-  partialResultToken : (Option ProgressToken) := none
+/-- The Client Capabilities of a {@link CodeActionRequest}. -/
+structure CodeActionClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
+  codeActionLiteralSupport : (Option ClientCodeActionLiteralOptions) := none
+  isPreferredSupport : (Option Bool) := none
+  disabledSupport : (Option Bool) := none
+  dataSupport : (Option Bool) := none
+  resolveSupport : (Option ClientCodeActionResolveOptions) := none
+  honorsChangeAnnotations : (Option Bool) := none
+  documentationSupport : (Option Bool) := none
+  tagSupport : (Option CodeActionTagOptions) := none
   deriving Inhabited
 
-instance : ToJson MonikerParams where
-  toJson s := Json.mkObj <|
-    [("textDocument", toJson s.textDocument)] ++
-    [("position", toJson s.position)] ++
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    (match s.partialResultToken with | some v => [("partialResultToken", toJson v)] | none => [])
+instance : ToJson CodeActionClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.tagSupport with | some v => ("tagSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.documentationSupport with | some v => ("documentationSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.honorsChangeAnnotations with | some v => ("honorsChangeAnnotations", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.resolveSupport with | some v => ("resolveSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.dataSupport with | some v => ("dataSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.disabledSupport with | some v => ("disabledSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.isPreferredSupport with | some v => ("isPreferredSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.codeActionLiteralSupport with | some v => ("codeActionLiteralSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson MonikerParams where
+instance : FromJson CodeActionClientCapabilities where
   fromJson? json := do
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let position ← json.getObjValAs? Position "position"
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let partialResultToken := (json.getObjValAs? ProgressToken "partialResultToken").toOption
-    return { textDocument, position, workDoneToken, partialResultToken }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    let codeActionLiteralSupport : Option ClientCodeActionLiteralOptions := (_obj.find compare "codeActionLiteralSupport").bind fun v => (fromJson? v).toOption
+    let isPreferredSupport : Option Bool := (_obj.find compare "isPreferredSupport").bind fun v => (fromJson? v).toOption
+    let disabledSupport : Option Bool := (_obj.find compare "disabledSupport").bind fun v => (fromJson? v).toOption
+    let dataSupport : Option Bool := (_obj.find compare "dataSupport").bind fun v => (fromJson? v).toOption
+    let resolveSupport : Option ClientCodeActionResolveOptions := (_obj.find compare "resolveSupport").bind fun v => (fromJson? v).toOption
+    let honorsChangeAnnotations : Option Bool := (_obj.find compare "honorsChangeAnnotations").bind fun v => (fromJson? v).toOption
+    let documentationSupport : Option Bool := (_obj.find compare "documentationSupport").bind fun v => (fromJson? v).toOption
+    let tagSupport : Option CodeActionTagOptions := (_obj.find compare "tagSupport").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration, codeActionLiteralSupport, isPreferredSupport, disabledSupport, dataSupport, resolveSupport, honorsChangeAnnotations, documentationSupport, tagSupport }
 
-/-- The parameter of a `textDocument/prepareTypeHierarchy` request.  @since 3.17.0 -/
-structure TypeHierarchyPrepareParams where
-  textDocument : TextDocumentIdentifier
-  position : Position
-  workDoneToken : (Option ProgressToken) := none
+/-- @since 3.18.0 -/
+structure ClientCodeLensResolveOptions where
+  properties : (Array String)
   deriving Inhabited
 
-instance : ToJson TypeHierarchyPrepareParams where
-  toJson s := Json.mkObj <|
-    [("textDocument", toJson s.textDocument)] ++
-    [("position", toJson s.position)] ++
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => [])
+instance : ToJson ClientCodeLensResolveOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("properties", toJson s.properties) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson TypeHierarchyPrepareParams where
+instance : FromJson ClientCodeLensResolveOptions where
   fromJson? json := do
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let position ← json.getObjValAs? Position "position"
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    return { textDocument, position, workDoneToken }
+    let _obj ← json.getObj?
+    let properties : (Array String) ← match _obj.find compare "properties" with | some v => fromJson? v | none => throw "property not found: properties"
+    return { properties }
 
-/-- Completion parameters -/
-structure CompletionParams where
-  textDocument : TextDocumentIdentifier
-  position : Position
-  workDoneToken : (Option ProgressToken) := none
-  partialResultToken : (Option ProgressToken) := none
-  context : (Option CompletionContext) := none
+/-- The client capabilities  of a {@link CodeLensRequest}. -/
+structure CodeLensClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
+  resolveSupport : (Option ClientCodeLensResolveOptions) := none
   deriving Inhabited
 
-instance : ToJson CompletionParams where
-  toJson s := Json.mkObj <|
-    [("textDocument", toJson s.textDocument)] ++
-    [("position", toJson s.position)] ++
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    (match s.partialResultToken with | some v => [("partialResultToken", toJson v)] | none => []) ++
-    (match s.context with | some v => [("context", toJson v)] | none => [])
+instance : ToJson CodeLensClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.resolveSupport with | some v => ("resolveSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson CompletionParams where
+instance : FromJson CodeLensClientCapabilities where
   fromJson? json := do
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let position ← json.getObjValAs? Position "position"
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let partialResultToken := (json.getObjValAs? ProgressToken "partialResultToken").toOption
-    let context := (json.getObjValAs? CompletionContext "context").toOption
-    return { textDocument, position, workDoneToken, partialResultToken, context }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    let resolveSupport : Option ClientCodeLensResolveOptions := (_obj.find compare "resolveSupport").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration, resolveSupport }
 
-/-- Parameters for a {@link HoverRequest}. -/
-structure HoverParams where
-  textDocument : TextDocumentIdentifier
-  position : Position
-  workDoneToken : (Option ProgressToken) := none
+/-- @since 3.18.0 -/
+structure ClientCompletionItemInsertTextModeOptions where
+  valueSet : (Array InsertTextMode)
   deriving Inhabited
 
-instance : ToJson HoverParams where
-  toJson s := Json.mkObj <|
-    [("textDocument", toJson s.textDocument)] ++
-    [("position", toJson s.position)] ++
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => [])
+instance : ToJson ClientCompletionItemInsertTextModeOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("valueSet", toJson s.valueSet) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson HoverParams where
+instance : FromJson ClientCompletionItemInsertTextModeOptions where
   fromJson? json := do
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let position ← json.getObjValAs? Position "position"
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    return { textDocument, position, workDoneToken }
+    let _obj ← json.getObj?
+    let valueSet : (Array InsertTextMode) ← match _obj.find compare "valueSet" with | some v => fromJson? v | none => throw "property not found: valueSet"
+    return { valueSet }
 
-/-- Parameters for a {@link DefinitionRequest}. -/
-structure DefinitionParams where
-  textDocument : TextDocumentIdentifier
-  position : Position
-  workDoneToken : (Option ProgressToken) := none
-  partialResultToken : (Option ProgressToken) := none
+/-- @since 3.18.0 -/
+structure ClientCompletionItemResolveOptions where
+  properties : (Array String)
   deriving Inhabited
 
-instance : ToJson DefinitionParams where
-  toJson s := Json.mkObj <|
-    [("textDocument", toJson s.textDocument)] ++
-    [("position", toJson s.position)] ++
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    (match s.partialResultToken with | some v => [("partialResultToken", toJson v)] | none => [])
+instance : ToJson ClientCompletionItemResolveOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("properties", toJson s.properties) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DefinitionParams where
+instance : FromJson ClientCompletionItemResolveOptions where
   fromJson? json := do
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let position ← json.getObjValAs? Position "position"
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let partialResultToken := (json.getObjValAs? ProgressToken "partialResultToken").toOption
-    return { textDocument, position, workDoneToken, partialResultToken }
+    let _obj ← json.getObj?
+    let properties : (Array String) ← match _obj.find compare "properties" with | some v => fromJson? v | none => throw "property not found: properties"
+    return { properties }
 
-/-- Parameters for a {@link ReferencesRequest}. -/
-structure ReferenceParams where
-  textDocument : TextDocumentIdentifier
-  position : Position
-  workDoneToken : (Option ProgressToken) := none
-  partialResultToken : (Option ProgressToken) := none
-  context : ReferenceContext
+/-- @since 3.18.0 -/
+structure CompletionItemTagOptions where
+  valueSet : (Array CompletionItemTag)
   deriving Inhabited
 
-instance : ToJson ReferenceParams where
-  toJson s := Json.mkObj <|
-    [("textDocument", toJson s.textDocument)] ++
-    [("position", toJson s.position)] ++
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    (match s.partialResultToken with | some v => [("partialResultToken", toJson v)] | none => []) ++
-    [("context", toJson s.context)]
+instance : ToJson CompletionItemTagOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("valueSet", toJson s.valueSet) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ReferenceParams where
+instance : FromJson CompletionItemTagOptions where
   fromJson? json := do
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let position ← json.getObjValAs? Position "position"
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let partialResultToken := (json.getObjValAs? ProgressToken "partialResultToken").toOption
-    let context ← json.getObjValAs? ReferenceContext "context"
-    return { textDocument, position, workDoneToken, partialResultToken, context }
+    let _obj ← json.getObj?
+    let valueSet : (Array CompletionItemTag) ← match _obj.find compare "valueSet" with | some v => fromJson? v | none => throw "property not found: valueSet"
+    return { valueSet }
 
-/-- Parameters for a {@link DocumentHighlightRequest}. -/
-structure DocumentHighlightParams where
-  textDocument : TextDocumentIdentifier
-  position : Position
-  workDoneToken : (Option ProgressToken) := none
-  partialResultToken : (Option ProgressToken) := none
+/-- @since 3.18.0 -/
+structure ClientCompletionItemOptions where
+  snippetSupport : (Option Bool) := none
+  commitCharactersSupport : (Option Bool) := none
+  documentationFormat : (Option (Array MarkupKind)) := none
+  deprecatedSupport : (Option Bool) := none
+  preselectSupport : (Option Bool) := none
+  tagSupport : (Option CompletionItemTagOptions) := none
+  insertReplaceSupport : (Option Bool) := none
+  resolveSupport : (Option ClientCompletionItemResolveOptions) := none
+  insertTextModeSupport : (Option ClientCompletionItemInsertTextModeOptions) := none
+  labelDetailsSupport : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson DocumentHighlightParams where
-  toJson s := Json.mkObj <|
-    [("textDocument", toJson s.textDocument)] ++
-    [("position", toJson s.position)] ++
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    (match s.partialResultToken with | some v => [("partialResultToken", toJson v)] | none => [])
+instance : ToJson ClientCompletionItemOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.labelDetailsSupport with | some v => ("labelDetailsSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.insertTextModeSupport with | some v => ("insertTextModeSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.resolveSupport with | some v => ("resolveSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.insertReplaceSupport with | some v => ("insertReplaceSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.tagSupport with | some v => ("tagSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.preselectSupport with | some v => ("preselectSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.deprecatedSupport with | some v => ("deprecatedSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.documentationFormat with | some v => ("documentationFormat", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.commitCharactersSupport with | some v => ("commitCharactersSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.snippetSupport with | some v => ("snippetSupport", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson DocumentHighlightParams where
+instance : FromJson ClientCompletionItemOptions where
   fromJson? json := do
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let position ← json.getObjValAs? Position "position"
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let partialResultToken := (json.getObjValAs? ProgressToken "partialResultToken").toOption
-    return { textDocument, position, workDoneToken, partialResultToken }
+    let _obj ← json.getObj?
+    let snippetSupport : Option Bool := (_obj.find compare "snippetSupport").bind fun v => (fromJson? v).toOption
+    let commitCharactersSupport : Option Bool := (_obj.find compare "commitCharactersSupport").bind fun v => (fromJson? v).toOption
+    let documentationFormat : Option (Array MarkupKind) := (_obj.find compare "documentationFormat").bind fun v => (fromJson? v).toOption
+    let deprecatedSupport : Option Bool := (_obj.find compare "deprecatedSupport").bind fun v => (fromJson? v).toOption
+    let preselectSupport : Option Bool := (_obj.find compare "preselectSupport").bind fun v => (fromJson? v).toOption
+    let tagSupport : Option CompletionItemTagOptions := (_obj.find compare "tagSupport").bind fun v => (fromJson? v).toOption
+    let insertReplaceSupport : Option Bool := (_obj.find compare "insertReplaceSupport").bind fun v => (fromJson? v).toOption
+    let resolveSupport : Option ClientCompletionItemResolveOptions := (_obj.find compare "resolveSupport").bind fun v => (fromJson? v).toOption
+    let insertTextModeSupport : Option ClientCompletionItemInsertTextModeOptions := (_obj.find compare "insertTextModeSupport").bind fun v => (fromJson? v).toOption
+    let labelDetailsSupport : Option Bool := (_obj.find compare "labelDetailsSupport").bind fun v => (fromJson? v).toOption
+    return { snippetSupport, commitCharactersSupport, documentationFormat, deprecatedSupport, preselectSupport, tagSupport, insertReplaceSupport, resolveSupport, insertTextModeSupport, labelDetailsSupport }
 
-/-- The parameters of a {@link RenameRequest}. -/
-structure RenameParams where
-  textDocument : TextDocumentIdentifier
-  position : Position
-  workDoneToken : (Option ProgressToken) := none
-  newName : String
+/-- @since 3.18.0 -/
+structure ClientCompletionItemOptionsKind where
+  valueSet : (Option (Array CompletionItemKind)) := none
   deriving Inhabited
 
-instance : ToJson RenameParams where
-  toJson s := Json.mkObj <|
-    [("textDocument", toJson s.textDocument)] ++
-    [("position", toJson s.position)] ++
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    [("newName", toJson s.newName)]
+instance : ToJson ClientCompletionItemOptionsKind where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.valueSet with | some v => ("valueSet", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson RenameParams where
+instance : FromJson ClientCompletionItemOptionsKind where
   fromJson? json := do
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let position ← json.getObjValAs? Position "position"
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let newName ← json.getObjValAs? String "newName"
-    return { textDocument, position, workDoneToken, newName }
+    let _obj ← json.getObj?
+    let valueSet : Option (Array CompletionItemKind) := (_obj.find compare "valueSet").bind fun v => (fromJson? v).toOption
+    return { valueSet }
 
-structure PrepareRenameParams where
-  textDocument : TextDocumentIdentifier
-  position : Position
-  workDoneToken : (Option ProgressToken) := none
+/-- The client supports the following `CompletionList` specific capabilities.  @since 3.17.0 -/
+structure CompletionListCapabilities where
+  itemDefaults : (Option (Array String)) := none
+  applyKindSupport : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson PrepareRenameParams where
-  toJson s := Json.mkObj <|
-    [("textDocument", toJson s.textDocument)] ++
-    [("position", toJson s.position)] ++
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => [])
+instance : ToJson CompletionListCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.applyKindSupport with | some v => ("applyKindSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.itemDefaults with | some v => ("itemDefaults", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson PrepareRenameParams where
+instance : FromJson CompletionListCapabilities where
   fromJson? json := do
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let position ← json.getObjValAs? Position "position"
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    return { textDocument, position, workDoneToken }
+    let _obj ← json.getObj?
+    let itemDefaults : Option (Array String) := (_obj.find compare "itemDefaults").bind fun v => (fromJson? v).toOption
+    let applyKindSupport : Option Bool := (_obj.find compare "applyKindSupport").bind fun v => (fromJson? v).toOption
+    return { itemDefaults, applyKindSupport }
 
-/-- Represents a location inside a resource, such as a line inside a text file. -/
-structure Location where
-  uri : String
-  range : Range
+/-- Completion client capabilities -/
+structure CompletionClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
+  completionItem : (Option ClientCompletionItemOptions) := none
+  completionItemKind : (Option ClientCompletionItemOptionsKind) := none
+  insertTextMode : (Option InsertTextMode) := none
+  contextSupport : (Option Bool) := none
+  completionList : (Option CompletionListCapabilities) := none
   deriving Inhabited
 
-instance : ToJson Location where
-  toJson s := Json.mkObj <|
-    [("uri", toJson s.uri)] ++
-    [("range", toJson s.range)]
+instance : ToJson CompletionClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.completionList with | some v => ("completionList", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.contextSupport with | some v => ("contextSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.insertTextMode with | some v => ("insertTextMode", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.completionItemKind with | some v => ("completionItemKind", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.completionItem with | some v => ("completionItem", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson Location where
+instance : FromJson CompletionClientCapabilities where
   fromJson? json := do
-    let uri ← json.getObjValAs? String "uri"
-    let range ← json.getObjValAs? Range "range"
-    return { uri, range }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    let completionItem : Option ClientCompletionItemOptions := (_obj.find compare "completionItem").bind fun v => (fromJson? v).toOption
+    let completionItemKind : Option ClientCompletionItemOptionsKind := (_obj.find compare "completionItemKind").bind fun v => (fromJson? v).toOption
+    let insertTextMode : Option InsertTextMode := (_obj.find compare "insertTextMode").bind fun v => (fromJson? v).toOption
+    let contextSupport : Option Bool := (_obj.find compare "contextSupport").bind fun v => (fromJson? v).toOption
+    let completionList : Option CompletionListCapabilities := (_obj.find compare "completionList").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration, completionItem, completionItemKind, insertTextMode, contextSupport, completionList }
 
-/-- Represents a color range from a document. -/
-structure ColorInformation where
-  range : Range
-  color : Color
+/-- @since 3.14.0 -/
+structure DeclarationClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
+  linkSupport : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson ColorInformation where
-  toJson s := Json.mkObj <|
-    [("range", toJson s.range)] ++
-    [("color", toJson s.color)]
+instance : ToJson DeclarationClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.linkSupport with | some v => ("linkSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson ColorInformation where
+instance : FromJson DeclarationClientCapabilities where
   fromJson? json := do
-    let range ← json.getObjValAs? Range "range"
-    let color ← json.getObjValAs? Color "color"
-    return { range, color }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    let linkSupport : Option Bool := (_obj.find compare "linkSupport").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration, linkSupport }
 
-/-- Parameters for a {@link ColorPresentationRequest}. -/
-structure ColorPresentationParams where
-  workDoneToken : (Option ProgressToken) := none
-  partialResultToken : (Option ProgressToken) := none
-  textDocument : TextDocumentIdentifier
-  color : Color
-  range : Range
+/-- Client Capabilities for a {@link DefinitionRequest}. -/
+structure DefinitionClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
+  linkSupport : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson ColorPresentationParams where
-  toJson s := Json.mkObj <|
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    (match s.partialResultToken with | some v => [("partialResultToken", toJson v)] | none => []) ++
-    [("textDocument", toJson s.textDocument)] ++
-    [("color", toJson s.color)] ++
-    [("range", toJson s.range)]
+instance : ToJson DefinitionClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.linkSupport with | some v => ("linkSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson ColorPresentationParams where
+instance : FromJson DefinitionClientCapabilities where
   fromJson? json := do
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let partialResultToken := (json.getObjValAs? ProgressToken "partialResultToken").toOption
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let color ← json.getObjValAs? Color "color"
-    let range ← json.getObjValAs? Range "range"
-    return { workDoneToken, partialResultToken, textDocument, color, range }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    let linkSupport : Option Bool := (_obj.find compare "linkSupport").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration, linkSupport }
 
-/-- A selection range represents a part of a selection hierarchy. A selection range may have a parent selection range that contains it. -/
-structure SelectionRange where
-  range : Range
-  parent : Json := Json.null
+/-- @since 3.18.0 -/
+structure ClientDiagnosticsTagOptions where
+  valueSet : (Array DiagnosticTag)
   deriving Inhabited
 
-instance : ToJson SelectionRange where
-  toJson s := Json.mkObj <|
-    [("range", toJson s.range)] ++
-    [("parent", toJson s.parent)]
+instance : ToJson ClientDiagnosticsTagOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("valueSet", toJson s.valueSet) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson SelectionRange where
+instance : FromJson ClientDiagnosticsTagOptions where
   fromJson? json := do
-    let range ← json.getObjValAs? Range "range"
-    let parent := json.getObjVal? "parent" |>.toOption |>.getD Json.null
-    return { range, parent }
+    let _obj ← json.getObj?
+    let valueSet : (Array DiagnosticTag) ← match _obj.find compare "valueSet" with | some v => fromJson? v | none => throw "property not found: valueSet"
+    return { valueSet }
 
-/-- Represents programming constructs like functions or constructors in the context of call hierarchy.  @since 3.16.0 -/
-structure CallHierarchyItem where
-  name : String
-  kind : SymbolKind
-  tags : (Option (Array SymbolTag)) := none
-  detail : (Option String) := none
-  uri : String
-  range : Range
-  selectionRange : Range
-  data : Json := Json.null
+/-- Client capabilities specific to diagnostic pull requests.  @since 3.17.0 -/
+structure DiagnosticClientCapabilities where
+  relatedInformation : (Option Bool) := none
+  tagSupport : (Option ClientDiagnosticsTagOptions) := none
+  codeDescriptionSupport : (Option Bool) := none
+  dataSupport : (Option Bool) := none
+  dynamicRegistration : (Option Bool) := none
+  relatedDocumentSupport : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson CallHierarchyItem where
-  toJson s := Json.mkObj <|
-    [("name", toJson s.name)] ++
-    [("kind", toJson s.kind)] ++
-    (match s.tags with | some v => [("tags", toJson v)] | none => []) ++
-    (match s.detail with | some v => [("detail", toJson v)] | none => []) ++
-    [("uri", toJson s.uri)] ++
-    [("range", toJson s.range)] ++
-    [("selectionRange", toJson s.selectionRange)] ++
-    [("data", toJson s.data)]
+instance : ToJson DiagnosticClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.relatedDocumentSupport with | some v => ("relatedDocumentSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.dataSupport with | some v => ("dataSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.codeDescriptionSupport with | some v => ("codeDescriptionSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.tagSupport with | some v => ("tagSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.relatedInformation with | some v => ("relatedInformation", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson CallHierarchyItem where
+instance : FromJson DiagnosticClientCapabilities where
   fromJson? json := do
-    let name ← json.getObjValAs? String "name"
-    let kind ← json.getObjValAs? SymbolKind "kind"
-    let tags := (json.getObjValAs? (Array SymbolTag) "tags").toOption
-    let detail := (json.getObjValAs? String "detail").toOption
-    let uri ← json.getObjValAs? String "uri"
-    let range ← json.getObjValAs? Range "range"
-    let selectionRange ← json.getObjValAs? Range "selectionRange"
-    let data := json.getObjVal? "data" |>.toOption |>.getD Json.null
-    return { name, kind, tags, detail, uri, range, selectionRange, data }
+    let _obj ← json.getObj?
+    let relatedInformation : Option Bool := (_obj.find compare "relatedInformation").bind fun v => (fromJson? v).toOption
+    let tagSupport : Option ClientDiagnosticsTagOptions := (_obj.find compare "tagSupport").bind fun v => (fromJson? v).toOption
+    let codeDescriptionSupport : Option Bool := (_obj.find compare "codeDescriptionSupport").bind fun v => (fromJson? v).toOption
+    let dataSupport : Option Bool := (_obj.find compare "dataSupport").bind fun v => (fromJson? v).toOption
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    let relatedDocumentSupport : Option Bool := (_obj.find compare "relatedDocumentSupport").bind fun v => (fromJson? v).toOption
+    return { relatedInformation, tagSupport, codeDescriptionSupport, dataSupport, dynamicRegistration, relatedDocumentSupport }
 
-/-- @since 3.16.0 -/
-structure SemanticTokensRangeParams where
-  workDoneToken : (Option ProgressToken) := none
-  partialResultToken : (Option ProgressToken) := none
-  textDocument : TextDocumentIdentifier
-  range : Range
+structure DocumentColorClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson SemanticTokensRangeParams where
-  toJson s := Json.mkObj <|
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    (match s.partialResultToken with | some v => [("partialResultToken", toJson v)] | none => []) ++
-    [("textDocument", toJson s.textDocument)] ++
-    [("range", toJson s.range)]
+instance : ToJson DocumentColorClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson SemanticTokensRangeParams where
+instance : FromJson DocumentColorClientCapabilities where
   fromJson? json := do
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let partialResultToken := (json.getObjValAs? ProgressToken "partialResultToken").toOption
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let range ← json.getObjValAs? Range "range"
-    return { workDoneToken, partialResultToken, textDocument, range }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration }
 
-/-- Params to show a resource in the UI.  @since 3.16.0 -/
-structure ShowDocumentParams where
-  uri : String
-  external : (Option Bool) := none
-  takeFocus : (Option Bool) := none
-  selection : (Option Range) := none
+/-- Client capabilities of a {@link DocumentFormattingRequest}. -/
+structure DocumentFormattingClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson ShowDocumentParams where
-  toJson s := Json.mkObj <|
-    [("uri", toJson s.uri)] ++
-    (match s.external with | some v => [("external", toJson v)] | none => []) ++
-    (match s.takeFocus with | some v => [("takeFocus", toJson v)] | none => []) ++
-    (match s.selection with | some v => [("selection", toJson v)] | none => [])
+instance : ToJson DocumentFormattingClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson ShowDocumentParams where
+instance : FromJson DocumentFormattingClientCapabilities where
   fromJson? json := do
-    let uri ← json.getObjValAs? String "uri"
-    let external := (json.getObjValAs? Bool "external").toOption
-    let takeFocus := (json.getObjValAs? Bool "takeFocus").toOption
-    let selection := (json.getObjValAs? Range "selection").toOption
-    return { uri, external, takeFocus, selection }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration }
 
-/-- The result of a linked editing range request.  @since 3.16.0 -/
-structure LinkedEditingRanges where
-  ranges : (Array Range)
-  wordPattern : (Option String) := none
+/-- Client Capabilities for a {@link DocumentHighlightRequest}. -/
+structure DocumentHighlightClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson LinkedEditingRanges where
-  toJson s := Json.mkObj <|
-    [("ranges", toJson s.ranges)] ++
-    (match s.wordPattern with | some v => [("wordPattern", toJson v)] | none => [])
+instance : ToJson DocumentHighlightClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson LinkedEditingRanges where
+instance : FromJson DocumentHighlightClientCapabilities where
   fromJson? json := do
-    let ranges ← json.getObjValAs? (Array Range) "ranges"
-    let wordPattern := (json.getObjValAs? String "wordPattern").toOption
-    return { ranges, wordPattern }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration }
 
-/-- @since 3.17.0 -/
-structure TypeHierarchyItem where
-  name : String
-  kind : SymbolKind
-  tags : (Option (Array SymbolTag)) := none
-  detail : (Option String) := none
-  uri : String
-  range : Range
-  selectionRange : Range
-  data : Json := Json.null
+/-- The client capabilities of a {@link DocumentLinkRequest}. -/
+structure DocumentLinkClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
+  tooltipSupport : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson TypeHierarchyItem where
-  toJson s := Json.mkObj <|
-    [("name", toJson s.name)] ++
-    [("kind", toJson s.kind)] ++
-    (match s.tags with | some v => [("tags", toJson v)] | none => []) ++
-    (match s.detail with | some v => [("detail", toJson v)] | none => []) ++
-    [("uri", toJson s.uri)] ++
-    [("range", toJson s.range)] ++
-    [("selectionRange", toJson s.selectionRange)] ++
-    [("data", toJson s.data)]
+instance : ToJson DocumentLinkClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.tooltipSupport with | some v => ("tooltipSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson TypeHierarchyItem where
+instance : FromJson DocumentLinkClientCapabilities where
   fromJson? json := do
-    let name ← json.getObjValAs? String "name"
-    let kind ← json.getObjValAs? SymbolKind "kind"
-    let tags := (json.getObjValAs? (Array SymbolTag) "tags").toOption
-    let detail := (json.getObjValAs? String "detail").toOption
-    let uri ← json.getObjValAs? String "uri"
-    let range ← json.getObjValAs? Range "range"
-    let selectionRange ← json.getObjValAs? Range "selectionRange"
-    let data := json.getObjVal? "data" |>.toOption |>.getD Json.null
-    return { name, kind, tags, detail, uri, range, selectionRange, data }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    let tooltipSupport : Option Bool := (_obj.find compare "tooltipSupport").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration, tooltipSupport }
 
-/-- A parameter literal used in inlay hint requests.  @since 3.17.0 -/
-structure InlayHintParams where
-  workDoneToken : (Option ProgressToken) := none
-  textDocument : TextDocumentIdentifier
-  range : Range
+/-- Client capabilities of a {@link DocumentOnTypeFormattingRequest}. -/
+structure DocumentOnTypeFormattingClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson InlayHintParams where
-  toJson s := Json.mkObj <|
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    [("textDocument", toJson s.textDocument)] ++
-    [("range", toJson s.range)]
+instance : ToJson DocumentOnTypeFormattingClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson InlayHintParams where
+instance : FromJson DocumentOnTypeFormattingClientCapabilities where
   fromJson? json := do
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let range ← json.getObjValAs? Range "range"
-    return { workDoneToken, textDocument, range }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration }
 
-/-- A text edit applicable to a text document. -/
-structure TextEdit where
-  range : Range
-  newText : String
+/-- Client capabilities of a {@link DocumentRangeFormattingRequest}. -/
+structure DocumentRangeFormattingClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
+  rangesSupport : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson TextEdit where
-  toJson s := Json.mkObj <|
-    [("range", toJson s.range)] ++
-    [("newText", toJson s.newText)]
+instance : ToJson DocumentRangeFormattingClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.rangesSupport with | some v => ("rangesSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson TextEdit where
+instance : FromJson DocumentRangeFormattingClientCapabilities where
   fromJson? json := do
-    let range ← json.getObjValAs? Range "range"
-    let newText ← json.getObjValAs? String "newText"
-    return { range, newText }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    let rangesSupport : Option Bool := (_obj.find compare "rangesSupport").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration, rangesSupport }
 
-/-- The result of a hover request. -/
-structure Hover where
-  contents : Json
-  range : (Option Range) := none
+/-- @since 3.18.0 -/
+structure ClientSymbolKindOptions where
+  valueSet : (Option (Array SymbolKind)) := none
   deriving Inhabited
 
-instance : ToJson Hover where
-  toJson s := Json.mkObj <|
-    [("contents", toJson s.contents)] ++
-    (match s.range with | some v => [("range", toJson v)] | none => [])
+instance : ToJson ClientSymbolKindOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.valueSet with | some v => ("valueSet", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson Hover where
+instance : FromJson ClientSymbolKindOptions where
   fromJson? json := do
-    let contents := json.getObjVal? "contents" |>.toOption |>.getD Json.null
-    let range := (json.getObjValAs? Range "range").toOption
-    return { contents, range }
+    let _obj ← json.getObj?
+    let valueSet : Option (Array SymbolKind) := (_obj.find compare "valueSet").bind fun v => (fromJson? v).toOption
+    return { valueSet }
 
-/-- A document highlight is a range inside a text document which deserves special attention. Usually a document highlight is visualized by changing the background color of its range. -/
-structure DocumentHighlight where
-  range : Range
-  kind : (Option DocumentHighlightKind) := none
+/-- @since 3.18.0 -/
+structure ClientSymbolTagOptions where
+  valueSet : (Array SymbolTag)
   deriving Inhabited
 
-instance : ToJson DocumentHighlight where
-  toJson s := Json.mkObj <|
-    [("range", toJson s.range)] ++
-    (match s.kind with | some v => [("kind", toJson v)] | none => [])
+instance : ToJson ClientSymbolTagOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("valueSet", toJson s.valueSet) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DocumentHighlight where
+instance : FromJson ClientSymbolTagOptions where
   fromJson? json := do
-    let range ← json.getObjValAs? Range "range"
-    let kind := (json.getObjValAs? DocumentHighlightKind "kind").toOption
-    return { range, kind }
-
-/-- Represents programming constructs like variables, classes, interfaces etc. that appear in a document. Document symbols can be hierarchical and they have two ranges: one that encloses its definition and one that points to its most interesting range, e.g. the range of an identifier. -/
-structure DocumentSymbol where
-  name : String
-  detail : (Option String) := none
-  kind : SymbolKind
-  tags : (Option (Array SymbolTag)) := none
-  deprecated : (Option Bool) := none
-  range : Range
-  selectionRange : Range
-  children : Json := Json.null
-  deriving Inhabited
-
-instance : ToJson DocumentSymbol where
-  toJson s := Json.mkObj <|
-    [("name", toJson s.name)] ++
-    (match s.detail with | some v => [("detail", toJson v)] | none => []) ++
-    [("kind", toJson s.kind)] ++
-    (match s.tags with | some v => [("tags", toJson v)] | none => []) ++
-    (match s.deprecated with | some v => [("deprecated", toJson v)] | none => []) ++
-    [("range", toJson s.range)] ++
-    [("selectionRange", toJson s.selectionRange)] ++
-    [("children", toJson s.children)]
-
-instance : FromJson DocumentSymbol where
-  fromJson? json := do
-    let name ← json.getObjValAs? String "name"
-    let detail := (json.getObjValAs? String "detail").toOption
-    let kind ← json.getObjValAs? SymbolKind "kind"
-    let tags := (json.getObjValAs? (Array SymbolTag) "tags").toOption
-    let deprecated := (json.getObjValAs? Bool "deprecated").toOption
-    let range ← json.getObjValAs? Range "range"
-    let selectionRange ← json.getObjValAs? Range "selectionRange"
-    let children := json.getObjVal? "children" |>.toOption |>.getD Json.null
-    return { name, detail, kind, tags, deprecated, range, selectionRange, children }
+    let _obj ← json.getObj?
+    let valueSet : (Array SymbolTag) ← match _obj.find compare "valueSet" with | some v => fromJson? v | none => throw "property not found: valueSet"
+    return { valueSet }
 
-/-- The parameters of a {@link CodeActionRequest}. -/
-structure CodeActionParams where
-  workDoneToken : (Option ProgressToken) := none
-  partialResultToken : (Option ProgressToken) := none
-  textDocument : TextDocumentIdentifier
-  range : Range
-  context : CodeActionContext
+/-- Client Capabilities for a {@link DocumentSymbolRequest}. -/
+structure DocumentSymbolClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
+  symbolKind : (Option ClientSymbolKindOptions) := none
+  hierarchicalDocumentSymbolSupport : (Option Bool) := none
+  tagSupport : (Option ClientSymbolTagOptions) := none
+  labelSupport : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson CodeActionParams where
-  toJson s := Json.mkObj <|
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    (match s.partialResultToken with | some v => [("partialResultToken", toJson v)] | none => []) ++
-    [("textDocument", toJson s.textDocument)] ++
-    [("range", toJson s.range)] ++
-    [("context", toJson s.context)]
+instance : ToJson DocumentSymbolClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.labelSupport with | some v => ("labelSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.tagSupport with | some v => ("tagSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.hierarchicalDocumentSymbolSupport with | some v => ("hierarchicalDocumentSymbolSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.symbolKind with | some v => ("symbolKind", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson CodeActionParams where
+instance : FromJson DocumentSymbolClientCapabilities where
   fromJson? json := do
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let partialResultToken := (json.getObjValAs? ProgressToken "partialResultToken").toOption
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let range ← json.getObjValAs? Range "range"
-    let context ← json.getObjValAs? CodeActionContext "context"
-    return { workDoneToken, partialResultToken, textDocument, range, context }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    let symbolKind : Option ClientSymbolKindOptions := (_obj.find compare "symbolKind").bind fun v => (fromJson? v).toOption
+    let hierarchicalDocumentSymbolSupport : Option Bool := (_obj.find compare "hierarchicalDocumentSymbolSupport").bind fun v => (fromJson? v).toOption
+    let tagSupport : Option ClientSymbolTagOptions := (_obj.find compare "tagSupport").bind fun v => (fromJson? v).toOption
+    let labelSupport : Option Bool := (_obj.find compare "labelSupport").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration, symbolKind, hierarchicalDocumentSymbolSupport, tagSupport, labelSupport }
 
-/-- A code lens represents a {@link Command command} that should be shown along with source text, like the number of references, a way to run tests, etc.  A code lens is _unresolved_ when no command is associated to it. For performance reasons the creation of a code lens and resolving should be done in ... -/
-structure CodeLens where
-  range : Range
-  command : (Option Command) := none
-  data : Json := Json.null
+/-- @since 3.18.0 -/
+structure ClientFoldingRangeKindOptions where
+  valueSet : (Option (Array FoldingRangeKind)) := none
   deriving Inhabited
 
-instance : ToJson CodeLens where
-  toJson s := Json.mkObj <|
-    [("range", toJson s.range)] ++
-    (match s.command with | some v => [("command", toJson v)] | none => []) ++
-    [("data", toJson s.data)]
+instance : ToJson ClientFoldingRangeKindOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.valueSet with | some v => ("valueSet", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson CodeLens where
+instance : FromJson ClientFoldingRangeKindOptions where
   fromJson? json := do
-    let range ← json.getObjValAs? Range "range"
-    let command := (json.getObjValAs? Command "command").toOption
-    let data := json.getObjVal? "data" |>.toOption |>.getD Json.null
-    return { range, command, data }
+    let _obj ← json.getObj?
+    let valueSet : Option (Array FoldingRangeKind) := (_obj.find compare "valueSet").bind fun v => (fromJson? v).toOption
+    return { valueSet }
 
-/-- A document link is a range in a text document that links to an internal or external resource, like another text document or a web site. -/
-structure DocumentLink where
-  range : Range
-  target : (Option String) := none
-  tooltip : (Option String) := none
-  data : Json := Json.null
+/-- @since 3.18.0 -/
+structure ClientFoldingRangeOptions where
+  collapsedText : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson DocumentLink where
-  toJson s := Json.mkObj <|
-    [("range", toJson s.range)] ++
-    (match s.target with | some v => [("target", toJson v)] | none => []) ++
-    (match s.tooltip with | some v => [("tooltip", toJson v)] | none => []) ++
-    [("data", toJson s.data)]
+instance : ToJson ClientFoldingRangeOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.collapsedText with | some v => ("collapsedText", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson DocumentLink where
+instance : FromJson ClientFoldingRangeOptions where
   fromJson? json := do
-    let range ← json.getObjValAs? Range "range"
-    let target := (json.getObjValAs? String "target").toOption
-    let tooltip := (json.getObjValAs? String "tooltip").toOption
-    let data := json.getObjVal? "data" |>.toOption |>.getD Json.null
-    return { range, target, tooltip, data }
+    let _obj ← json.getObj?
+    let collapsedText : Option Bool := (_obj.find compare "collapsedText").bind fun v => (fromJson? v).toOption
+    return { collapsedText }
 
-/-- The parameters of a {@link DocumentRangeFormattingRequest}. -/
-structure DocumentRangeFormattingParams where
-  workDoneToken : (Option ProgressToken) := none
-  textDocument : TextDocumentIdentifier
-  range : Range
-  options : FormattingOptions
+structure FoldingRangeClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
+  rangeLimit : (Option Nat) := none
+  lineFoldingOnly : (Option Bool) := none
+  foldingRangeKind : (Option ClientFoldingRangeKindOptions) := none
+  foldingRange : (Option ClientFoldingRangeOptions) := none
   deriving Inhabited
 
-instance : ToJson DocumentRangeFormattingParams where
-  toJson s := Json.mkObj <|
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    [("textDocument", toJson s.textDocument)] ++
-    [("range", toJson s.range)] ++
-    [("options", toJson s.options)]
+instance : ToJson FoldingRangeClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.foldingRange with | some v => ("foldingRange", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.foldingRangeKind with | some v => ("foldingRangeKind", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.lineFoldingOnly with | some v => ("lineFoldingOnly", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.rangeLimit with | some v => ("rangeLimit", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson DocumentRangeFormattingParams where
+instance : FromJson FoldingRangeClientCapabilities where
   fromJson? json := do
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let range ← json.getObjValAs? Range "range"
-    let options ← json.getObjValAs? FormattingOptions "options"
-    return { workDoneToken, textDocument, range, options }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    let rangeLimit : Option Nat := (_obj.find compare "rangeLimit").bind fun v => (fromJson? v).toOption
+    let lineFoldingOnly : Option Bool := (_obj.find compare "lineFoldingOnly").bind fun v => (fromJson? v).toOption
+    let foldingRangeKind : Option ClientFoldingRangeKindOptions := (_obj.find compare "foldingRangeKind").bind fun v => (fromJson? v).toOption
+    let foldingRange : Option ClientFoldingRangeOptions := (_obj.find compare "foldingRange").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration, rangeLimit, lineFoldingOnly, foldingRangeKind, foldingRange }
 
-/-- Represents the connection of two locations. Provides additional metadata over normal {@link Location locations}, including an origin range. -/
-structure LocationLink where
-  originSelectionRange : (Option Range) := none
-  targetUri : String
-  targetRange : Range
-  targetSelectionRange : Range
+structure HoverClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
+  contentFormat : (Option (Array MarkupKind)) := none
   deriving Inhabited
 
-instance : ToJson LocationLink where
-  toJson s := Json.mkObj <|
-    (match s.originSelectionRange with | some v => [("originSelectionRange", toJson v)] | none => []) ++
-    [("targetUri", toJson s.targetUri)] ++
-    [("targetRange", toJson s.targetRange)] ++
-    [("targetSelectionRange", toJson s.targetSelectionRange)]
+instance : ToJson HoverClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.contentFormat with | some v => ("contentFormat", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson LocationLink where
+instance : FromJson HoverClientCapabilities where
   fromJson? json := do
-    let originSelectionRange := (json.getObjValAs? Range "originSelectionRange").toOption
-    let targetUri ← json.getObjValAs? String "targetUri"
-    let targetRange ← json.getObjValAs? Range "targetRange"
-    let targetSelectionRange ← json.getObjValAs? Range "targetSelectionRange"
-    return { originSelectionRange, targetUri, targetRange, targetSelectionRange }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    let contentFormat : Option (Array MarkupKind) := (_obj.find compare "contentFormat").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration, contentFormat }
 
-/-- @since 3.17.0 -/
-structure InlineValueContext where
-  frameId : Int
-  stoppedLocation : Range
+/-- @since 3.6.0 -/
+structure ImplementationClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
+  linkSupport : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson InlineValueContext where
-  toJson s := Json.mkObj <|
-    [("frameId", toJson s.frameId)] ++
-    [("stoppedLocation", toJson s.stoppedLocation)]
+instance : ToJson ImplementationClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.linkSupport with | some v => ("linkSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson InlineValueContext where
+instance : FromJson ImplementationClientCapabilities where
   fromJson? json := do
-    let frameId ← json.getObjValAs? Int "frameId"
-    let stoppedLocation ← json.getObjValAs? Range "stoppedLocation"
-    return { frameId, stoppedLocation }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    let linkSupport : Option Bool := (_obj.find compare "linkSupport").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration, linkSupport }
 
-/-- Provide inline value as text.  @since 3.17.0 -/
-structure InlineValueText where
-  range : Range
-  text : String
+/-- @since 3.18.0 -/
+structure ClientInlayHintResolveOptions where
+  properties : (Array String)
   deriving Inhabited
 
-instance : ToJson InlineValueText where
-  toJson s := Json.mkObj <|
-    [("range", toJson s.range)] ++
-    [("text", toJson s.text)]
+instance : ToJson ClientInlayHintResolveOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("properties", toJson s.properties) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson InlineValueText where
+instance : FromJson ClientInlayHintResolveOptions where
   fromJson? json := do
-    let range ← json.getObjValAs? Range "range"
-    let text ← json.getObjValAs? String "text"
-    return { range, text }
+    let _obj ← json.getObj?
+    let properties : (Array String) ← match _obj.find compare "properties" with | some v => fromJson? v | none => throw "property not found: properties"
+    return { properties }
 
-/-- Provide inline value through a variable lookup. If only a range is specified, the variable name will be extracted from the underlying document. An optional variable name can be used to override the extracted name.  @since 3.17.0 -/
-structure InlineValueVariableLookup where
-  range : Range
-  variableName : (Option String) := none
-  caseSensitiveLookup : Bool
+/-- Inlay hint client capabilities.  @since 3.17.0 -/
+structure InlayHintClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
+  resolveSupport : (Option ClientInlayHintResolveOptions) := none
   deriving Inhabited
 
-instance : ToJson InlineValueVariableLookup where
-  toJson s := Json.mkObj <|
-    [("range", toJson s.range)] ++
-    (match s.variableName with | some v => [("variableName", toJson v)] | none => []) ++
-    [("caseSensitiveLookup", toJson s.caseSensitiveLookup)]
+instance : ToJson InlayHintClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.resolveSupport with | some v => ("resolveSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson InlineValueVariableLookup where
+instance : FromJson InlayHintClientCapabilities where
   fromJson? json := do
-    let range ← json.getObjValAs? Range "range"
-    let variableName := (json.getObjValAs? String "variableName").toOption
-    let caseSensitiveLookup ← json.getObjValAs? Bool "caseSensitiveLookup"
-    return { range, variableName, caseSensitiveLookup }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    let resolveSupport : Option ClientInlayHintResolveOptions := (_obj.find compare "resolveSupport").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration, resolveSupport }
 
-/-- Provide an inline value through an expression evaluation. If only a range is specified, the expression will be extracted from the underlying document. An optional expression can be used to override the extracted expression.  @since 3.17.0 -/
-structure InlineValueEvaluatableExpression where
-  range : Range
-  expression : (Option String) := none
+/-- Client capabilities specific to inline values.  @since 3.17.0 -/
+structure InlineValueClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson InlineValueEvaluatableExpression where
-  toJson s := Json.mkObj <|
-    [("range", toJson s.range)] ++
-    (match s.expression with | some v => [("expression", toJson v)] | none => [])
+instance : ToJson InlineValueClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson InlineValueEvaluatableExpression where
+instance : FromJson InlineValueClientCapabilities where
   fromJson? json := do
-    let range ← json.getObjValAs? Range "range"
-    let expression := (json.getObjValAs? String "expression").toOption
-    return { range, expression }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration }
 
-/-- A special text edit to provide an insert and a replace operation.  @since 3.16.0 -/
-structure InsertReplaceEdit where
-  newText : String
-  insert : Range
-  replace : Range
+/-- Client capabilities for the linked editing range request.  @since 3.16.0 -/
+structure LinkedEditingRangeClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson InsertReplaceEdit where
-  toJson s := Json.mkObj <|
-    [("newText", toJson s.newText)] ++
-    [("insert", toJson s.insert)] ++
-    [("replace", toJson s.replace)]
+instance : ToJson LinkedEditingRangeClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson InsertReplaceEdit where
+instance : FromJson LinkedEditingRangeClientCapabilities where
   fromJson? json := do
-    let newText ← json.getObjValAs? String "newText"
-    let insert ← json.getObjValAs? Range "insert"
-    let replace ← json.getObjValAs? Range "replace"
-    return { newText, insert, replace }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration }
 
-/-- @since 3.18.0 -/
-structure PrepareRenamePlaceholder where
-  range : Range
-  placeholder : String
+/-- Client capabilities specific to the moniker request.  @since 3.16.0 -/
+structure MonikerClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson PrepareRenamePlaceholder where
-  toJson s := Json.mkObj <|
-    [("range", toJson s.range)] ++
-    [("placeholder", toJson s.placeholder)]
+instance : ToJson MonikerClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson PrepareRenamePlaceholder where
+instance : FromJson MonikerClientCapabilities where
   fromJson? json := do
-    let range ← json.getObjValAs? Range "range"
-    let placeholder ← json.getObjValAs? String "placeholder"
-    return { range, placeholder }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration }
 
-/-- @since 3.18.0 -/
-structure TextDocumentContentChangePartial where
-  range : Range
-  rangeLength : (Option Nat) := none
-  text : String
+/-- The publish diagnostic client capabilities. -/
+structure PublishDiagnosticsClientCapabilities where
+  relatedInformation : (Option Bool) := none
+  tagSupport : (Option ClientDiagnosticsTagOptions) := none
+  codeDescriptionSupport : (Option Bool) := none
+  dataSupport : (Option Bool) := none
+  versionSupport : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson TextDocumentContentChangePartial where
-  toJson s := Json.mkObj <|
-    [("range", toJson s.range)] ++
-    (match s.rangeLength with | some v => [("rangeLength", toJson v)] | none => []) ++
-    [("text", toJson s.text)]
+instance : ToJson PublishDiagnosticsClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.versionSupport with | some v => ("versionSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.dataSupport with | some v => ("dataSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.codeDescriptionSupport with | some v => ("codeDescriptionSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.tagSupport with | some v => ("tagSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.relatedInformation with | some v => ("relatedInformation", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson TextDocumentContentChangePartial where
+instance : FromJson PublishDiagnosticsClientCapabilities where
   fromJson? json := do
-    let range ← json.getObjValAs? Range "range"
-    let rangeLength := (json.getObjValAs? Nat "rangeLength").toOption
-    let text ← json.getObjValAs? String "text"
-    return { range, rangeLength, text }
+    let _obj ← json.getObj?
+    let relatedInformation : Option Bool := (_obj.find compare "relatedInformation").bind fun v => (fromJson? v).toOption
+    let tagSupport : Option ClientDiagnosticsTagOptions := (_obj.find compare "tagSupport").bind fun v => (fromJson? v).toOption
+    let codeDescriptionSupport : Option Bool := (_obj.find compare "codeDescriptionSupport").bind fun v => (fromJson? v).toOption
+    let dataSupport : Option Bool := (_obj.find compare "dataSupport").bind fun v => (fromJson? v).toOption
+    let versionSupport : Option Bool := (_obj.find compare "versionSupport").bind fun v => (fromJson? v).toOption
+    return { relatedInformation, tagSupport, codeDescriptionSupport, dataSupport, versionSupport }
 
-/-- Edit range variant that includes ranges for insert and replace operations.  @since 3.18.0 -/
-structure EditRangeWithInsertReplace where
-  insert : Range
-  replace : Range
+/-- Client Capabilities for a {@link ReferencesRequest}. -/
+structure ReferenceClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson EditRangeWithInsertReplace where
-  toJson s := Json.mkObj <|
-    [("insert", toJson s.insert)] ++
-    [("replace", toJson s.replace)]
+instance : ToJson ReferenceClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson EditRangeWithInsertReplace where
+instance : FromJson ReferenceClientCapabilities where
   fromJson? json := do
-    let insert ← json.getObjValAs? Range "insert"
-    let replace ← json.getObjValAs? Range "replace"
-    return { insert, replace }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration }
 
-/-- Options for notifications/requests for user operations on files.  @since 3.16.0 -/
-structure FileOperationOptions where
-  didCreate : (Option FileOperationRegistrationOptions) := none
-  willCreate : (Option FileOperationRegistrationOptions) := none
-  didRename : (Option FileOperationRegistrationOptions) := none
-  willRename : (Option FileOperationRegistrationOptions) := none
-  didDelete : (Option FileOperationRegistrationOptions) := none
-  willDelete : (Option FileOperationRegistrationOptions) := none
+structure RenameClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
+  prepareSupport : (Option Bool) := none
+  prepareSupportDefaultBehavior : (Option PrepareSupportDefaultBehavior) := none
+  honorsChangeAnnotations : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson FileOperationOptions where
-  toJson s := Json.mkObj <|
-    (match s.didCreate with | some v => [("didCreate", toJson v)] | none => []) ++
-    (match s.willCreate with | some v => [("willCreate", toJson v)] | none => []) ++
-    (match s.didRename with | some v => [("didRename", toJson v)] | none => []) ++
-    (match s.willRename with | some v => [("willRename", toJson v)] | none => []) ++
-    (match s.didDelete with | some v => [("didDelete", toJson v)] | none => []) ++
-    (match s.willDelete with | some v => [("willDelete", toJson v)] | none => [])
+instance : ToJson RenameClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.honorsChangeAnnotations with | some v => ("honorsChangeAnnotations", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.prepareSupportDefaultBehavior with | some v => ("prepareSupportDefaultBehavior", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.prepareSupport with | some v => ("prepareSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson FileOperationOptions where
+instance : FromJson RenameClientCapabilities where
   fromJson? json := do
-    let didCreate := (json.getObjValAs? FileOperationRegistrationOptions "didCreate").toOption
-    let willCreate := (json.getObjValAs? FileOperationRegistrationOptions "willCreate").toOption
-    let didRename := (json.getObjValAs? FileOperationRegistrationOptions "didRename").toOption
-    let willRename := (json.getObjValAs? FileOperationRegistrationOptions "willRename").toOption
-    let didDelete := (json.getObjValAs? FileOperationRegistrationOptions "didDelete").toOption
-    let willDelete := (json.getObjValAs? FileOperationRegistrationOptions "willDelete").toOption
-    return { didCreate, willCreate, didRename, willRename, didDelete, willDelete }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    let prepareSupport : Option Bool := (_obj.find compare "prepareSupport").bind fun v => (fromJson? v).toOption
+    let prepareSupportDefaultBehavior : Option PrepareSupportDefaultBehavior := (_obj.find compare "prepareSupportDefaultBehavior").bind fun v => (fromJson? v).toOption
+    let honorsChangeAnnotations : Option Bool := (_obj.find compare "honorsChangeAnnotations").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration, prepareSupport, prepareSupportDefaultBehavior, honorsChangeAnnotations }
 
-/-- Represents the signature of something callable. A signature can have a label, like a function-name, a doc-comment, and a set of parameters. -/
-structure SignatureInformation where
-  label : String
-  documentation : Json := Json.null
-  parameters : (Option (Array ParameterInformation)) := none
-  activeParameter : (Option Nat) := none
+structure SelectionRangeClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson SignatureInformation where
-  toJson s := Json.mkObj <|
-    [("label", toJson s.label)] ++
-    [("documentation", toJson s.documentation)] ++
-    (match s.parameters with | some v => [("parameters", toJson v)] | none => []) ++
-    (match s.activeParameter with | some v => [("activeParameter", toJson v)] | none => [])
+instance : ToJson SelectionRangeClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson SignatureInformation where
+instance : FromJson SelectionRangeClientCapabilities where
   fromJson? json := do
-    let label ← json.getObjValAs? String "label"
-    let documentation := json.getObjVal? "documentation" |>.toOption |>.getD Json.null
-    let parameters := (json.getObjValAs? (Array ParameterInformation) "parameters").toOption
-    let activeParameter := (json.getObjValAs? Nat "activeParameter").toOption
-    return { label, documentation, parameters, activeParameter }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration }
 
-/-- @since 3.16.0 -/
-structure SemanticTokensRegistrationOptions where
-  documentSelector : (Option Json)
-  legend : SemanticTokensLegend
+/-- @since 3.18.0 -/
+structure ClientSemanticTokensRequestOptions where
   range : Json := Json.null
   full : Json := Json.null
-  id : (Option String) := none
   deriving Inhabited
 
-instance : ToJson SemanticTokensRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)] ++
-    [("legend", toJson s.legend)] ++
-    [("range", toJson s.range)] ++
-    [("full", toJson s.full)] ++
-    (match s.id with | some v => [("id", toJson v)] | none => [])
+instance : ToJson ClientSemanticTokensRequestOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("range", toJson s.range) :: ("full", toJson s.full) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson SemanticTokensRegistrationOptions where
+instance : FromJson ClientSemanticTokensRequestOptions where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    let legend ← json.getObjValAs? SemanticTokensLegend "legend"
-    let range := json.getObjVal? "range" |>.toOption |>.getD Json.null
-    let full := json.getObjVal? "full" |>.toOption |>.getD Json.null
-    let id := (json.getObjValAs? String "id").toOption
-    return { documentSelector, legend, range, full, id }
+    let _obj ← json.getObj?
+    let range : Json := (_obj.find compare "range").getD Json.null
+    let full : Json := (_obj.find compare "full").getD Json.null
+    return { range, full }
 
-structure InitializeParams where
-  processId : (Option Int)
-  clientInfo : (Option ClientInfo) := none
-  locale : (Option String) := none
-  rootPath : (Option String) := none
-  rootUri : (Option String)
-  capabilities : Json
-  initializationOptions : Json := Json.null
-  trace : (Option TraceValue) := none
-  workspaceFolders : (Option (Array WorkspaceFolder)) := none
+/-- @since 3.16.0 -/
+structure SemanticTokensClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
+  requests : ClientSemanticTokensRequestOptions
+  tokenTypes : (Array String)
+  tokenModifiers : (Array String)
+  formats : (Array TokenFormat)
+  overlappingTokenSupport : (Option Bool) := none
+  multilineTokenSupport : (Option Bool) := none
+  serverCancelSupport : (Option Bool) := none
+  augmentsSyntaxTokens : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson InitializeParams where
-  toJson s := Json.mkObj <|
-    [("processId", toJson s.processId)] ++
-    (match s.clientInfo with | some v => [("clientInfo", toJson v)] | none => []) ++
-    (match s.locale with | some v => [("locale", toJson v)] | none => []) ++
-    (match s.rootPath with | some v => [("rootPath", toJson v)] | none => []) ++
-    [("rootUri", toJson s.rootUri)] ++
-    [("capabilities", toJson s.capabilities)] ++
-    [("initializationOptions", toJson s.initializationOptions)] ++
-    (match s.trace with | some v => [("trace", toJson v)] | none => []) ++
-    (match s.workspaceFolders with | some v => [("workspaceFolders", toJson v)] | none => [])
+instance : ToJson SemanticTokensClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.augmentsSyntaxTokens with | some v => ("augmentsSyntaxTokens", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.serverCancelSupport with | some v => ("serverCancelSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.multilineTokenSupport with | some v => ("multilineTokenSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.overlappingTokenSupport with | some v => ("overlappingTokenSupport", toJson v) :: kvs | none => kvs)
+    let kvs := ("requests", toJson s.requests) :: ("tokenTypes", toJson s.tokenTypes) :: ("tokenModifiers", toJson s.tokenModifiers) :: ("formats", toJson s.formats) :: kvs
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson InitializeParams where
+instance : FromJson SemanticTokensClientCapabilities where
   fromJson? json := do
-    let processId ← json.getObjValAs? (Option Int) "processId"
-    let clientInfo := (json.getObjValAs? ClientInfo "clientInfo").toOption
-    let locale := (json.getObjValAs? String "locale").toOption
-    let rootPath := (json.getObjValAs? String "rootPath").toOption
-    let rootUri ← json.getObjValAs? (Option String) "rootUri"
-    let capabilities := json.getObjVal? "capabilities" |>.toOption |>.getD Json.null
-    let initializationOptions := json.getObjVal? "initializationOptions" |>.toOption |>.getD Json.null
-    let trace := (json.getObjValAs? TraceValue "trace").toOption
-    let workspaceFolders := (json.getObjValAs? (Array WorkspaceFolder) "workspaceFolders").toOption
-    return { processId, clientInfo, locale, rootPath, rootUri, capabilities, initializationOptions, trace, workspaceFolders }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    let requests : ClientSemanticTokensRequestOptions ← match _obj.find compare "requests" with | some v => fromJson? v | none => throw "property not found: requests"
+    let tokenTypes : (Array String) ← match _obj.find compare "tokenTypes" with | some v => fromJson? v | none => throw "property not found: tokenTypes"
+    let tokenModifiers : (Array String) ← match _obj.find compare "tokenModifiers" with | some v => fromJson? v | none => throw "property not found: tokenModifiers"
+    let formats : (Array TokenFormat) ← match _obj.find compare "formats" with | some v => fromJson? v | none => throw "property not found: formats"
+    let overlappingTokenSupport : Option Bool := (_obj.find compare "overlappingTokenSupport").bind fun v => (fromJson? v).toOption
+    let multilineTokenSupport : Option Bool := (_obj.find compare "multilineTokenSupport").bind fun v => (fromJson? v).toOption
+    let serverCancelSupport : Option Bool := (_obj.find compare "serverCancelSupport").bind fun v => (fromJson? v).toOption
+    let augmentsSyntaxTokens : Option Bool := (_obj.find compare "augmentsSyntaxTokens").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration, requests, tokenTypes, tokenModifiers, formats, overlappingTokenSupport, multilineTokenSupport, serverCancelSupport, augmentsSyntaxTokens }
 
-/-- Registration options for a {@link CompletionRequest}. -/
-structure CompletionRegistrationOptions where
-  documentSelector : (Option Json)
-  triggerCharacters : (Option (Array String)) := none
-  allCommitCharacters : (Option (Array String)) := none
-  resolveProvider : (Option Bool) := none
-  completionItem : (Option ServerCompletionItemOptions) := none
+/-- @since 3.18.0 -/
+structure ClientSignatureParameterInformationOptions where
+  labelOffsetSupport : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson CompletionRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("documentSelector", toJson s.documentSelector)] ++
-    (match s.triggerCharacters with | some v => [("triggerCharacters", toJson v)] | none => []) ++
-    (match s.allCommitCharacters with | some v => [("allCommitCharacters", toJson v)] | none => []) ++
-    (match s.resolveProvider with | some v => [("resolveProvider", toJson v)] | none => []) ++
-    (match s.completionItem with | some v => [("completionItem", toJson v)] | none => [])
+instance : ToJson ClientSignatureParameterInformationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.labelOffsetSupport with | some v => ("labelOffsetSupport", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson CompletionRegistrationOptions where
+instance : FromJson ClientSignatureParameterInformationOptions where
   fromJson? json := do
-    let documentSelector ← json.getObjValAs? (Option Json) "documentSelector"
-    let triggerCharacters := (json.getObjValAs? (Array String) "triggerCharacters").toOption
-    let allCommitCharacters := (json.getObjValAs? (Array String) "allCommitCharacters").toOption
-    let resolveProvider := (json.getObjValAs? Bool "resolveProvider").toOption
-    let completionItem := (json.getObjValAs? ServerCompletionItemOptions "completionItem").toOption
-    return { documentSelector, triggerCharacters, allCommitCharacters, resolveProvider, completionItem }
+    let _obj ← json.getObj?
+    let labelOffsetSupport : Option Bool := (_obj.find compare "labelOffsetSupport").bind fun v => (fromJson? v).toOption
+    return { labelOffsetSupport }
 
-/-- Options specific to a notebook plus its cells to be synced to the server.  If a selector provides a notebook document filter but no cell selector all cells of a matching notebook document will be synced.  If a selector provides no notebook document filter but only a cell selector all notebook docume... -/
-structure NotebookDocumentSyncOptions where
-  notebookSelector : Json
-  save : (Option Bool) := none
+/-- @since 3.18.0 -/
+structure ClientSignatureInformationOptions where
+  documentationFormat : (Option (Array MarkupKind)) := none
+  parameterInformation : (Option ClientSignatureParameterInformationOptions) := none
+  activeParameterSupport : (Option Bool) := none
+  noActiveParameterSupport : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson NotebookDocumentSyncOptions where
-  toJson s := Json.mkObj <|
-    [("notebookSelector", toJson s.notebookSelector)] ++
-    (match s.save with | some v => [("save", toJson v)] | none => [])
+instance : ToJson ClientSignatureInformationOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.noActiveParameterSupport with | some v => ("noActiveParameterSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.activeParameterSupport with | some v => ("activeParameterSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.parameterInformation with | some v => ("parameterInformation", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.documentationFormat with | some v => ("documentationFormat", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson NotebookDocumentSyncOptions where
+instance : FromJson ClientSignatureInformationOptions where
   fromJson? json := do
-    let notebookSelector := json.getObjVal? "notebookSelector" |>.toOption |>.getD Json.null
-    let save := (json.getObjValAs? Bool "save").toOption
-    return { notebookSelector, save }
+    let _obj ← json.getObj?
+    let documentationFormat : Option (Array MarkupKind) := (_obj.find compare "documentationFormat").bind fun v => (fromJson? v).toOption
+    let parameterInformation : Option ClientSignatureParameterInformationOptions := (_obj.find compare "parameterInformation").bind fun v => (fromJson? v).toOption
+    let activeParameterSupport : Option Bool := (_obj.find compare "activeParameterSupport").bind fun v => (fromJson? v).toOption
+    let noActiveParameterSupport : Option Bool := (_obj.find compare "noActiveParameterSupport").bind fun v => (fromJson? v).toOption
+    return { documentationFormat, parameterInformation, activeParameterSupport, noActiveParameterSupport }
 
-/-- Workspace specific client capabilities. -/
-structure WorkspaceClientCapabilities where
-  applyEdit : (Option Bool) := none
-  workspaceEdit : (Option WorkspaceEditClientCapabilities) := none
-  didChangeConfiguration : (Option DidChangeConfigurationClientCapabilities) := none
-  didChangeWatchedFiles : (Option DidChangeWatchedFilesClientCapabilities) := none
-  symbol : (Option WorkspaceSymbolClientCapabilities) := none
-  executeCommand : (Option ExecuteCommandClientCapabilities) := none
-  workspaceFolders : (Option Bool) := none
-  configuration : (Option Bool) := none
-  semanticTokens : (Option SemanticTokensWorkspaceClientCapabilities) := none
-  codeLens : (Option CodeLensWorkspaceClientCapabilities) := none
-  fileOperations : (Option FileOperationClientCapabilities) := none
-  inlineValue : (Option InlineValueWorkspaceClientCapabilities) := none
-  inlayHint : (Option InlayHintWorkspaceClientCapabilities) := none
-  diagnostics : (Option DiagnosticWorkspaceClientCapabilities) := none
-  foldingRange : Json := Json.null
-  textDocumentContent : Json := Json.null
+/-- Client Capabilities for a {@link SignatureHelpRequest}. -/
+structure SignatureHelpClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
+  signatureInformation : (Option ClientSignatureInformationOptions) := none
+  contextSupport : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson WorkspaceClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.applyEdit with | some v => [("applyEdit", toJson v)] | none => []) ++
-    (match s.workspaceEdit with | some v => [("workspaceEdit", toJson v)] | none => []) ++
-    (match s.didChangeConfiguration with | some v => [("didChangeConfiguration", toJson v)] | none => []) ++
-    (match s.didChangeWatchedFiles with | some v => [("didChangeWatchedFiles", toJson v)] | none => []) ++
-    (match s.symbol with | some v => [("symbol", toJson v)] | none => []) ++
-    (match s.executeCommand with | some v => [("executeCommand", toJson v)] | none => []) ++
-    (match s.workspaceFolders with | some v => [("workspaceFolders", toJson v)] | none => []) ++
-    (match s.configuration with | some v => [("configuration", toJson v)] | none => []) ++
-    (match s.semanticTokens with | some v => [("semanticTokens", toJson v)] | none => []) ++
-    (match s.codeLens with | some v => [("codeLens", toJson v)] | none => []) ++
-    (match s.fileOperations with | some v => [("fileOperations", toJson v)] | none => []) ++
-    (match s.inlineValue with | some v => [("inlineValue", toJson v)] | none => []) ++
-    (match s.inlayHint with | some v => [("inlayHint", toJson v)] | none => []) ++
-    (match s.diagnostics with | some v => [("diagnostics", toJson v)] | none => []) ++
-    [("foldingRange", toJson s.foldingRange)] ++
-    [("textDocumentContent", toJson s.textDocumentContent)]
+instance : ToJson SignatureHelpClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.contextSupport with | some v => ("contextSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.signatureInformation with | some v => ("signatureInformation", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson WorkspaceClientCapabilities where
+instance : FromJson SignatureHelpClientCapabilities where
   fromJson? json := do
-    let applyEdit := (json.getObjValAs? Bool "applyEdit").toOption
-    let workspaceEdit := (json.getObjValAs? WorkspaceEditClientCapabilities "workspaceEdit").toOption
-    let didChangeConfiguration := (json.getObjValAs? DidChangeConfigurationClientCapabilities "didChangeConfiguration").toOption
-    let didChangeWatchedFiles := (json.getObjValAs? DidChangeWatchedFilesClientCapabilities "didChangeWatchedFiles").toOption
-    let symbol := (json.getObjValAs? WorkspaceSymbolClientCapabilities "symbol").toOption
-    let executeCommand := (json.getObjValAs? ExecuteCommandClientCapabilities "executeCommand").toOption
-    let workspaceFolders := (json.getObjValAs? Bool "workspaceFolders").toOption
-    let configuration := (json.getObjValAs? Bool "configuration").toOption
-    let semanticTokens := (json.getObjValAs? SemanticTokensWorkspaceClientCapabilities "semanticTokens").toOption
-    let codeLens := (json.getObjValAs? CodeLensWorkspaceClientCapabilities "codeLens").toOption
-    let fileOperations := (json.getObjValAs? FileOperationClientCapabilities "fileOperations").toOption
-    let inlineValue := (json.getObjValAs? InlineValueWorkspaceClientCapabilities "inlineValue").toOption
-    let inlayHint := (json.getObjValAs? InlayHintWorkspaceClientCapabilities "inlayHint").toOption
-    let diagnostics := (json.getObjValAs? DiagnosticWorkspaceClientCapabilities "diagnostics").toOption
-    let foldingRange := json.getObjVal? "foldingRange" |>.toOption |>.getD Json.null
-    let textDocumentContent := json.getObjVal? "textDocumentContent" |>.toOption |>.getD Json.null
-    return { applyEdit, workspaceEdit, didChangeConfiguration, didChangeWatchedFiles, symbol, executeCommand, workspaceFolders, configuration, semanticTokens, codeLens, fileOperations, inlineValue, inlayHint, diagnostics, foldingRange, textDocumentContent }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    let signatureInformation : Option ClientSignatureInformationOptions := (_obj.find compare "signatureInformation").bind fun v => (fromJson? v).toOption
+    let contextSupport : Option Bool := (_obj.find compare "contextSupport").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration, signatureInformation, contextSupport }
 
-structure WindowClientCapabilities where
-  workDoneProgress : (Option Bool) := none
-  showMessage : (Option ShowMessageRequestClientCapabilities) := none
-  showDocument : (Option ShowDocumentClientCapabilities) := none
+structure TextDocumentFilterClientCapabilities where
+  relativePatternSupport : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson WindowClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.workDoneProgress with | some v => [("workDoneProgress", toJson v)] | none => []) ++
-    (match s.showMessage with | some v => [("showMessage", toJson v)] | none => []) ++
-    (match s.showDocument with | some v => [("showDocument", toJson v)] | none => [])
+instance : ToJson TextDocumentFilterClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.relativePatternSupport with | some v => ("relativePatternSupport", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson WindowClientCapabilities where
+instance : FromJson TextDocumentFilterClientCapabilities where
   fromJson? json := do
-    let workDoneProgress := (json.getObjValAs? Bool "workDoneProgress").toOption
-    let showMessage := (json.getObjValAs? ShowMessageRequestClientCapabilities "showMessage").toOption
-    let showDocument := (json.getObjValAs? ShowDocumentClientCapabilities "showDocument").toOption
-    return { workDoneProgress, showMessage, showDocument }
+    let _obj ← json.getObj?
+    let relativePatternSupport : Option Bool := (_obj.find compare "relativePatternSupport").bind fun v => (fromJson? v).toOption
+    return { relativePatternSupport }
 
-/-- Completion client capabilities -/
-structure CompletionClientCapabilities where
+structure TextDocumentSyncClientCapabilities where
   dynamicRegistration : (Option Bool) := none
-  completionItem : (Option ClientCompletionItemOptions) := none
-  completionItemKind : (Option ClientCompletionItemOptionsKind) := none
-  insertTextMode : (Option InsertTextMode) := none
-  contextSupport : (Option Bool) := none
-  completionList : (Option CompletionListCapabilities) := none
+  willSave : (Option Bool) := none
+  willSaveWaitUntil : (Option Bool) := none
+  didSave : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson CompletionClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => []) ++
-    (match s.completionItem with | some v => [("completionItem", toJson v)] | none => []) ++
-    (match s.completionItemKind with | some v => [("completionItemKind", toJson v)] | none => []) ++
-    (match s.insertTextMode with | some v => [("insertTextMode", toJson v)] | none => []) ++
-    (match s.contextSupport with | some v => [("contextSupport", toJson v)] | none => []) ++
-    (match s.completionList with | some v => [("completionList", toJson v)] | none => [])
+instance : ToJson TextDocumentSyncClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.didSave with | some v => ("didSave", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.willSaveWaitUntil with | some v => ("willSaveWaitUntil", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.willSave with | some v => ("willSave", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson CompletionClientCapabilities where
+instance : FromJson TextDocumentSyncClientCapabilities where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    let completionItem := (json.getObjValAs? ClientCompletionItemOptions "completionItem").toOption
-    let completionItemKind := (json.getObjValAs? ClientCompletionItemOptionsKind "completionItemKind").toOption
-    let insertTextMode := (json.getObjValAs? InsertTextMode "insertTextMode").toOption
-    let contextSupport := (json.getObjValAs? Bool "contextSupport").toOption
-    let completionList := (json.getObjValAs? CompletionListCapabilities "completionList").toOption
-    return { dynamicRegistration, completionItem, completionItemKind, insertTextMode, contextSupport, completionList }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    let willSave : Option Bool := (_obj.find compare "willSave").bind fun v => (fromJson? v).toOption
+    let willSaveWaitUntil : Option Bool := (_obj.find compare "willSaveWaitUntil").bind fun v => (fromJson? v).toOption
+    let didSave : Option Bool := (_obj.find compare "didSave").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration, willSave, willSaveWaitUntil, didSave }
 
-/-- Client Capabilities for a {@link SignatureHelpRequest}. -/
-structure SignatureHelpClientCapabilities where
+/-- Since 3.6.0 -/
+structure TypeDefinitionClientCapabilities where
   dynamicRegistration : (Option Bool) := none
-  signatureInformation : (Option ClientSignatureInformationOptions) := none
-  contextSupport : (Option Bool) := none
+  linkSupport : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson SignatureHelpClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => []) ++
-    (match s.signatureInformation with | some v => [("signatureInformation", toJson v)] | none => []) ++
-    (match s.contextSupport with | some v => [("contextSupport", toJson v)] | none => [])
+instance : ToJson TypeDefinitionClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.linkSupport with | some v => ("linkSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson SignatureHelpClientCapabilities where
+instance : FromJson TypeDefinitionClientCapabilities where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    let signatureInformation := (json.getObjValAs? ClientSignatureInformationOptions "signatureInformation").toOption
-    let contextSupport := (json.getObjValAs? Bool "contextSupport").toOption
-    return { dynamicRegistration, signatureInformation, contextSupport }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    let linkSupport : Option Bool := (_obj.find compare "linkSupport").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration, linkSupport }
 
-/-- The Client Capabilities of a {@link CodeActionRequest}. -/
-structure CodeActionClientCapabilities where
+/-- @since 3.17.0 -/
+structure TypeHierarchyClientCapabilities where
   dynamicRegistration : (Option Bool) := none
-  codeActionLiteralSupport : (Option ClientCodeActionLiteralOptions) := none
-  isPreferredSupport : (Option Bool) := none
-  disabledSupport : (Option Bool) := none
-  dataSupport : (Option Bool) := none
-  resolveSupport : (Option ClientCodeActionResolveOptions) := none
-  honorsChangeAnnotations : (Option Bool) := none
-  documentationSupport : (Option Bool) := none
-  tagSupport : (Option CodeActionTagOptions) := none
   deriving Inhabited
 
-instance : ToJson CodeActionClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => []) ++
-    (match s.codeActionLiteralSupport with | some v => [("codeActionLiteralSupport", toJson v)] | none => []) ++
-    (match s.isPreferredSupport with | some v => [("isPreferredSupport", toJson v)] | none => []) ++
-    (match s.disabledSupport with | some v => [("disabledSupport", toJson v)] | none => []) ++
-    (match s.dataSupport with | some v => [("dataSupport", toJson v)] | none => []) ++
-    (match s.resolveSupport with | some v => [("resolveSupport", toJson v)] | none => []) ++
-    (match s.honorsChangeAnnotations with | some v => [("honorsChangeAnnotations", toJson v)] | none => []) ++
-    (match s.documentationSupport with | some v => [("documentationSupport", toJson v)] | none => []) ++
-    (match s.tagSupport with | some v => [("tagSupport", toJson v)] | none => [])
+instance : ToJson TypeHierarchyClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson CodeActionClientCapabilities where
+instance : FromJson TypeHierarchyClientCapabilities where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    let codeActionLiteralSupport := (json.getObjValAs? ClientCodeActionLiteralOptions "codeActionLiteralSupport").toOption
-    let isPreferredSupport := (json.getObjValAs? Bool "isPreferredSupport").toOption
-    let disabledSupport := (json.getObjValAs? Bool "disabledSupport").toOption
-    let dataSupport := (json.getObjValAs? Bool "dataSupport").toOption
-    let resolveSupport := (json.getObjValAs? ClientCodeActionResolveOptions "resolveSupport").toOption
-    let honorsChangeAnnotations := (json.getObjValAs? Bool "honorsChangeAnnotations").toOption
-    let documentationSupport := (json.getObjValAs? Bool "documentationSupport").toOption
-    let tagSupport := (json.getObjValAs? CodeActionTagOptions "tagSupport").toOption
-    return { dynamicRegistration, codeActionLiteralSupport, isPreferredSupport, disabledSupport, dataSupport, resolveSupport, honorsChangeAnnotations, documentationSupport, tagSupport }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration }
 
-/-- The publish diagnostic client capabilities. -/
-structure PublishDiagnosticsClientCapabilities where
-  relatedInformation : (Option Bool) := none
-  tagSupport : (Option ClientDiagnosticsTagOptions) := none
-  codeDescriptionSupport : (Option Bool) := none
-  dataSupport : (Option Bool) := none
-  versionSupport : (Option Bool) := none
+/-- Text document specific client capabilities. -/
+structure TextDocumentClientCapabilities where
+  synchronization : (Option TextDocumentSyncClientCapabilities) := none
+  filters : (Option TextDocumentFilterClientCapabilities) := none
+  completion : (Option CompletionClientCapabilities) := none
+  hover : (Option HoverClientCapabilities) := none
+  signatureHelp : (Option SignatureHelpClientCapabilities) := none
+  declaration : (Option DeclarationClientCapabilities) := none
+  definition : (Option DefinitionClientCapabilities) := none
+  typeDefinition : (Option TypeDefinitionClientCapabilities) := none
+  implementation : (Option ImplementationClientCapabilities) := none
+  references : (Option ReferenceClientCapabilities) := none
+  documentHighlight : (Option DocumentHighlightClientCapabilities) := none
+  documentSymbol : (Option DocumentSymbolClientCapabilities) := none
+  codeAction : (Option CodeActionClientCapabilities) := none
+  codeLens : (Option CodeLensClientCapabilities) := none
+  documentLink : (Option DocumentLinkClientCapabilities) := none
+  colorProvider : (Option DocumentColorClientCapabilities) := none
+  formatting : (Option DocumentFormattingClientCapabilities) := none
+  rangeFormatting : (Option DocumentRangeFormattingClientCapabilities) := none
+  onTypeFormatting : (Option DocumentOnTypeFormattingClientCapabilities) := none
+  rename : (Option RenameClientCapabilities) := none
+  foldingRange : (Option FoldingRangeClientCapabilities) := none
+  selectionRange : (Option SelectionRangeClientCapabilities) := none
+  publishDiagnostics : (Option PublishDiagnosticsClientCapabilities) := none
+  callHierarchy : (Option CallHierarchyClientCapabilities) := none
+  semanticTokens : (Option SemanticTokensClientCapabilities) := none
+  linkedEditingRange : (Option LinkedEditingRangeClientCapabilities) := none
+  moniker : (Option MonikerClientCapabilities) := none
+  typeHierarchy : (Option TypeHierarchyClientCapabilities) := none
+  inlineValue : (Option InlineValueClientCapabilities) := none
+  inlayHint : (Option InlayHintClientCapabilities) := none
+  diagnostic : (Option DiagnosticClientCapabilities) := none
+  inlineCompletion : Json := Json.null
   deriving Inhabited
 
-instance : ToJson PublishDiagnosticsClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.relatedInformation with | some v => [("relatedInformation", toJson v)] | none => []) ++
-    (match s.tagSupport with | some v => [("tagSupport", toJson v)] | none => []) ++
-    (match s.codeDescriptionSupport with | some v => [("codeDescriptionSupport", toJson v)] | none => []) ++
-    (match s.dataSupport with | some v => [("dataSupport", toJson v)] | none => []) ++
-    (match s.versionSupport with | some v => [("versionSupport", toJson v)] | none => [])
+instance : ToJson TextDocumentClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("inlineCompletion", toJson s.inlineCompletion) :: kvs
+    let kvs := (match s.diagnostic with | some v => ("diagnostic", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.inlayHint with | some v => ("inlayHint", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.inlineValue with | some v => ("inlineValue", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.typeHierarchy with | some v => ("typeHierarchy", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.moniker with | some v => ("moniker", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.linkedEditingRange with | some v => ("linkedEditingRange", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.semanticTokens with | some v => ("semanticTokens", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.callHierarchy with | some v => ("callHierarchy", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.publishDiagnostics with | some v => ("publishDiagnostics", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.selectionRange with | some v => ("selectionRange", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.foldingRange with | some v => ("foldingRange", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.rename with | some v => ("rename", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.onTypeFormatting with | some v => ("onTypeFormatting", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.rangeFormatting with | some v => ("rangeFormatting", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.formatting with | some v => ("formatting", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.colorProvider with | some v => ("colorProvider", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.documentLink with | some v => ("documentLink", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.codeLens with | some v => ("codeLens", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.codeAction with | some v => ("codeAction", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.documentSymbol with | some v => ("documentSymbol", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.documentHighlight with | some v => ("documentHighlight", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.references with | some v => ("references", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.implementation with | some v => ("implementation", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.typeDefinition with | some v => ("typeDefinition", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.definition with | some v => ("definition", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.declaration with | some v => ("declaration", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.signatureHelp with | some v => ("signatureHelp", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.hover with | some v => ("hover", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.completion with | some v => ("completion", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.filters with | some v => ("filters", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.synchronization with | some v => ("synchronization", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson PublishDiagnosticsClientCapabilities where
+instance : FromJson TextDocumentClientCapabilities where
   fromJson? json := do
-    let relatedInformation := (json.getObjValAs? Bool "relatedInformation").toOption
-    let tagSupport := (json.getObjValAs? ClientDiagnosticsTagOptions "tagSupport").toOption
-    let codeDescriptionSupport := (json.getObjValAs? Bool "codeDescriptionSupport").toOption
-    let dataSupport := (json.getObjValAs? Bool "dataSupport").toOption
-    let versionSupport := (json.getObjValAs? Bool "versionSupport").toOption
-    return { relatedInformation, tagSupport, codeDescriptionSupport, dataSupport, versionSupport }
+    let _obj ← json.getObj?
+    let synchronization : Option TextDocumentSyncClientCapabilities := (_obj.find compare "synchronization").bind fun v => (fromJson? v).toOption
+    let filters : Option TextDocumentFilterClientCapabilities := (_obj.find compare "filters").bind fun v => (fromJson? v).toOption
+    let completion : Option CompletionClientCapabilities := (_obj.find compare "completion").bind fun v => (fromJson? v).toOption
+    let hover : Option HoverClientCapabilities := (_obj.find compare "hover").bind fun v => (fromJson? v).toOption
+    let signatureHelp : Option SignatureHelpClientCapabilities := (_obj.find compare "signatureHelp").bind fun v => (fromJson? v).toOption
+    let declaration : Option DeclarationClientCapabilities := (_obj.find compare "declaration").bind fun v => (fromJson? v).toOption
+    let definition : Option DefinitionClientCapabilities := (_obj.find compare "definition").bind fun v => (fromJson? v).toOption
+    let typeDefinition : Option TypeDefinitionClientCapabilities := (_obj.find compare "typeDefinition").bind fun v => (fromJson? v).toOption
+    let implementation : Option ImplementationClientCapabilities := (_obj.find compare "implementation").bind fun v => (fromJson? v).toOption
+    let references : Option ReferenceClientCapabilities := (_obj.find compare "references").bind fun v => (fromJson? v).toOption
+    let documentHighlight : Option DocumentHighlightClientCapabilities := (_obj.find compare "documentHighlight").bind fun v => (fromJson? v).toOption
+    let documentSymbol : Option DocumentSymbolClientCapabilities := (_obj.find compare "documentSymbol").bind fun v => (fromJson? v).toOption
+    let codeAction : Option CodeActionClientCapabilities := (_obj.find compare "codeAction").bind fun v => (fromJson? v).toOption
+    let codeLens : Option CodeLensClientCapabilities := (_obj.find compare "codeLens").bind fun v => (fromJson? v).toOption
+    let documentLink : Option DocumentLinkClientCapabilities := (_obj.find compare "documentLink").bind fun v => (fromJson? v).toOption
+    let colorProvider : Option DocumentColorClientCapabilities := (_obj.find compare "colorProvider").bind fun v => (fromJson? v).toOption
+    let formatting : Option DocumentFormattingClientCapabilities := (_obj.find compare "formatting").bind fun v => (fromJson? v).toOption
+    let rangeFormatting : Option DocumentRangeFormattingClientCapabilities := (_obj.find compare "rangeFormatting").bind fun v => (fromJson? v).toOption
+    let onTypeFormatting : Option DocumentOnTypeFormattingClientCapabilities := (_obj.find compare "onTypeFormatting").bind fun v => (fromJson? v).toOption
+    let rename : Option RenameClientCapabilities := (_obj.find compare "rename").bind fun v => (fromJson? v).toOption
+    let foldingRange : Option FoldingRangeClientCapabilities := (_obj.find compare "foldingRange").bind fun v => (fromJson? v).toOption
+    let selectionRange : Option SelectionRangeClientCapabilities := (_obj.find compare "selectionRange").bind fun v => (fromJson? v).toOption
+    let publishDiagnostics : Option PublishDiagnosticsClientCapabilities := (_obj.find compare "publishDiagnostics").bind fun v => (fromJson? v).toOption
+    let callHierarchy : Option CallHierarchyClientCapabilities := (_obj.find compare "callHierarchy").bind fun v => (fromJson? v).toOption
+    let semanticTokens : Option SemanticTokensClientCapabilities := (_obj.find compare "semanticTokens").bind fun v => (fromJson? v).toOption
+    let linkedEditingRange : Option LinkedEditingRangeClientCapabilities := (_obj.find compare "linkedEditingRange").bind fun v => (fromJson? v).toOption
+    let moniker : Option MonikerClientCapabilities := (_obj.find compare "moniker").bind fun v => (fromJson? v).toOption
+    let typeHierarchy : Option TypeHierarchyClientCapabilities := (_obj.find compare "typeHierarchy").bind fun v => (fromJson? v).toOption
+    let inlineValue : Option InlineValueClientCapabilities := (_obj.find compare "inlineValue").bind fun v => (fromJson? v).toOption
+    let inlayHint : Option InlayHintClientCapabilities := (_obj.find compare "inlayHint").bind fun v => (fromJson? v).toOption
+    let diagnostic : Option DiagnosticClientCapabilities := (_obj.find compare "diagnostic").bind fun v => (fromJson? v).toOption
+    let inlineCompletion : Json := (_obj.find compare "inlineCompletion").getD Json.null
+    return { synchronization, filters, completion, hover, signatureHelp, declaration, definition, typeDefinition, implementation, references, documentHighlight, documentSymbol, codeAction, codeLens, documentLink, colorProvider, formatting, rangeFormatting, onTypeFormatting, rename, foldingRange, selectionRange, publishDiagnostics, callHierarchy, semanticTokens, linkedEditingRange, moniker, typeHierarchy, inlineValue, inlayHint, diagnostic, inlineCompletion }
 
-/-- Client capabilities specific to diagnostic pull requests.  @since 3.17.0 -/
-structure DiagnosticClientCapabilities where
-  relatedInformation : (Option Bool) := none
-  tagSupport : (Option ClientDiagnosticsTagOptions) := none
-  codeDescriptionSupport : (Option Bool) := none
-  dataSupport : (Option Bool) := none
-  dynamicRegistration : (Option Bool) := none
-  relatedDocumentSupport : (Option Bool) := none
+/-- Client capabilities for the showDocument request.  @since 3.16.0 -/
+structure ShowDocumentClientCapabilities where
+  support : Bool
   deriving Inhabited
 
-instance : ToJson DiagnosticClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.relatedInformation with | some v => [("relatedInformation", toJson v)] | none => []) ++
-    (match s.tagSupport with | some v => [("tagSupport", toJson v)] | none => []) ++
-    (match s.codeDescriptionSupport with | some v => [("codeDescriptionSupport", toJson v)] | none => []) ++
-    (match s.dataSupport with | some v => [("dataSupport", toJson v)] | none => []) ++
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => []) ++
-    (match s.relatedDocumentSupport with | some v => [("relatedDocumentSupport", toJson v)] | none => [])
+instance : ToJson ShowDocumentClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("support", toJson s.support) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson DiagnosticClientCapabilities where
-  fromJson? json := do
-    let relatedInformation := (json.getObjValAs? Bool "relatedInformation").toOption
-    let tagSupport := (json.getObjValAs? ClientDiagnosticsTagOptions "tagSupport").toOption
-    let codeDescriptionSupport := (json.getObjValAs? Bool "codeDescriptionSupport").toOption
-    let dataSupport := (json.getObjValAs? Bool "dataSupport").toOption
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    let relatedDocumentSupport := (json.getObjValAs? Bool "relatedDocumentSupport").toOption
-    return { relatedInformation, tagSupport, codeDescriptionSupport, dataSupport, dynamicRegistration, relatedDocumentSupport }
-
-/-- @since 3.16.0 -/
-structure SemanticTokensClientCapabilities where
-  dynamicRegistration : (Option Bool) := none
-  requests : ClientSemanticTokensRequestOptions
-  tokenTypes : (Array String)
-  tokenModifiers : (Array String)
-  formats : (Array TokenFormat)
-  overlappingTokenSupport : (Option Bool) := none
-  multilineTokenSupport : (Option Bool) := none
-  serverCancelSupport : (Option Bool) := none
-  augmentsSyntaxTokens : (Option Bool) := none
-  deriving Inhabited
-
-instance : ToJson SemanticTokensClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.dynamicRegistration with | some v => [("dynamicRegistration", toJson v)] | none => []) ++
-    [("requests", toJson s.requests)] ++
-    [("tokenTypes", toJson s.tokenTypes)] ++
-    [("tokenModifiers", toJson s.tokenModifiers)] ++
-    [("formats", toJson s.formats)] ++
-    (match s.overlappingTokenSupport with | some v => [("overlappingTokenSupport", toJson v)] | none => []) ++
-    (match s.multilineTokenSupport with | some v => [("multilineTokenSupport", toJson v)] | none => []) ++
-    (match s.serverCancelSupport with | some v => [("serverCancelSupport", toJson v)] | none => []) ++
-    (match s.augmentsSyntaxTokens with | some v => [("augmentsSyntaxTokens", toJson v)] | none => [])
-
-instance : FromJson SemanticTokensClientCapabilities where
+instance : FromJson ShowDocumentClientCapabilities where
   fromJson? json := do
-    let dynamicRegistration := (json.getObjValAs? Bool "dynamicRegistration").toOption
-    let requests ← json.getObjValAs? ClientSemanticTokensRequestOptions "requests"
-    let tokenTypes ← json.getObjValAs? (Array String) "tokenTypes"
-    let tokenModifiers ← json.getObjValAs? (Array String) "tokenModifiers"
-    let formats ← json.getObjValAs? (Array TokenFormat) "formats"
-    let overlappingTokenSupport := (json.getObjValAs? Bool "overlappingTokenSupport").toOption
-    let multilineTokenSupport := (json.getObjValAs? Bool "multilineTokenSupport").toOption
-    let serverCancelSupport := (json.getObjValAs? Bool "serverCancelSupport").toOption
-    let augmentsSyntaxTokens := (json.getObjValAs? Bool "augmentsSyntaxTokens").toOption
-    return { dynamicRegistration, requests, tokenTypes, tokenModifiers, formats, overlappingTokenSupport, multilineTokenSupport, serverCancelSupport, augmentsSyntaxTokens }
+    let _obj ← json.getObj?
+    let support : Bool ← match _obj.find compare "support" with | some v => fromJson? v | none => throw "property not found: support"
+    return { support }
 
-/-- Cell changes to a notebook document.  @since 3.18.0 -/
-structure NotebookDocumentCellChanges where
-  «structure» : (Option NotebookDocumentCellChangeStructure) := none
-  data : Json := Json.null
-  textContent : (Option (Array NotebookDocumentCellContentChanges)) := none
+/-- @since 3.18.0 -/
+structure ClientShowMessageActionItemOptions where
+  additionalPropertiesSupport : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson NotebookDocumentCellChanges where
-  toJson s := Json.mkObj <|
-    (match s.«structure» with | some v => [("structure", toJson v)] | none => []) ++
-    [("data", toJson s.data)] ++
-    (match s.textContent with | some v => [("textContent", toJson v)] | none => [])
+instance : ToJson ClientShowMessageActionItemOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.additionalPropertiesSupport with | some v => ("additionalPropertiesSupport", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson NotebookDocumentCellChanges where
+instance : FromJson ClientShowMessageActionItemOptions where
   fromJson? json := do
-    let «structure» := (json.getObjValAs? NotebookDocumentCellChangeStructure "structure").toOption
-    let data := json.getObjVal? "data" |>.toOption |>.getD Json.null
-    let textContent := (json.getObjValAs? (Array NotebookDocumentCellContentChanges) "textContent").toOption
-    return { «structure», data, textContent }
+    let _obj ← json.getObj?
+    let additionalPropertiesSupport : Option Bool := (_obj.find compare "additionalPropertiesSupport").bind fun v => (fromJson? v).toOption
+    return { additionalPropertiesSupport }
 
-/-- Represents information about programming constructs like variables, classes, interfaces etc. -/
-structure SymbolInformation where
-  name : String
-  kind : SymbolKind
-  tags : (Option (Array SymbolTag)) := none
-  containerName : (Option String) := none
-  deprecated : (Option Bool) := none
-  location : Location
+/-- Show message request client capabilities -/
+structure ShowMessageRequestClientCapabilities where
+  messageActionItem : (Option ClientShowMessageActionItemOptions) := none
   deriving Inhabited
 
-instance : ToJson SymbolInformation where
-  toJson s := Json.mkObj <|
-    [("name", toJson s.name)] ++
-    [("kind", toJson s.kind)] ++
-    (match s.tags with | some v => [("tags", toJson v)] | none => []) ++
-    (match s.containerName with | some v => [("containerName", toJson v)] | none => []) ++
-    (match s.deprecated with | some v => [("deprecated", toJson v)] | none => []) ++
-    [("location", toJson s.location)]
+instance : ToJson ShowMessageRequestClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.messageActionItem with | some v => ("messageActionItem", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson SymbolInformation where
+instance : FromJson ShowMessageRequestClientCapabilities where
   fromJson? json := do
-    let name ← json.getObjValAs? String "name"
-    let kind ← json.getObjValAs? SymbolKind "kind"
-    let tags := (json.getObjValAs? (Array SymbolTag) "tags").toOption
-    let containerName := (json.getObjValAs? String "containerName").toOption
-    let deprecated := (json.getObjValAs? Bool "deprecated").toOption
-    let location ← json.getObjValAs? Location "location"
-    return { name, kind, tags, containerName, deprecated, location }
+    let _obj ← json.getObj?
+    let messageActionItem : Option ClientShowMessageActionItemOptions := (_obj.find compare "messageActionItem").bind fun v => (fromJson? v).toOption
+    return { messageActionItem }
 
-/-- A special workspace symbol that supports locations without a range.  See also SymbolInformation.  @since 3.17.0 -/
-structure WorkspaceSymbol where
-  name : String
-  kind : SymbolKind
-  tags : (Option (Array SymbolTag)) := none
-  containerName : (Option String) := none
-  location : Json
-  data : Json := Json.null
+structure WindowClientCapabilities where
+  workDoneProgress : (Option Bool) := none
+  showMessage : (Option ShowMessageRequestClientCapabilities) := none
+  showDocument : (Option ShowDocumentClientCapabilities) := none
   deriving Inhabited
 
-instance : ToJson WorkspaceSymbol where
-  toJson s := Json.mkObj <|
-    [("name", toJson s.name)] ++
-    [("kind", toJson s.kind)] ++
-    (match s.tags with | some v => [("tags", toJson v)] | none => []) ++
-    (match s.containerName with | some v => [("containerName", toJson v)] | none => []) ++
-    [("location", toJson s.location)] ++
-    [("data", toJson s.data)]
+instance : ToJson WindowClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.showDocument with | some v => ("showDocument", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.showMessage with | some v => ("showMessage", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workDoneProgress with | some v => ("workDoneProgress", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson WorkspaceSymbol where
+instance : FromJson WindowClientCapabilities where
   fromJson? json := do
-    let name ← json.getObjValAs? String "name"
-    let kind ← json.getObjValAs? SymbolKind "kind"
-    let tags := (json.getObjValAs? (Array SymbolTag) "tags").toOption
-    let containerName := (json.getObjValAs? String "containerName").toOption
-    let location := json.getObjVal? "location" |>.toOption |>.getD Json.null
-    let data := json.getObjVal? "data" |>.toOption |>.getD Json.null
-    return { name, kind, tags, containerName, location, data }
+    let _obj ← json.getObj?
+    let workDoneProgress : Option Bool := (_obj.find compare "workDoneProgress").bind fun v => (fromJson? v).toOption
+    let showMessage : Option ShowMessageRequestClientCapabilities := (_obj.find compare "showMessage").bind fun v => (fromJson? v).toOption
+    let showDocument : Option ShowDocumentClientCapabilities := (_obj.find compare "showDocument").bind fun v => (fromJson? v).toOption
+    return { workDoneProgress, showMessage, showDocument }
 
-/-- An inlay hint label part allows for interactive and composite labels of inlay hints.  @since 3.17.0 -/
-structure InlayHintLabelPart where
-  value : String
-  tooltip : Json := Json.null
-  location : (Option Location) := none
-  command : (Option Command) := none
+/-- @since 3.16.0 -/
+structure CodeLensWorkspaceClientCapabilities where
+  refreshSupport : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson InlayHintLabelPart where
-  toJson s := Json.mkObj <|
-    [("value", toJson s.value)] ++
-    [("tooltip", toJson s.tooltip)] ++
-    (match s.location with | some v => [("location", toJson v)] | none => []) ++
-    (match s.command with | some v => [("command", toJson v)] | none => [])
+instance : ToJson CodeLensWorkspaceClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.refreshSupport with | some v => ("refreshSupport", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson InlayHintLabelPart where
+instance : FromJson CodeLensWorkspaceClientCapabilities where
   fromJson? json := do
-    let value ← json.getObjValAs? String "value"
-    let tooltip := json.getObjVal? "tooltip" |>.toOption |>.getD Json.null
-    let location := (json.getObjValAs? Location "location").toOption
-    let command := (json.getObjValAs? Command "command").toOption
-    return { value, tooltip, location, command }
+    let _obj ← json.getObj?
+    let refreshSupport : Option Bool := (_obj.find compare "refreshSupport").bind fun v => (fromJson? v).toOption
+    return { refreshSupport }
 
-/-- Represents a related message and source code location for a diagnostic. This should be used to point to code locations that cause or related to a diagnostics, e.g when duplicating a symbol in a scope. -/
-structure DiagnosticRelatedInformation where
-  location : Location
-  message : String
+/-- Workspace client capabilities specific to diagnostic pull requests.  @since 3.17.0 -/
+structure DiagnosticWorkspaceClientCapabilities where
+  refreshSupport : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson DiagnosticRelatedInformation where
-  toJson s := Json.mkObj <|
-    [("location", toJson s.location)] ++
-    [("message", toJson s.message)]
+instance : ToJson DiagnosticWorkspaceClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.refreshSupport with | some v => ("refreshSupport", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson DiagnosticRelatedInformation where
+instance : FromJson DiagnosticWorkspaceClientCapabilities where
   fromJson? json := do
-    let location ← json.getObjValAs? Location "location"
-    let message ← json.getObjValAs? String "message"
-    return { location, message }
+    let _obj ← json.getObj?
+    let refreshSupport : Option Bool := (_obj.find compare "refreshSupport").bind fun v => (fromJson? v).toOption
+    return { refreshSupport }
 
-/-- The parameter of a `callHierarchy/incomingCalls` request.  @since 3.16.0 -/
-structure CallHierarchyIncomingCallsParams where
-  workDoneToken : (Option ProgressToken) := none
-  partialResultToken : (Option ProgressToken) := none
-  item : CallHierarchyItem
+structure DidChangeConfigurationClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson CallHierarchyIncomingCallsParams where
-  toJson s := Json.mkObj <|
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    (match s.partialResultToken with | some v => [("partialResultToken", toJson v)] | none => []) ++
-    [("item", toJson s.item)]
+instance : ToJson DidChangeConfigurationClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson CallHierarchyIncomingCallsParams where
+instance : FromJson DidChangeConfigurationClientCapabilities where
   fromJson? json := do
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let partialResultToken := (json.getObjValAs? ProgressToken "partialResultToken").toOption
-    let item ← json.getObjValAs? CallHierarchyItem "item"
-    return { workDoneToken, partialResultToken, item }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration }
 
-/-- Represents an incoming call, e.g. a caller of a method or constructor.  @since 3.16.0 -/
-structure CallHierarchyIncomingCall where
-  «from» : CallHierarchyItem
-  fromRanges : (Array Range)
+structure DidChangeWatchedFilesClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
+  relativePatternSupport : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson CallHierarchyIncomingCall where
-  toJson s := Json.mkObj <|
-    [("from", toJson s.«from»)] ++
-    [("fromRanges", toJson s.fromRanges)]
+instance : ToJson DidChangeWatchedFilesClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.relativePatternSupport with | some v => ("relativePatternSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson CallHierarchyIncomingCall where
+instance : FromJson DidChangeWatchedFilesClientCapabilities where
   fromJson? json := do
-    let «from» ← json.getObjValAs? CallHierarchyItem "from"
-    let fromRanges ← json.getObjValAs? (Array Range) "fromRanges"
-    return { «from», fromRanges }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    let relativePatternSupport : Option Bool := (_obj.find compare "relativePatternSupport").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration, relativePatternSupport }
 
-/-- The parameter of a `callHierarchy/outgoingCalls` request.  @since 3.16.0 -/
-structure CallHierarchyOutgoingCallsParams where
-  workDoneToken : (Option ProgressToken) := none
-  partialResultToken : (Option ProgressToken) := none
-  item : CallHierarchyItem
+/-- The client capabilities of a {@link ExecuteCommandRequest}. -/
+structure ExecuteCommandClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson CallHierarchyOutgoingCallsParams where
-  toJson s := Json.mkObj <|
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    (match s.partialResultToken with | some v => [("partialResultToken", toJson v)] | none => []) ++
-    [("item", toJson s.item)]
+instance : ToJson ExecuteCommandClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson CallHierarchyOutgoingCallsParams where
+instance : FromJson ExecuteCommandClientCapabilities where
   fromJson? json := do
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let partialResultToken := (json.getObjValAs? ProgressToken "partialResultToken").toOption
-    let item ← json.getObjValAs? CallHierarchyItem "item"
-    return { workDoneToken, partialResultToken, item }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration }
 
-/-- Represents an outgoing call, e.g. calling a getter from a method or a method from a constructor etc.  @since 3.16.0 -/
-structure CallHierarchyOutgoingCall where
-  to : CallHierarchyItem
-  fromRanges : (Array Range)
+/-- Capabilities relating to events from file operations by the user in the client.  These events do not come from the file system, they come from user operations like renaming a file in the UI.  @since 3.16.0 -/
+structure FileOperationClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
+  didCreate : (Option Bool) := none
+  willCreate : (Option Bool) := none
+  didRename : (Option Bool) := none
+  willRename : (Option Bool) := none
+  didDelete : (Option Bool) := none
+  willDelete : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson CallHierarchyOutgoingCall where
-  toJson s := Json.mkObj <|
-    [("to", toJson s.to)] ++
-    [("fromRanges", toJson s.fromRanges)]
+instance : ToJson FileOperationClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.willDelete with | some v => ("willDelete", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.didDelete with | some v => ("didDelete", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.willRename with | some v => ("willRename", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.didRename with | some v => ("didRename", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.willCreate with | some v => ("willCreate", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.didCreate with | some v => ("didCreate", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson CallHierarchyOutgoingCall where
+instance : FromJson FileOperationClientCapabilities where
   fromJson? json := do
-    let to ← json.getObjValAs? CallHierarchyItem "to"
-    let fromRanges ← json.getObjValAs? (Array Range) "fromRanges"
-    return { to, fromRanges }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    let didCreate : Option Bool := (_obj.find compare "didCreate").bind fun v => (fromJson? v).toOption
+    let willCreate : Option Bool := (_obj.find compare "willCreate").bind fun v => (fromJson? v).toOption
+    let didRename : Option Bool := (_obj.find compare "didRename").bind fun v => (fromJson? v).toOption
+    let willRename : Option Bool := (_obj.find compare "willRename").bind fun v => (fromJson? v).toOption
+    let didDelete : Option Bool := (_obj.find compare "didDelete").bind fun v => (fromJson? v).toOption
+    let willDelete : Option Bool := (_obj.find compare "willDelete").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration, didCreate, willCreate, didRename, willRename, didDelete, willDelete }
 
-/-- The parameter of a `typeHierarchy/supertypes` request.  @since 3.17.0 -/
-structure TypeHierarchySupertypesParams where
-  workDoneToken : (Option ProgressToken) := none
-  partialResultToken : (Option ProgressToken) := none
-  item : TypeHierarchyItem
+/-- Client workspace capabilities specific to inlay hints.  @since 3.17.0 -/
+structure InlayHintWorkspaceClientCapabilities where
+  refreshSupport : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson TypeHierarchySupertypesParams where
-  toJson s := Json.mkObj <|
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    (match s.partialResultToken with | some v => [("partialResultToken", toJson v)] | none => []) ++
-    [("item", toJson s.item)]
+instance : ToJson InlayHintWorkspaceClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.refreshSupport with | some v => ("refreshSupport", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson TypeHierarchySupertypesParams where
+instance : FromJson InlayHintWorkspaceClientCapabilities where
   fromJson? json := do
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let partialResultToken := (json.getObjValAs? ProgressToken "partialResultToken").toOption
-    let item ← json.getObjValAs? TypeHierarchyItem "item"
-    return { workDoneToken, partialResultToken, item }
+    let _obj ← json.getObj?
+    let refreshSupport : Option Bool := (_obj.find compare "refreshSupport").bind fun v => (fromJson? v).toOption
+    return { refreshSupport }
 
-/-- The parameter of a `typeHierarchy/subtypes` request.  @since 3.17.0 -/
-structure TypeHierarchySubtypesParams where
-  workDoneToken : (Option ProgressToken) := none
-  partialResultToken : (Option ProgressToken) := none
-  item : TypeHierarchyItem
+/-- Client workspace capabilities specific to inline values.  @since 3.17.0 -/
+structure InlineValueWorkspaceClientCapabilities where
+  refreshSupport : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson TypeHierarchySubtypesParams where
-  toJson s := Json.mkObj <|
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    (match s.partialResultToken with | some v => [("partialResultToken", toJson v)] | none => []) ++
-    [("item", toJson s.item)]
+instance : ToJson InlineValueWorkspaceClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.refreshSupport with | some v => ("refreshSupport", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson TypeHierarchySubtypesParams where
+instance : FromJson InlineValueWorkspaceClientCapabilities where
   fromJson? json := do
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let partialResultToken := (json.getObjValAs? ProgressToken "partialResultToken").toOption
-    let item ← json.getObjValAs? TypeHierarchyItem "item"
-    return { workDoneToken, partialResultToken, item }
+    let _obj ← json.getObj?
+    let refreshSupport : Option Bool := (_obj.find compare "refreshSupport").bind fun v => (fromJson? v).toOption
+    return { refreshSupport }
 
-structure ColorPresentation where
-  label : String
-  textEdit : (Option TextEdit) := none
-  additionalTextEdits : (Option (Array TextEdit)) := none
+/-- @since 3.16.0 -/
+structure SemanticTokensWorkspaceClientCapabilities where
+  refreshSupport : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson ColorPresentation where
-  toJson s := Json.mkObj <|
-    [("label", toJson s.label)] ++
-    (match s.textEdit with | some v => [("textEdit", toJson v)] | none => []) ++
-    (match s.additionalTextEdits with | some v => [("additionalTextEdits", toJson v)] | none => [])
+instance : ToJson SemanticTokensWorkspaceClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.refreshSupport with | some v => ("refreshSupport", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson ColorPresentation where
+instance : FromJson SemanticTokensWorkspaceClientCapabilities where
   fromJson? json := do
-    let label ← json.getObjValAs? String "label"
-    let textEdit := (json.getObjValAs? TextEdit "textEdit").toOption
-    let additionalTextEdits := (json.getObjValAs? (Array TextEdit) "additionalTextEdits").toOption
-    return { label, textEdit, additionalTextEdits }
+    let _obj ← json.getObj?
+    let refreshSupport : Option Bool := (_obj.find compare "refreshSupport").bind fun v => (fromJson? v).toOption
+    return { refreshSupport }
 
-/-- A special text edit with an additional change annotation.  @since 3.16.0. -/
-structure AnnotatedTextEdit where
-  range : Range
-  newText : String
-  annotationId : ChangeAnnotationIdentifier
+/-- @since 3.18.0 -/
+structure ChangeAnnotationsSupportOptions where
+  groupsOnLabel : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson AnnotatedTextEdit where
-  toJson s := Json.mkObj <|
-    [("range", toJson s.range)] ++
-    [("newText", toJson s.newText)] ++
-    [("annotationId", toJson s.annotationId)]
+instance : ToJson ChangeAnnotationsSupportOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.groupsOnLabel with | some v => ("groupsOnLabel", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson AnnotatedTextEdit where
+instance : FromJson ChangeAnnotationsSupportOptions where
   fromJson? json := do
-    let range ← json.getObjValAs? Range "range"
-    let newText ← json.getObjValAs? String "newText"
-    let annotationId ← json.getObjValAs? ChangeAnnotationIdentifier "annotationId"
-    return { range, newText, annotationId }
+    let _obj ← json.getObj?
+    let groupsOnLabel : Option Bool := (_obj.find compare "groupsOnLabel").bind fun v => (fromJson? v).toOption
+    return { groupsOnLabel }
 
-/-- A parameter literal used in inline value requests.  @since 3.17.0 -/
-structure InlineValueParams where
-  workDoneToken : (Option ProgressToken) := none
-  textDocument : TextDocumentIdentifier
-  range : Range
-  context : InlineValueContext
+structure WorkspaceEditClientCapabilities where
+  documentChanges : (Option Bool) := none
+  resourceOperations : (Option (Array ResourceOperationKind)) := none
+  failureHandling : (Option FailureHandlingKind) := none
+  normalizesLineEndings : (Option Bool) := none
+  changeAnnotationSupport : (Option ChangeAnnotationsSupportOptions) := none
+  metadataSupport : (Option Bool) := none
+  snippetEditSupport : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson InlineValueParams where
-  toJson s := Json.mkObj <|
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    [("textDocument", toJson s.textDocument)] ++
-    [("range", toJson s.range)] ++
-    [("context", toJson s.context)]
+instance : ToJson WorkspaceEditClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.snippetEditSupport with | some v => ("snippetEditSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.metadataSupport with | some v => ("metadataSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.changeAnnotationSupport with | some v => ("changeAnnotationSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.normalizesLineEndings with | some v => ("normalizesLineEndings", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.failureHandling with | some v => ("failureHandling", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.resourceOperations with | some v => ("resourceOperations", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.documentChanges with | some v => ("documentChanges", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson InlineValueParams where
+instance : FromJson WorkspaceEditClientCapabilities where
   fromJson? json := do
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let range ← json.getObjValAs? Range "range"
-    let context ← json.getObjValAs? InlineValueContext "context"
-    return { workDoneToken, textDocument, range, context }
+    let _obj ← json.getObj?
+    let documentChanges : Option Bool := (_obj.find compare "documentChanges").bind fun v => (fromJson? v).toOption
+    let resourceOperations : Option (Array ResourceOperationKind) := (_obj.find compare "resourceOperations").bind fun v => (fromJson? v).toOption
+    let failureHandling : Option FailureHandlingKind := (_obj.find compare "failureHandling").bind fun v => (fromJson? v).toOption
+    let normalizesLineEndings : Option Bool := (_obj.find compare "normalizesLineEndings").bind fun v => (fromJson? v).toOption
+    let changeAnnotationSupport : Option ChangeAnnotationsSupportOptions := (_obj.find compare "changeAnnotationSupport").bind fun v => (fromJson? v).toOption
+    let metadataSupport : Option Bool := (_obj.find compare "metadataSupport").bind fun v => (fromJson? v).toOption
+    let snippetEditSupport : Option Bool := (_obj.find compare "snippetEditSupport").bind fun v => (fromJson? v).toOption
+    return { documentChanges, resourceOperations, failureHandling, normalizesLineEndings, changeAnnotationSupport, metadataSupport, snippetEditSupport }
 
-/-- A completion item represents a text snippet that is proposed to complete text that is being typed. -/
-structure CompletionItem where
-  label : String
-  labelDetails : (Option CompletionItemLabelDetails) := none
-  kind : (Option CompletionItemKind) := none
-  tags : (Option (Array CompletionItemTag)) := none
-  detail : (Option String) := none
-  documentation : Json := Json.null
-  deprecated : (Option Bool) := none
-  preselect : (Option Bool) := none
-  sortText : (Option String) := none
-  filterText : (Option String) := none
-  insertText : (Option String) := none
-  insertTextFormat : (Option InsertTextFormat) := none
-  insertTextMode : (Option InsertTextMode) := none
-  textEdit : Json := Json.null
-  textEditText : (Option String) := none
-  additionalTextEdits : (Option (Array TextEdit)) := none
-  commitCharacters : (Option (Array String)) := none
-  command : (Option Command) := none
-  data : Json := Json.null
+/-- @since 3.18.0 -/
+structure ClientSymbolResolveOptions where
+  properties : (Array String)
   deriving Inhabited
 
-instance : ToJson CompletionItem where
-  toJson s := Json.mkObj <|
-    [("label", toJson s.label)] ++
-    (match s.labelDetails with | some v => [("labelDetails", toJson v)] | none => []) ++
-    (match s.kind with | some v => [("kind", toJson v)] | none => []) ++
-    (match s.tags with | some v => [("tags", toJson v)] | none => []) ++
-    (match s.detail with | some v => [("detail", toJson v)] | none => []) ++
-    [("documentation", toJson s.documentation)] ++
-    (match s.deprecated with | some v => [("deprecated", toJson v)] | none => []) ++
-    (match s.preselect with | some v => [("preselect", toJson v)] | none => []) ++
-    (match s.sortText with | some v => [("sortText", toJson v)] | none => []) ++
-    (match s.filterText with | some v => [("filterText", toJson v)] | none => []) ++
-    (match s.insertText with | some v => [("insertText", toJson v)] | none => []) ++
-    (match s.insertTextFormat with | some v => [("insertTextFormat", toJson v)] | none => []) ++
-    (match s.insertTextMode with | some v => [("insertTextMode", toJson v)] | none => []) ++
-    [("textEdit", toJson s.textEdit)] ++
-    (match s.textEditText with | some v => [("textEditText", toJson v)] | none => []) ++
-    (match s.additionalTextEdits with | some v => [("additionalTextEdits", toJson v)] | none => []) ++
-    (match s.commitCharacters with | some v => [("commitCharacters", toJson v)] | none => []) ++
-    (match s.command with | some v => [("command", toJson v)] | none => []) ++
-    [("data", toJson s.data)]
+instance : ToJson ClientSymbolResolveOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("properties", toJson s.properties) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson CompletionItem where
+instance : FromJson ClientSymbolResolveOptions where
   fromJson? json := do
-    let label ← json.getObjValAs? String "label"
-    let labelDetails := (json.getObjValAs? CompletionItemLabelDetails "labelDetails").toOption
-    let kind := (json.getObjValAs? CompletionItemKind "kind").toOption
-    let tags := (json.getObjValAs? (Array CompletionItemTag) "tags").toOption
-    let detail := (json.getObjValAs? String "detail").toOption
-    let documentation := json.getObjVal? "documentation" |>.toOption |>.getD Json.null
-    let deprecated := (json.getObjValAs? Bool "deprecated").toOption
-    let preselect := (json.getObjValAs? Bool "preselect").toOption
-    let sortText := (json.getObjValAs? String "sortText").toOption
-    let filterText := (json.getObjValAs? String "filterText").toOption
-    let insertText := (json.getObjValAs? String "insertText").toOption
-    let insertTextFormat := (json.getObjValAs? InsertTextFormat "insertTextFormat").toOption
-    let insertTextMode := (json.getObjValAs? InsertTextMode "insertTextMode").toOption
-    let textEdit := json.getObjVal? "textEdit" |>.toOption |>.getD Json.null
-    let textEditText := (json.getObjValAs? String "textEditText").toOption
-    let additionalTextEdits := (json.getObjValAs? (Array TextEdit) "additionalTextEdits").toOption
-    let commitCharacters := (json.getObjValAs? (Array String) "commitCharacters").toOption
-    let command := (json.getObjValAs? Command "command").toOption
-    let data := json.getObjVal? "data" |>.toOption |>.getD Json.null
-    return { label, labelDetails, kind, tags, detail, documentation, deprecated, preselect, sortText, filterText, insertText, insertTextFormat, insertTextMode, textEdit, textEditText, additionalTextEdits, commitCharacters, command, data }
+    let _obj ← json.getObj?
+    let properties : (Array String) ← match _obj.find compare "properties" with | some v => fromJson? v | none => throw "property not found: properties"
+    return { properties }
 
-/-- In many cases the items of an actual completion result share the same value for properties like `commitCharacters` or the range of a text edit. A completion list can therefore define item defaults which will be used if a completion item itself doesn't specify the value.  If a completion list specifi... -/
-structure CompletionItemDefaults where
-  commitCharacters : (Option (Array String)) := none
-  editRange : Json := Json.null
-  insertTextFormat : (Option InsertTextFormat) := none
-  insertTextMode : (Option InsertTextMode) := none
-  data : Json := Json.null
+/-- Client capabilities for a {@link WorkspaceSymbolRequest}. -/
+structure WorkspaceSymbolClientCapabilities where
+  dynamicRegistration : (Option Bool) := none
+  symbolKind : (Option ClientSymbolKindOptions) := none
+  tagSupport : (Option ClientSymbolTagOptions) := none
+  resolveSupport : (Option ClientSymbolResolveOptions) := none
   deriving Inhabited
 
-instance : ToJson CompletionItemDefaults where
-  toJson s := Json.mkObj <|
-    (match s.commitCharacters with | some v => [("commitCharacters", toJson v)] | none => []) ++
-    [("editRange", toJson s.editRange)] ++
-    (match s.insertTextFormat with | some v => [("insertTextFormat", toJson v)] | none => []) ++
-    (match s.insertTextMode with | some v => [("insertTextMode", toJson v)] | none => []) ++
-    [("data", toJson s.data)]
+instance : ToJson WorkspaceSymbolClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.resolveSupport with | some v => ("resolveSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.tagSupport with | some v => ("tagSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.symbolKind with | some v => ("symbolKind", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.dynamicRegistration with | some v => ("dynamicRegistration", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson CompletionItemDefaults where
+instance : FromJson WorkspaceSymbolClientCapabilities where
   fromJson? json := do
-    let commitCharacters := (json.getObjValAs? (Array String) "commitCharacters").toOption
-    let editRange := json.getObjVal? "editRange" |>.toOption |>.getD Json.null
-    let insertTextFormat := (json.getObjValAs? InsertTextFormat "insertTextFormat").toOption
-    let insertTextMode := (json.getObjValAs? InsertTextMode "insertTextMode").toOption
-    let data := json.getObjVal? "data" |>.toOption |>.getD Json.null
-    return { commitCharacters, editRange, insertTextFormat, insertTextMode, data }
+    let _obj ← json.getObj?
+    let dynamicRegistration : Option Bool := (_obj.find compare "dynamicRegistration").bind fun v => (fromJson? v).toOption
+    let symbolKind : Option ClientSymbolKindOptions := (_obj.find compare "symbolKind").bind fun v => (fromJson? v).toOption
+    let tagSupport : Option ClientSymbolTagOptions := (_obj.find compare "tagSupport").bind fun v => (fromJson? v).toOption
+    let resolveSupport : Option ClientSymbolResolveOptions := (_obj.find compare "resolveSupport").bind fun v => (fromJson? v).toOption
+    return { dynamicRegistration, symbolKind, tagSupport, resolveSupport }
 
-/-- Defines workspace specific capabilities of the server.  @since 3.18.0 -/
-structure WorkspaceOptions where
-  workspaceFolders : (Option WorkspaceFoldersServerCapabilities) := none
-  fileOperations : (Option FileOperationOptions) := none
+/-- Workspace specific client capabilities. -/
+structure WorkspaceClientCapabilities where
+  applyEdit : (Option Bool) := none
+  workspaceEdit : (Option WorkspaceEditClientCapabilities) := none
+  didChangeConfiguration : (Option DidChangeConfigurationClientCapabilities) := none
+  didChangeWatchedFiles : (Option DidChangeWatchedFilesClientCapabilities) := none
+  symbol : (Option WorkspaceSymbolClientCapabilities) := none
+  executeCommand : (Option ExecuteCommandClientCapabilities) := none
+  workspaceFolders : (Option Bool) := none
+  configuration : (Option Bool) := none
+  semanticTokens : (Option SemanticTokensWorkspaceClientCapabilities) := none
+  codeLens : (Option CodeLensWorkspaceClientCapabilities) := none
+  fileOperations : (Option FileOperationClientCapabilities) := none
+  inlineValue : (Option InlineValueWorkspaceClientCapabilities) := none
+  inlayHint : (Option InlayHintWorkspaceClientCapabilities) := none
+  diagnostics : (Option DiagnosticWorkspaceClientCapabilities) := none
+  foldingRange : Json := Json.null
   textDocumentContent : Json := Json.null
   deriving Inhabited
 
-instance : ToJson WorkspaceOptions where
-  toJson s := Json.mkObj <|
-    (match s.workspaceFolders with | some v => [("workspaceFolders", toJson v)] | none => []) ++
-    (match s.fileOperations with | some v => [("fileOperations", toJson v)] | none => []) ++
-    [("textDocumentContent", toJson s.textDocumentContent)]
-
-instance : FromJson WorkspaceOptions where
-  fromJson? json := do
-    let workspaceFolders := (json.getObjValAs? WorkspaceFoldersServerCapabilities "workspaceFolders").toOption
-    let fileOperations := (json.getObjValAs? FileOperationOptions "fileOperations").toOption
-    let textDocumentContent := json.getObjVal? "textDocumentContent" |>.toOption |>.getD Json.null
-    return { workspaceFolders, fileOperations, textDocumentContent }
-
-/-- Signature help represents the signature of something callable. There can be multiple signature but only one active and only one active parameter. -/
-structure SignatureHelp where
-  signatures : (Array SignatureInformation)
-  activeSignature : (Option Nat) := none
-  activeParameter : (Option Nat) := none
-  deriving Inhabited
-
-instance : ToJson SignatureHelp where
-  toJson s := Json.mkObj <|
-    [("signatures", toJson s.signatures)] ++
-    (match s.activeSignature with | some v => [("activeSignature", toJson v)] | none => []) ++
-    (match s.activeParameter with | some v => [("activeParameter", toJson v)] | none => [])
+instance : ToJson WorkspaceClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("foldingRange", toJson s.foldingRange) :: ("textDocumentContent", toJson s.textDocumentContent) :: kvs
+    let kvs := (match s.diagnostics with | some v => ("diagnostics", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.inlayHint with | some v => ("inlayHint", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.inlineValue with | some v => ("inlineValue", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.fileOperations with | some v => ("fileOperations", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.codeLens with | some v => ("codeLens", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.semanticTokens with | some v => ("semanticTokens", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.configuration with | some v => ("configuration", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workspaceFolders with | some v => ("workspaceFolders", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.executeCommand with | some v => ("executeCommand", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.symbol with | some v => ("symbol", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.didChangeWatchedFiles with | some v => ("didChangeWatchedFiles", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.didChangeConfiguration with | some v => ("didChangeConfiguration", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workspaceEdit with | some v => ("workspaceEdit", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.applyEdit with | some v => ("applyEdit", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson SignatureHelp where
+instance : FromJson WorkspaceClientCapabilities where
   fromJson? json := do
-    let signatures ← json.getObjValAs? (Array SignatureInformation) "signatures"
-    let activeSignature := (json.getObjValAs? Nat "activeSignature").toOption
-    let activeParameter := (json.getObjValAs? Nat "activeParameter").toOption
-    return { signatures, activeSignature, activeParameter }
+    let _obj ← json.getObj?
+    let applyEdit : Option Bool := (_obj.find compare "applyEdit").bind fun v => (fromJson? v).toOption
+    let workspaceEdit : Option WorkspaceEditClientCapabilities := (_obj.find compare "workspaceEdit").bind fun v => (fromJson? v).toOption
+    let didChangeConfiguration : Option DidChangeConfigurationClientCapabilities := (_obj.find compare "didChangeConfiguration").bind fun v => (fromJson? v).toOption
+    let didChangeWatchedFiles : Option DidChangeWatchedFilesClientCapabilities := (_obj.find compare "didChangeWatchedFiles").bind fun v => (fromJson? v).toOption
+    let symbol : Option WorkspaceSymbolClientCapabilities := (_obj.find compare "symbol").bind fun v => (fromJson? v).toOption
+    let executeCommand : Option ExecuteCommandClientCapabilities := (_obj.find compare "executeCommand").bind fun v => (fromJson? v).toOption
+    let workspaceFolders : Option Bool := (_obj.find compare "workspaceFolders").bind fun v => (fromJson? v).toOption
+    let configuration : Option Bool := (_obj.find compare "configuration").bind fun v => (fromJson? v).toOption
+    let semanticTokens : Option SemanticTokensWorkspaceClientCapabilities := (_obj.find compare "semanticTokens").bind fun v => (fromJson? v).toOption
+    let codeLens : Option CodeLensWorkspaceClientCapabilities := (_obj.find compare "codeLens").bind fun v => (fromJson? v).toOption
+    let fileOperations : Option FileOperationClientCapabilities := (_obj.find compare "fileOperations").bind fun v => (fromJson? v).toOption
+    let inlineValue : Option InlineValueWorkspaceClientCapabilities := (_obj.find compare "inlineValue").bind fun v => (fromJson? v).toOption
+    let inlayHint : Option InlayHintWorkspaceClientCapabilities := (_obj.find compare "inlayHint").bind fun v => (fromJson? v).toOption
+    let diagnostics : Option DiagnosticWorkspaceClientCapabilities := (_obj.find compare "diagnostics").bind fun v => (fromJson? v).toOption
+    let foldingRange : Json := (_obj.find compare "foldingRange").getD Json.null
+    let textDocumentContent : Json := (_obj.find compare "textDocumentContent").getD Json.null
+    return { applyEdit, workspaceEdit, didChangeConfiguration, didChangeWatchedFiles, symbol, executeCommand, workspaceFolders, configuration, semanticTokens, codeLens, fileOperations, inlineValue, inlayHint, diagnostics, foldingRange, textDocumentContent }
 
-/-- Registration options specific to a notebook.  @since 3.17.0 -/
-structure NotebookDocumentSyncRegistrationOptions where
-  notebookSelector : Json
-  save : (Option Bool) := none
-  id : (Option String) := none
+/-- Defines the capabilities provided by the client. -/
+structure ClientCapabilities where
+  workspace : (Option WorkspaceClientCapabilities) := none
+  textDocument : (Option TextDocumentClientCapabilities) := none
+  notebookDocument : (Option NotebookDocumentClientCapabilities) := none
+  window : (Option WindowClientCapabilities) := none
+  general : (Option GeneralClientCapabilities) := none
+  experimental : Json := Json.null
   deriving Inhabited
 
-instance : ToJson NotebookDocumentSyncRegistrationOptions where
-  toJson s := Json.mkObj <|
-    [("notebookSelector", toJson s.notebookSelector)] ++
-    (match s.save with | some v => [("save", toJson v)] | none => []) ++
-    (match s.id with | some v => [("id", toJson v)] | none => [])
+instance : ToJson ClientCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("experimental", toJson s.experimental) :: kvs
+    let kvs := (match s.general with | some v => ("general", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.window with | some v => ("window", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.notebookDocument with | some v => ("notebookDocument", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.textDocument with | some v => ("textDocument", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.workspace with | some v => ("workspace", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson NotebookDocumentSyncRegistrationOptions where
+instance : FromJson ClientCapabilities where
   fromJson? json := do
-    let notebookSelector := json.getObjVal? "notebookSelector" |>.toOption |>.getD Json.null
-    let save := (json.getObjValAs? Bool "save").toOption
-    let id := (json.getObjValAs? String "id").toOption
-    return { notebookSelector, save, id }
+    let _obj ← json.getObj?
+    let workspace : Option WorkspaceClientCapabilities := (_obj.find compare "workspace").bind fun v => (fromJson? v).toOption
+    let textDocument : Option TextDocumentClientCapabilities := (_obj.find compare "textDocument").bind fun v => (fromJson? v).toOption
+    let notebookDocument : Option NotebookDocumentClientCapabilities := (_obj.find compare "notebookDocument").bind fun v => (fromJson? v).toOption
+    let window : Option WindowClientCapabilities := (_obj.find compare "window").bind fun v => (fromJson? v).toOption
+    let general : Option GeneralClientCapabilities := (_obj.find compare "general").bind fun v => (fromJson? v).toOption
+    let experimental : Json := (_obj.find compare "experimental").getD Json.null
+    return { workspace, textDocument, notebookDocument, window, general, experimental }
 
-/-- Text document specific client capabilities. -/
-structure TextDocumentClientCapabilities where
-  synchronization : (Option TextDocumentSyncClientCapabilities) := none
-  filters : (Option TextDocumentFilterClientCapabilities) := none
-  completion : (Option CompletionClientCapabilities) := none
-  hover : (Option HoverClientCapabilities) := none
-  signatureHelp : (Option SignatureHelpClientCapabilities) := none
-  declaration : (Option DeclarationClientCapabilities) := none
-  definition : (Option DefinitionClientCapabilities) := none
-  typeDefinition : (Option TypeDefinitionClientCapabilities) := none
-  implementation : (Option ImplementationClientCapabilities) := none
-  references : (Option ReferenceClientCapabilities) := none
-  documentHighlight : (Option DocumentHighlightClientCapabilities) := none
-  documentSymbol : (Option DocumentSymbolClientCapabilities) := none
-  codeAction : (Option CodeActionClientCapabilities) := none
-  codeLens : (Option CodeLensClientCapabilities) := none
-  documentLink : (Option DocumentLinkClientCapabilities) := none
-  colorProvider : (Option DocumentColorClientCapabilities) := none
-  formatting : (Option DocumentFormattingClientCapabilities) := none
-  rangeFormatting : (Option DocumentRangeFormattingClientCapabilities) := none
-  onTypeFormatting : (Option DocumentOnTypeFormattingClientCapabilities) := none
-  rename : (Option RenameClientCapabilities) := none
-  foldingRange : (Option FoldingRangeClientCapabilities) := none
-  selectionRange : (Option SelectionRangeClientCapabilities) := none
-  publishDiagnostics : (Option PublishDiagnosticsClientCapabilities) := none
-  callHierarchy : (Option CallHierarchyClientCapabilities) := none
-  semanticTokens : (Option SemanticTokensClientCapabilities) := none
-  linkedEditingRange : (Option LinkedEditingRangeClientCapabilities) := none
-  moniker : (Option MonikerClientCapabilities) := none
-  typeHierarchy : (Option TypeHierarchyClientCapabilities) := none
-  inlineValue : (Option InlineValueClientCapabilities) := none
-  inlayHint : (Option InlayHintClientCapabilities) := none
-  diagnostic : (Option DiagnosticClientCapabilities) := none
-  inlineCompletion : Json := Json.null
+structure TextDocumentSyncOptions where
+  openClose : (Option Bool) := none
+  change : (Option TextDocumentSyncKind) := none
+  willSave : (Option Bool) := none
+  willSaveWaitUntil : (Option Bool) := none
+  save : Json := Json.null
   deriving Inhabited
 
-instance : ToJson TextDocumentClientCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.synchronization with | some v => [("synchronization", toJson v)] | none => []) ++
-    (match s.filters with | some v => [("filters", toJson v)] | none => []) ++
-    (match s.completion with | some v => [("completion", toJson v)] | none => []) ++
-    (match s.hover with | some v => [("hover", toJson v)] | none => []) ++
-    (match s.signatureHelp with | some v => [("signatureHelp", toJson v)] | none => []) ++
-    (match s.declaration with | some v => [("declaration", toJson v)] | none => []) ++
-    (match s.definition with | some v => [("definition", toJson v)] | none => []) ++
-    (match s.typeDefinition with | some v => [("typeDefinition", toJson v)] | none => []) ++
-    (match s.implementation with | some v => [("implementation", toJson v)] | none => []) ++
-    (match s.references with | some v => [("references", toJson v)] | none => []) ++
-    (match s.documentHighlight with | some v => [("documentHighlight", toJson v)] | none => []) ++
-    (match s.documentSymbol with | some v => [("documentSymbol", toJson v)] | none => []) ++
-    (match s.codeAction with | some v => [("codeAction", toJson v)] | none => []) ++
-    (match s.codeLens with | some v => [("codeLens", toJson v)] | none => []) ++
-    (match s.documentLink with | some v => [("documentLink", toJson v)] | none => []) ++
-    (match s.colorProvider with | some v => [("colorProvider", toJson v)] | none => []) ++
-    (match s.formatting with | some v => [("formatting", toJson v)] | none => []) ++
-    (match s.rangeFormatting with | some v => [("rangeFormatting", toJson v)] | none => []) ++
-    (match s.onTypeFormatting with | some v => [("onTypeFormatting", toJson v)] | none => []) ++
-    (match s.rename with | some v => [("rename", toJson v)] | none => []) ++
-    (match s.foldingRange with | some v => [("foldingRange", toJson v)] | none => []) ++
-    (match s.selectionRange with | some v => [("selectionRange", toJson v)] | none => []) ++
-    (match s.publishDiagnostics with | some v => [("publishDiagnostics", toJson v)] | none => []) ++
-    (match s.callHierarchy with | some v => [("callHierarchy", toJson v)] | none => []) ++
-    (match s.semanticTokens with | some v => [("semanticTokens", toJson v)] | none => []) ++
-    (match s.linkedEditingRange with | some v => [("linkedEditingRange", toJson v)] | none => []) ++
-    (match s.moniker with | some v => [("moniker", toJson v)] | none => []) ++
-    (match s.typeHierarchy with | some v => [("typeHierarchy", toJson v)] | none => []) ++
-    (match s.inlineValue with | some v => [("inlineValue", toJson v)] | none => []) ++
-    (match s.inlayHint with | some v => [("inlayHint", toJson v)] | none => []) ++
-    (match s.diagnostic with | some v => [("diagnostic", toJson v)] | none => []) ++
-    [("inlineCompletion", toJson s.inlineCompletion)]
+instance : ToJson TextDocumentSyncOptions where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("save", toJson s.save) :: kvs
+    let kvs := (match s.willSaveWaitUntil with | some v => ("willSaveWaitUntil", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.willSave with | some v => ("willSave", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.change with | some v => ("change", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.openClose with | some v => ("openClose", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson TextDocumentClientCapabilities where
+instance : FromJson TextDocumentSyncOptions where
   fromJson? json := do
-    let synchronization := (json.getObjValAs? TextDocumentSyncClientCapabilities "synchronization").toOption
-    let filters := (json.getObjValAs? TextDocumentFilterClientCapabilities "filters").toOption
-    let completion := (json.getObjValAs? CompletionClientCapabilities "completion").toOption
-    let hover := (json.getObjValAs? HoverClientCapabilities "hover").toOption
-    let signatureHelp := (json.getObjValAs? SignatureHelpClientCapabilities "signatureHelp").toOption
-    let declaration := (json.getObjValAs? DeclarationClientCapabilities "declaration").toOption
-    let definition := (json.getObjValAs? DefinitionClientCapabilities "definition").toOption
-    let typeDefinition := (json.getObjValAs? TypeDefinitionClientCapabilities "typeDefinition").toOption
-    let implementation := (json.getObjValAs? ImplementationClientCapabilities "implementation").toOption
-    let references := (json.getObjValAs? ReferenceClientCapabilities "references").toOption
-    let documentHighlight := (json.getObjValAs? DocumentHighlightClientCapabilities "documentHighlight").toOption
-    let documentSymbol := (json.getObjValAs? DocumentSymbolClientCapabilities "documentSymbol").toOption
-    let codeAction := (json.getObjValAs? CodeActionClientCapabilities "codeAction").toOption
-    let codeLens := (json.getObjValAs? CodeLensClientCapabilities "codeLens").toOption
-    let documentLink := (json.getObjValAs? DocumentLinkClientCapabilities "documentLink").toOption
-    let colorProvider := (json.getObjValAs? DocumentColorClientCapabilities "colorProvider").toOption
-    let formatting := (json.getObjValAs? DocumentFormattingClientCapabilities "formatting").toOption
-    let rangeFormatting := (json.getObjValAs? DocumentRangeFormattingClientCapabilities "rangeFormatting").toOption
-    let onTypeFormatting := (json.getObjValAs? DocumentOnTypeFormattingClientCapabilities "onTypeFormatting").toOption
-    let rename := (json.getObjValAs? RenameClientCapabilities "rename").toOption
-    let foldingRange := (json.getObjValAs? FoldingRangeClientCapabilities "foldingRange").toOption
-    let selectionRange := (json.getObjValAs? SelectionRangeClientCapabilities "selectionRange").toOption
-    let publishDiagnostics := (json.getObjValAs? PublishDiagnosticsClientCapabilities "publishDiagnostics").toOption
-    let callHierarchy := (json.getObjValAs? CallHierarchyClientCapabilities "callHierarchy").toOption
-    let semanticTokens := (json.getObjValAs? SemanticTokensClientCapabilities "semanticTokens").toOption
-    let linkedEditingRange := (json.getObjValAs? LinkedEditingRangeClientCapabilities "linkedEditingRange").toOption
-    let moniker := (json.getObjValAs? MonikerClientCapabilities "moniker").toOption
-    let typeHierarchy := (json.getObjValAs? TypeHierarchyClientCapabilities "typeHierarchy").toOption
-    let inlineValue := (json.getObjValAs? InlineValueClientCapabilities "inlineValue").toOption
-    let inlayHint := (json.getObjValAs? InlayHintClientCapabilities "inlayHint").toOption
-    let diagnostic := (json.getObjValAs? DiagnosticClientCapabilities "diagnostic").toOption
-    let inlineCompletion := json.getObjVal? "inlineCompletion" |>.toOption |>.getD Json.null
-    return { synchronization, filters, completion, hover, signatureHelp, declaration, definition, typeDefinition, implementation, references, documentHighlight, documentSymbol, codeAction, codeLens, documentLink, colorProvider, formatting, rangeFormatting, onTypeFormatting, rename, foldingRange, selectionRange, publishDiagnostics, callHierarchy, semanticTokens, linkedEditingRange, moniker, typeHierarchy, inlineValue, inlayHint, diagnostic, inlineCompletion }
+    let _obj ← json.getObj?
+    let openClose : Option Bool := (_obj.find compare "openClose").bind fun v => (fromJson? v).toOption
+    let change : Option TextDocumentSyncKind := (_obj.find compare "change").bind fun v => (fromJson? v).toOption
+    let willSave : Option Bool := (_obj.find compare "willSave").bind fun v => (fromJson? v).toOption
+    let willSaveWaitUntil : Option Bool := (_obj.find compare "willSaveWaitUntil").bind fun v => (fromJson? v).toOption
+    let save : Json := (_obj.find compare "save").getD Json.null
+    return { openClose, change, willSave, willSaveWaitUntil, save }
 
-/-- A change event for a notebook document.  @since 3.17.0 -/
-structure NotebookDocumentChangeEvent where
-  metadata : Json := Json.null
-  cells : (Option NotebookDocumentCellChanges) := none
+/-- @since 3.18.0 -/
+structure TextDocumentContentChangePartial where
+  range : Range
+  rangeLength : (Option Nat) := none
+  text : String
   deriving Inhabited
 
-instance : ToJson NotebookDocumentChangeEvent where
-  toJson s := Json.mkObj <|
-    [("metadata", toJson s.metadata)] ++
-    (match s.cells with | some v => [("cells", toJson v)] | none => [])
+instance : ToJson TextDocumentContentChangePartial where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("text", toJson s.text) :: kvs
+    let kvs := (match s.rangeLength with | some v => ("rangeLength", toJson v) :: kvs | none => kvs)
+    let kvs := ("range", toJson s.range) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson NotebookDocumentChangeEvent where
+instance : FromJson TextDocumentContentChangePartial where
   fromJson? json := do
-    let metadata := json.getObjVal? "metadata" |>.toOption |>.getD Json.null
-    let cells := (json.getObjValAs? NotebookDocumentCellChanges "cells").toOption
-    return { metadata, cells }
+    let _obj ← json.getObj?
+    let range : Range ← match _obj.find compare "range" with | some v => fromJson? v | none => throw "property not found: range"
+    let rangeLength : Option Nat := (_obj.find compare "rangeLength").bind fun v => (fromJson? v).toOption
+    let text : String ← match _obj.find compare "text" with | some v => fromJson? v | none => throw "property not found: text"
+    return { range, rangeLength, text }
 
-/-- Inlay hint information.  @since 3.17.0 -/
-structure InlayHint where
-  position : Position
-  label : Json
-  kind : (Option InlayHintKind) := none
-  textEdits : (Option (Array TextEdit)) := none
-  tooltip : Json := Json.null
-  paddingLeft : (Option Bool) := none
-  paddingRight : (Option Bool) := none
-  data : Json := Json.null
+/-- @since 3.18.0 -/
+structure TextDocumentContentChangeWholeDocument where
+  text : String
   deriving Inhabited
 
-instance : ToJson InlayHint where
-  toJson s := Json.mkObj <|
-    [("position", toJson s.position)] ++
-    [("label", toJson s.label)] ++
-    (match s.kind with | some v => [("kind", toJson v)] | none => []) ++
-    (match s.textEdits with | some v => [("textEdits", toJson v)] | none => []) ++
-    [("tooltip", toJson s.tooltip)] ++
-    (match s.paddingLeft with | some v => [("paddingLeft", toJson v)] | none => []) ++
-    (match s.paddingRight with | some v => [("paddingRight", toJson v)] | none => []) ++
-    [("data", toJson s.data)]
+instance : ToJson TextDocumentContentChangeWholeDocument where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("text", toJson s.text) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson InlayHint where
+instance : FromJson TextDocumentContentChangeWholeDocument where
   fromJson? json := do
-    let position ← json.getObjValAs? Position "position"
-    let label := json.getObjVal? "label" |>.toOption |>.getD Json.null
-    let kind := (json.getObjValAs? InlayHintKind "kind").toOption
-    let textEdits := (json.getObjValAs? (Array TextEdit) "textEdits").toOption
-    let tooltip := json.getObjVal? "tooltip" |>.toOption |>.getD Json.null
-    let paddingLeft := (json.getObjValAs? Bool "paddingLeft").toOption
-    let paddingRight := (json.getObjValAs? Bool "paddingRight").toOption
-    let data := json.getObjVal? "data" |>.toOption |>.getD Json.null
-    return { position, label, kind, textEdits, tooltip, paddingLeft, paddingRight, data }
+    let _obj ← json.getObj?
+    let text : String ← match _obj.find compare "text" with | some v => fromJson? v | none => throw "property not found: text"
+    return { text }
 
-/-- Represents a diagnostic, such as a compiler error or warning. Diagnostic objects are only valid in the scope of a resource. -/
-structure Diagnostic where
-  range : Range
-  severity : (Option DiagnosticSeverity) := none
-  code : Json := Json.null
-  codeDescription : (Option CodeDescription) := none
-  source : (Option String) := none
-  message : String
-  tags : (Option (Array DiagnosticTag)) := none
-  relatedInformation : (Option (Array DiagnosticRelatedInformation)) := none
-  data : Json := Json.null
+/-- Edit range variant that includes ranges for insert and replace operations.  @since 3.18.0 -/
+structure EditRangeWithInsertReplace where
+  insert : Range
+  replace : Range
   deriving Inhabited
 
-instance : ToJson Diagnostic where
-  toJson s := Json.mkObj <|
-    [("range", toJson s.range)] ++
-    (match s.severity with | some v => [("severity", toJson v)] | none => []) ++
-    [("code", toJson s.code)] ++
-    (match s.codeDescription with | some v => [("codeDescription", toJson v)] | none => []) ++
-    (match s.source with | some v => [("source", toJson v)] | none => []) ++
-    [("message", toJson s.message)] ++
-    (match s.tags with | some v => [("tags", toJson v)] | none => []) ++
-    (match s.relatedInformation with | some v => [("relatedInformation", toJson v)] | none => []) ++
-    [("data", toJson s.data)]
+instance : ToJson EditRangeWithInsertReplace where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("insert", toJson s.insert) :: ("replace", toJson s.replace) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson Diagnostic where
+instance : FromJson EditRangeWithInsertReplace where
   fromJson? json := do
-    let range ← json.getObjValAs? Range "range"
-    let severity := (json.getObjValAs? DiagnosticSeverity "severity").toOption
-    let code := json.getObjVal? "code" |>.toOption |>.getD Json.null
-    let codeDescription := (json.getObjValAs? CodeDescription "codeDescription").toOption
-    let source := (json.getObjValAs? String "source").toOption
-    let message ← json.getObjValAs? String "message"
-    let tags := (json.getObjValAs? (Array DiagnosticTag) "tags").toOption
-    let relatedInformation := (json.getObjValAs? (Array DiagnosticRelatedInformation) "relatedInformation").toOption
-    let data := json.getObjVal? "data" |>.toOption |>.getD Json.null
-    return { range, severity, code, codeDescription, source, message, tags, relatedInformation, data }
+    let _obj ← json.getObj?
+    let insert : Range ← match _obj.find compare "insert" with | some v => fromJson? v | none => throw "property not found: insert"
+    let replace : Range ← match _obj.find compare "replace" with | some v => fromJson? v | none => throw "property not found: replace"
+    return { insert, replace }
 
-/-- Describes textual changes on a text document. A TextDocumentEdit describes all changes on a document version Si and after they are applied move the document to version Si+1. So the creator of a TextDocumentEdit doesn't need to sort the array of edits or do any kind of ordering. However the edits mus... -/
-structure TextDocumentEdit where
-  textDocument : OptionalVersionedTextDocumentIdentifier
-  edits : Json
+/-- @since 3.18.0 @deprecated use MarkupContent instead. -/
+structure MarkedStringWithLanguage where
+  language : String
+  value : String
   deriving Inhabited
 
-instance : ToJson TextDocumentEdit where
-  toJson s := Json.mkObj <|
-    [("textDocument", toJson s.textDocument)] ++
-    [("edits", toJson s.edits)]
+instance : ToJson MarkedStringWithLanguage where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("language", toJson s.language) :: ("value", toJson s.value) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson TextDocumentEdit where
+instance : FromJson MarkedStringWithLanguage where
   fromJson? json := do
-    let textDocument ← json.getObjValAs? OptionalVersionedTextDocumentIdentifier "textDocument"
-    let edits := json.getObjVal? "edits" |>.toOption |>.getD Json.null
-    return { textDocument, edits }
+    let _obj ← json.getObj?
+    let language : String ← match _obj.find compare "language" with | some v => fromJson? v | none => throw "property not found: language"
+    let value : String ← match _obj.find compare "value" with | some v => fromJson? v | none => throw "property not found: value"
+    return { language, value }
 
-/-- Represents a collection of {@link CompletionItem completion items} to be presented in the editor. -/
-structure CompletionList where
-  isIncomplete : Bool
-  itemDefaults : (Option CompletionItemDefaults) := none
-  applyKind : (Option CompletionItemApplyKinds) := none
-  items : Json
+/-- A notebook cell text document filter denotes a cell text document by different properties.  @since 3.17.0 -/
+structure NotebookCellTextDocumentFilter where
+  notebook : Json
+  language : (Option String) := none
   deriving Inhabited
 
-instance : ToJson CompletionList where
-  toJson s := Json.mkObj <|
-    [("isIncomplete", toJson s.isIncomplete)] ++
-    (match s.itemDefaults with | some v => [("itemDefaults", toJson v)] | none => []) ++
-    (match s.applyKind with | some v => [("applyKind", toJson v)] | none => []) ++
-    [("items", toJson s.items)]
+instance : ToJson NotebookCellTextDocumentFilter where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.language with | some v => ("language", toJson v) :: kvs | none => kvs)
+    let kvs := ("notebook", toJson s.notebook) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson CompletionList where
+instance : FromJson NotebookCellTextDocumentFilter where
   fromJson? json := do
-    let isIncomplete ← json.getObjValAs? Bool "isIncomplete"
-    let itemDefaults := (json.getObjValAs? CompletionItemDefaults "itemDefaults").toOption
-    let applyKind := (json.getObjValAs? CompletionItemApplyKinds "applyKind").toOption
-    let items := json.getObjVal? "items" |>.toOption |>.getD Json.null
-    return { isIncomplete, itemDefaults, applyKind, items }
+    let _obj ← json.getObj?
+    let notebook : Json := (_obj.find compare "notebook").getD Json.null
+    let language : Option String := (_obj.find compare "language").bind fun v => (fromJson? v).toOption
+    return { notebook, language }
 
-/-- Additional information about the context in which a signature help request was triggered.  @since 3.15.0 -/
-structure SignatureHelpContext where
-  triggerKind : SignatureHelpTriggerKind
-  triggerCharacter : (Option String) := none
-  isRetrigger : Bool
-  activeSignatureHelp : (Option SignatureHelp) := none
+/-- A relative pattern is a helper to construct glob patterns that are matched relatively to a base URI. The common value for a `baseUri` is a workspace folder root, but it can be another absolute URI as well.  @since 3.17.0 -/
+structure RelativePattern where
+  baseUri : Json
+  pattern : Pattern
   deriving Inhabited
 
-instance : ToJson SignatureHelpContext where
-  toJson s := Json.mkObj <|
-    [("triggerKind", toJson s.triggerKind)] ++
-    (match s.triggerCharacter with | some v => [("triggerCharacter", toJson v)] | none => []) ++
-    [("isRetrigger", toJson s.isRetrigger)] ++
-    (match s.activeSignatureHelp with | some v => [("activeSignatureHelp", toJson v)] | none => [])
+instance : ToJson RelativePattern where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("baseUri", toJson s.baseUri) :: ("pattern", toJson s.pattern) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson SignatureHelpContext where
+instance : FromJson RelativePattern where
   fromJson? json := do
-    let triggerKind ← json.getObjValAs? SignatureHelpTriggerKind "triggerKind"
-    let triggerCharacter := (json.getObjValAs? String "triggerCharacter").toOption
-    let isRetrigger ← json.getObjValAs? Bool "isRetrigger"
-    let activeSignatureHelp := (json.getObjValAs? SignatureHelp "activeSignatureHelp").toOption
-    return { triggerKind, triggerCharacter, isRetrigger, activeSignatureHelp }
+    let _obj ← json.getObj?
+    let baseUri : Json := (_obj.find compare "baseUri").getD Json.null
+    let pattern : Pattern ← match _obj.find compare "pattern" with | some v => fromJson? v | none => throw "property not found: pattern"
+    return { baseUri, pattern }
 
-/-- Defines the capabilities provided by a language server. -/
-structure ServerCapabilities where
-  positionEncoding : (Option PositionEncodingKind) := none
-  textDocumentSync : Json := Json.null
-  notebookDocumentSync : Json := Json.null
-  completionProvider : (Option CompletionOptions) := none
-  hoverProvider : Json := Json.null
-  signatureHelpProvider : (Option SignatureHelpOptions) := none
-  declarationProvider : Json := Json.null
-  definitionProvider : Json := Json.null
-  typeDefinitionProvider : Json := Json.null
-  implementationProvider : Json := Json.null
-  referencesProvider : Json := Json.null
-  documentHighlightProvider : Json := Json.null
-  documentSymbolProvider : Json := Json.null
-  codeActionProvider : Json := Json.null
-  codeLensProvider : (Option CodeLensOptions) := none
-  documentLinkProvider : (Option DocumentLinkOptions) := none
-  colorProvider : Json := Json.null
-  workspaceSymbolProvider : Json := Json.null
-  documentFormattingProvider : Json := Json.null
-  documentRangeFormattingProvider : Json := Json.null
-  documentOnTypeFormattingProvider : (Option DocumentOnTypeFormattingOptions) := none
-  renameProvider : Json := Json.null
-  foldingRangeProvider : Json := Json.null
-  selectionRangeProvider : Json := Json.null
-  executeCommandProvider : (Option ExecuteCommandOptions) := none
-  callHierarchyProvider : Json := Json.null
-  linkedEditingRangeProvider : Json := Json.null
-  semanticTokensProvider : Json := Json.null
-  monikerProvider : Json := Json.null
-  typeHierarchyProvider : Json := Json.null
-  inlineValueProvider : Json := Json.null
-  inlayHintProvider : Json := Json.null
-  diagnosticProvider : Json := Json.null
-  inlineCompletionProvider : Json := Json.null
-  workspace : (Option WorkspaceOptions) := none
-  experimental : Json := Json.null
+/-- A document filter where `language` is required field.  @since 3.18.0 -/
+structure TextDocumentFilterLanguage where
+  language : String
+  scheme : (Option String) := none
+  pattern : (Option GlobPattern) := none
   deriving Inhabited
 
-instance : ToJson ServerCapabilities where
-  toJson s := Json.mkObj <|
-    (match s.positionEncoding with | some v => [("positionEncoding", toJson v)] | none => []) ++
-    [("textDocumentSync", toJson s.textDocumentSync)] ++
-    [("notebookDocumentSync", toJson s.notebookDocumentSync)] ++
-    (match s.completionProvider with | some v => [("completionProvider", toJson v)] | none => []) ++
-    [("hoverProvider", toJson s.hoverProvider)] ++
-    (match s.signatureHelpProvider with | some v => [("signatureHelpProvider", toJson v)] | none => []) ++
-    [("declarationProvider", toJson s.declarationProvider)] ++
-    [("definitionProvider", toJson s.definitionProvider)] ++
-    [("typeDefinitionProvider", toJson s.typeDefinitionProvider)] ++
-    [("implementationProvider", toJson s.implementationProvider)] ++
-    [("referencesProvider", toJson s.referencesProvider)] ++
-    [("documentHighlightProvider", toJson s.documentHighlightProvider)] ++
-    [("documentSymbolProvider", toJson s.documentSymbolProvider)] ++
-    [("codeActionProvider", toJson s.codeActionProvider)] ++
-    (match s.codeLensProvider with | some v => [("codeLensProvider", toJson v)] | none => []) ++
-    (match s.documentLinkProvider with | some v => [("documentLinkProvider", toJson v)] | none => []) ++
-    [("colorProvider", toJson s.colorProvider)] ++
-    [("workspaceSymbolProvider", toJson s.workspaceSymbolProvider)] ++
-    [("documentFormattingProvider", toJson s.documentFormattingProvider)] ++
-    [("documentRangeFormattingProvider", toJson s.documentRangeFormattingProvider)] ++
-    (match s.documentOnTypeFormattingProvider with | some v => [("documentOnTypeFormattingProvider", toJson v)] | none => []) ++
-    [("renameProvider", toJson s.renameProvider)] ++
-    [("foldingRangeProvider", toJson s.foldingRangeProvider)] ++
-    [("selectionRangeProvider", toJson s.selectionRangeProvider)] ++
-    (match s.executeCommandProvider with | some v => [("executeCommandProvider", toJson v)] | none => []) ++
-    [("callHierarchyProvider", toJson s.callHierarchyProvider)] ++
-    [("linkedEditingRangeProvider", toJson s.linkedEditingRangeProvider)] ++
-    [("semanticTokensProvider", toJson s.semanticTokensProvider)] ++
-    [("monikerProvider", toJson s.monikerProvider)] ++
-    [("typeHierarchyProvider", toJson s.typeHierarchyProvider)] ++
-    [("inlineValueProvider", toJson s.inlineValueProvider)] ++
-    [("inlayHintProvider", toJson s.inlayHintProvider)] ++
-    [("diagnosticProvider", toJson s.diagnosticProvider)] ++
-    [("inlineCompletionProvider", toJson s.inlineCompletionProvider)] ++
-    (match s.workspace with | some v => [("workspace", toJson v)] | none => []) ++
-    [("experimental", toJson s.experimental)]
+instance : ToJson TextDocumentFilterLanguage where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.pattern with | some v => ("pattern", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.scheme with | some v => ("scheme", toJson v) :: kvs | none => kvs)
+    let kvs := ("language", toJson s.language) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson ServerCapabilities where
+instance : FromJson TextDocumentFilterLanguage where
   fromJson? json := do
-    let positionEncoding := (json.getObjValAs? PositionEncodingKind "positionEncoding").toOption
-    let textDocumentSync := json.getObjVal? "textDocumentSync" |>.toOption |>.getD Json.null
-    let notebookDocumentSync := json.getObjVal? "notebookDocumentSync" |>.toOption |>.getD Json.null
-    let completionProvider := (json.getObjValAs? CompletionOptions "completionProvider").toOption
-    let hoverProvider := json.getObjVal? "hoverProvider" |>.toOption |>.getD Json.null
-    let signatureHelpProvider := (json.getObjValAs? SignatureHelpOptions "signatureHelpProvider").toOption
-    let declarationProvider := json.getObjVal? "declarationProvider" |>.toOption |>.getD Json.null
-    let definitionProvider := json.getObjVal? "definitionProvider" |>.toOption |>.getD Json.null
-    let typeDefinitionProvider := json.getObjVal? "typeDefinitionProvider" |>.toOption |>.getD Json.null
-    let implementationProvider := json.getObjVal? "implementationProvider" |>.toOption |>.getD Json.null
-    let referencesProvider := json.getObjVal? "referencesProvider" |>.toOption |>.getD Json.null
-    let documentHighlightProvider := json.getObjVal? "documentHighlightProvider" |>.toOption |>.getD Json.null
-    let documentSymbolProvider := json.getObjVal? "documentSymbolProvider" |>.toOption |>.getD Json.null
-    let codeActionProvider := json.getObjVal? "codeActionProvider" |>.toOption |>.getD Json.null
-    let codeLensProvider := (json.getObjValAs? CodeLensOptions "codeLensProvider").toOption
-    let documentLinkProvider := (json.getObjValAs? DocumentLinkOptions "documentLinkProvider").toOption
-    let colorProvider := json.getObjVal? "colorProvider" |>.toOption |>.getD Json.null
-    let workspaceSymbolProvider := json.getObjVal? "workspaceSymbolProvider" |>.toOption |>.getD Json.null
-    let documentFormattingProvider := json.getObjVal? "documentFormattingProvider" |>.toOption |>.getD Json.null
-    let documentRangeFormattingProvider := json.getObjVal? "documentRangeFormattingProvider" |>.toOption |>.getD Json.null
-    let documentOnTypeFormattingProvider := (json.getObjValAs? DocumentOnTypeFormattingOptions "documentOnTypeFormattingProvider").toOption
-    let renameProvider := json.getObjVal? "renameProvider" |>.toOption |>.getD Json.null
-    let foldingRangeProvider := json.getObjVal? "foldingRangeProvider" |>.toOption |>.getD Json.null
-    let selectionRangeProvider := json.getObjVal? "selectionRangeProvider" |>.toOption |>.getD Json.null
-    let executeCommandProvider := (json.getObjValAs? ExecuteCommandOptions "executeCommandProvider").toOption
-    let callHierarchyProvider := json.getObjVal? "callHierarchyProvider" |>.toOption |>.getD Json.null
-    let linkedEditingRangeProvider := json.getObjVal? "linkedEditingRangeProvider" |>.toOption |>.getD Json.null
-    let semanticTokensProvider := json.getObjVal? "semanticTokensProvider" |>.toOption |>.getD Json.null
-    let monikerProvider := json.getObjVal? "monikerProvider" |>.toOption |>.getD Json.null
-    let typeHierarchyProvider := json.getObjVal? "typeHierarchyProvider" |>.toOption |>.getD Json.null
-    let inlineValueProvider := json.getObjVal? "inlineValueProvider" |>.toOption |>.getD Json.null
-    let inlayHintProvider := json.getObjVal? "inlayHintProvider" |>.toOption |>.getD Json.null
-    let diagnosticProvider := json.getObjVal? "diagnosticProvider" |>.toOption |>.getD Json.null
-    let inlineCompletionProvider := json.getObjVal? "inlineCompletionProvider" |>.toOption |>.getD Json.null
-    let workspace := (json.getObjValAs? WorkspaceOptions "workspace").toOption
-    let experimental := json.getObjVal? "experimental" |>.toOption |>.getD Json.null
-    return { positionEncoding, textDocumentSync, notebookDocumentSync, completionProvider, hoverProvider, signatureHelpProvider, declarationProvider, definitionProvider, typeDefinitionProvider, implementationProvider, referencesProvider, documentHighlightProvider, documentSymbolProvider, codeActionProvider, codeLensProvider, documentLinkProvider, colorProvider, workspaceSymbolProvider, documentFormattingProvider, documentRangeFormattingProvider, documentOnTypeFormattingProvider, renameProvider, foldingRangeProvider, selectionRangeProvider, executeCommandProvider, callHierarchyProvider, linkedEditingRangeProvider, semanticTokensProvider, monikerProvider, typeHierarchyProvider, inlineValueProvider, inlayHintProvider, diagnosticProvider, inlineCompletionProvider, workspace, experimental }
+    let _obj ← json.getObj?
+    let language : String ← match _obj.find compare "language" with | some v => fromJson? v | none => throw "property not found: language"
+    let scheme : Option String := (_obj.find compare "scheme").bind fun v => (fromJson? v).toOption
+    let pattern : Option GlobPattern := (_obj.find compare "pattern").bind fun v => (fromJson? v).toOption
+    return { language, scheme, pattern }
 
-/-- Defines the capabilities provided by the client. -/
-structure ClientCapabilities where
-  workspace : Json := Json.null
-  textDocument : (Option TextDocumentClientCapabilities) := none
-  notebookDocument : (Option NotebookDocumentClientCapabilities) := none
-  window : (Option WindowClientCapabilities) := none
-  general : (Option GeneralClientCapabilities) := none
-  experimental : Json := Json.null
+/-- A document filter where `scheme` is required field.  @since 3.18.0 -/
+structure TextDocumentFilterScheme where
+  language : (Option String) := none
+  scheme : String
+  pattern : (Option GlobPattern) := none
   deriving Inhabited
 
-instance : ToJson ClientCapabilities where
-  toJson s := Json.mkObj <|
-    [("workspace", toJson s.workspace)] ++
-    (match s.textDocument with | some v => [("textDocument", toJson v)] | none => []) ++
-    (match s.notebookDocument with | some v => [("notebookDocument", toJson v)] | none => []) ++
-    (match s.window with | some v => [("window", toJson v)] | none => []) ++
-    (match s.general with | some v => [("general", toJson v)] | none => []) ++
-    [("experimental", toJson s.experimental)]
+instance : ToJson TextDocumentFilterScheme where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.pattern with | some v => ("pattern", toJson v) :: kvs | none => kvs)
+    let kvs := ("scheme", toJson s.scheme) :: kvs
+    let kvs := (match s.language with | some v => ("language", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson ClientCapabilities where
+instance : FromJson TextDocumentFilterScheme where
   fromJson? json := do
-    let workspace := json.getObjVal? "workspace" |>.toOption |>.getD Json.null
-    let textDocument := (json.getObjValAs? TextDocumentClientCapabilities "textDocument").toOption
-    let notebookDocument := (json.getObjValAs? NotebookDocumentClientCapabilities "notebookDocument").toOption
-    let window := (json.getObjValAs? WindowClientCapabilities "window").toOption
-    let general := (json.getObjValAs? GeneralClientCapabilities "general").toOption
-    let experimental := json.getObjVal? "experimental" |>.toOption |>.getD Json.null
-    return { workspace, textDocument, notebookDocument, window, general, experimental }
+    let _obj ← json.getObj?
+    let language : Option String := (_obj.find compare "language").bind fun v => (fromJson? v).toOption
+    let scheme : String ← match _obj.find compare "scheme" with | some v => fromJson? v | none => throw "property not found: scheme"
+    let pattern : Option GlobPattern := (_obj.find compare "pattern").bind fun v => (fromJson? v).toOption
+    return { language, scheme, pattern }
 
-/-- The params sent in a change notebook document notification.  @since 3.17.0 -/
-structure DidChangeNotebookDocumentParams where
-  notebookDocument : VersionedNotebookDocumentIdentifier
-  change : NotebookDocumentChangeEvent
+/-- A document filter where `pattern` is required field.  @since 3.18.0 -/
+structure TextDocumentFilterPattern where
+  language : (Option String) := none
+  scheme : (Option String) := none
+  pattern : GlobPattern
   deriving Inhabited
 
-instance : ToJson DidChangeNotebookDocumentParams where
-  toJson s := Json.mkObj <|
-    [("notebookDocument", toJson s.notebookDocument)] ++
-    [("change", toJson s.change)]
+instance : ToJson TextDocumentFilterPattern where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("pattern", toJson s.pattern) :: kvs
+    let kvs := (match s.scheme with | some v => ("scheme", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.language with | some v => ("language", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson DidChangeNotebookDocumentParams where
+instance : FromJson TextDocumentFilterPattern where
   fromJson? json := do
-    let notebookDocument ← json.getObjValAs? VersionedNotebookDocumentIdentifier "notebookDocument"
-    let change ← json.getObjValAs? NotebookDocumentChangeEvent "change"
-    return { notebookDocument, change }
+    let _obj ← json.getObj?
+    let language : Option String := (_obj.find compare "language").bind fun v => (fromJson? v).toOption
+    let scheme : Option String := (_obj.find compare "scheme").bind fun v => (fromJson? v).toOption
+    let pattern : GlobPattern ← match _obj.find compare "pattern" with | some v => fromJson? v | none => throw "property not found: pattern"
+    return { language, scheme, pattern }
 
-/-- A workspace edit represents changes to many resources managed in the workspace. The edit should either provide `changes` or `documentChanges`. If documentChanges are present they are preferred over `changes` if the client can handle versioned document edits.  Since version 3.13.0 a workspace edit ca... -/
-structure WorkspaceEdit where
-  changes : Json := Json.null
-  documentChanges : Json := Json.null
-  changeAnnotations : Json := Json.null
+/-- A notebook document filter where `notebookType` is required field.  @since 3.18.0 -/
+structure NotebookDocumentFilterNotebookType where
+  notebookType : String
+  scheme : (Option String) := none
+  pattern : (Option GlobPattern) := none
   deriving Inhabited
 
-instance : ToJson WorkspaceEdit where
-  toJson s := Json.mkObj <|
-    [("changes", toJson s.changes)] ++
-    [("documentChanges", toJson s.documentChanges)] ++
-    [("changeAnnotations", toJson s.changeAnnotations)]
+instance : ToJson NotebookDocumentFilterNotebookType where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.pattern with | some v => ("pattern", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.scheme with | some v => ("scheme", toJson v) :: kvs | none => kvs)
+    let kvs := ("notebookType", toJson s.notebookType) :: kvs
+    Json.mkObj kvs
 
-instance : FromJson WorkspaceEdit where
+instance : FromJson NotebookDocumentFilterNotebookType where
   fromJson? json := do
-    let changes := json.getObjVal? "changes" |>.toOption |>.getD Json.null
-    let documentChanges := json.getObjVal? "documentChanges" |>.toOption |>.getD Json.null
-    let changeAnnotations := json.getObjVal? "changeAnnotations" |>.toOption |>.getD Json.null
-    return { changes, documentChanges, changeAnnotations }
+    let _obj ← json.getObj?
+    let notebookType : String ← match _obj.find compare "notebookType" with | some v => fromJson? v | none => throw "property not found: notebookType"
+    let scheme : Option String := (_obj.find compare "scheme").bind fun v => (fromJson? v).toOption
+    let pattern : Option GlobPattern := (_obj.find compare "pattern").bind fun v => (fromJson? v).toOption
+    return { notebookType, scheme, pattern }
 
-/-- Parameters for a {@link SignatureHelpRequest}. -/
-structure SignatureHelpParams where
-  textDocument : TextDocumentIdentifier
-  position : Position
-  workDoneToken : (Option ProgressToken) := none
-  context : (Option SignatureHelpContext) := none
+/-- A notebook document filter where `scheme` is required field.  @since 3.18.0 -/
+structure NotebookDocumentFilterScheme where
+  notebookType : (Option String) := none
+  scheme : String
+  pattern : (Option GlobPattern) := none
   deriving Inhabited
 
-instance : ToJson SignatureHelpParams where
-  toJson s := Json.mkObj <|
-    [("textDocument", toJson s.textDocument)] ++
-    [("position", toJson s.position)] ++
-    (match s.workDoneToken with | some v => [("workDoneToken", toJson v)] | none => []) ++
-    (match s.context with | some v => [("context", toJson v)] | none => [])
+instance : ToJson NotebookDocumentFilterScheme where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.pattern with | some v => ("pattern", toJson v) :: kvs | none => kvs)
+    let kvs := ("scheme", toJson s.scheme) :: kvs
+    let kvs := (match s.notebookType with | some v => ("notebookType", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson SignatureHelpParams where
+instance : FromJson NotebookDocumentFilterScheme where
   fromJson? json := do
-    let textDocument ← json.getObjValAs? TextDocumentIdentifier "textDocument"
-    let position ← json.getObjValAs? Position "position"
-    let workDoneToken := (json.getObjValAs? ProgressToken "workDoneToken").toOption
-    let context := (json.getObjValAs? SignatureHelpContext "context").toOption
-    return { textDocument, position, workDoneToken, context }
+    let _obj ← json.getObj?
+    let notebookType : Option String := (_obj.find compare "notebookType").bind fun v => (fromJson? v).toOption
+    let scheme : String ← match _obj.find compare "scheme" with | some v => fromJson? v | none => throw "property not found: scheme"
+    let pattern : Option GlobPattern := (_obj.find compare "pattern").bind fun v => (fromJson? v).toOption
+    return { notebookType, scheme, pattern }
 
-/-- The result returned from an initialize request. -/
-structure InitializeResult where
-  capabilities : ServerCapabilities
-  serverInfo : (Option ServerInfo) := none
+/-- A notebook document filter where `pattern` is required field.  @since 3.18.0 -/
+structure NotebookDocumentFilterPattern where
+  notebookType : (Option String) := none
+  scheme : (Option String) := none
+  pattern : GlobPattern
   deriving Inhabited
 
-instance : ToJson InitializeResult where
-  toJson s := Json.mkObj <|
-    [("capabilities", toJson s.capabilities)] ++
-    (match s.serverInfo with | some v => [("serverInfo", toJson v)] | none => [])
+instance : ToJson NotebookDocumentFilterPattern where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := ("pattern", toJson s.pattern) :: kvs
+    let kvs := (match s.scheme with | some v => ("scheme", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.notebookType with | some v => ("notebookType", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson InitializeResult where
+instance : FromJson NotebookDocumentFilterPattern where
   fromJson? json := do
-    let capabilities ← json.getObjValAs? ServerCapabilities "capabilities"
-    let serverInfo := (json.getObjValAs? ServerInfo "serverInfo").toOption
-    return { capabilities, serverInfo }
+    let _obj ← json.getObj?
+    let notebookType : Option String := (_obj.find compare "notebookType").bind fun v => (fromJson? v).toOption
+    let scheme : Option String := (_obj.find compare "scheme").bind fun v => (fromJson? v).toOption
+    let pattern : GlobPattern ← match _obj.find compare "pattern" with | some v => fromJson? v | none => throw "property not found: pattern"
+    return { notebookType, scheme, pattern }
 
-/-- A code action represents a change that can be performed in code, e.g. to fix a problem or to refactor code.  A CodeAction must set either `edit` and/or a `command`. If both are supplied, the `edit` is applied first, then the `command` is executed. -/
-structure CodeAction where
-  title : String
-  kind : (Option CodeActionKind) := none
-  diagnostics : Json := Json.null
-  isPreferred : (Option Bool) := none
-  disabled : (Option CodeActionDisabled) := none
-  edit : (Option WorkspaceEdit) := none
-  command : (Option Command) := none
-  data : Json := Json.null
-  tags : (Option (Array CodeActionTag)) := none
+/-- General diagnostics capabilities for pull and push model. -/
+structure DiagnosticsCapabilities where
+  relatedInformation : (Option Bool) := none
+  tagSupport : (Option ClientDiagnosticsTagOptions) := none
+  codeDescriptionSupport : (Option Bool) := none
+  dataSupport : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson CodeAction where
-  toJson s := Json.mkObj <|
-    [("title", toJson s.title)] ++
-    (match s.kind with | some v => [("kind", toJson v)] | none => []) ++
-    [("diagnostics", toJson s.diagnostics)] ++
-    (match s.isPreferred with | some v => [("isPreferred", toJson v)] | none => []) ++
-    (match s.disabled with | some v => [("disabled", toJson v)] | none => []) ++
-    (match s.edit with | some v => [("edit", toJson v)] | none => []) ++
-    (match s.command with | some v => [("command", toJson v)] | none => []) ++
-    [("data", toJson s.data)] ++
-    (match s.tags with | some v => [("tags", toJson v)] | none => [])
+instance : ToJson DiagnosticsCapabilities where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.dataSupport with | some v => ("dataSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.codeDescriptionSupport with | some v => ("codeDescriptionSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.tagSupport with | some v => ("tagSupport", toJson v) :: kvs | none => kvs)
+    let kvs := (match s.relatedInformation with | some v => ("relatedInformation", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson CodeAction where
+instance : FromJson DiagnosticsCapabilities where
   fromJson? json := do
-    let title ← json.getObjValAs? String "title"
-    let kind := (json.getObjValAs? CodeActionKind "kind").toOption
-    let diagnostics := json.getObjVal? "diagnostics" |>.toOption |>.getD Json.null
-    let isPreferred := (json.getObjValAs? Bool "isPreferred").toOption
-    let disabled := (json.getObjValAs? CodeActionDisabled "disabled").toOption
-    let edit := (json.getObjValAs? WorkspaceEdit "edit").toOption
-    let command := (json.getObjValAs? Command "command").toOption
-    let data := json.getObjVal? "data" |>.toOption |>.getD Json.null
-    let tags := (json.getObjValAs? (Array CodeActionTag) "tags").toOption
-    return { title, kind, diagnostics, isPreferred, disabled, edit, command, data, tags }
+    let _obj ← json.getObj?
+    let relatedInformation : Option Bool := (_obj.find compare "relatedInformation").bind fun v => (fromJson? v).toOption
+    let tagSupport : Option ClientDiagnosticsTagOptions := (_obj.find compare "tagSupport").bind fun v => (fromJson? v).toOption
+    let codeDescriptionSupport : Option Bool := (_obj.find compare "codeDescriptionSupport").bind fun v => (fromJson? v).toOption
+    let dataSupport : Option Bool := (_obj.find compare "dataSupport").bind fun v => (fromJson? v).toOption
+    return { relatedInformation, tagSupport, codeDescriptionSupport, dataSupport }
 
-/-- The parameters passed via an apply workspace edit request. -/
-structure ApplyWorkspaceEditParams where
-  label : (Option String) := none
-  edit : WorkspaceEdit
-  metadata : Json := Json.null
+/-- @since 3.18.0 -/
+structure ClientSemanticTokensRequestFullDelta where
+  delta : (Option Bool) := none
   deriving Inhabited
 
-instance : ToJson ApplyWorkspaceEditParams where
-  toJson s := Json.mkObj <|
-    (match s.label with | some v => [("label", toJson v)] | none => []) ++
-    [("edit", toJson s.edit)] ++
-    [("metadata", toJson s.metadata)]
+instance : ToJson ClientSemanticTokensRequestFullDelta where
+  toJson s :=
+    let kvs : List (String × Json) := []
+    let kvs := (match s.delta with | some v => ("delta", toJson v) :: kvs | none => kvs)
+    Json.mkObj kvs
 
-instance : FromJson ApplyWorkspaceEditParams where
+instance : FromJson ClientSemanticTokensRequestFullDelta where
   fromJson? json := do
-    let label := (json.getObjValAs? String "label").toOption
-    let edit ← json.getObjValAs? WorkspaceEdit "edit"
-    let metadata := json.getObjVal? "metadata" |>.toOption |>.getD Json.null
-    return { label, edit, metadata }
+    let _obj ← json.getObj?
+    let delta : Option Bool := (_obj.find compare "delta").bind fun v => (fromJson? v).toOption
+    return { delta }
 
 /-! ## Request Methods -/
 
@@ -8638,4 +9610,398 @@ def CancelNotificationMethod : String := "$/cancelRequest"
 /-- Method: `$/progress` -/
 def ProgressNotificationMethod : String := "$/progress"
 
+/-! ## Method Dispatch -/
+
+/-- Every method in the metamodel, for routing without string comparison. -/
+inductive MethodId where
+  | implementationRequest
+  | typeDefinitionRequest
+  | workspaceFoldersRequest
+  | configurationRequest
+  | documentColorRequest
+  | colorPresentationRequest
+  | foldingRangeRequest
+  | declarationRequest
+  | selectionRangeRequest
+  | workDoneProgressCreateRequest
+  | callHierarchyPrepareRequest
+  | callHierarchyIncomingCallsRequest
+  | callHierarchyOutgoingCallsRequest
+  | semanticTokensRequest
+  | semanticTokensDeltaRequest
+  | semanticTokensRangeRequest
+  | semanticTokensRefreshRequest
+  | showDocumentRequest
+  | linkedEditingRangeRequest
+  | willCreateFilesRequest
+  | willRenameFilesRequest
+  | willDeleteFilesRequest
+  | monikerRequest
+  | typeHierarchyPrepareRequest
+  | typeHierarchySupertypesRequest
+  | typeHierarchySubtypesRequest
+  | inlineValueRequest
+  | inlineValueRefreshRequest
+  | inlayHintRequest
+  | inlayHintResolveRequest
+  | inlayHintRefreshRequest
+  | documentDiagnosticRequest
+  | workspaceDiagnosticRequest
+  | diagnosticRefreshRequest
+  | registrationRequest
+  | unregistrationRequest
+  | initializeRequest
+  | shutdownRequest
+  | showMessageRequest
+  | willSaveTextDocumentWaitUntilRequest
+  | completionRequest
+  | completionResolveRequest
+  | hoverRequest
+  | signatureHelpRequest
+  | definitionRequest
+  | referencesRequest
+  | documentHighlightRequest
+  | documentSymbolRequest
+  | codeActionRequest
+  | codeActionResolveRequest
+  | workspaceSymbolRequest
+  | workspaceSymbolResolveRequest
+  | codeLensRequest
+  | codeLensResolveRequest
+  | codeLensRefreshRequest
+  | documentLinkRequest
+  | documentLinkResolveRequest
+  | documentFormattingRequest
+  | documentRangeFormattingRequest
+  | documentOnTypeFormattingRequest
+  | renameRequest
+  | prepareRenameRequest
+  | executeCommandRequest
+  | applyWorkspaceEditRequest
+  | didChangeWorkspaceFoldersNotification
+  | workDoneProgressCancelNotification
+  | didCreateFilesNotification
+  | didRenameFilesNotification
+  | didDeleteFilesNotification
+  | didOpenNotebookDocumentNotification
+  | didChangeNotebookDocumentNotification
+  | didSaveNotebookDocumentNotification
+  | didCloseNotebookDocumentNotification
+  | initializedNotification
+  | exitNotification
+  | didChangeConfigurationNotification
+  | showMessageNotification
+  | logMessageNotification
+  | telemetryEventNotification
+  | didOpenTextDocumentNotification
+  | didChangeTextDocumentNotification
+  | didCloseTextDocumentNotification
+  | didSaveTextDocumentNotification
+  | willSaveTextDocumentNotification
+  | didChangeWatchedFilesNotification
+  | publishDiagnosticsNotification
+  | setTraceNotification
+  | logTraceNotification
+  | cancelNotification
+  | progressNotification
+  deriving Inhabited, BEq, Hashable, Repr
+
+namespace MethodId
+
+/-- Number of method IDs; tables indexed by `toNat` have this size. -/
+def count : Nat := 90
+
+/-- Dense index of a method ID, for array-backed handler tables. -/
+def toNat : MethodId → Nat
+  | .implementationRequest => 0
+  | .typeDefinitionRequest => 1
+  | .workspaceFoldersRequest => 2
+  | .configurationRequest => 3
+  | .documentColorRequest => 4
+  | .colorPresentationRequest => 5
+  | .foldingRangeRequest => 6
+  | .declarationRequest => 7
+  | .selectionRangeRequest => 8
+  | .workDoneProgressCreateRequest => 9
+  | .callHierarchyPrepareRequest => 10
+  | .callHierarchyIncomingCallsRequest => 11
+  | .callHierarchyOutgoingCallsRequest => 12
+  | .semanticTokensRequest => 13
+  | .semanticTokensDeltaRequest => 14
+  | .semanticTokensRangeRequest => 15
+  | .semanticTokensRefreshRequest => 16
+  | .showDocumentRequest => 17
+  | .linkedEditingRangeRequest => 18
+  | .willCreateFilesRequest => 19
+  | .willRenameFilesRequest => 20
+  | .willDeleteFilesRequest => 21
+  | .monikerRequest => 22
+  | .typeHierarchyPrepareRequest => 23
+  | .typeHierarchySupertypesRequest => 24
+  | .typeHierarchySubtypesRequest => 25
+  | .inlineValueRequest => 26
+  | .inlineValueRefreshRequest => 27
+  | .inlayHintRequest => 28
+  | .inlayHintResolveRequest => 29
+  | .inlayHintRefreshRequest => 30
+  | .documentDiagnosticRequest => 31
+  | .workspaceDiagnosticRequest => 32
+  | .diagnosticRefreshRequest => 33
+  | .registrationRequest => 34
+  | .unregistrationRequest => 35
+  | .initializeRequest => 36
+  | .shutdownRequest => 37
+  | .showMessageRequest => 38
+  | .willSaveTextDocumentWaitUntilRequest => 39
+  | .completionRequest => 40
+  | .completionResolveRequest => 41
+  | .hoverRequest => 42
+  | .signatureHelpRequest => 43
+  | .definitionRequest => 44
+  | .referencesRequest => 45
+  | .documentHighlightRequest => 46
+  | .documentSymbolRequest => 47
+  | .codeActionRequest => 48
+  | .codeActionResolveRequest => 49
+  | .workspaceSymbolRequest => 50
+  | .workspaceSymbolResolveRequest => 51
+  | .codeLensRequest => 52
+  | .codeLensResolveRequest => 53
+  | .codeLensRefreshRequest => 54
+  | .documentLinkRequest => 55
+  | .documentLinkResolveRequest => 56
+  | .documentFormattingRequest => 57
+  | .documentRangeFormattingRequest => 58
+  | .documentOnTypeFormattingRequest => 59
+  | .renameRequest => 60
+  | .prepareRenameRequest => 61
+  | .executeCommandRequest => 62
+  | .applyWorkspaceEditRequest => 63
+  | .didChangeWorkspaceFoldersNotification => 64
+  | .workDoneProgressCancelNotification => 65
+  | .didCreateFilesNotification => 66
+  | .didRenameFilesNotification => 67
+  | .didDeleteFilesNotification => 68
+  | .didOpenNotebookDocumentNotification => 69
+  | .didChangeNotebookDocumentNotification => 70
+  | .didSaveNotebookDocumentNotification => 71
+  | .didCloseNotebookDocumentNotification => 72
+  | .initializedNotification => 73
+  | .exitNotification => 74
+  | .didChangeConfigurationNotification => 75
+  | .showMessageNotification => 76
+  | .logMessageNotification => 77
+  | .telemetryEventNotification => 78
+  | .didOpenTextDocumentNotification => 79
+  | .didChangeTextDocumentNotification => 80
+  | .didCloseTextDocumentNotification => 81
+  | .didSaveTextDocumentNotification => 82
+  | .willSaveTextDocumentNotification => 83
+  | .didChangeWatchedFilesNotification => 84
+  | .publishDiagnosticsNotification => 85
+  | .setTraceNotification => 86
+  | .logTraceNotification => 87
+  | .cancelNotification => 88
+  | .progressNotification => 89
+
+/-- The method name as sent on the wire. -/
+def name : MethodId → String
+  | .implementationRequest => "textDocument/implementation"
+  | .typeDefinitionRequest => "textDocument/typeDefinition"
+  | .workspaceFoldersRequest => "workspace/workspaceFolders"
+  | .configurationRequest => "workspace/configuration"
+  | .documentColorRequest => "textDocument/documentColor"
+  | .colorPresentationRequest => "textDocument/colorPresentation"
+  | .foldingRangeRequest => "textDocument/foldingRange"
+  | .declarationRequest => "textDocument/declaration"
+  | .selectionRangeRequest => "textDocument/selectionRange"
+  | .workDoneProgressCreateRequest => "window/workDoneProgress/create"
+  | .callHierarchyPrepareRequest => "textDocument/prepareCallHierarchy"
+  | .callHierarchyIncomingCallsRequest => "callHierarchy/incomingCalls"
+  | .callHierarchyOutgoingCallsRequest => "callHierarchy/outgoingCalls"
+  | .semanticTokensRequest => "textDocument/semanticTokens/full"
+  | .semanticTokensDeltaRequest => "textDocument/semanticTokens/full/delta"
+  | .semanticTokensRangeRequest => "textDocument/semanticTokens/range"
+  | .semanticTokensRefreshRequest => "workspace/semanticTokens/refresh"
+  | .showDocumentRequest => "window/showDocument"
+  | .linkedEditingRangeRequest => "textDocument/linkedEditingRange"
+  | .willCreateFilesRequest => "workspace/willCreateFiles"
+  | .willRenameFilesRequest => "workspace/willRenameFiles"
+  | .willDeleteFilesRequest => "workspace/willDeleteFiles"
+  | .monikerRequest => "textDocument/moniker"
+  | .typeHierarchyPrepareRequest => "textDocument/prepareTypeHierarchy"
+  | .typeHierarchySupertypesRequest => "typeHierarchy/supertypes"
+  | .typeHierarchySubtypesRequest => "typeHierarchy/subtypes"
+  | .inlineValueRequest => "textDocument/inlineValue"
+  | .inlineValueRefreshRequest => "workspace/inlineValue/refresh"
+  | .inlayHintRequest => "textDocument/inlayHint"
+  | .inlayHintResolveRequest => "inlayHint/resolve"
+  | .inlayHintRefreshRequest => "workspace/inlayHint/refresh"
+  | .documentDiagnosticRequest => "textDocument/diagnostic"
+  | .workspaceDiagnosticRequest => "workspace/diagnostic"
+  | .diagnosticRefreshRequest => "workspace/diagnostic/refresh"
+  | .registrationRequest => "client/registerCapability"
+  | .unregistrationRequest => "client/unregisterCapability"
+  | .initializeRequest => "initialize"
+  | .shutdownRequest => "shutdown"
+  | .showMessageRequest => "window/showMessageRequest"
+  | .willSaveTextDocumentWaitUntilRequest => "textDocument/willSaveWaitUntil"
+  | .completionRequest => "textDocument/completion"
+  | .completionResolveRequest => "completionItem/resolve"
+  | .hoverRequest => "textDocument/hover"
+  | .signatureHelpRequest => "textDocument/signatureHelp"
+  | .definitionRequest => "textDocument/definition"
+  | .referencesRequest => "textDocument/references"
+  | .documentHighlightRequest => "textDocument/documentHighlight"
+  | .documentSymbolRequest => "textDocument/documentSymbol"
+  | .codeActionRequest => "textDocument/codeAction"
+  | .codeActionResolveRequest => "codeAction/resolve"
+  | .workspaceSymbolRequest => "workspace/symbol"
+  | .workspaceSymbolResolveRequest => "workspaceSymbol/resolve"
+  | .codeLensRequest => "textDocument/codeLens"
+  | .codeLensResolveRequest => "codeLens/resolve"
+  | .codeLensRefreshRequest => "workspace/codeLens/refresh"
+  | .documentLinkRequest => "textDocument/documentLink"
+  | .documentLinkResolveRequest => "documentLink/resolve"
+  | .documentFormattingRequest => "textDocument/formatting"
+  | .documentRangeFormattingRequest => "textDocument/rangeFormatting"
+  | .documentOnTypeFormattingRequest => "textDocument/onTypeFormatting"
+  | .renameRequest => "textDocument/rename"
+  | .prepareRenameRequest => "textDocument/prepareRename"
+  | .executeCommandRequest => "workspace/executeCommand"
+  | .applyWorkspaceEditRequest => "workspace/applyEdit"
+  | .didChangeWorkspaceFoldersNotification => "workspace/didChangeWorkspaceFolders"
+  | .workDoneProgressCancelNotification => "window/workDoneProgress/cancel"
+  | .didCreateFilesNotification => "workspace/didCreateFiles"
+  | .didRenameFilesNotification => "workspace/didRenameFiles"
+  | .didDeleteFilesNotification => "workspace/didDeleteFiles"
+  | .didOpenNotebookDocumentNotification => "notebookDocument/didOpen"
+  | .didChangeNotebookDocumentNotification => "notebookDocument/didChange"
+  | .didSaveNotebookDocumentNotification => "notebookDocument/didSave"
+  | .didCloseNotebookDocumentNotification => "notebookDocument/didClose"
+  | .initializedNotification => "initialized"
+  | .exitNotification => "exit"
+  | .didChangeConfigurationNotification => "workspace/didChangeConfiguration"
+  | .showMessageNotification => "window/showMessage"
+  | .logMessageNotification => "window/logMessage"
+  | .telemetryEventNotification => "telemetry/event"
+  | .didOpenTextDocumentNotification => "textDocument/didOpen"
+  | .didChangeTextDocumentNotification => "textDocument/didChange"
+  | .didCloseTextDocumentNotification => "textDocument/didClose"
+  | .didSaveTextDocumentNotification => "textDocument/didSave"
+  | .willSaveTextDocumentNotification => "textDocument/willSave"
+  | .didChangeWatchedFilesNotification => "workspace/didChangeWatchedFiles"
+  | .publishDiagnosticsNotification => "textDocument/publishDiagnostics"
+  | .setTraceNotification => "$/setTrace"
+  | .logTraceNotification => "$/logTrace"
+  | .cancelNotification => "$/cancelRequest"
+  | .progressNotification => "$/progress"
+
+/-- Seeded FNV-1a over the method name, folded to mix the high bits. -/
+def methodHash (s : String) : UInt64 :=
+  let h := s.foldl (fun h c => (h ^^^ c.toNat.toUInt64) * 1099511628211) 14695981039346656043
+  h ^^^ (h >>> 32)
+
+private def table : Array (Option MethodId) := Id.run do
+  let mut t : Array (Option MethodId) := Array.replicate 1024 none
+  t := t.set! 8 (some .completionRequest)
+  t := t.set! 9 (some .willCreateFilesRequest)
+  t := t.set! 19 (some .documentFormattingRequest)
+  t := t.set! 22 (some .telemetryEventNotification)
+  t := t.set! 47 (some .declarationRequest)
+  t := t.set! 59 (some .didOpenNotebookDocumentNotification)
+  t := t.set! 63 (some .inlineValueRefreshRequest)
+  t := t.set! 64 (some .progressNotification)
+  t := t.set! 73 (some .executeCommandRequest)
+  t := t.set! 102 (some .inlayHintRefreshRequest)
+  t := t.set! 110 (some .workspaceFoldersRequest)
+  t := t.set! 124 (some .applyWorkspaceEditRequest)
+  t := t.set! 138 (some .linkedEditingRangeRequest)
+  t := t.set! 153 (some .showMessageNotification)
+  t := t.set! 156 (some .didRenameFilesNotification)
+  t := t.set! 159 (some .prepareRenameRequest)
+  t := t.set! 166 (some .inlayHintResolveRequest)
+  t := t.set! 185 (some .workspaceSymbolRequest)
+  t := t.set! 186 (some .workDoneProgressCreateRequest)
+  t := t.set! 187 (some .implementationRequest)
+  t := t.set! 202 (some .semanticTokensRefreshRequest)
+  t := t.set! 213 (some .shutdownRequest)
+  t := t.set! 235 (some .typeHierarchySubtypesRequest)
+  t := t.set! 242 (some .foldingRangeRequest)
+  t := t.set! 265 (some .willSaveTextDocumentNotification)
+  t := t.set! 276 (some .showDocumentRequest)
+  t := t.set! 281 (some .callHierarchyPrepareRequest)
+  t := t.set! 287 (some .didSaveNotebookDocumentNotification)
+  t := t.set! 301 (some .documentOnTypeFormattingRequest)
+  t := t.set! 317 (some .willDeleteFilesRequest)
+  t := t.set! 338 (some .workspaceDiagnosticRequest)
+  t := t.set! 367 (some .definitionRequest)
+  t := t.set! 381 (some .inlayHintRequest)
+  t := t.set! 394 (some .willSaveTextDocumentWaitUntilRequest)
+  t := t.set! 397 (some .didCreateFilesNotification)
+  t := t.set! 403 (some .didChangeNotebookDocumentNotification)
+  t := t.set! 441 (some .signatureHelpRequest)
+  t := t.set! 457 (some .documentLinkResolveRequest)
+  t := t.set! 469 (some .diagnosticRefreshRequest)
+  t := t.set! 501 (some .didChangeWorkspaceFoldersNotification)
+  t := t.set! 510 (some .typeHierarchySupertypesRequest)
+  t := t.set! 513 (some .initializedNotification)
+  t := t.set! 526 (some .logTraceNotification)
+  t := t.set! 534 (some .inlineValueRequest)
+  t := t.set! 559 (some .typeHierarchyPrepareRequest)
+  t := t.set! 564 (some .setTraceNotification)
+  t := t.set! 580 (some .referencesRequest)
+  t := t.set! 584 (some .callHierarchyIncomingCallsRequest)
+  t := t.set! 601 (some .codeActionResolveRequest)
+  t := t.set! 609 (some .unregistrationRequest)
+  t := t.set! 618 (some .documentColorRequest)
+  t := t.set! 634 (some .hoverRequest)
+  t := t.set! 654 (some .codeLensRequest)
+  t := t.set! 657 (some .documentRangeFormattingRequest)
+  t := t.set! 660 (some .didChangeWatchedFilesNotification)
+  t := t.set! 663 (some .registrationRequest)
+  t := t.set! 670 (some .didCloseNotebookDocumentNotification)
+  t := t.set! 675 (some .workspaceSymbolResolveRequest)
+  t := t.set! 676 (some .codeLensResolveRequest)
+  t := t.set! 684 (some .exitNotification)
+  t := t.set! 700 (some .colorPresentationRequest)
+  t := t.set! 720 (some .documentDiagnosticRequest)
+  t := t.set! 734 (some .didSaveTextDocumentNotification)
+  t := t.set! 747 (some .publishDiagnosticsNotification)
+  t := t.set! 749 (some .selectionRangeRequest)
+  t := t.set! 753 (some .codeLensRefreshRequest)
+  t := t.set! 756 (some .callHierarchyOutgoingCallsRequest)
+  t := t.set! 758 (some .semanticTokensDeltaRequest)
+  t := t.set! 760 (some .showMessageRequest)
+  t := t.set! 778 (some .completionResolveRequest)
+  t := t.set! 788 (some .renameRequest)
+  t := t.set! 809 (some .typeDefinitionRequest)
+  t := t.set! 839 (some .workDoneProgressCancelNotification)
+  t := t.set! 879 (some .codeActionRequest)
+  t := t.set! 881 (some .willRenameFilesRequest)
+  t := t.set! 899 (some .didCloseTextDocumentNotification)
+  t := t.set! 906 (some .semanticTokensRangeRequest)
+  t := t.set! 914 (some .documentLinkRequest)
+  t := t.set! 918 (some .initializeRequest)
+  t := t.set! 921 (some .documentSymbolRequest)
+  t := t.set! 925 (some .didChangeTextDocumentNotification)
+  t := t.set! 930 (some .logMessageNotification)
+  t := t.set! 934 (some .semanticTokensRequest)
+  t := t.set! 936 (some .documentHighlightRequest)
+  t := t.set! 939 (some .didChangeConfigurationNotification)
+  t := t.set! 944 (some .cancelNotification)
+  t := t.set! 956 (some .configurationRequest)
+  t := t.set! 975 (some .didDeleteFilesNotification)
+  t := t.set! 1003 (some .didOpenTextDocumentNotification)
+  t := t.set! 1008 (some .monikerRequest)
+  return t
+
+/-- Look up a method by name with one hash, one array index and one comparison. -/
+def ofString? (s : String) : Option MethodId :=
+  match table[(methodHash s &&& 1023).toNat]? with
+  | some (some id) => if id.name == s then some id else none
+  | _ => none
+
+end MethodId
+
 end Lapis.Protocol.Generated
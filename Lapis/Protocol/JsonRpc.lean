@@ -191,6 +191,80 @@ def Message.toJson : Message → Json
 instance : ToJson Message where
   toJson := Message.toJson
 
+/-! ## Incoming Messages -/
+
+/-- Params of an incoming message, decoded on first use and then cached -/
+structure LazyParams where
+  /-- Decoded params; `none` when the message had no params -/
+  value : Thunk (Except String (Option Json))
+
+namespace LazyParams
+
+/-- Params that are already decoded -/
+def ofJson (params : Option Json) : LazyParams :=
+  { value := Thunk.pure (.ok params) }
+
+/-- Params still held as the bytes `[start, stop)` of a message body -/
+def ofSlice (body : ByteArray) (start stop : Nat) : LazyParams :=
+  { value := Thunk.mk fun _ => do
+      let some text := String.fromUTF8? (body.extract start stop)
+        | throw "params are not valid UTF-8"
+      some <$> Json.parse text }
+
+/-- Decode the params, or return the cached result -/
+def get (p : LazyParams) : Except String (Option Json) :=
+  p.value.get
+
+instance : Inhabited LazyParams := ⟨ofJson none⟩
+
+end LazyParams
+
+/-- A request as read from the transport, with its params not yet decoded -/
+structure IncomingRequest where
+  id : RequestId
+  method : String
+  params : LazyParams
+  deriving Inhabited
+
+/-- A notification as read from the transport, with its params not yet decoded -/
+structure IncomingNotification where
+  method : String
+  params : LazyParams
+  deriving Inhabited
+
+instance : Coe RequestMessage IncomingRequest where
+  coe r := { id := r.id, method := r.method, params := .ofJson r.params }
+
+instance : Coe NotificationMessage IncomingNotification where
+  coe n := { method := n.method, params := .ofJson n.params }
+
+/-- A message as read from the transport. Responses are decoded eagerly. -/
+inductive Incoming where
+  | request (msg : IncomingRequest)
+  | notification (msg : IncomingNotification)
+  | response (msg : ResponseMessage)
+  | errorResponse (msg : ErrorResponseMessage)
+  deriving Inhabited
+
+namespace Incoming
+
+def ofMessage : Message → Incoming
+  | .request msg => .request msg
+  | .notification msg => .notification msg
+  | .response msg => .response msg
+  | .errorResponse msg => .errorResponse msg
+
+/-- Decode the params, producing a fully decoded message -/
+def toMessage : Incoming → Except String Message
+  | .request msg => do
+    return .request { id := msg.id, method := msg.method, params := ← msg.params.get }
+  | .notification msg => do
+    return .notification { method := msg.method, params := ← msg.params.get }
+  | .response msg => pure (.response msg)
+  | .errorResponse msg => pure (.errorResponse msg)
+
+end Incoming
+
 def mkResponse (id : RequestId) (result : Json) : Message :=
   .response { id, result }
 
@@ -133,6 +133,15 @@ def flush (dm : DiagnosticsManager) : IO Unit := do
   for (_, job) in jobs.toList do
     let _ ← IO.wait job.task
 
+/-- Number of scheduled jobs that have not finished yet -/
+def pendingCount (dm : DiagnosticsManager) : IO Nat := do
+  let jobs ← dm.pendingJobs.get
+  let mut pending := 0
+  for (_, job) in jobs.toList do
+    unless ← IO.hasFinished job.task do
+      pending := pending + 1
+  return pending
+
 /-- Cancel all pending diagnostic jobs -/
 def cancelAll (dm : DiagnosticsManager) : IO Unit := do
   -- Atomically swap out all jobs
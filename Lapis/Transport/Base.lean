@@ -1,24 +1,76 @@
+import Std.Data.HashMap
 import Lapis.Protocol.JsonRpc
 
 namespace Lapis.Transport
 
 open Lapis.Protocol.JsonRpc
+open Std (HashMap)
 
 class Transport (T : Type) where
   readMessage : T → IO (Option Message)
+  /-- Read a message whose params may still be undecoded; transports override this
+      to skip decoding params that are never used -/
+  readIncoming : T → IO (Option Incoming) := fun t => return (← readMessage t).map .ofMessage
   writeMessage : T → Message → IO Unit
+  /-- Write several messages at once; transports override this to flush once per batch -/
+  writeMessages : T → Array Message → IO Unit := fun t msgs => msgs.forM (writeMessage t)
   close : T → IO Unit
 
 /-! ## Writer Actor for Output Channel -/
 
+/-- Default number of unsent messages before `OutputChannel.send` blocks -/
+def defaultOutputCapacity : Nat := 1024
+
+/-- Key under which a newer message replaces an unsent one: diagnostics per URI and
+    progress reports per token. Only the latest of either is worth sending. -/
+def coalesceKey? : Message → Option String
+  | .notification { method := "textDocument/publishDiagnostics", params := some params } =>
+    (params.getObjValAs? String "uri").toOption.map ("diagnostics " ++ ·)
+  | .notification { method := "$/progress", params := some params } =>
+    -- `begin` and `end` must each reach the client
+    let kind := (params.getObjValD "value").getObjValAs? String "kind"
+    if kind.toOption == some "report" then
+      (params.getObjVal? "token").toOption.map (fun token => "progress " ++ token.compress)
+    else
+      none
+  | _ => none
+
+/-- Messages not yet taken by the writer -/
+private structure Pending where
+  msgs : Array Message := #[]
+  /-- Position in `msgs` of the message holding each coalescing key -/
+  keys : HashMap String Nat := {}
+
+/-- Add `msg`, replacing an unsent message with the same key in place.
+    Returns whether it replaced one, or `none` if the queue is full. -/
+private def Pending.push? (p : Pending) (capacity : Nat) (key : Option String)
+    (msg : Message) : Option (Pending × Bool) :=
+  match key.bind p.keys.get? with
+  | some i => some ({ p with msgs := p.msgs.set! i msg }, true)
+  | none =>
+    if p.msgs.size ≥ capacity then none
+    else
+      let keys := match key with
+        | some k => p.keys.insert k p.msgs.size
+        | none => p.keys
+      some ({ msgs := p.msgs.push msg, keys }, false)
+
 /-- State for the output writer actor -/
 private structure WriterState where
   /-- Queue of pending messages -/
-  queue : IO.Ref (Array Message)
+  queue : IO.Ref Pending
+  /-- Messages the queue holds before senders wait -/
+  capacity : Nat
   /-- Signal for new messages -/
   signal : IO.Ref (IO.Promise Unit)
+  /-- Signal for senders waiting on a full queue, resolved when the writer drains it -/
+  space : IO.Ref (IO.Promise Unit)
   /-- Shutdown flag -/
   shutdown : IO.Ref Bool
+  /-- Largest queue depth seen -/
+  peak : IO.Ref Nat
+  /-- Messages that replaced an unsent one instead of being queued -/
+  coalesced : IO.Ref Nat
 
 /-- A thread-safe output channel for sending messages to the client -/
 structure OutputChannel where
@@ -30,47 +82,101 @@ structure OutputChannel where
 namespace OutputChannel
 
 /-- The writer loop that processes messages -/
-private partial def writerLoop (state : WriterState) (writeFunc : Message → IO Unit) : IO Unit := do
+private partial def writerLoop (state : WriterState) (writeBatch : Array Message → IO Unit) : IO Unit := do
+  -- Take the signal before looking at the queue: a message queued after the
+  -- check swaps this promise out and resolves it, so the wait below returns
+  let sig ← state.signal.get
+
   -- Check shutdown
   if ← state.shutdown.get then return
 
   -- Try to get messages
-  let msgs ← state.queue.swap #[]
+  let pending ← state.queue.swap {}
 
-  if msgs.isEmpty then
-    -- Wait for signal
-    let sig ← state.signal.get
-    let _ := sig.result!
-    writerLoop state writeFunc
+  if pending.msgs.isEmpty then
+    -- Block until a sender or shutdown resolves the signal
+    let _ ← IO.wait sig.result!
+    writerLoop state writeBatch
   else
-    -- Write all messages
-    for msg in msgs do
-      writeFunc msg
-    writerLoop state writeFunc
-
-/-- Create a new output channel with a writer actor -/
-def new (writeFunc : Message → IO Unit) : IO OutputChannel := do
-  let queue ← IO.mkRef #[]
-  let signal ← IO.Promise.new
+    -- The queue is empty again; wake senders waiting for room
+    let space ← state.space.swap (← IO.Promise.new)
+    space.resolve ()
+    -- Write everything drained in this wake-up together
+    writeBatch pending.msgs
+    writerLoop state writeBatch
+
+/-- Create a new output channel whose writer hands each drained batch to `writeBatch`.
+    `send` blocks while `capacity` messages are waiting; a capacity of 0 is
+    treated as 1, since no message could ever be queued. -/
+def newBatched (writeBatch : Array Message → IO Unit)
+    (capacity : Nat := defaultOutputCapacity) : IO OutputChannel := do
+  let queue ← IO.mkRef ({} : Pending)
+  let signal : IO.Promise Unit ← IO.Promise.new
   let signalRef ← IO.mkRef signal
+  let spaceSignal : IO.Promise Unit ← IO.Promise.new
+  let space ← IO.mkRef spaceSignal
   let shutdown ← IO.mkRef false
-  let state : WriterState := { queue, signal := signalRef, shutdown }
+  let peak ← IO.mkRef 0
+  let coalesced ← IO.mkRef 0
+  let state : WriterState := {
+    queue, capacity := max 1 capacity, signal := signalRef, space, shutdown, peak, coalesced
+  }
 
   -- Spawn writer actor
-  let task ← IO.asTask (prio := .default) (writerLoop state writeFunc)
+  let task ← IO.asTask (prio := .default) (writerLoop state writeBatch)
 
   return { state, task }
 
-/-- Send a message through the output channel (non-blocking) -/
+/-- Create a new output channel with a writer actor -/
+def new (writeFunc : Message → IO Unit) : IO OutputChannel :=
+  newBatched (·.forM writeFunc)
+
+/-- Queue or coalesce `msg` if there is room; false if the queue is full -/
+private def tryEnqueue (state : WriterState) (key : Option String) (msg : Message) : IO Bool := do
+  let result ← state.queue.modifyGet fun p =>
+    match p.push? state.capacity key msg with
+    | some (p', coalesced) => (some (coalesced, p'.msgs.size), p')
+    | none => (none, p)
+  match result with
+  | some (true, _) =>
+    state.coalesced.modify (· + 1)
+    return true
+  | some (false, depth) =>
+    state.peak.modify (max · depth)
+    return true
+  | none => return false
+
+/-- Queue `msg`, waiting while the queue is full -/
+private partial def enqueue (state : WriterState) (key : Option String) (msg : Message) : IO Unit := do
+  if ← tryEnqueue state key msg then return
+  -- After shutdown nothing drains the queue
+  if ← state.shutdown.get then return
+  let space ← state.space.get
+  -- Retry holding the promise, so a drain just before it is not missed
+  if ← tryEnqueue state key msg then return
+  let _ ← IO.wait space.result!
+  enqueue state key msg
+
+/-- Send a message through the output channel.
+    Blocks only while the queue is full, so a slow client slows the server down
+    instead of growing the queue without bound. -/
 def send (ch : OutputChannel) (msg : Message) : IO Unit := do
-  -- Add message to queue
-  ch.state.queue.modify (·.push msg)
-  -- Signal the writer
-  let sig ← ch.state.signal.get
+  enqueue ch.state (coalesceKey? msg) msg
+  -- Signal the writer, leaving a fresh promise for its next wait
+  let sig ← ch.state.signal.swap (← IO.Promise.new)
   sig.resolve ()
-  -- Create new signal for next wait
-  let newSig ← IO.Promise.new
-  ch.state.signal.set newSig
+
+/-- Number of messages waiting for the writer -/
+def queueSize (ch : OutputChannel) : IO Nat := do
+  return (← ch.state.queue.get).msgs.size
+
+/-- Largest number of messages that have waited for the writer at once -/
+def peakQueueSize (ch : OutputChannel) : IO Nat :=
+  ch.state.peak.get
+
+/-- Number of diagnostics and progress reports that replaced an unsent one -/
+def coalescedCount (ch : OutputChannel) : IO Nat :=
+  ch.state.coalesced.get
 
 /-- Send a notification through the output channel -/
 def sendNotification (ch : OutputChannel) (method : String) (params : Lean.Json) : IO Unit := do
@@ -88,6 +194,8 @@ def shutdown (ch : OutputChannel) : IO Unit := do
   -- Signal to wake up the writer if it's waiting
   let sig ← ch.state.signal.get
   sig.resolve ()
+  -- Release senders waiting for room; they drop their messages
+  (← ch.state.space.get).resolve ()
   -- Wait for writer to finish
   let _ ← IO.wait ch.task
 
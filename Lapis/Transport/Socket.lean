@@ -0,0 +1,145 @@
+/-
+  TCP transport for LSP
+
+  A connection carries the same Content-Length framed messages as stdio, so
+  the socket is wrapped in an `IO.FS.Stream` and framed by the stdio reader
+  and writer. A `Listener` accepts connections; `Dispatcher.runHost` serves
+  each one as its own session.
+
+  Sockets come from `Std.Internal.Async.TCP`, which is not a stable API. Its
+  types appear only in private definitions here, so a toolchain that changes
+  it needs changes to this file alone. It is written against the API where
+  `Server.accept`, `Client.recv?` and `Client.send` return an `AsyncTask`
+  (Lean v4.18 to v4.21), which later toolchains replaced. So this module and
+  `Concurrent.Tcp` make up the separate `LapisTcp` library: `Lapis` does not
+  import them, and the default build does not depend on this API.
+-/
+import Std.Internal.Async.TCP
+import Lapis.Transport.Base
+import Lapis.Transport.Stdio
+
+namespace Lapis.Transport.Socket
+
+open Std.Internal.IO.Async
+open Std.Net
+open Lapis.Protocol.JsonRpc
+open Lapis.Transport.Stdio (StdioTransport)
+
+/-- Block the calling thread until a socket operation completes -/
+private def await (op : IO (AsyncTask α)) : IO α := do
+  IO.ofExcept (← IO.wait (← op))
+
+/-- Bytes requested per receive; `recv?` returns as soon as any have arrived -/
+def recvChunkSize : UInt64 := 65536
+
+/-- Bytes received from the peer but not read yet; `data[pos:]` is unread -/
+private structure Received where
+  data : ByteArray := ByteArray.empty
+  pos : Nat := 0
+
+/-- Receive more bytes into the buffer, dropping those already read; false once the
+    peer has closed the connection -/
+private def receive (client : TCP.Socket.Client) (buf : IO.Ref Received) : IO Bool := do
+  let some chunk ← await (client.recv? recvChunkSize) | return false
+  if chunk.size == 0 then return false
+  buf.modify fun r => { data := r.data.extract r.pos r.data.size ++ chunk, pos := 0 }
+  return true
+
+/-- Index of the first newline in `data` at or after `start` -/
+private def findNewline (data : ByteArray) (start : Nat) : Option Nat := Id.run do
+  for i in [start:data.size] do
+    if data[i]! == 0x0A then return some i
+  return none
+
+private def decodeLine (bytes : ByteArray) : IO String :=
+  match String.fromUTF8? bytes with
+  | some line => return line
+  | none => throw (IO.userError "received a line that is not valid UTF-8")
+
+/-- The next line including its newline; the rest of the input at EOF -/
+private partial def takeLine (client : TCP.Socket.Client) (buf : IO.Ref Received)
+    (scanFrom : Nat := 0) : IO String := do
+  let r ← buf.get
+  match findNewline r.data (max r.pos scanFrom) with
+  | some i =>
+    buf.set { r with pos := i + 1 }
+    decodeLine (r.data.extract r.pos (i + 1))
+  | none =>
+    let unread := r.data.size - r.pos
+    if ← receive client buf then
+      -- Unread bytes were moved to the front; only the new ones need scanning
+      takeLine client buf unread
+    else
+      buf.set {}
+      decodeLine (r.data.extract r.pos r.data.size)
+
+/-- The connection as a byte stream. Reads return what has arrived, up to the size
+    asked for, and an empty array once the peer closes the connection. -/
+private def streamOf (client : TCP.Socket.Client) : IO IO.FS.Stream := do
+  let buf ← IO.mkRef ({} : Received)
+  return {
+    flush := pure ()
+    read := fun n => do
+      let r ← buf.get
+      if r.pos < r.data.size then
+        let stop := min r.data.size (r.pos + n.toNat)
+        buf.set { r with pos := stop }
+        return r.data.extract r.pos stop
+      return (← await (client.recv? n.toUInt64)).getD ByteArray.empty
+    write := fun bytes => await (client.send bytes)
+    getLine := takeLine client buf
+    putStr := fun s => await (client.send s.toUTF8)
+    isTty := pure false
+  }
+
+/-- An LSP connection over TCP. The socket itself stays private to this module,
+    so only this file depends on `Std.Internal.Async.TCP`. -/
+structure SocketTransport where
+  framed : StdioTransport
+  shutdown : IO Unit
+
+/-- Frame messages over an accepted socket -/
+private def ofClient (client : TCP.Socket.Client) : IO SocketTransport := do
+  let stream ← streamOf client
+  return {
+    framed := Stdio.ofStreams stream stream
+    shutdown := await client.shutdown
+  }
+
+def close (t : SocketTransport) : IO Unit := do
+  try t.shutdown catch _ => pure ()  -- the peer may have gone already
+
+instance : Transport SocketTransport where
+  readMessage t := Stdio.readMessage t.framed
+  readIncoming t := Stdio.readIncoming t.framed
+  writeMessage t := Stdio.writeMessage t.framed
+  writeMessages t := Stdio.writeMessages t.framed
+  close := close
+
+/-! ## Listening -/
+
+/-- A bound TCP socket accepting LSP connections -/
+structure Listener where
+  /-- The port bound, which the system picks when listening on port 0 -/
+  port : UInt16
+  /-- Wait for the next connection -/
+  accept : IO SocketTransport
+
+/-- Listen on `port`, on the loopback interface unless `host` says otherwise.
+    Port 0 lets the system pick a free port; `Listener.port` reports it. -/
+def listenTcp (port : UInt16) (host : IPv4Addr := IPv4Addr.ofParts 127 0 0 1)
+    (backlog : UInt32 := 128) : IO Listener := do
+  let server ← TCP.Socket.Server.mk
+  server.bind (.v4 { addr := host, port })
+  server.listen backlog
+  let bound := match ← server.getSockName with
+    | .v4 addr => addr.port
+    | .v6 addr => addr.port
+  let accept := do
+    let client ← await server.accept
+    -- Responses are written a batch at a time, so don't hold small ones back
+    client.noDelay
+    ofClient client
+  return { port := bound, accept }
+
+end Lapis.Transport.Socket
@@ -1,64 +1,61 @@
 /- stdin/stdout transport for LSP -/
 import Lapis.Transport.Base
+import Lapis.Protocol.Envelope
 
 namespace Lapis.Transport.Stdio
 
 open Lapis.Protocol.JsonRpc
+open Lapis.Protocol.Envelope
 open Lean Json
 
+/-- Content-Length framing over a pair of byte streams; stdin and stdout unless
+    built with `ofStreams` -/
 structure StdioTransport where
   stdin : IO.FS.Stream
   stdout : IO.FS.Stream
 
+/-- Frame messages over `input` and `output` instead of the process's stdio -/
+def ofStreams (input output : IO.FS.Stream) : StdioTransport :=
+  { stdin := input, stdout := output }
+
 def create : IO StdioTransport := do
-  let stdin ← IO.getStdin
-  let stdout ← IO.getStdout
-  return { stdin, stdout }
-
-private def readByte (stream : IO.FS.Stream) : IO (Option UInt8) := do
-  let buf ← stream.read 1
-  if buf.size == 0 then
-    return none
-  else
-    return some buf[0]!
-
-private def readUntil (stream : IO.FS.Stream) (delim : ByteArray) : IO (Option ByteArray) := do
-  let mut result : ByteArray := ByteArray.empty
-  let mut matchIdx := 0
-
-  while true do
-    match ← readByte stream with
-    | none => return none  -- EOF
-    | some b =>
-      result := result.push b
-
-      if b == delim[matchIdx]! then
-        matchIdx := matchIdx + 1
-        if matchIdx == delim.size then
-          let endIdx := result.size - delim.size
-          return some (result.extract 0 endIdx)
-      else
-        matchIdx := 0
-
-  return none
-
-private def parseHeaders (headerBlock : String) : Except String (List (String × String)) := do
-  let lines := headerBlock.splitOn "\r\n"
+  return ofStreams (← IO.getStdin) (← IO.getStdout)
+
+/-- Read header lines up to the blank line ending them; `none` at EOF.
+    `getLine` returns as soon as a line is complete and is served from the
+    stream's own buffer. A fixed-size `read` would instead wait on a pipe until
+    the whole size arrived, long after a client has sent its one message. -/
+private partial def readHeaderLines (stream : IO.FS.Stream) (lines : Array String := #[]) :
+    IO (Option (Array String)) := do
+  let line ← stream.getLine
+  if line.isEmpty then return none  -- EOF
+  let line := line.trimRight
+  if line.isEmpty then return some lines
+  readHeaderLines stream (lines.push line)
+
+/-- Read exactly `n` bytes, or fewer at EOF -/
+private def readExact (stream : IO.FS.Stream) (n : Nat) : IO ByteArray := do
+  let mut result := ByteArray.empty
+  while result.size < n do
+    let chunk ← stream.read (n - result.size).toUSize
+    if chunk.size == 0 then break
+    result := result ++ chunk
+  return result
+
+private def parseHeaders (lines : Array String) : Except String (List (String × String)) := do
   let mut headers := []
   for line in lines do
-    if line.isEmpty then continue
     match line.splitOn ": " with
     | [key, value] => headers := (key.toLower, value) :: headers
     | _ => throw s!"Invalid header line: {line}"
   return headers
 
-def readMessage (t : StdioTransport) : IO (Option Message) := do
-  let headerDelim := "\r\n\r\n".toUTF8
-  let some headerBytes ← readUntil t.stdin headerDelim
+/-- Read the next message body; `none` at EOF -/
+private def readBody (t : StdioTransport) : IO (Option ByteArray) := do
+  let some headerLines ← readHeaderLines t.stdin
     | return none
 
-  let headerStr := String.fromUTF8! headerBytes
-  let headers ← IO.ofExcept (parseHeaders headerStr)
+  let headers ← IO.ofExcept (parseHeaders headerLines)
 
   let some (_, lengthStr) := headers.find? (·.1 == "content-length")
     | throw (IO.userError "Missing Content-Length header")
@@ -66,33 +63,45 @@ def readMessage (t : StdioTransport) : IO (Option Message) := do
   let some contentLength := lengthStr.toNat?
     | throw (IO.userError s!"Invalid Content-Length: {lengthStr}")
 
-  let content ← t.stdin.read contentLength.toUSize
+  let content ← readExact t.stdin contentLength
   if content.size != contentLength then
     throw (IO.userError s!"Unexpected EOF: expected {contentLength} bytes, got {content.size}")
+  return some content
 
-  let contentStr := String.fromUTF8! content
-
-  let json ← IO.ofExcept (Json.parse contentStr)
-  let msg ← IO.ofExcept (Message.fromJson? json)
-
-  return some msg
+/-- Read a message, leaving request and notification params as body bytes -/
+def readIncoming (t : StdioTransport) : IO (Option Incoming) := do
+  let some content ← readBody t
+    | return none
+  return some (← IO.ofExcept (parseIncoming content))
 
-def writeMessage (t : StdioTransport) (msg : Message) : IO Unit := do
-  let json := toJson msg
-  let content := json.compress
-  let contentBytes := content.toUTF8
+def readMessage (t : StdioTransport) : IO (Option Message) := do
+  let some incoming ← readIncoming t
+    | return none
+  return some (← IO.ofExcept incoming.toMessage)
 
+/-- Frame a message with its Content-Length header -/
+def encodeMessage (msg : Message) : ByteArray :=
+  let contentBytes := (toJson msg).compress.toUTF8
   let header := s!"Content-Length: {contentBytes.size}\r\n\r\n"
+  header.toUTF8 ++ contentBytes
 
-  t.stdout.write header.toUTF8
-  t.stdout.write contentBytes
+/-- Write a batch of messages with a single write and flush -/
+def writeMessages (t : StdioTransport) (msgs : Array Message) : IO Unit := do
+  if msgs.isEmpty then return
+  let out := msgs.foldl (fun out msg => out ++ encodeMessage msg) ByteArray.empty
+  t.stdout.write out
   t.stdout.flush
 
+def writeMessage (t : StdioTransport) (msg : Message) : IO Unit :=
+  writeMessages t #[msg]
+
 def close (_ : StdioTransport) : IO Unit := pure ()
 
 instance : Transport StdioTransport where
   readMessage := readMessage
+  readIncoming := readIncoming
   writeMessage := writeMessage
+  writeMessages := writeMessages
   close := close
 
 end Lapis.Transport.Stdio
@@ -0,0 +1,4 @@
+import Lapis
+
+import Lapis.Transport.Socket
+import Lapis.Concurrent.Tcp
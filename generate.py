@@ -1,10 +1,29 @@
 #!/usr/bin/env python3
 
+import argparse
 import json
+import re
+import resource
+import sys
+import time
 from collections import defaultdict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
+
+ROOT = Path(__file__).parent
+
+FNV_OFFSET = 0xCBF29CE484222325
+FNV_PRIME = 0x100000001B3
+UINT64_MASK = (1 << 64) - 1
+
+# Seeds tried per table size before doubling it when searching for a perfect hash
+METHOD_HASH_ATTEMPTS = 256
+
+# Enumerations with at least this many values decode through a lookup table
+ENUM_TABLE_MIN_SIZE = 8
+
+LEAN_IDENT = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
 
 LEAN_KEYWORDS = {
     "end",
@@ -84,23 +103,16 @@ FORCE_JSON_TYPES = {
     "LSPObject",
     "LSPArray",
     "DocumentSelector",
-    # Recursive types
-    "FoldingRange",
-    "SelectionRange",
-    "Moniker",
-    "InlayHint",
+    # Hand-written modules define their own types under these names
+    # (Protocol.Messages, Protocol.Types, Protocol.Capabilities and
+    # Server.WorkspaceEdit). References stay Json so generated structures
+    # do not pin the generated variants.
     "CompletionItem",
-    "DocumentHighlight",
-    "DocumentSymbol",
-    "CodeAction",
     "CreateFile",
     "RenameFile",
     "DeleteFile",
     "Diagnostic",
-    "FileOperationPattern",
-    "NotebookCell",
     "ClientCapabilities",
-    "WorkspaceClientCapabilities",
     # Proposed types that are referenced
     "InlineCompletionItem",
     "TextDocumentContentOptions",
@@ -157,6 +169,49 @@ class GeneratorContext:
     enumerations: dict[str, Any]
     type_aliases: dict[str, Any]
     all_names: set = field(default_factory=set)
+    type_cache: dict[int, str] = field(default_factory=dict)
+    resolved: dict[str, "ResolvedStructure"] = field(default_factory=dict)
+
+
+@dataclass(slots=True, frozen=True)
+class ResolvedField:
+    """A structure field with its Lean name and resolved type."""
+
+    name: str
+    json_name: str
+    lean_type: str
+    optional: bool
+
+    @property
+    def is_json(self) -> bool:
+        return self.lean_type == "Json"
+
+    @property
+    def inner_type(self) -> str:
+        """The field type with any `Option` wrapper removed."""
+        if self.lean_type.startswith("(Option"):
+            return self.lean_type[8:-1]
+        return self.lean_type
+
+
+@dataclass(slots=True, frozen=True)
+class ResolvedStructure:
+    """A structure with inherited properties flattened and deduplicated."""
+
+    name: str
+    documentation: Optional[str]
+    fields: tuple[ResolvedField, ...]
+
+
+@dataclass(slots=True, frozen=True)
+class DeclarationStats:
+    """Size of one emitted declaration, as reported by `--stats`."""
+
+    name: str
+    section: str
+    lines: int
+    fields: int
+    json_fields: int
 
 
 def get_type_references(typ: dict) -> set[str]:
@@ -251,40 +306,101 @@ def type_to_lean(typ: dict, ctx: GeneratorContext, parent_name: str = "") -> str
         return "Json"
 
 
-def topological_sort(items: list[dict], ctx: GeneratorContext, get_deps) -> list[dict]:
-    """Topologically sort items based on dependencies."""
+def strongly_connected_components(items: list[dict], get_deps) -> list[list[dict]]:
+    """Group items into strongly connected components, dependencies first.
+
+    This is an iterative Tarjan's algorithm, linear in the size of the graph.
+    Items inside a component keep their input order.
+    """
     name_to_item = {item["name"]: item for item in items}
-    in_degree = {item["name"]: 0 for item in items}
-    graph = defaultdict(list)
-
-    for item in items:
-        deps = get_deps(item)
-        for dep in deps:
-            if (
-                dep in name_to_item
-                and dep != item["name"]
-                and dep not in FORCE_JSON_TYPES
-            ):
-                graph[dep].append(item["name"])
-                in_degree[item["name"]] += 1
-
-    result = []
-    queue = [name for name, degree in in_degree.items() if degree == 0]
-
-    while queue:
-        name = queue.pop(0)
-        result.append(name_to_item[name])
-        for neighbor in graph[name]:
-            in_degree[neighbor] -= 1
-            if in_degree[neighbor] == 0:
-                queue.append(neighbor)
-
-    remaining = [
-        item for item in items if item["name"] not in {r["name"] for r in result}
-    ]
-    result.extend(remaining)
+    position = {name: i for i, name in enumerate(name_to_item)}
+    edges = {
+        name: sorted(d for d in get_deps(item) if d in name_to_item)
+        for name, item in name_to_item.items()
+    }
+
+    index: dict[str, int] = {}
+    low: dict[str, int] = {}
+    stack: list[str] = []
+    on_stack: set[str] = set()
+    components = []
+
+    def visit(name: str):
+        index[name] = low[name] = len(index)
+        stack.append(name)
+        on_stack.add(name)
+
+    for root in name_to_item:
+        if root in index:
+            continue
+        visit(root)
+        work = [(root, iter(edges[root]))]
+        while work:
+            name, deps = work[-1]
+            descended = False
+            for dep in deps:
+                if dep not in index:
+                    visit(dep)
+                    work.append((dep, iter(edges[dep])))
+                    descended = True
+                    break
+                if dep in on_stack:
+                    low[name] = min(low[name], index[dep])
+            if descended:
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[name])
+
+            if low[name] == index[name]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == name:
+                        break
+                component.sort(key=position.__getitem__)
+                components.append([name_to_item[m] for m in component])
+
+    return components
+
+
+def reachable_types(metamodel: dict, roots: set[str], keep: set[str]) -> set[str]:
+    """Names of all types transitively referenced from the given methods.
+
+    A method contributes its params, result, partial result, registration
+    options and error data. `keep` adds extra type roots, such as types that
+    hand-written modules use directly.
+    """
+    structures = {s["name"]: s for s in metamodel["structures"]}
+    aliases = {t["name"]: t for t in metamodel["typeAliases"]}
+
+    pending = set(keep)
+    for msg in metamodel["requests"] + metamodel["notifications"]:
+        if msg["method"] not in roots:
+            continue
+        for key in ("params", "result", "partialResult", "registrationOptions", "errorData"):
+            typ = msg.get(key)
+            # Positional params are given as a list of types
+            for t in typ if isinstance(typ, list) else [typ]:
+                if isinstance(t, dict):
+                    pending.update(get_type_references(t))
+
+    reached = set()
+    while pending:
+        name = pending.pop()
+        if name in reached:
+            continue
+        reached.add(name)
+        if name in structures:
+            pending.update(get_structure_deps(structures[name]))
+        elif name in aliases:
+            pending.update(get_type_references(aliases[name]["type"]))
 
-    return result
+    return reached
 
 
 def get_structure_deps(struct: dict) -> set[str]:
@@ -303,63 +419,124 @@ def get_structure_deps(struct: dict) -> set[str]:
     return deps
 
 
-def generate_structure(struct: dict, ctx: GeneratorContext) -> str:
-    """Generate a Lean structure from an LSP structure."""
-    name = to_lean_type_name(struct["name"])
-    props = struct.get("properties", [])
-    extends = struct.get("extends", [])
-    mixins = struct.get("mixins", [])
+def resolved_structure_deps(struct: dict, ctx: GeneratorContext) -> set[str]:
+    """Generated types a structure's Lean definition actually mentions.
 
-    lines = []
+    Unlike `get_structure_deps`, references that collapse to `Json` (unions,
+    maps, forced types) are not dependencies, so they cannot create cycles.
+    """
+    deps = set()
+    for f in resolve_structure(struct, ctx).fields:
+        deps.update(LEAN_IDENT.findall(f.lean_type))
+    return deps & ctx.all_names
 
-    if struct.get("documentation"):
-        doc = (
-            struct["documentation"]
-            .replace("\n", " ")
-            .replace('"', "'")
-            .replace("--", "- -")
-        )
-        if len(doc) > 300:
-            doc = doc[:300] + "..."
-        lines.append(f"/-- {doc} -/")
 
-    lines.append(f"structure {name} where")
+def alias_lean_type(alias: dict, ctx: GeneratorContext) -> str:
+    """The Lean type a type alias abbreviates."""
+    name = to_lean_type_name(alias["name"])
+    if name in FORCE_JSON_TYPES:
+        return "Json"
+    return type_to_lean(alias["type"], ctx, name)
 
-    all_props = []
 
-    for ext in extends:
-        if ext["kind"] == "reference":
-            ext_name = ext["name"]
-            if ext_name in ctx.structures and ext_name not in FORCE_JSON_TYPES:
-                ext_struct = ctx.structures[ext_name]
-                all_props.extend(ext_struct.get("properties", []))
+def resolved_alias_deps(alias: dict, ctx: GeneratorContext) -> set[str]:
+    """Generated types a type alias's Lean definition actually mentions."""
+    return set(LEAN_IDENT.findall(alias_lean_type(alias, ctx))) & ctx.all_names
 
-    for mixin in mixins:
-        if mixin["kind"] == "reference":
-            mixin_name = mixin["name"]
-            if mixin_name in ctx.structures and mixin_name not in FORCE_JSON_TYPES:
-                mixin_struct = ctx.structures[mixin_name]
-                all_props.extend(mixin_struct.get("properties", []))
 
-    all_props.extend(props)
+def is_recursive(component: list[dict], ctx: GeneratorContext) -> bool:
+    """Whether a component needs recursive definitions."""
+    if len(component) > 1:
+        return True
+    struct = component[0]
+    return struct["name"] in resolved_structure_deps(struct, ctx)
+
+
+def resolve_type(typ: dict, ctx: GeneratorContext) -> str:
+    """Memoized `type_to_lean` for property types.
+
+    Property type dicts are owned by the metamodel, which outlives the context,
+    so their identity is a stable cache key.
+    """
+    key = id(typ)
+    resolved = ctx.type_cache.get(key)
+    if resolved is None:
+        resolved = type_to_lean(typ, ctx)
+        ctx.type_cache[key] = resolved
+    return resolved
+
+
+def format_doc(doc: str, limit: int) -> str:
+    """Flatten and truncate documentation so it fits in a Lean doc comment."""
+    doc = doc.replace("\n", " ").replace('"', "'").replace("--", "- -")
+    if len(doc) > limit:
+        doc = doc[:limit] + "..."
+    return doc
+
+
+def resolve_structure(struct: dict, ctx: GeneratorContext) -> ResolvedStructure:
+    """Flatten a structure's inherited properties and resolve their types once."""
+    name = struct["name"]
+    cached = ctx.resolved.get(name)
+    if cached is not None:
+        return cached
+
+    all_props = []
+    for parent in struct.get("extends", []) + struct.get("mixins", []):
+        if (
+            parent["kind"] == "reference"
+            and parent["name"] in ctx.structures
+            and parent["name"] not in FORCE_JSON_TYPES
+        ):
+            all_props.extend(ctx.structures[parent["name"]].get("properties", []))
+    all_props.extend(struct.get("properties", []))
 
     seen = set()
-    unique_props = []
-    for p in all_props:
-        if p["name"] not in seen:
-            seen.add(p["name"])
-            unique_props.append(p)
+    fields = []
+    for prop in all_props:
+        if prop["name"] in seen:
+            continue
+        seen.add(prop["name"])
+        fields.append(
+            ResolvedField(
+                name=to_lean_field_name(prop["name"]),
+                json_name=prop["name"],
+                lean_type=resolve_type(prop["type"], ctx),
+                optional=bool(prop.get("optional")),
+            )
+        )
+
+    doc = struct.get("documentation")
+    resolved = ResolvedStructure(
+        name=to_lean_type_name(name),
+        documentation=format_doc(doc, 300) if doc else None,
+        fields=tuple(fields),
+    )
+    ctx.resolved[name] = resolved
+    return resolved
+
+
+def generate_structure(struct: ResolvedStructure, derive: bool = True) -> str:
+    """Generate a Lean structure from a resolved LSP structure.
+
+    Members of a mutual block pass `derive=False` and derive `Inhabited`
+    together after the block instead.
+    """
+    lines = []
+
+    if struct.documentation:
+        lines.append(f"/-- {struct.documentation} -/")
 
-    if not unique_props:
+    lines.append(f"structure {struct.name} where")
+
+    if not struct.fields:
         lines.append("  dummy : Unit := ()")
-        lines.append("  deriving Inhabited")
     else:
-        for prop in unique_props:
-            field_name = to_lean_field_name(prop["name"])
-            field_type = type_to_lean(prop["type"], ctx, name)
+        for f in struct.fields:
+            field_type = f.lean_type
 
-            if prop.get("optional"):
-                if field_type == "Json":
+            if f.optional:
+                if f.is_json:
                     # Json fields use Json.null as default
                     default = " := Json.null"
                 elif not field_type.startswith("(Option"):
@@ -370,138 +547,160 @@ def generate_structure(struct: dict, ctx: GeneratorContext) -> str:
             else:
                 default = ""
 
-            lines.append(f"  {field_name} : {field_type}{default}")
+            lines.append(f"  {f.name} : {field_type}{default}")
 
+    if derive:
         lines.append("  deriving Inhabited")
 
     return "\n".join(lines)
 
 
-def generate_tojson_instance(struct: dict, ctx: GeneratorContext) -> str:
-    """Generate ToJson instance for a structure."""
-    name = to_lean_type_name(struct["name"])
-    extends = struct.get("extends", [])
-    mixins = struct.get("mixins", [])
+def tojson_body(struct: ResolvedStructure, indent: str = "    ") -> list[str]:
+    """Lines of a term encoding a non-empty structure bound to `s`.
+
+    The entry list is built back to front by consing onto one accumulator, so
+    each emitted field costs a single list cell. There are no singleton lists
+    and no `++` copies. `Json.mkObj` sorts keys into the same tree whatever the
+    insertion order, so the encoded JSON is unchanged.
+    """
+    lines = [f"{indent}let kvs : List (String × Json) := []"]
+    required: list[str] = []
+
+    def flush():
+        if required:
+            lines.append(f"{indent}let kvs := {' :: '.join(reversed(required))} :: kvs")
+            required.clear()
+
+    for f in reversed(struct.fields):
+        entry = f'("{f.json_name}", toJson s.{f.name})'
+        # Optional fields are only emitted when present; Json fields always are
+        if f.optional and not f.is_json:
+            flush()
+            lines.append(
+                f'{indent}let kvs := (match s.{f.name} with | some v => ("{f.json_name}", toJson v) :: kvs | none => kvs)'
+            )
+        else:
+            required.append(entry)
+    flush()
+
+    lines.append(f"{indent}Json.mkObj kvs")
+    return lines
+
+
+def fromjson_body(struct: ResolvedStructure) -> list[str]:
+    """The `do`-block lines decoding a non-empty structure from `json`.
+
+    Each field is one tree lookup on the object's entries, as `getObjVal?`
+    does, but a missing key is an `Option` rather than a "property not found"
+    error. Absent optional fields therefore no longer allocate an error message
+    only to discard it. The object is bound to `_obj`, which no escaped field
+    name can shadow.
+    """
+    lines = ["    let _obj ← json.getObj?"]
+    for f in struct.fields:
+        lookup = f'_obj.find compare "{f.json_name}"'
+        if f.is_json:
+            # For Json fields, just take the value or use null
+            lines.append(f"    let {f.name} : Json := ({lookup}).getD Json.null")
+        elif f.optional:
+            lines.append(
+                f"    let {f.name} : Option {f.inner_type} := ({lookup}).bind fun v => (fromJson? v).toOption"
+            )
+        else:
+            lines.append(
+                f"    let {f.name} : {f.lean_type} ← match {lookup} with"
+                f' | some v => fromJson? v | none => throw "property not found: {f.json_name}"'
+            )
 
-    all_props = []
-    for ext in extends:
-        if (
-            ext["kind"] == "reference"
-            and ext["name"] in ctx.structures
-            and ext["name"] not in FORCE_JSON_TYPES
-        ):
-            all_props.extend(ctx.structures[ext["name"]].get("properties", []))
-    for mixin in mixins:
-        if (
-            mixin["kind"] == "reference"
-            and mixin["name"] in ctx.structures
-            and mixin["name"] not in FORCE_JSON_TYPES
-        ):
-            all_props.extend(ctx.structures[mixin["name"]].get("properties", []))
-    all_props.extend(struct.get("properties", []))
+    field_list = ", ".join(f.name for f in struct.fields)
+    lines.append(f"    return {{ {field_list} }}")
+    return lines
 
-    seen = set()
-    unique_props = []
-    for p in all_props:
-        if p["name"] not in seen:
-            seen.add(p["name"])
-            unique_props.append(p)
 
-    lines = [f"instance : ToJson {name} where"]
+def generate_tojson_instance(struct: ResolvedStructure) -> str:
+    """Generate ToJson instance for a structure."""
+    lines = [f"instance : ToJson {struct.name} where"]
 
-    if not unique_props:
+    if not struct.fields:
         lines.append("  toJson _ := Json.mkObj []")
     else:
-        lines.append("  toJson s := Json.mkObj <|")
-        parts = []
-        for prop in unique_props:
-            field_name = to_lean_field_name(prop["name"])
-            json_name = prop["name"]
-            field_type = type_to_lean(prop["type"], ctx, name)
-
-            # For optional fields or Json types, handle specially
-            if prop.get("optional") and field_type != "Json":
-                parts.append(
-                    f'    (match s.{field_name} with | some v => [("{json_name}", toJson v)] | none => [])'
-                )
-            else:
-                parts.append(f'    [("{json_name}", toJson s.{field_name})]')
-
-        lines.append(" ++\n".join(parts))
+        lines.append("  toJson s :=")
+        lines.extend(tojson_body(struct))
 
     return "\n".join(lines)
 
 
-def generate_fromjson_instance(struct: dict, ctx: GeneratorContext) -> str:
+def generate_fromjson_instance(struct: ResolvedStructure) -> str:
     """Generate FromJson instance for a structure."""
-    name = to_lean_type_name(struct["name"])
-    extends = struct.get("extends", [])
-    mixins = struct.get("mixins", [])
-
-    all_props = []
-    for ext in extends:
-        if (
-            ext["kind"] == "reference"
-            and ext["name"] in ctx.structures
-            and ext["name"] not in FORCE_JSON_TYPES
-        ):
-            all_props.extend(ctx.structures[ext["name"]].get("properties", []))
-    for mixin in mixins:
-        if (
-            mixin["kind"] == "reference"
-            and mixin["name"] in ctx.structures
-            and mixin["name"] not in FORCE_JSON_TYPES
-        ):
-            all_props.extend(ctx.structures[mixin["name"]].get("properties", []))
-    all_props.extend(struct.get("properties", []))
+    lines = [f"instance : FromJson {struct.name} where"]
 
-    seen = set()
-    unique_props = []
-    for p in all_props:
-        if p["name"] not in seen:
-            seen.add(p["name"])
-            unique_props.append(p)
-
-    lines = [f"instance : FromJson {name} where"]
-
-    if not unique_props:
+    if not struct.fields:
         lines.append(f"  fromJson? _ := return {{ dummy := () }}")
     else:
         lines.append("  fromJson? json := do")
-        for prop in unique_props:
-            field_name = to_lean_field_name(prop["name"])
-            json_name = prop["name"]
-            field_type = type_to_lean(prop["type"], ctx, name)
-
-            if field_type == "Json":
-                # For Json fields, just get the value or use null
-                if prop.get("optional"):
-                    lines.append(
-                        f'    let {field_name} := json.getObjVal? "{json_name}" |>.toOption |>.getD Json.null'
-                    )
-                else:
-                    lines.append(
-                        f'    let {field_name} := json.getObjVal? "{json_name}" |>.toOption |>.getD Json.null'
-                    )
-            elif prop.get("optional"):
-                if field_type.startswith("(Option"):
-                    inner_type = field_type[8:-1]
-                else:
-                    inner_type = field_type
-                lines.append(
-                    f'    let {field_name} := (json.getObjValAs? {inner_type} "{json_name}").toOption'
-                )
-            else:
-                lines.append(
-                    f'    let {field_name} ← json.getObjValAs? {field_type} "{json_name}"'
-                )
-
-        field_list = ", ".join(to_lean_field_name(p["name"]) for p in unique_props)
-        lines.append(f"    return {{ {field_list} }}")
+        lines.extend(fromjson_body(struct))
 
     return "\n".join(lines)
 
 
+def generate_structure_block(struct: dict, ctx: GeneratorContext) -> str:
+    """Generate a structure together with its JSON instances."""
+    resolved = resolve_structure(struct, ctx)
+    return "\n\n".join(
+        [
+            generate_structure(resolved),
+            generate_tojson_instance(resolved),
+            generate_fromjson_instance(resolved),
+        ]
+    )
+
+
+def generate_recursive_block(component: list[dict], ctx: GeneratorContext) -> str:
+    """Generate a group of (mutually) recursive structures and their JSON instances.
+
+    The instances are `partial def`s that bring the group's own instances into
+    scope with `letI`, so nested occurrences such as `Array DocumentSymbol`
+    resolve to the definition being written.
+    """
+    members = [resolve_structure(struct, ctx) for struct in component]
+    names = [m.name for m in members]
+    mutual = len(members) > 1
+
+    def wrap(decls: list[str]) -> str:
+        body = "\n\n".join(decls)
+        return f"mutual\n{body}\nend" if mutual else body
+
+    blocks = []
+    blocks.append(wrap([generate_structure(m, derive=not mutual) for m in members]))
+    if mutual:
+        blocks.append(f"deriving instance Inhabited for {', '.join(names)}")
+
+    tojson = []
+    for m in members:
+        lines = [f"partial def {m.name}.toJsonImpl (s : {m.name}) : Json :="]
+        lines.extend(f"  letI : ToJson {n} := ⟨{n}.toJsonImpl⟩" for n in names)
+        lines.extend(tojson_body(m, indent="  "))
+        tojson.append("\n".join(lines))
+    blocks.append(wrap(tojson))
+    blocks.append(
+        "\n".join(f"instance : ToJson {n} := ⟨{n}.toJsonImpl⟩" for n in names)
+    )
+
+    fromjson = []
+    for m in members:
+        lines = [f"partial def {m.name}.fromJsonImpl (json : Json) : Except String {m.name} :="]
+        lines.extend(f"  letI : FromJson {n} := ⟨{n}.fromJsonImpl⟩" for n in names)
+        lines.append("  do")
+        lines.extend(fromjson_body(m))
+        fromjson.append("\n".join(lines))
+    blocks.append(wrap(fromjson))
+    blocks.append(
+        "\n".join(f"instance : FromJson {n} := ⟨{n}.fromJsonImpl⟩" for n in names)
+    )
+
+    return "\n\n".join(blocks)
+
+
 def generate_enumeration(enum: dict, ctx: GeneratorContext) -> str:
     """Generate a Lean inductive type from an LSP enumeration."""
     name = to_lean_type_name(enum["name"])
@@ -510,15 +709,7 @@ def generate_enumeration(enum: dict, ctx: GeneratorContext) -> str:
     lines = []
 
     if enum.get("documentation"):
-        doc = (
-            enum["documentation"]
-            .replace("\n", " ")
-            .replace('"', "'")
-            .replace("--", "- -")
-        )
-        if len(doc) > 200:
-            doc = doc[:200] + "..."
-        lines.append(f"/-- {doc} -/")
+        lines.append(f"/-- {format_doc(enum['documentation'], 200)} -/")
 
     lines.append(f"inductive {name} where")
 
@@ -571,74 +762,139 @@ def generate_enum_tojson(enum: dict, ctx: GeneratorContext) -> str:
     return "\n".join(lines)
 
 
+def enum_decode_cases(enum: dict) -> list[tuple[Any, str]]:
+    """The `(value, constructor)` pairs a decoder accepts, first occurrence wins."""
+    seen_values = set()
+    seen_match_values = set()
+    cases = []
+    for val in enum.get("values", []):
+        val_name = val["name"]
+        lean_name = val_name[0].lower() + val_name[1:] if val_name else val_name
+        lean_name = escape_name(lean_name)
+        value = val["value"]
+
+        if lean_name in seen_values or value in seen_match_values:
+            continue
+        seen_values.add(lean_name)
+        seen_match_values.add(value)
+        cases.append((value, lean_name))
+    return cases
+
+
 def generate_enum_fromjson(enum: dict, ctx: GeneratorContext) -> str:
-    """Generate FromJson instance for an enumeration."""
+    """Generate FromJson instance for an enumeration.
+
+    Large enumerations decode through a precomputed table: a hash map for
+    string enums, and array indexing for integer enums whose values are dense.
+    Small or sparse ones keep a plain `match`.
+    """
     name = to_lean_type_name(enum["name"])
-    values = enum.get("values", [])
     base_type = enum["type"]["name"]
+    cases = enum_decode_cases(enum)
+
+    if len(cases) >= ENUM_TABLE_MIN_SIZE:
+        if base_type == "string":
+            return generate_enum_hash_decoder(name, cases)
+        values = [value for value, _ in cases]
+        span = max(values) - min(values) + 1
+        if span <= 2 * len(cases):
+            return generate_enum_array_decoder(name, cases)
 
     lines = [f"instance : FromJson {name} where"]
     lines.append("  fromJson? json := do")
 
-    seen_values = set()
-    seen_match_values = set()
-
     if base_type == "string":
         lines.append("    let s ← json.getStr?")
         lines.append("    match s with")
-        for val in values:
-            val_name = val["name"]
-            lean_name = val_name[0].lower() + val_name[1:] if val_name else val_name
-            lean_name = escape_name(lean_name)
-            value = val["value"]
-
-            if lean_name in seen_values or value in seen_match_values:
-                continue
-            seen_values.add(lean_name)
-            seen_match_values.add(value)
-
+        for value, lean_name in cases:
             lines.append(f'    | "{value}" => return .{lean_name}')
         lines.append(f'    | s => throw s!"Invalid {name}: {{s}}"')
     else:
         lines.append("    let n ← json.getInt?")
         lines.append("    match n with")
-        for val in values:
-            val_name = val["name"]
-            lean_name = val_name[0].lower() + val_name[1:] if val_name else val_name
-            lean_name = escape_name(lean_name)
-            value = val["value"]
-
-            if lean_name in seen_values or value in seen_match_values:
-                continue
-            seen_values.add(lean_name)
-            seen_match_values.add(value)
-
+        for value, lean_name in cases:
             lines.append(f"    | {value} => return .{lean_name}")
         lines.append(f'    | n => throw s!"Invalid {name}: {{n}}"')
 
     return "\n".join(lines)
 
 
+def generate_enum_hash_decoder(name: str, cases: list[tuple[Any, str]]) -> str:
+    """Decode a string enumeration with one hash lookup."""
+    lines = [f"private def {name}.decodeTable : Std.HashMap String {name} :="]
+    lines.append("  Std.HashMap.ofList [")
+    entries = [f'    ("{value}", {name}.{lean_name})' for value, lean_name in cases]
+    lines.append(",\n".join(entries))
+    lines.append("  ]")
+    lines.append("")
+    lines.append(f"instance : FromJson {name} where")
+    lines.append("  fromJson? json := do")
+    lines.append("    let s ← json.getStr?")
+    lines.append(f"    let some v := {name}.decodeTable[s]?")
+    lines.append(f'      | throw s!"Invalid {name}: {{s}}"')
+    lines.append("    return v")
+    return "\n".join(lines)
+
+
+def generate_enum_array_decoder(name: str, cases: list[tuple[Any, str]]) -> str:
+    """Decode a dense integer enumeration by indexing an array with `n - min`."""
+    by_value = dict(cases)
+    lo, hi = min(by_value), max(by_value)
+    gaps = hi - lo + 1 != len(by_value)
+
+    if gaps:
+        table_type = f"Array (Option {name})"
+        entries = [
+            f"some {name}.{by_value[v]}" if v in by_value else "none"
+            for v in range(lo, hi + 1)
+        ]
+    else:
+        table_type = f"Array {name}"
+        entries = [f"{name}.{by_value[v]}" for v in range(lo, hi + 1)]
+
+    if lo == 0:
+        index = "n.toNat"
+    elif lo > 0:
+        index = f"(n - {lo}).toNat"
+    else:
+        index = f"(n + {-lo}).toNat"
+    lookup = f"{name}.decodeTable[{index}]?"
+    if gaps:
+        lookup = f"({lookup}).join"
+
+    lines = [f"private def {name}.decodeTable : {table_type} :="]
+    lines.append("  #[")
+    lines.append(",\n".join(f"    {e}" for e in entries))
+    lines.append("  ]")
+    lines.append("")
+    lines.append(f"instance : FromJson {name} where")
+    lines.append("  fromJson? json := do")
+    lines.append("    let n ← json.getInt?")
+    lines.append(f"    let some v := if n < {lo} then none else {lookup}")
+    lines.append(f'      | throw s!"Invalid {name}: {{n}}"')
+    lines.append("    return v")
+    return "\n".join(lines)
+
+
+def generate_enumeration_block(enum: dict, ctx: GeneratorContext) -> str:
+    """Generate an enumeration together with its JSON instances."""
+    return "\n\n".join(
+        [
+            generate_enumeration(enum, ctx),
+            generate_enum_tojson(enum, ctx),
+            generate_enum_fromjson(enum, ctx),
+        ]
+    )
+
+
 def generate_type_alias(alias: dict, ctx: GeneratorContext) -> str:
     """Generate a Lean abbreviation from an LSP type alias."""
     name = to_lean_type_name(alias["name"])
-
-    if name in FORCE_JSON_TYPES:
-        typ = "Json"
-    else:
-        typ = type_to_lean(alias["type"], ctx, name)
+    typ = alias_lean_type(alias, ctx)
 
     lines = []
     if alias.get("documentation"):
-        doc = (
-            alias["documentation"]
-            .replace("\n", " ")
-            .replace('"', "'")
-            .replace("--", "- -")
-        )
-        if len(doc) > 200:
-            doc = doc[:200] + "..."
-        lines.append(f"/-- {doc} -/")
+        lines.append(f"/-- {format_doc(alias['documentation'], 200)} -/")
 
     lines.append(f"abbrev {name} := {typ}")
 
@@ -663,102 +919,549 @@ def generate_notification_method(notif: dict, ctx: GeneratorContext) -> str:
     return f'/-- Method: `{method}` -/\ndef {const_name}Method : String := "{method}"'
 
 
-def main():
-    metamodel_path = Path(__file__).parent / "metamodel.json"
-    with open(metamodel_path) as f:
-        metamodel = json.load(f)
+def method_hash(method: str, init: int) -> int:
+    """FNV-1a over code points with a final fold. Mirrors `MethodId.methodHash`."""
+    h = init
+    for ch in method:
+        h = ((h ^ ord(ch)) * FNV_PRIME) & UINT64_MASK
+    return h ^ (h >> 32)
 
-    all_names = set()
-    for s in metamodel["structures"]:
-        if not s.get("proposed"):
-            all_names.add(s["name"])
-    for e in metamodel["enumerations"]:
-        if not e.get("proposed"):
-            all_names.add(e["name"])
-    for t in metamodel["typeAliases"]:
-        if not t.get("proposed"):
-            all_names.add(t["name"])
 
-    ctx = GeneratorContext(
-        structures={s["name"]: s for s in metamodel["structures"]},
-        enumerations={e["name"]: e for e in metamodel["enumerations"]},
-        type_aliases={t["name"]: t for t in metamodel["typeAliases"]},
-        all_names=all_names,
+def find_method_hash(methods: list[str]) -> tuple[int, int]:
+    """Find a hash seed and power-of-two table size that place every method alone."""
+    size = 1
+    while size < 2 * len(methods):
+        size *= 2
+    while True:
+        for attempt in range(METHOD_HASH_ATTEMPTS):
+            init = FNV_OFFSET ^ attempt
+            slots = {method_hash(m, init) & (size - 1) for m in methods}
+            if len(slots) == len(methods):
+                return init, size
+        size *= 2
+
+
+def generate_method_dispatch(messages: list[dict]) -> str:
+    """Generate `MethodId` and a perfect-hash lookup from method names to it."""
+    methods = []
+    seen = set()
+    for msg in messages:
+        method = msg["method"]
+        if method in seen:
+            continue
+        seen.add(method)
+        type_name = msg.get("typeName", method.replace("/", "_").replace("$", "Dollar"))
+        const_name = type_name.replace("/", "_").replace("$", "Dollar")
+        methods.append((escape_name(const_name[0].lower() + const_name[1:]), method))
+
+    init, size = find_method_hash([method for _, method in methods])
+    slots = sorted(
+        (method_hash(method, init) & (size - 1), ctor) for ctor, method in methods
     )
 
-    output_path = Path(__file__).parent / "Lapis" / "Protocol" / "Generated.lean"
+    lines = ["/-- Every method in the metamodel, for routing without string comparison. -/"]
+    lines.append("inductive MethodId where")
+    for ctor, _ in methods:
+        lines.append(f"  | {ctor}")
+    lines.append("  deriving Inhabited, BEq, Hashable, Repr")
+    lines.append("")
+    lines.append("namespace MethodId")
+    lines.append("")
+    lines.append("/-- Number of method IDs; tables indexed by `toNat` have this size. -/")
+    lines.append(f"def count : Nat := {len(methods)}")
+    lines.append("")
+    lines.append("/-- Dense index of a method ID, for array-backed handler tables. -/")
+    lines.append("def toNat : MethodId → Nat")
+    for i, (ctor, _) in enumerate(methods):
+        lines.append(f"  | .{ctor} => {i}")
+    lines.append("")
+    lines.append("/-- The method name as sent on the wire. -/")
+    lines.append("def name : MethodId → String")
+    for ctor, method in methods:
+        lines.append(f'  | .{ctor} => "{method}"')
+    lines.append("")
+    lines.append("/-- Seeded FNV-1a over the method name, folded to mix the high bits. -/")
+    lines.append("def methodHash (s : String) : UInt64 :=")
+    lines.append(f"  let h := s.foldl (fun h c => (h ^^^ c.toNat.toUInt64) * {FNV_PRIME}) {init}")
+    lines.append("  h ^^^ (h >>> 32)")
+    lines.append("")
+    lines.append("private def table : Array (Option MethodId) := Id.run do")
+    lines.append(f"  let mut t : Array (Option MethodId) := Array.replicate {size} none")
+    for slot, ctor in slots:
+        lines.append(f"  t := t.set! {slot} (some .{ctor})")
+    lines.append("  return t")
+    lines.append("")
+    lines.append("/-- Look up a method by name with one hash, one array index and one comparison. -/")
+    lines.append("def ofString? (s : String) : Option MethodId :=")
+    lines.append(f"  match table[(methodHash s &&& {size - 1}).toNat]? with")
+    lines.append("  | some (some id) => if id.name == s then some id else none")
+    lines.append("  | _ => none")
+    lines.append("")
+    lines.append("end MethodId")
+    return "\n".join(lines)
+
 
+GENERATED_NAMESPACE = "Lapis.Protocol.Generated"
+
+BASE_IMPORTS = ["Lean.Data.Json", "Std.Data.HashMap"]
+
+
+@dataclass
+class Declaration:
+    """A rendered top-level declaration and the generated types it refers to."""
+
+    names: tuple[str, ...]
+    section: str
+    text: str
+    deps: set[str] = field(default_factory=set)
+
+
+def generated_refs(refs: set[str], ctx: GeneratorContext) -> set[str]:
+    """Keep only the references that are emitted as real declarations."""
+    return {r for r in refs if r in ctx.all_names and r not in FORCE_JSON_TYPES}
+
+
+def render_module(sections: list[tuple[str, list[Declaration]]], imports: list[str]) -> str:
+    """Render a generated Lean module from titled groups of declarations."""
     lines = []
     lines.append("/-")
     lines.append("  Auto-generated LSP 3.17 Protocol Types")
     lines.append("  Generated from metamodel.json - DO NOT EDIT MANUALLY")
     lines.append("-/")
-    lines.append("import Lean.Data.Json")
+    for module in imports:
+        lines.append(f"import {module}")
     lines.append("")
-    lines.append("namespace Lapis.Protocol.Generated")
+    lines.append(f"namespace {GENERATED_NAMESPACE}")
     lines.append("")
     lines.append("open Lean Json")
     lines.append("")
 
-    enumerations = [e for e in metamodel["enumerations"] if not e.get("proposed")]
-    type_aliases = [t for t in metamodel["typeAliases"] if not t.get("proposed")]
-    structures = [s for s in metamodel["structures"] if not s.get("proposed")]
-    requests = [r for r in metamodel["requests"] if not r.get("proposed")]
-    notifications = [n for n in metamodel["notifications"] if not n.get("proposed")]
-
-    lines.append("/-! ## Enumerations -/")
-    lines.append("")
-    for enum in enumerations:
-        lines.append(generate_enumeration(enum, ctx))
-        lines.append("")
-        lines.append(generate_enum_tojson(enum, ctx))
-        lines.append("")
-        lines.append(generate_enum_fromjson(enum, ctx))
+    for title, decls in sections:
+        lines.append(f"/-! ## {title} -/")
         lines.append("")
+        for decl in decls:
+            lines.append(decl.text)
+            lines.append("")
 
-    lines.append("/-! ## Type Aliases -/")
+    lines.append(f"end {GENERATED_NAMESPACE}")
     lines.append("")
-    for alias in type_aliases:
-        lines.append(generate_type_alias(alias, ctx))
-        lines.append("")
+    return "\n".join(lines)
 
-    sorted_structures = topological_sort(structures, ctx, get_structure_deps)
 
-    lines.append("/-! ## Structures -/")
-    lines.append("")
-    for struct in sorted_structures:
-        lines.append(generate_structure(struct, ctx))
-        lines.append("")
-        lines.append(generate_tojson_instance(struct, ctx))
-        lines.append("")
-        lines.append(generate_fromjson_instance(struct, ctx))
-        lines.append("")
+def group_sections(decls: list[Declaration]) -> list[tuple[str, list[Declaration]]]:
+    """Group declarations by section, keeping first-seen section order."""
+    sections: dict[str, list[Declaration]] = {}
+    for decl in decls:
+        sections.setdefault(decl.section, []).append(decl)
+    return list(sections.items())
+
+
+def partition_modules(
+    decls: list[Declaration], module_size: int
+) -> list[tuple[str, list[Declaration]]]:
+    """Split declarations into dependency layers, each chunked into bounded modules.
+
+    A declaration's layer is one more than the deepest layer it depends on, so
+    modules within a layer never import each other and lake can build them in
+    parallel. Lean modules cannot import each other in a cycle, so a cycle
+    between declarations is an error.
+    """
+    by_name = {name: d for d in decls for name in d.names}
+    layer: dict[str, int] = {}
+
+    def layer_of(name: str, path: list[str]) -> int:
+        if name in layer:
+            return layer[name]
+        if name in path:
+            cycle = " -> ".join(path[path.index(name) :] + [name])
+            raise SystemExit(f"error: dependency cycle between generated declarations: {cycle}")
+        path.append(name)
+        deps = [by_name[d].names[0] for d in by_name[name].deps if d in by_name]
+        result = 1 + max(layer_of(d, path) for d in deps) if deps else 0
+        path.pop()
+        layer[name] = result
+        return result
+
+    layers = defaultdict(list)
+    for decl in decls:
+        layers[layer_of(decl.names[0], [])].append(decl)
+
+    modules = []
+    for depth in sorted(layers):
+        members = layers[depth]
+        chunks = [members[i : i + module_size] for i in range(0, len(members), module_size)]
+        for i, chunk in enumerate(chunks):
+            suffix = f"Part{i + 1}" if len(chunks) > 1 else ""
+            modules.append((f"Layer{depth}{suffix}", chunk))
+    return modules
+
+
+def write_split(
+    output_path: Path,
+    types: list[Declaration],
+    methods: list[Declaration],
+    module_size: int,
+) -> tuple[int, int]:
+    """Write one module per partition plus an umbrella module at `output_path`.
+
+    Returns the number of modules and how many of them were rewritten.
+    """
+    module_dir = output_path.with_suffix("")
+    modules = partition_modules(types, module_size) + [("Methods", methods)]
+
+    owner = {n: name for name, decls in modules for decl in decls for n in decl.names}
+    written = 0
+    for name, decls in modules:
+        deps = {owner[d] for decl in decls for d in decl.deps if d in owner}
+        deps.discard(name)
+        imports = BASE_IMPORTS + [f"{GENERATED_NAMESPACE}.{d}" for d in sorted(deps)]
+        content = render_module(group_sections(decls), imports)
+        written += write_if_changed(module_dir / f"{name}.lean", content)
+
+    # Drop modules left over from a previous partitioning
+    produced = {f"{name}.lean" for name, _ in modules}
+    for stale in module_dir.glob("*.lean"):
+        if stale.name not in produced:
+            stale.unlink()
 
-    lines.append("/-! ## Request Methods -/")
+    lines = []
+    lines.append("/-")
+    lines.append("  Auto-generated LSP 3.17 Protocol Types")
+    lines.append("  Generated from metamodel.json - DO NOT EDIT MANUALLY")
+    lines.append("-/")
+    for name, _ in modules:
+        lines.append(f"import {GENERATED_NAMESPACE}.{name}")
     lines.append("")
-    for req in requests:
-        lines.append(generate_request_method(req, ctx))
-        lines.append("")
+    written += write_if_changed(output_path, "\n".join(lines))
+
+    return len(modules), written
+
+
+def rename_references(node: Any, names: set[str], suffix: str) -> Any:
+    """Copy a metamodel fragment, appending `suffix` to references to `names`."""
+    if isinstance(node, list):
+        return [rename_references(item, names, suffix) for item in node]
+    if not isinstance(node, dict):
+        return node
+    copy = {key: rename_references(value, names, suffix) for key, value in node.items()}
+    if copy.get("kind") == "reference" and copy["name"] in names:
+        copy["name"] += suffix
+    return copy
+
+
+def scale_metamodel(metamodel: dict, factor: int) -> dict:
+    """Replicate every type `factor` times to benchmark the generator.
+
+    Copy k renames each enumeration, alias and structure to `<Name>Copy<k>`
+    and rewrites the references between them, so every copy has the shape of
+    the original type graph. Methods and forced-`Json` types are not copied.
+    """
+    kinds = ("enumerations", "typeAliases", "structures")
+    names = {
+        item["name"]
+        for kind in kinds
+        for item in metamodel[kind]
+        if item["name"] not in FORCE_JSON_TYPES
+    }
+    scaled = dict(metamodel)
+    for kind in kinds:
+        items = list(metamodel[kind])
+        for k in range(1, factor):
+            suffix = f"Copy{k}"
+            for item in metamodel[kind]:
+                if item["name"] in names:
+                    copy = rename_references(item, names, suffix)
+                    copy["name"] += suffix
+                    items.append(copy)
+        scaled[kind] = items
+    return scaled
+
+
+def declaration_stats(decl: Declaration, ctx: GeneratorContext) -> DeclarationStats:
+    """Measure a rendered declaration; fields are counted for structures only."""
+    fields = []
+    if decl.section == "Structures":
+        for name in decl.names:
+            fields.extend(resolve_structure(ctx.structures[name], ctx).fields)
+    return DeclarationStats(
+        name="+".join(decl.names),
+        section=decl.section,
+        lines=decl.text.count("\n") + 1,
+        fields=len(fields),
+        json_fields=sum(1 for f in fields if f.inner_type == "Json"),
+    )
 
-    lines.append("/-! ## Notification Methods -/")
-    lines.append("")
-    for notif in notifications:
-        lines.append(generate_notification_method(notif, ctx))
-        lines.append("")
 
-    lines.append("end Lapis.Protocol.Generated")
-    lines.append("")
+def peak_memory_kib() -> int:
+    """Peak resident set size of this process."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak // 1024 if sys.platform == "darwin" else peak
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        f.write("\n".join(lines))
 
-    print(f"Generated {output_path}")
+def report_stats(
+    stats: list[DeclarationStats], elapsed: float, peak_kib: int, json_path: Optional[Path]
+) -> None:
+    """Print per-declaration and per-section sizes, optionally saving them as JSON."""
+    print(f"{'lines':>6} {'fields':>6} {'json':>5}  declaration")
+    for s in stats:
+        print(f"{s.lines:6} {s.fields:6} {s.json_fields:5}  {s.section}: {s.name}")
+
+    totals: dict[str, dict[str, int]] = {}
+    for s in stats:
+        total = totals.setdefault(
+            s.section, {"declarations": 0, "lines": 0, "fields": 0, "jsonFields": 0}
+        )
+        total["declarations"] += 1
+        total["lines"] += s.lines
+        total["fields"] += s.fields
+        total["jsonFields"] += s.json_fields
+
+    print()
+    for section, total in totals.items():
+        print(
+            f"{section}: {total['declarations']} declarations, {total['lines']} lines, "
+            f"{total['fields']} fields ({total['jsonFields']} Json)"
+        )
+    print(f"wall time: {elapsed:.3f} s, peak memory: {peak_kib / 1024:.1f} MiB")
+
+    if json_path is not None:
+        report = {
+            "wallSeconds": elapsed,
+            "peakMemoryKiB": peak_kib,
+            "sections": totals,
+            "declarations": [
+                {
+                    "name": s.name,
+                    "section": s.section,
+                    "lines": s.lines,
+                    "fields": s.fields,
+                    "jsonFields": s.json_fields,
+                }
+                for s in stats
+            ],
+        }
+        json_path.parent.mkdir(parents=True, exist_ok=True)
+        json_path.write_text(json.dumps(report, indent=2) + "\n")
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write `content` to `path` unless it already holds exactly that text."""
+    if path.exists() and path.read_text() == content:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+    return True
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Generate Lean protocol types from the LSP metamodel."
+    )
+    parser.add_argument(
+        "--metamodel",
+        type=Path,
+        default=ROOT / "metamodel.json",
+        help="path to the LSP metamodel.json",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=ROOT / "Lapis" / "Protocol" / "Generated.lean",
+        help="path of the generated Lean file",
+    )
+    parser.add_argument(
+        "--split",
+        action="store_true",
+        help="emit one module per dependency layer plus an umbrella import",
+    )
+    parser.add_argument(
+        "--module-size",
+        type=int,
+        default=50,
+        help="maximum number of declarations per module with --split",
+    )
+    parser.add_argument(
+        "--roots",
+        nargs="+",
+        metavar="METHOD",
+        help="only emit types reachable from these request/notification methods",
+    )
+    parser.add_argument(
+        "--keep",
+        nargs="+",
+        default=[],
+        metavar="TYPE",
+        help="extra types to treat as roots with --roots",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="report size per declaration, wall time and peak memory",
+    )
+    parser.add_argument(
+        "--stats-json",
+        type=Path,
+        metavar="PATH",
+        help="also write the --stats report to PATH as JSON",
+    )
+    parser.add_argument(
+        "--scale",
+        type=int,
+        default=1,
+        metavar="N",
+        help="replicate every type N times (for benchmarking the generator)",
+    )
+    args = parser.parse_args()
+    if args.module_size < 1:
+        parser.error("--module-size must be at least 1")
+    return args
+
+
+def main():
+    args = parse_args()
+    if args.scale < 1:
+        raise SystemExit("error: --scale must be at least 1")
+    started = time.perf_counter()
+    with open(args.metamodel) as f:
+        metamodel = json.load(f)
+    if args.scale > 1:
+        metamodel = scale_metamodel(metamodel, args.scale)
+
+    reachable = None
+    if args.roots:
+        methods = {m["method"] for m in metamodel["requests"] + metamodel["notifications"]}
+        unknown = sorted(set(args.roots) - methods)
+        if unknown:
+            raise SystemExit(f"error: unknown root methods: {', '.join(unknown)}")
+        reachable = reachable_types(metamodel, set(args.roots), set(args.keep))
+
+    pruned: dict[str, list[str]] = defaultdict(list)
+
+    def emitted(kind: str, item: dict) -> bool:
+        if item.get("proposed"):
+            return False
+        if reachable is not None and item["name"] not in reachable:
+            pruned[kind].append(item["name"])
+            return False
+        return True
+
+    enumerations = [e for e in metamodel["enumerations"] if emitted("enumerations", e)]
+    type_aliases = [t for t in metamodel["typeAliases"] if emitted("type aliases", t)]
+    structures = [s for s in metamodel["structures"] if emitted("structures", s)]
+    requests = [r for r in metamodel["requests"] if not r.get("proposed")]
+    notifications = [n for n in metamodel["notifications"] if not n.get("proposed")]
+
+    all_names = {item["name"] for item in enumerations + type_aliases + structures}
+
+    ctx = GeneratorContext(
+        structures={s["name"]: s for s in metamodel["structures"]},
+        enumerations={e["name"]: e for e in metamodel["enumerations"]},
+        type_aliases={t["name"]: t for t in metamodel["typeAliases"]},
+        all_names=all_names,
+    )
+
+    output_path = args.output
+
+    def emit(
+        section: str,
+        members: list[dict],
+        text: str,
+        deps: set[str] = frozenset(),
+    ) -> Declaration:
+        names = tuple(m.get("name", m.get("method")) for m in members)
+        return Declaration(names, section, text, generated_refs(set(deps), ctx) - set(names))
+
+    def emit_structures(component: list[dict]) -> Declaration:
+        deps = set().union(*(resolved_structure_deps(s, ctx) for s in component))
+        if is_recursive(component, ctx):
+            text = generate_recursive_block(component, ctx)
+        else:
+            text = generate_structure_block(component[0], ctx)
+        return emit("Structures", component, text, deps)
+
+    components = strongly_connected_components(
+        structures, lambda struct: resolved_structure_deps(struct, ctx)
+    )
+
+    sections = [
+        (
+            "Enumerations",
+            [
+                emit("Enumerations", [enum], generate_enumeration_block(enum, ctx))
+                for enum in enumerations
+            ],
+        ),
+        (
+            "Type Aliases",
+            [
+                emit(
+                    "Type Aliases",
+                    [alias],
+                    generate_type_alias(alias, ctx),
+                    resolved_alias_deps(alias, ctx),
+                )
+                for alias in type_aliases
+            ],
+        ),
+        (
+            "Structures",
+            [emit_structures(component) for component in components],
+        ),
+        (
+            "Request Methods",
+            [
+                emit("Request Methods", [req], generate_request_method(req, ctx))
+                for req in requests
+            ],
+        ),
+        (
+            "Notification Methods",
+            [
+                emit("Notification Methods", [notif], generate_notification_method(notif, ctx))
+                for notif in notifications
+            ],
+        ),
+        (
+            "Method Dispatch",
+            [
+                emit(
+                    "Method Dispatch",
+                    [{"name": "MethodId"}],
+                    generate_method_dispatch(requests + notifications),
+                )
+            ],
+        ),
+    ]
+
+    if args.split:
+        types = [decl for _, decls in sections[:3] for decl in decls]
+        methods = [decl for _, decls in sections[3:] for decl in decls]
+        module_count, written = write_split(output_path, types, methods, args.module_size)
+        if written:
+            print(f"Generated {output_path} and {module_count} modules ({written} rewritten)")
+        else:
+            print(f"{output_path} and its {module_count} modules are up to date, left untouched")
+    else:
+        if write_if_changed(output_path, render_module(sections, BASE_IMPORTS)):
+            print(f"Generated {output_path}")
+        else:
+            print(f"{output_path} is up to date, left untouched")
+
+    elapsed = time.perf_counter() - started
+
     print(f"  - {len(enumerations)} enumerations")
     print(f"  - {len(type_aliases)} type aliases")
     print(f"  - {len(structures)} structures")
     print(f"  - {len(requests)} request methods")
     print(f"  - {len(notifications)} notification methods")
+    for kind, names in pruned.items():
+        print(f"  - pruned {len(names)} unreachable {kind}: {', '.join(sorted(names))}")
+
+    if args.stats or args.stats_json:
+        stats = [declaration_stats(decl, ctx) for _, decls in sections for decl in decls]
+        report_stats(stats, elapsed, peak_memory_kib(), args.stats_json)
 
 
 if __name__ == "__main__":
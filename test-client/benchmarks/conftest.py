@@ -0,0 +1,199 @@
+"""
+Configuration for the Lapis benchmarks.
+
+Benchmarks are not part of the default test run; invoke them explicitly:
+
+    pytest benchmarks -s --concurrency 1,8,32 --bench-requests 500
+
+The first run records `results/latency-baseline.json`; later runs fail when a
+metric regresses past `--regression-threshold` (by default
+`harness.DEFAULT_REGRESSION_THRESHOLD`). Pass `--update-baseline` to accept
+the current numbers.
+
+With `--collect-stats SECONDS`, benchmarks using the `client` fixture poll
+the server's `$/lapis/stats` at that interval and write the time series to
+`results/stats/<test>.json`.
+"""
+
+import os
+import re
+from pathlib import Path
+
+import pytest
+import pytest_lsp
+from harness import DEFAULT_REGRESSION_THRESHOLD, RESULTS_DIR, Baseline
+from lsprotocol.types import ClientCapabilities, InitializeParams
+from pytest_lsp import ClientServerConfig, LanguageClient
+from statscollector import StatsCollector, client_fetcher
+
+SERVER_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "..", ".lake", "build", "bin", "test"
+)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("lapis benchmarks")
+    group.addoption(
+        "--concurrency",
+        default="1,8,32",
+        help="comma-separated concurrency levels to benchmark (default: 1,8,32)",
+    )
+    group.addoption(
+        "--bench-requests",
+        type=int,
+        default=500,
+        help="measured operations per method and concurrency level (default: 500)",
+    )
+    group.addoption(
+        "--baseline",
+        type=Path,
+        default=RESULTS_DIR / "latency-baseline.json",
+        help="JSON file holding the latency baseline",
+    )
+    group.addoption(
+        "--update-baseline",
+        action="store_true",
+        help="overwrite the baseline with this run's results",
+    )
+    group.addoption(
+        "--regression-threshold",
+        type=float,
+        default=DEFAULT_REGRESSION_THRESHOLD,
+        help="allowed relative slowdown before a benchmark fails "
+        f"(default: {DEFAULT_REGRESSION_THRESHOLD})",
+    )
+    group.addoption(
+        "--flood-sizes",
+        default="1K,10K,100K,1M,10M",
+        help="document sizes for the didChange flood (default: 1K,10K,100K,1M,10M)",
+    )
+    group.addoption(
+        "--flood-edits",
+        type=int,
+        default=2000,
+        help="incremental edits streamed per document size (default: 2000)",
+    )
+    group.addoption(
+        "--keystroke-interval",
+        type=float,
+        default=0.01,
+        help="seconds between streamed edits (default: 0.01)",
+    )
+    group.addoption(
+        "--memory-cycles",
+        type=int,
+        default=200,
+        help="open/edit/close cycles in the memory growth session (default: 200)",
+    )
+    group.addoption(
+        "--memory-duration",
+        type=float,
+        default=0.0,
+        help="run the memory session for this many seconds instead of a cycle count",
+    )
+    group.addoption(
+        "--memory-growth-limit",
+        type=float,
+        default=32.0,
+        help="allowed RSS growth in MiB once documents are closed (default: 32)",
+    )
+    group.addoption(
+        "--startup-runs",
+        type=int,
+        default=20,
+        help="server launches measured by the startup benchmark (default: 20)",
+    )
+    group.addoption(
+        "--cancel-delays",
+        default="0,50,200",
+        help="milliseconds before cancelling the slow requests (default: 0,50,200)",
+    )
+    group.addoption(
+        "--slow-ms",
+        type=int,
+        default=1000,
+        help="CPU time each slow request burns if not cancelled (default: 1000)",
+    )
+    group.addoption(
+        "--ingest-messages",
+        type=int,
+        default=10000,
+        help="notifications per burst in the ingest benchmark (default: 10000)",
+    )
+    group.addoption(
+        "--ingest-body-sizes",
+        default="64,1024,16384",
+        help="message body sizes in bytes for the ingest benchmark (default: 64,1024,16384)",
+    )
+    group.addoption(
+        "--collect-stats",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="poll $/lapis/stats at this interval and write the time series",
+    )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    # Benchmarks must not compete for cores, and they share result files
+    return 0
+
+
+def parse_size(size: str) -> int:
+    """Parse a byte count such as `512`, `10K` or `1M`."""
+    units = {"K": 1024, "M": 1024 * 1024}
+    size = size.strip().upper()
+    if size[-1:] in units:
+        return int(size[:-1]) * units[size[-1]]
+    return int(size)
+
+
+def pytest_generate_tests(metafunc):
+    if "concurrency" in metafunc.fixturenames:
+        levels = [int(c) for c in metafunc.config.getoption("concurrency").split(",")]
+        metafunc.parametrize("concurrency", levels)
+    if "document_size" in metafunc.fixturenames:
+        sizes = metafunc.config.getoption("flood_sizes").split(",")
+        metafunc.parametrize("document_size", [parse_size(s) for s in sizes], ids=sizes)
+
+
+@pytest.fixture(scope="session")
+def baseline(pytestconfig):
+    """Latency baseline shared by every benchmark, saved after the session."""
+    baseline = Baseline(
+        pytestconfig.getoption("baseline"),
+        pytestconfig.getoption("regression_threshold"),
+        update=pytestconfig.getoption("update_baseline"),
+    )
+    yield baseline
+    baseline.save()
+
+
+@pytest.fixture
+def bench_requests(pytestconfig) -> int:
+    return pytestconfig.getoption("bench_requests")
+
+
+@pytest_lsp.fixture(
+    config=ClientServerConfig(server_command=[SERVER_PATH]),
+)
+async def client(lsp_client: LanguageClient, request):
+    """LSP client fixture for benchmarking Lapis server."""
+    await lsp_client.initialize_session(
+        InitializeParams(capabilities=ClientCapabilities())
+    )
+    interval = request.config.getoption("collect_stats")
+    collector = None
+    if interval:
+        collector = StatsCollector(client_fetcher(lsp_client), interval)
+        collector.start()
+
+    yield
+
+    if collector is not None:
+        await collector.stop()
+        print(f"\nserver stats: {collector.summary()}")
+        name = re.sub(r"[^\w.-]+", "_", request.node.name)
+        collector.write(RESULTS_DIR / "stats" / f"{name}.json")
+    await lsp_client.shutdown_session()
@@ -0,0 +1,220 @@
+"""
+Shared measurement helpers for the Lapis benchmarks.
+
+Latencies are wall-clock times measured on the client, so they include
+JSON-RPC framing and the client's own event loop overhead.
+"""
+
+import asyncio
+import json
+import math
+import os
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from statscollector import client_fetcher
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+# Latency increases smaller than this are treated as noise, whatever the ratio
+MIN_LATENCY_DELTA_MS = 0.5
+
+# Relative change a metric may show against the baseline before it counts as
+# a regression; `--regression-threshold` overrides it
+DEFAULT_REGRESSION_THRESHOLD = 0.25
+
+
+def percentile(samples: List[float], p: float) -> float:
+    """Nearest-rank percentile of `samples` (p in 0..100)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, math.ceil(p * len(ordered) / 100) - 1)
+    return ordered[rank]
+
+
+@dataclass
+class LatencyStats:
+    """Latency percentiles and throughput for one method at one concurrency."""
+
+    count: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    throughput: float
+
+    @classmethod
+    def from_samples(cls, samples: List[float], elapsed: float) -> "LatencyStats":
+        millis = [s * 1000 for s in samples]
+        return cls(
+            count=len(samples),
+            p50_ms=percentile(millis, 50),
+            p95_ms=percentile(millis, 95),
+            p99_ms=percentile(millis, 99),
+            throughput=len(samples) / elapsed if elapsed > 0 else 0.0,
+        )
+
+    def __str__(self) -> str:
+        return (
+            f"n={self.count} p50={self.p50_ms:.2f}ms p95={self.p95_ms:.2f}ms "
+            f"p99={self.p99_ms:.2f}ms throughput={self.throughput:.1f}/s"
+        )
+
+
+async def run_load(
+    concurrency: int,
+    total: int,
+    operation: Callable[[int, int], Awaitable[object]],
+) -> LatencyStats:
+    """
+    Run `total` operations with `concurrency` workers and time each one.
+
+    `operation(worker, index)` is awaited once per index; every worker issues
+    its next operation as soon as the previous one completes.
+    """
+    samples: List[float] = []
+    next_index = 0
+
+    async def worker(w: int) -> None:
+        nonlocal next_index
+        while next_index < total:
+            index = next_index
+            next_index += 1
+            start = time.perf_counter()
+            await operation(w, index)
+            samples.append(time.perf_counter() - start)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(w) for w in range(concurrency)))
+    return LatencyStats.from_samples(samples, time.perf_counter() - started)
+
+
+class DiagnosticsWatcher(dict):
+    """
+    Drop-in replacement for `client.diagnostics` that can be observed.
+
+    pytest-lsp stores every `textDocument/publishDiagnostics` it receives with
+    `client.diagnostics[uri] = ...`; this dict also notifies the listeners and
+    futures registered for that URI, so concurrent waiters never steal each
+    other's notifications.
+    """
+
+    def __init__(self, initial: Optional[dict] = None):
+        super().__init__(initial or {})
+        self._listeners: Dict[str, List[Callable[[list], None]]] = defaultdict(list)
+        self._waiters: Dict[str, List[Tuple[Callable[[list], bool], asyncio.Future]]] = (
+            defaultdict(list)
+        )
+
+    def __setitem__(self, uri, diagnostics) -> None:
+        super().__setitem__(uri, diagnostics)
+        for listener in self._listeners.get(uri, []):
+            listener(diagnostics)
+        waiting = []
+        for predicate, future in self._waiters.pop(uri, []):
+            if future.done():
+                continue
+            if predicate(diagnostics):
+                future.set_result(diagnostics)
+            else:
+                waiting.append((predicate, future))
+        if waiting:
+            self._waiters[uri] = waiting
+
+    def wait_for(self, uri: str, predicate: Callable[[list], bool]) -> asyncio.Future:
+        """Future for the first diagnostics published for `uri` that satisfy `predicate`."""
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[uri].append((predicate, future))
+        return future
+
+    def next_publish(self, uri: str) -> asyncio.Future:
+        """Future for the next diagnostics published for `uri`."""
+        return self.wait_for(uri, lambda _: True)
+
+    def subscribe(self, uri: str, listener: Callable[[list], None]) -> None:
+        """Call `listener(diagnostics)` on every publish for `uri`."""
+        self._listeners[uri].append(listener)
+
+    @classmethod
+    def install(cls, client) -> "DiagnosticsWatcher":
+        watcher = cls(client.diagnostics)
+        client.diagnostics = watcher
+        return watcher
+
+
+async def server_pid(client) -> int:
+    """PID of the server process behind `client`, as reported by `$/lapis/stats`."""
+    stats = await client_fetcher(client)()
+    return stats["pid"]
+
+
+def process_cpu_seconds(pid: int) -> float:
+    """User plus system CPU time consumed so far by `pid` (Linux only)."""
+    with open(f"/proc/{pid}/stat") as f:
+        # The command name may contain spaces; fields resume after its ')'
+        fields = f.read().rsplit(")", 1)[1].split()
+    utime, stime = int(fields[11]), int(fields[12])
+    return (utime + stime) / os.sysconf("SC_CLK_TCK")
+
+
+def process_rss_kib(pid: int) -> int:
+    """Resident set size of `pid` in KiB (Linux only)."""
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    raise ValueError(f"no VmRSS for process {pid}")
+
+
+class Baseline:
+    """
+    Benchmark results keyed by method and concurrency, persisted as JSON.
+
+    A run is compared against the stored entry when one exists; entries that
+    are missing (or all entries, with `update=True`) are recorded instead.
+    A latency percentile regresses when it grows by more than `threshold`
+    (and by more than MIN_LATENCY_DELTA_MS), throughput when it drops by
+    more than `threshold`.
+    """
+
+    def __init__(self, path: Path, threshold: float, update: bool = False):
+        self.path = path
+        self.threshold = threshold
+        self.update = update
+        self.entries: Dict[str, Dict[str, dict]] = {}
+        if path.exists():
+            self.entries = json.loads(path.read_text())
+        self.dirty = False
+
+    def check(self, method: str, concurrency: int, stats: LatencyStats) -> List[str]:
+        """Record or compare `stats`; returns a description of each regression."""
+        level = str(concurrency)
+        previous = self.entries.get(method, {}).get(level)
+        if previous is None or self.update:
+            self.entries.setdefault(method, {})[level] = asdict(stats)
+            self.dirty = True
+            return []
+
+        regressions = []
+        for metric in ("p50_ms", "p95_ms", "p99_ms"):
+            old, new = previous[metric], getattr(stats, metric)
+            if new > old * (1 + self.threshold) and new - old > MIN_LATENCY_DELTA_MS:
+                regressions.append(
+                    f"{method} @ {concurrency}: {metric} {old:.2f} -> {new:.2f}"
+                )
+        old_throughput = previous["throughput"]
+        if stats.throughput < old_throughput * (1 - self.threshold):
+            regressions.append(
+                f"{method} @ {concurrency}: throughput "
+                f"{old_throughput:.1f}/s -> {stats.throughput:.1f}/s"
+            )
+        return regressions
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.entries, indent=2, sort_keys=True) + "\n")
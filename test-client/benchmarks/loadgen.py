@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Pipelined raw JSON-RPC load generator for the Lapis test server.
+
+Unlike the pytest-lsp benchmarks, this bypasses lsprotocol entirely: every
+frame is encoded before the clock starts, up to --window requests are kept
+in flight over the server's stdio, and responses are matched by ID. What it
+reports is therefore the server's capacity rather than the client's.
+
+    python benchmarks/loadgen.py --requests 20000 --window 256 \\
+        --mix hover=60,completion=30,didChange=10
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from harness import percentile
+from statscollector import StatsCollector, session_fetcher
+
+DEFAULT_SERVER = Path(__file__).parent / ".." / ".." / ".lake" / "build" / "bin" / "test"
+
+DOCUMENT_URI = "file:///loadgen.txt"
+DOCUMENT_LINES = 500
+DOCUMENT = "".join(f"line {i} has some words to hover over\n" for i in range(DOCUMENT_LINES))
+
+# Workload kinds: LSP method and whether a response is expected
+KINDS = {
+    "hover": ("textDocument/hover", True),
+    "completion": ("textDocument/completion", True),
+    "didChange": ("textDocument/didChange", False),
+}
+
+
+def frame(body: bytes) -> bytes:
+    return b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+
+
+def encode(message: dict) -> bytes:
+    return frame(json.dumps(message, separators=(",", ":")).encode())
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Optional[dict]:
+    """Read one Content-Length framed message, or None at end of stream."""
+    body = await read_frame_body(reader)
+    return None if body is None else json.loads(body)
+
+
+async def read_frame_body(reader: asyncio.StreamReader) -> Optional[bytes]:
+    """Read the raw body of one Content-Length framed message."""
+    length = None
+    while True:
+        line = await reader.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.partition(b":")
+        if name.strip().lower() == b"content-length":
+            length = int(value)
+    if length is None:
+        raise ValueError("frame without Content-Length")
+    return await reader.readexactly(length)
+
+
+def parse_mix(spec: str) -> List[Tuple[str, int]]:
+    mix = []
+    for part in spec.split(","):
+        kind, _, weight = part.partition("=")
+        if kind not in KINDS:
+            raise SystemExit(f"error: unknown workload kind {kind!r}, expected one of {', '.join(KINDS)}")
+        mix.append((kind, int(weight or 1)))
+    return mix
+
+
+@dataclass
+class Frame:
+    kind: str
+    data: bytes
+    request_id: Optional[int] = None
+
+
+def build_workload(mix: List[Tuple[str, int]], total: int, seed: int) -> List[Frame]:
+    """Pre-encode `total` messages drawn from `mix`, in send order."""
+    rng = random.Random(seed)
+    kinds = [kind for kind, _ in mix]
+    weights = [weight for _, weight in mix]
+    frames = []
+    version = 1
+    for request_id in range(1, total + 1):
+        kind = rng.choices(kinds, weights)[0]
+        method, is_request = KINDS[kind]
+        position = {"line": rng.randrange(DOCUMENT_LINES), "character": rng.randrange(20)}
+        if kind == "didChange":
+            version += 1
+            params = {
+                "textDocument": {"uri": DOCUMENT_URI, "version": version},
+                "contentChanges": [
+                    {"range": {"start": position, "end": position}, "text": "x"}
+                ],
+            }
+        else:
+            params = {"textDocument": {"uri": DOCUMENT_URI}, "position": position}
+        message = {"jsonrpc": "2.0", "method": method, "params": params}
+        if is_request:
+            message["id"] = request_id
+            frames.append(Frame(kind, encode(message), request_id))
+        else:
+            frames.append(Frame(kind, encode(message)))
+    return frames
+
+
+@dataclass
+class Results:
+    latencies: Dict[str, List[float]] = field(default_factory=dict)
+    notifications: Dict[str, int] = field(default_factory=dict)
+    errors: int = 0
+    elapsed: float = 0.0
+
+    def to_json(self) -> dict:
+        responses = sum(len(v) for v in self.latencies.values())
+        report = {
+            "elapsedSeconds": self.elapsed,
+            "responsesPerSecond": responses / self.elapsed if self.elapsed else 0.0,
+            "notificationsPerSecond": (
+                sum(self.notifications.values()) / self.elapsed if self.elapsed else 0.0
+            ),
+            "errors": self.errors,
+            "methods": {},
+        }
+        for kind, samples in self.latencies.items():
+            millis = [s * 1000 for s in samples]
+            report["methods"][kind] = {
+                "count": len(samples),
+                "p50_ms": percentile(millis, 50),
+                "p95_ms": percentile(millis, 95),
+                "p99_ms": percentile(millis, 99),
+            }
+        for kind, count in self.notifications.items():
+            report["methods"][kind] = {"count": count}
+        return report
+
+
+class Session:
+    """One server process spoken to over raw stdio."""
+
+    def __init__(self, process: asyncio.subprocess.Process):
+        self.process = process
+        self.pending: Dict[int, asyncio.Future] = {}
+        self.reader_task = asyncio.create_task(self._read_loop())
+
+    async def _read_loop(self) -> None:
+        while True:
+            message = await read_frame(self.process.stdout)
+            if message is None:
+                break
+            if "method" in message:
+                # Server-initiated traffic (diagnostics, log messages) is ignored
+                if "id" in message:
+                    self.write(encode({"jsonrpc": "2.0", "id": message["id"], "result": None}))
+                continue
+            future = self.pending.pop(message.get("id"), None)
+            if future is not None and not future.done():
+                future.set_result(message)
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("server closed its output"))
+
+    def write(self, data: bytes) -> None:
+        self.process.stdin.write(data)
+
+    def expect(self, request_id: int) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self.pending[request_id] = future
+        return future
+
+    async def request(self, request_id: int, method: str, params) -> dict:
+        response = self.expect(request_id)
+        self.write(encode({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}))
+        await self.process.stdin.drain()
+        return await response
+
+    async def notify(self, method: str, params) -> None:
+        self.write(encode({"jsonrpc": "2.0", "method": method, "params": params}))
+        await self.process.stdin.drain()
+
+
+async def start_session(server: str) -> Session:
+    process = await asyncio.create_subprocess_exec(
+        server,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    session = Session(process)
+    await session.request(0, "initialize", {"processId": None, "rootUri": None, "capabilities": {}})
+    await session.notify("initialized", {})
+    await session.notify(
+        "textDocument/didOpen",
+        {
+            "textDocument": {
+                "uri": DOCUMENT_URI,
+                "languageId": "plaintext",
+                "version": 1,
+                "text": DOCUMENT,
+            }
+        },
+    )
+    return session
+
+
+async def stop_session(session: Session, next_id: int) -> None:
+    await session.request(next_id, "shutdown", None)
+    await session.notify("exit", None)
+    session.process.stdin.close()
+    try:
+        await asyncio.wait_for(session.process.wait(), timeout=5.0)
+    except asyncio.TimeoutError:
+        session.process.kill()
+    session.reader_task.cancel()
+
+
+async def run(frames: List[Frame], session: Session, window: int) -> Results:
+    """Send every frame, keeping at most `window` requests unanswered."""
+    results = Results()
+    slots = asyncio.Semaphore(window)
+    outstanding = []
+
+    async def collect(frame: Frame, future: asyncio.Future, sent: float) -> None:
+        try:
+            response = await future
+        finally:
+            slots.release()
+        results.latencies.setdefault(frame.kind, []).append(time.perf_counter() - sent)
+        if "error" in response:
+            results.errors += 1
+
+    started = time.perf_counter()
+    for frame in frames:
+        if frame.request_id is None:
+            session.write(frame.data)
+            results.notifications[frame.kind] = results.notifications.get(frame.kind, 0) + 1
+        else:
+            await slots.acquire()
+            future = session.expect(frame.request_id)
+            session.write(frame.data)
+            outstanding.append(asyncio.create_task(collect(frame, future, time.perf_counter())))
+        await session.process.stdin.drain()
+    await asyncio.gather(*outstanding)
+    results.elapsed = time.perf_counter() - started
+    return results
+
+
+def print_report(report: dict) -> None:
+    print(f"elapsed: {report['elapsedSeconds']:.3f} s")
+    print(f"responses: {report['responsesPerSecond']:.0f}/s")
+    print(f"notifications: {report['notificationsPerSecond']:.0f}/s")
+    print(f"errors: {report['errors']}")
+    for kind, stats in report["methods"].items():
+        if "p50_ms" in stats:
+            print(
+                f"  {kind}: n={stats['count']} p50={stats['p50_ms']:.2f}ms "
+                f"p95={stats['p95_ms']:.2f}ms p99={stats['p99_ms']:.2f}ms"
+            )
+        else:
+            print(f"  {kind}: n={stats['count']} (notifications)")
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--server", default=str(DEFAULT_SERVER), help="server executable")
+    parser.add_argument("--requests", type=int, default=10000, help="messages to send")
+    parser.add_argument(
+        "--window", type=int, default=128, help="maximum requests in flight"
+    )
+    parser.add_argument(
+        "--mix",
+        default="hover=70,completion=20,didChange=10",
+        help="weighted workload, e.g. hover=70,completion=20,didChange=10",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="workload random seed")
+    parser.add_argument("--json", type=Path, help="also write the report to this file")
+    parser.add_argument(
+        "--stats", type=Path, help="poll $/lapis/stats during the run and write it here"
+    )
+    parser.add_argument(
+        "--stats-interval", type=float, default=0.1, help="seconds between stats polls"
+    )
+    return parser.parse_args(argv)
+
+
+async def main_async(args: argparse.Namespace) -> dict:
+    frames = build_workload(parse_mix(args.mix), args.requests, args.seed)
+    session = await start_session(args.server)
+    collector = None
+    if args.stats:
+        # IDs above the workload's and the shutdown request's
+        collector = StatsCollector(session_fetcher(session, args.requests + 2), args.stats_interval)
+        collector.start()
+    try:
+        results = await run(frames, session, args.window)
+        if collector is not None:
+            await collector.stop()
+            print(f"server stats: {collector.summary()}")
+            collector.write(args.stats)
+    finally:
+        await stop_session(session, args.requests + 1)
+    return results.to_json()
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    report = asyncio.run(main_async(args))
+    print_report(report)
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(report, indent=2) + "\n")
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Record an LSP session with timestamps, and replay it against the server.
+
+Record by configuring the editor to launch this proxy instead of the server;
+it forwards both directions unchanged and appends every message to a trace:
+
+    python benchmarks/sessiontrace.py record --trace slow.jsonl -- /path/to/server
+
+Replay the client side of the trace against the test binary, at the
+original pace, N times faster, or as fast as possible, and compare response
+times request by request:
+
+    python benchmarks/sessiontrace.py replay slow.jsonl --speed max
+
+A trace is JSON lines: a header, then one entry per message with `t`
+(seconds since the session started), `from` (`client` or `server`) and the
+decoded `message`.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import defaultdict, deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from harness import percentile
+from loadgen import DEFAULT_SERVER, encode, frame, read_frame, read_frame_body
+
+TRACE_VERSION = 1
+
+
+class TraceWriter:
+    def __init__(self, path: Path, server: List[str]):
+        self.file = open(path, "w")
+        self.started = time.perf_counter()
+        self._write(
+            {
+                "version": TRACE_VERSION,
+                "server": server,
+                "recorded": datetime.now(timezone.utc).isoformat(),
+            }
+        )
+
+    def _write(self, entry: dict) -> None:
+        self.file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self.file.flush()
+
+    def record(self, sender: str, body: bytes) -> None:
+        self._write(
+            {
+                "t": time.perf_counter() - self.started,
+                "from": sender,
+                "message": json.loads(body),
+            }
+        )
+
+    def close(self) -> None:
+        self.file.close()
+
+
+async def stdin_reader() -> asyncio.StreamReader:
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=2**26)
+    await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader), sys.stdin.buffer
+    )
+    return reader
+
+
+async def record(trace: Path, server: List[str]) -> int:
+    process = await asyncio.create_subprocess_exec(
+        *server,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        limit=2**26,
+    )
+    writer = TraceWriter(trace, server)
+    editor = await stdin_reader()
+
+    async def client_to_server() -> None:
+        while (body := await read_frame_body(editor)) is not None:
+            writer.record("client", body)
+            process.stdin.write(frame(body))
+            await process.stdin.drain()
+        process.stdin.close()
+
+    async def server_to_client() -> None:
+        while (body := await read_frame_body(process.stdout)) is not None:
+            writer.record("server", body)
+            sys.stdout.buffer.write(frame(body))
+            sys.stdout.buffer.flush()
+
+    upstream = asyncio.create_task(client_to_server())
+    await server_to_client()
+    upstream.cancel()
+    writer.close()
+    return await process.wait()
+
+
+def load_trace(path: Path) -> List[dict]:
+    with open(path) as f:
+        header = json.loads(f.readline())
+        if header.get("version") != TRACE_VERSION:
+            raise SystemExit(f"error: unsupported trace version {header.get('version')}")
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def original_timings(entries: List[dict]) -> Dict[object, dict]:
+    """Method and recorded response time of every client request, by ID."""
+    requests = {}
+    for entry in entries:
+        message = entry["message"]
+        if entry["from"] == "client" and "method" in message and "id" in message:
+            requests[message["id"]] = {"method": message["method"], "sent": entry["t"]}
+        elif entry["from"] == "server" and "method" not in message:
+            request = requests.get(message.get("id"))
+            if request is not None and "original" not in request:
+                request["original"] = entry["t"] - request["sent"]
+    return requests
+
+
+async def replay(entries: List[dict], server: str, speed: Optional[float], timeout: float) -> dict:
+    """
+    Send the client side of `entries` to a fresh server.
+
+    Recorded client responses to server requests are not replayed on the
+    clock; they answer the replayed server's requests of the same method, in
+    order, since the server picks its own request IDs.
+    """
+    requests = original_timings(entries)
+    server_methods = {
+        e["message"]["id"]: e["message"]["method"]
+        for e in entries
+        if e["from"] == "server" and "method" in e["message"] and "id" in e["message"]
+    }
+    answers: Dict[str, deque] = defaultdict(deque)
+    schedule = []
+    for entry in entries:
+        message = entry["message"]
+        if entry["from"] != "client":
+            continue
+        if "method" not in message and message.get("id") in server_methods:
+            answers[server_methods[message["id"]]].append(message)
+        else:
+            schedule.append(entry)
+
+    process = await asyncio.create_subprocess_exec(
+        server,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+        limit=2**26,
+    )
+    sent_at: Dict[object, float] = {}
+    replayed: Dict[object, float] = {}
+    all_answered = asyncio.Event()
+    if not requests:
+        all_answered.set()
+
+    async def read_loop() -> None:
+        while (message := await read_frame(process.stdout)) is not None:
+            if "method" in message:
+                if "id" in message:
+                    recorded = answers[message["method"]]
+                    answer = dict(recorded.popleft()) if recorded else {"result": None}
+                    answer.update(jsonrpc="2.0", id=message["id"])
+                    process.stdin.write(encode(answer))
+                continue
+            request_id = message.get("id")
+            if request_id in sent_at and request_id not in replayed:
+                replayed[request_id] = time.perf_counter() - sent_at[request_id]
+                if len(replayed) == len(requests):
+                    all_answered.set()
+
+    reader = asyncio.create_task(read_loop())
+    started = time.perf_counter()
+    for entry in schedule:
+        if speed is not None:
+            delay = entry["t"] / speed - (time.perf_counter() - started)
+            if delay > 0:
+                await asyncio.sleep(delay)
+        message = entry["message"]
+        if "method" in message and "id" in message:
+            sent_at[message["id"]] = time.perf_counter()
+        process.stdin.write(encode(message))
+        await process.stdin.drain()
+
+    try:
+        await asyncio.wait_for(all_answered.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+    elapsed = time.perf_counter() - started
+
+    if process.returncode is None:
+        process.stdin.close()
+        try:
+            await asyncio.wait_for(process.wait(), timeout=5.0)
+        except asyncio.TimeoutError:
+            process.kill()
+    reader.cancel()
+
+    per_request = []
+    for request_id, request in requests.items():
+        per_request.append(
+            {
+                "id": request_id,
+                "method": request["method"],
+                "original_ms": _ms(request.get("original")),
+                "replay_ms": _ms(replayed.get(request_id)),
+            }
+        )
+    return {"elapsedSeconds": elapsed, "speed": speed, "requests": per_request}
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else seconds * 1000
+
+
+def summarize(report: dict, top: int) -> None:
+    by_method = defaultdict(list)
+    unanswered = 0
+    for request in report["requests"]:
+        if request["replay_ms"] is None:
+            unanswered += 1
+        elif request["original_ms"] is not None:
+            by_method[request["method"]].append(request)
+
+    print(f"replayed in {report['elapsedSeconds']:.2f} s, {unanswered} requests unanswered")
+    for method, requests in sorted(by_method.items()):
+        original = [r["original_ms"] for r in requests]
+        replayed = [r["replay_ms"] for r in requests]
+        deltas = [r["replay_ms"] - r["original_ms"] for r in requests]
+        print(
+            f"  {method}: n={len(requests)} "
+            f"original p50={percentile(original, 50):.2f}ms "
+            f"replay p50={percentile(replayed, 50):.2f}ms "
+            f"delta p50={percentile(deltas, 50):+.2f}ms p95={percentile(deltas, 95):+.2f}ms"
+        )
+
+    compared = [r for reqs in by_method.values() for r in reqs]
+    compared.sort(key=lambda r: r["replay_ms"] - r["original_ms"], reverse=True)
+    if compared[:top]:
+        print("largest slowdowns:")
+    for r in compared[:top]:
+        print(
+            f"  id={r['id']} {r['method']}: {r['original_ms']:.2f}ms -> "
+            f"{r['replay_ms']:.2f}ms ({r['replay_ms'] - r['original_ms']:+.2f}ms)"
+        )
+
+
+def parse_speed(value: str) -> Optional[float]:
+    if value == "max":
+        return None
+    speed = float(value)
+    if speed <= 0:
+        raise argparse.ArgumentTypeError("speed must be positive or 'max'")
+    return speed
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rec = commands.add_parser("record", help="proxy an editor session and record it")
+    rec.add_argument("--trace", type=Path, required=True, help="trace file to write")
+    rec.add_argument("server", nargs=argparse.REMAINDER, help="-- server command line")
+
+    rep = commands.add_parser("replay", help="replay a recorded session")
+    rep.add_argument("trace", type=Path, help="trace file to replay")
+    rep.add_argument("--server", default=str(DEFAULT_SERVER), help="server executable")
+    rep.add_argument(
+        "--speed",
+        type=parse_speed,
+        default=1.0,
+        help="1 for the original pace, N for N times faster, 'max' for no delays",
+    )
+    rep.add_argument(
+        "--timeout", type=float, default=30.0, help="seconds to wait for late responses"
+    )
+    rep.add_argument("--top", type=int, default=10, help="slowest requests to list")
+    rep.add_argument("--json", type=Path, help="also write per-request results here")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.command == "record":
+        server = args.server[1:] if args.server[:1] == ["--"] else args.server
+        if not server:
+            raise SystemExit("error: missing server command after --")
+        return asyncio.run(record(args.trace, server))
+
+    report = asyncio.run(replay(load_trace(args.trace), args.server, args.speed, args.timeout))
+    summarize(report, args.top)
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(report, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+"""
+Poll the server's `$/lapis/stats` request while a benchmark runs.
+
+Each poll records the server's queue gauges: actor mailbox depths, the
+output queue with its peak depth and count of coalesced messages, in-flight
+requests and notification handlers, and registered gauges such as
+`pendingDiagnostics`. The per-method latency histograms are
+cumulative, so only the last answer's are kept. Results are written as
+JSON with one series per gauge:
+
+    {"intervalSeconds": 0.1,
+     "samples": [{"t": 0.0, "mailbox.lsp": 0, "outputQueue": 3, ...}, ...],
+     "latency": {"textDocument/hover": {"count": ..., "buckets": [...]}}}
+
+The server reports latency as a list of histograms with a `method` field;
+the collector keys them by method.
+
+Benchmarks collect stats with `--collect-stats SECONDS`; the load generator
+takes `--stats PATH`.
+"""
+
+import asyncio
+import itertools
+import json
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+STATS_METHOD = "$/lapis/stats"
+
+
+def to_plain(value):
+    """Turn the objects pygls may build for unknown responses back into dicts and lists."""
+    if hasattr(value, "_asdict"):
+        return to_plain(value._asdict())
+    if isinstance(value, dict):
+        return {k: to_plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_plain(v) for v in value]
+    return value
+
+
+def client_fetcher(client) -> Callable[[], Awaitable[dict]]:
+    """Fetch stats through a pytest-lsp client."""
+
+    async def fetch() -> dict:
+        return to_plain(await client.protocol.send_request_async(STATS_METHOD, {}))
+
+    return fetch
+
+
+def session_fetcher(session, first_id: int) -> Callable[[], Awaitable[dict]]:
+    """Fetch stats through a raw loadgen session, using IDs from `first_id` up."""
+    ids = itertools.count(first_id)
+
+    async def fetch() -> dict:
+        response = await session.request(next(ids), STATS_METHOD, {})
+        return response["result"]
+
+    return fetch
+
+
+def flatten(stats: dict) -> Dict[str, int]:
+    """One value per gauge, e.g. `mailbox.vfs` or `gauge.pendingDiagnostics`."""
+    values = {f"mailbox.{name}": depth for name, depth in stats["mailboxes"].items()}
+    for key in (
+        "outputQueue",
+        "outputQueuePeak",
+        "outputCoalesced",
+        "pendingRequests",
+        "notificationTasks",
+    ):
+        values[key] = stats[key]
+    values.update({f"gauge.{name}": value for name, value in stats["gauges"].items()})
+    return values
+
+
+def latency_by_method(stats: dict) -> Dict[str, dict]:
+    return {h["method"]: h for h in stats["latency"]}
+
+
+def histogram_percentile(histogram: dict, p: float) -> Optional[float]:
+    """Upper bound in ms of the bucket holding the p-th percentile; None if unbounded."""
+    rank = p / 100 * histogram["count"]
+    seen = 0
+    for bucket in histogram["buckets"]:
+        seen += bucket["count"]
+        if seen >= rank and bucket["count"]:
+            return None if bucket["leUs"] is None else bucket["leUs"] / 1000
+    return None
+
+
+class StatsCollector:
+    """Polls `fetch` every `interval` seconds until stopped."""
+
+    def __init__(self, fetch: Callable[[], Awaitable[dict]], interval: float = 0.1):
+        self.fetch = fetch
+        self.interval = interval
+        self.samples: List[dict] = []
+        self.latency: Dict[str, dict] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._poll())
+
+    async def _poll(self) -> None:
+        started = time.perf_counter()
+        while True:
+            sent = time.perf_counter()
+            stats = await self.fetch()
+            self.samples.append({"t": sent - started, **flatten(stats)})
+            self.latency = latency_by_method(stats)
+            await asyncio.sleep(max(0.0, self.interval - (time.perf_counter() - sent)))
+
+    async def stop(self) -> None:
+        """Take a last sample, so short runs still report their histograms."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self.latency = latency_by_method(await self.fetch())
+
+    def peaks(self) -> Dict[str, int]:
+        peaks: Dict[str, int] = {}
+        for sample in self.samples:
+            for key, value in sample.items():
+                if key != "t":
+                    peaks[key] = max(peaks.get(key, 0), value)
+        return peaks
+
+    def summary(self) -> str:
+        lines = ["peak " + " ".join(f"{k}={v}" for k, v in sorted(self.peaks().items()))]
+        for method, histogram in sorted(self.latency.items()):
+            p50 = histogram_percentile(histogram, 50)
+            p99 = histogram_percentile(histogram, 99)
+            lines.append(
+                f"  {method}: n={histogram['count']} server p50<={_bound(p50)} "
+                f"p99<={_bound(p99)} max={histogram['maxUs'] / 1000:.2f}ms"
+            )
+        return "\n".join(lines)
+
+    def write(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        report = {
+            "intervalSeconds": self.interval,
+            "samples": self.samples,
+            "latency": self.latency,
+        }
+        path.write_text(json.dumps(report, indent=2) + "\n")
+
+
+def _bound(millis: Optional[float]) -> str:
+    return "inf" if millis is None else f"{millis:g}ms"
@@ -0,0 +1,153 @@
+"""
+How much a `$/cancelRequest` actually gives back.
+
+Each scenario saturates the server with slow `test/slow` requests, which
+burn CPU for --slow-ms, while a probe measures completion latency for an
+unrelated request. The slow requests are cancelled after a delay, or not
+at all for the reference run. Handlers are either cooperative (they poll
+`ctx.isCancelled`) or not.
+
+Reported per scenario: time from cancel to the `requestCancelled` answer,
+probe latency, and server CPU spent until the slow handlers have finished.
+CPU recovered is the difference from the uncancelled run.
+"""
+
+import asyncio
+import os
+import time
+
+import pytest
+from harness import LatencyStats, process_cpu_seconds
+from loadgen import DEFAULT_SERVER, encode, start_session, stop_session
+
+REQUEST_CANCELLED = -32800
+
+# A cancelled request must be answered within this many seconds of the cancel
+CANCEL_RESPONSE_LIMIT = 0.25
+
+PROBE_INTERVAL = 0.02
+
+# Request IDs are allocated in blocks of this size, one block per scenario
+IDS_PER_SCENARIO = 100_000
+
+
+async def run_scenario(
+    session, base_id: int, slow_ms: int, cooperative: bool, cancel_after
+) -> dict:
+    """Saturate the server, optionally cancel, and measure what was recovered."""
+    workers = os.cpu_count() or 4
+    pid = session.process.pid
+    cpu_before = process_cpu_seconds(pid)
+    started = time.perf_counter()
+
+    slow = []
+    for i in range(workers):
+        request_id = base_id + i
+        slow.append((request_id, session.expect(request_id)))
+        session.write(
+            encode(
+                {
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "method": "test/slow",
+                    "params": {"millis": slow_ms, "cooperative": cooperative},
+                }
+            )
+        )
+    await session.process.stdin.drain()
+
+    probe_samples = []
+
+    async def probe():
+        probe_id = base_id + workers
+        deadline = started + slow_ms / 1000
+        while time.perf_counter() < deadline:
+            sent = time.perf_counter()
+            await session.request(
+                probe_id,
+                "textDocument/completion",
+                {
+                    "textDocument": {"uri": "file:///loadgen.txt"},
+                    "position": {"line": 0, "character": 0},
+                },
+            )
+            probe_samples.append(time.perf_counter() - sent)
+            probe_id += 1
+            await asyncio.sleep(PROBE_INTERVAL)
+
+    probing = asyncio.create_task(probe())
+
+    cancel_latencies = []
+    codes = []
+    if cancel_after is not None:
+        await asyncio.sleep(cancel_after / 1000)
+        cancelled_at = time.perf_counter()
+        for request_id, _ in slow:
+            session.write(
+                encode({"jsonrpc": "2.0", "method": "$/cancelRequest", "params": {"id": request_id}})
+            )
+        await session.process.stdin.drain()
+        for _, future in slow:
+            response = await future
+            cancel_latencies.append(time.perf_counter() - cancelled_at)
+            codes.append(response.get("error", {}).get("code"))
+    else:
+        await asyncio.gather(*(future for _, future in slow))
+
+    await probing
+    # Let handlers that ignore the cancellation run to the end before reading CPU
+    remaining = started + slow_ms / 1000 * 1.5 - time.perf_counter()
+    if remaining > 0:
+        await asyncio.sleep(remaining)
+    cpu = process_cpu_seconds(pid) - cpu_before
+
+    return {
+        "cpu": cpu,
+        "probe": LatencyStats.from_samples(probe_samples, time.perf_counter() - started),
+        "cancelLatencies": cancel_latencies,
+        "codes": codes,
+    }
+
+
+@pytest.fixture
+def cancel_options(pytestconfig):
+    delays = [int(d) for d in pytestconfig.getoption("cancel_delays").split(",")]
+    return pytestconfig.getoption("slow_ms"), delays
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cooperative", [False, True], ids=["blocking", "cooperative"])
+async def test_cancellation_recovers_work(cancel_options, cooperative):
+    slow_ms, delays = cancel_options
+    session = await start_session(str(DEFAULT_SERVER))
+    try:
+        reference = await run_scenario(session, IDS_PER_SCENARIO, slow_ms, cooperative, None)
+        print(
+            f"\nuncancelled: cpu={reference['cpu']:.2f}s probe {reference['probe']}"
+        )
+
+        slow_answers = []
+        for i, delay in enumerate(delays, start=2):
+            result = await run_scenario(
+                session, i * IDS_PER_SCENARIO, slow_ms, cooperative, delay
+            )
+            worst = max(result["cancelLatencies"])
+            recovered = reference["cpu"] - result["cpu"]
+            print(
+                f"cancel after {delay}ms: answered in <= {worst * 1000:.1f}ms, "
+                f"cpu={result['cpu']:.2f}s (recovered {recovered:.2f}s), "
+                f"probe {result['probe']}"
+            )
+
+            assert all(code == REQUEST_CANCELLED for code in result["codes"]), (
+                f"Cancelled requests answered with {result['codes']}"
+            )
+            if worst > CANCEL_RESPONSE_LIMIT:
+                slow_answers.append(f"{delay}ms: {worst * 1000:.0f}ms")
+    finally:
+        await stop_session(session, 1)
+
+    assert not slow_answers, (
+        f"requestCancelled took longer than {CANCEL_RESPONSE_LIMIT * 1000:.0f}ms: "
+        + ", ".join(slow_answers)
+    )
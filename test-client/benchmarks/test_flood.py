@@ -0,0 +1,136 @@
+"""
+Sustained didChange flood on documents from kilobytes to megabytes.
+
+Edits are streamed at keystroke rate without waiting for the server. Each
+edit inserts a `TODO` line, so the number of diagnostics in a publish tells
+which edit it reflects; that gives edit-to-publishDiagnostics latency even
+when the server coalesces or reorders its publishes.
+
+The test server rescans the whole document for every publish, so latency
+includes a linear diagnostics pass; server CPU time per edit is reported
+alongside it to separate the VFS cost from that pass across sizes.
+"""
+
+import asyncio
+import json
+import random
+import time
+
+import pytest
+from harness import (
+    RESULTS_DIR,
+    DiagnosticsWatcher,
+    LatencyStats,
+    process_cpu_seconds,
+    server_pid,
+)
+from lsprotocol.types import (
+    DidChangeTextDocumentParams,
+    DidOpenTextDocumentParams,
+    TextDocumentItem,
+    VersionedTextDocumentIdentifier,
+)
+
+FILLER_LINE = "the quick brown fox jumps over the lazy dog 0123456789\n"
+
+RESULTS_FILE = RESULTS_DIR / "didchange-flood.json"
+
+# How long the server may take to catch up after the last edit is sent
+SETTLE_TIMEOUT = 300.0
+
+
+def make_document(size: int) -> str:
+    repeats = max(1, size // len(FILLER_LINE))
+    return FILLER_LINE * repeats
+
+
+@pytest.fixture
+def flood_options(pytestconfig):
+    return (
+        pytestconfig.getoption("flood_edits"),
+        pytestconfig.getoption("keystroke_interval"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_didchange_flood(client, document_size, flood_options):
+    edits, interval = flood_options
+    uri = f"file:///bench_flood_{document_size}.txt"
+    text = make_document(document_size)
+    line_count = text.count("\n")
+    rng = random.Random(document_size)
+
+    watcher = DiagnosticsWatcher.install(client)
+    published = watcher.next_publish(uri)
+    client.text_document_did_open(
+        DidOpenTextDocumentParams(
+            text_document=TextDocumentItem(
+                uri=uri, language_id="plaintext", version=1, text=text
+            )
+        )
+    )
+    await asyncio.wait_for(published, timeout=60.0)
+
+    sent_at = []
+    samples = []
+    done = asyncio.get_running_loop().create_future()
+
+    def on_publish(diagnostics):
+        # Every edit before the one this publish reflects is now visible too
+        now = time.perf_counter()
+        while len(samples) < min(len(diagnostics), len(sent_at)):
+            samples.append(now - sent_at[len(samples)])
+        if len(samples) == edits and not done.done():
+            done.set_result(None)
+
+    watcher.subscribe(uri, on_publish)
+
+    pid = await server_pid(client)
+    cpu_before = process_cpu_seconds(pid)
+    started = time.perf_counter()
+
+    for i in range(edits):
+        line = rng.randrange(line_count + i)
+        sent_at.append(time.perf_counter())
+        client.text_document_did_change(
+            DidChangeTextDocumentParams(
+                text_document=VersionedTextDocumentIdentifier(uri=uri, version=i + 2),
+                content_changes=[
+                    {
+                        "range": {
+                            "start": {"line": line, "character": 0},
+                            "end": {"line": line, "character": 0},
+                        },
+                        "text": "TODO\n",
+                    }
+                ],
+            )
+        )
+        await asyncio.sleep(interval)
+
+    try:
+        await asyncio.wait_for(done, timeout=SETTLE_TIMEOUT)
+    except asyncio.TimeoutError:
+        pytest.fail(f"Only {len(samples)} of {edits} edits reached diagnostics")
+
+    elapsed = time.perf_counter() - started
+    cpu = process_cpu_seconds(pid) - cpu_before
+    stats = LatencyStats.from_samples(samples, elapsed)
+
+    print(
+        f"\n{document_size} bytes: {stats} "
+        f"server cpu={cpu:.2f}s ({cpu / edits * 1e6:.0f}us/edit)"
+    )
+
+    results = json.loads(RESULTS_FILE.read_text()) if RESULTS_FILE.exists() else {}
+    results[str(document_size)] = {
+        "edits": edits,
+        "keystrokeInterval": interval,
+        "p50_ms": stats.p50_ms,
+        "p95_ms": stats.p95_ms,
+        "p99_ms": stats.p99_ms,
+        "serverCpuSeconds": cpu,
+        "cpuPerEditUs": cpu / edits * 1e6,
+    }
+    RESULTS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    RESULTS_FILE.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
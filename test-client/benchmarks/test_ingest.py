@@ -0,0 +1,95 @@
+"""
+How many messages per second the server can read off stdin.
+
+A burst of notifications for a method without a handler is written in one
+go, followed by a `$/lapis/stats` request. The LSP actor answers that
+request after it has taken every earlier notification from its mailbox, so
+the time to the answer covers framing, envelope parsing and routing, and
+almost nothing else. Bodies are padded to each --ingest-body-sizes value;
+since nothing handles the method, the padded params are never decoded.
+
+Each size is recorded in the latency baseline as `ingest/<size>`; run the
+benchmark on the old and the new build to compare messages per second.
+
+A burst arrives faster than the server reads, which hides a reader that
+waits for more input than one message. So `test_interactive_round_trips`
+also behaves like an editor: it sends one request and waits for its answer
+before sending the next, with a timeout on each one. It is recorded as
+`ingest/interactive`.
+"""
+
+import asyncio
+import time
+
+import pytest
+from harness import LatencyStats
+from loadgen import DEFAULT_SERVER, encode, start_session, stop_session
+
+# Routed like any notification, but nothing handles it
+METHOD = "$/lapis/ingestBenchmark"
+
+RUNS = 5
+
+INTERACTIVE_ROUND_TRIPS = 1000
+
+# A reader that waits for more than one message never answers; fail instead of hanging
+ROUND_TRIP_TIMEOUT = 5.0
+
+
+def build_burst(count: int, body_size: int) -> bytes:
+    """`count` framed notifications whose bodies are about `body_size` bytes."""
+    empty = len(encode({"jsonrpc": "2.0", "method": METHOD, "params": {"pad": ""}}))
+    padding = "x" * max(0, body_size - empty)
+    message = encode({"jsonrpc": "2.0", "method": METHOD, "params": {"pad": padding}})
+    return message * count
+
+
+@pytest.mark.asyncio
+async def test_ingest_rate(pytestconfig, baseline):
+    count = pytestconfig.getoption("ingest_messages")
+    sizes = pytestconfig.getoption("ingest_body_sizes").split(",")
+
+    session = await start_session(str(DEFAULT_SERVER))
+    next_id = 1
+    regressions = []
+    try:
+        for size in sizes:
+            burst = build_burst(count, int(size))
+            samples = []
+            for _ in range(RUNS):
+                started = time.perf_counter()
+                session.write(burst)
+                await session.request(next_id, "$/lapis/stats", {})
+                samples.append(time.perf_counter() - started)
+                next_id += 1
+
+            # Per-burst latencies, with throughput counted in messages
+            stats = LatencyStats.from_samples(samples, sum(samples) / count)
+            print(f"\ningest {size}B bodies: {stats.throughput:.0f} messages/s ({stats})")
+            regressions += baseline.check(f"ingest/{size}", 1, stats)
+    finally:
+        await stop_session(session, next_id)
+
+    assert not regressions, "Ingest rate regressed:\n" + "\n".join(regressions)
+
+
+@pytest.mark.asyncio
+async def test_interactive_round_trips(baseline):
+    session = await asyncio.wait_for(start_session(str(DEFAULT_SERVER)), ROUND_TRIP_TIMEOUT)
+    next_id = 1
+    try:
+        samples = []
+        for _ in range(INTERACTIVE_ROUND_TRIPS):
+            started = time.perf_counter()
+            await asyncio.wait_for(
+                session.request(next_id, "$/lapis/stats", {}), ROUND_TRIP_TIMEOUT
+            )
+            samples.append(time.perf_counter() - started)
+            next_id += 1
+    finally:
+        await stop_session(session, next_id)
+
+    stats = LatencyStats.from_samples(samples, sum(samples))
+    print(f"\ninteractive round trips: {stats.throughput:.0f}/s ({stats})")
+    regressions = baseline.check("ingest/interactive", 1, stats)
+    assert not regressions, "Interactive round trips regressed:\n" + "\n".join(regressions)
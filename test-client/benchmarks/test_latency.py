@@ -0,0 +1,118 @@
+"""
+Latency percentile benchmarks for hover, completion and diagnostics.
+
+Each benchmark drives one method at a given concurrency level, records
+p50/p95/p99 latency and throughput, and compares them with the baseline.
+"""
+
+import asyncio
+
+import pytest
+from harness import DiagnosticsWatcher, run_load
+from lsprotocol.types import (
+    CompletionParams,
+    DidChangeTextDocumentParams,
+    DidOpenTextDocumentParams,
+    HoverParams,
+    Position,
+    TextDocumentIdentifier,
+    TextDocumentItem,
+    VersionedTextDocumentIdentifier,
+)
+
+# Requests sent before measuring, so process startup and first-use costs
+# do not land in the percentiles
+WARMUP_REQUESTS = 20
+
+DOCUMENT = "\n".join(f"line {i} has some words to hover over" for i in range(200))
+
+
+def open_document(client, uri: str, text: str = DOCUMENT) -> None:
+    client.text_document_did_open(
+        DidOpenTextDocumentParams(
+            text_document=TextDocumentItem(
+                uri=uri, language_id="plaintext", version=1, text=text
+            )
+        )
+    )
+
+
+def report(baseline, method: str, concurrency: int, stats) -> None:
+    print(f"\n{method} @ {concurrency}: {stats}")
+    regressions = baseline.check(method, concurrency, stats)
+    assert not regressions, "Latency regressed:\n" + "\n".join(regressions)
+
+
+@pytest.mark.asyncio
+async def test_hover_latency(client, concurrency, baseline, bench_requests):
+    """Hover requests on an open document."""
+    uri = "file:///bench_hover.txt"
+    open_document(client, uri)
+
+    async def hover(_worker: int, index: int):
+        await client.text_document_hover_async(
+            HoverParams(
+                text_document=TextDocumentIdentifier(uri=uri),
+                position=Position(line=index % 200, character=index % 30),
+            )
+        )
+
+    await run_load(concurrency, WARMUP_REQUESTS, hover)
+    stats = await run_load(concurrency, bench_requests, hover)
+    report(baseline, "textDocument/hover", concurrency, stats)
+
+
+@pytest.mark.asyncio
+async def test_completion_latency(client, concurrency, baseline, bench_requests):
+    """Completion requests on an open document."""
+    uri = "file:///bench_completion.txt"
+    open_document(client, uri)
+
+    async def complete(_worker: int, index: int):
+        await client.text_document_completion_async(
+            CompletionParams(
+                text_document=TextDocumentIdentifier(uri=uri),
+                position=Position(line=index % 200, character=0),
+            )
+        )
+
+    await run_load(concurrency, WARMUP_REQUESTS, complete)
+    stats = await run_load(concurrency, bench_requests, complete)
+    report(baseline, "textDocument/completion", concurrency, stats)
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_latency(client, concurrency, baseline, bench_requests):
+    """
+    Time from `didChange` to the matching `publishDiagnostics`.
+
+    Every worker owns one document and keeps a single edit in flight, so the
+    next diagnostics published for that URI answer the edit just sent.
+    """
+    watcher = DiagnosticsWatcher.install(client)
+    uris = [f"file:///bench_diagnostics_{w}.txt" for w in range(concurrency)]
+    versions = dict.fromkeys(uris, 1)
+
+    for uri in uris:
+        published = watcher.next_publish(uri)
+        open_document(client, uri)
+        await asyncio.wait_for(published, timeout=10.0)
+
+    async def edit(worker: int, index: int):
+        uri = uris[worker]
+        versions[uri] += 1
+        marker = "TODO" if index % 2 else "FIXME"
+        published = watcher.next_publish(uri)
+        client.text_document_did_change(
+            DidChangeTextDocumentParams(
+                text_document=VersionedTextDocumentIdentifier(
+                    uri=uri, version=versions[uri]
+                ),
+                content_changes=[{"text": f"{marker} edit {index}\n{DOCUMENT}"}],
+            )
+        )
+        await asyncio.wait_for(published, timeout=10.0)
+
+    await run_load(concurrency, WARMUP_REQUESTS, edit)
+    stats = await run_load(concurrency, bench_requests, edit)
+    report(baseline, "textDocument/publishDiagnostics", concurrency, stats)
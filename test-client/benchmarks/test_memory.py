@@ -0,0 +1,140 @@
+"""
+Long-session memory growth of the server process.
+
+A scripted session repeats open, edit, close cycles. Every cycle streams
+edits into its documents, which covers per-document history (append-only
+piece table buffers, kept snapshots), then closes them, which covers state
+left behind for closed documents. URIs are unique per cycle: diagnostics
+carry no version on the client side, so a late publish for a reused URI
+could otherwise satisfy the next cycle's wait. RSS is read from
+`/proc/<pid>/status` after each cycle, once every document is closed.
+
+The first cycles are warm-up: allocator arenas and caches grow there and
+are expected to. After that, RSS with all documents closed must stay
+within --memory-growth-limit of the warm-up level.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+from harness import RESULTS_DIR, DiagnosticsWatcher, process_rss_kib, server_pid
+from lsprotocol.types import (
+    DidChangeTextDocumentParams,
+    DidCloseTextDocumentParams,
+    DidOpenTextDocumentParams,
+    HoverParams,
+    Position,
+    TextDocumentIdentifier,
+    TextDocumentItem,
+    VersionedTextDocumentIdentifier,
+)
+
+DOCUMENTS_PER_CYCLE = 4
+EDITS_PER_DOCUMENT = 50
+DOCUMENT = "the quick brown fox jumps over the lazy dog\n" * 2000
+
+# Fraction of the cycles (at least one) treated as warm-up
+WARMUP_FRACTION = 0.1
+
+RESULTS_FILE = RESULTS_DIR / "memory-growth.json"
+
+
+async def edit_cycle(client, watcher: DiagnosticsWatcher, uris) -> None:
+    """Open every URI, stream edits into it, wait until they are applied, close it."""
+    for uri in uris:
+        client.text_document_did_open(
+            DidOpenTextDocumentParams(
+                text_document=TextDocumentItem(
+                    uri=uri, language_id="plaintext", version=1, text=DOCUMENT
+                )
+            )
+        )
+
+    applied = []
+    for uri in uris:
+        # Each edit adds one TODO diagnostic, so the count shows all edits landed
+        applied.append(watcher.wait_for(uri, lambda d: len(d) >= EDITS_PER_DOCUMENT))
+        for i in range(EDITS_PER_DOCUMENT):
+            line = (i * 37) % 2000
+            client.text_document_did_change(
+                DidChangeTextDocumentParams(
+                    text_document=VersionedTextDocumentIdentifier(uri=uri, version=i + 2),
+                    content_changes=[
+                        {
+                            "range": {
+                                "start": {"line": line, "character": 0},
+                                "end": {"line": line, "character": 0},
+                            },
+                            "text": "TODO edited\n",
+                        }
+                    ],
+                )
+            )
+    await asyncio.wait_for(asyncio.gather(*applied), timeout=60.0)
+
+    for uri in uris:
+        client.text_document_did_close(
+            DidCloseTextDocumentParams(text_document=TextDocumentIdentifier(uri=uri))
+        )
+
+    # The hover is answered after the VFS has processed the closes above
+    await client.text_document_hover_async(
+        HoverParams(
+            text_document=TextDocumentIdentifier(uri=uris[-1]),
+            position=Position(line=0, character=0),
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_memory_growth_after_close(client, pytestconfig):
+    cycles = pytestconfig.getoption("memory_cycles")
+    duration = pytestconfig.getoption("memory_duration")
+    limit_kib = pytestconfig.getoption("memory_growth_limit") * 1024
+
+    watcher = DiagnosticsWatcher.install(client)
+    pid = await server_pid(client)
+    started = time.perf_counter()
+    samples = [{"cycle": 0, "seconds": 0.0, "rssKiB": process_rss_kib(pid)}]
+
+    def more_cycles() -> bool:
+        if duration > 0:
+            return time.perf_counter() - started < duration
+        return cycle < cycles
+
+    cycle = 0
+    while more_cycles():
+        cycle += 1
+        uris = [f"file:///memory_{cycle}_{j}.txt" for j in range(DOCUMENTS_PER_CYCLE)]
+        await edit_cycle(client, watcher, uris)
+        samples.append(
+            {
+                "cycle": cycle,
+                "seconds": time.perf_counter() - started,
+                "rssKiB": process_rss_kib(pid),
+            }
+        )
+
+    warmup = max(1, int(cycle * WARMUP_FRACTION))
+    settled = samples[warmup]["rssKiB"]
+    final = samples[-1]["rssKiB"]
+    peak = max(s["rssKiB"] for s in samples[warmup:])
+    growth = peak - settled
+
+    print(
+        f"\n{cycle} cycles in {samples[-1]['seconds']:.0f}s: "
+        f"rss after warm-up {settled / 1024:.1f} MiB, final {final / 1024:.1f} MiB, "
+        f"peak growth {growth / 1024:.1f} MiB"
+    )
+
+    RESULTS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    RESULTS_FILE.write_text(
+        json.dumps({"warmupCycles": warmup, "samples": samples}, indent=2) + "\n"
+    )
+
+    assert growth <= limit_kib, (
+        f"RSS grew by {growth / 1024:.1f} MiB after warm-up "
+        f"(limit {limit_kib / 1024:.1f} MiB); samples in {RESULTS_FILE}"
+    )
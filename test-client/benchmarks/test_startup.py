@@ -0,0 +1,108 @@
+"""
+Server startup time, measured from process spawn.
+
+Each run launches a fresh server and speaks raw JSON-RPC to it, so that
+pytest-lsp's own setup is not included. Two intervals are timed from
+spawn: until the initialize result arrives, and until the first
+`publishDiagnostics` for a document opened right after `initialized`.
+"""
+
+import asyncio
+import time
+
+import pytest
+from harness import LatencyStats
+from loadgen import DEFAULT_SERVER, encode, read_frame
+
+URI = "file:///bench_startup.txt"
+
+
+async def read_until(process, predicate) -> dict:
+    while True:
+        message = await read_frame(process.stdout)
+        if message is None:
+            raise ConnectionError("server exited during startup")
+        if predicate(message):
+            return message
+
+
+async def launch_once() -> tuple:
+    """Spawn, initialize and open a document; returns both intervals in seconds."""
+    spawned = time.perf_counter()
+    process = await asyncio.create_subprocess_exec(
+        str(DEFAULT_SERVER),
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    try:
+        process.stdin.write(
+            encode(
+                {
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "method": "initialize",
+                    "params": {"processId": None, "rootUri": None, "capabilities": {}},
+                }
+            )
+        )
+        await process.stdin.drain()
+        await read_until(process, lambda m: m.get("id") == 1 and "method" not in m)
+        initialized = time.perf_counter() - spawned
+
+        process.stdin.write(encode({"jsonrpc": "2.0", "method": "initialized", "params": {}}))
+        process.stdin.write(
+            encode(
+                {
+                    "jsonrpc": "2.0",
+                    "method": "textDocument/didOpen",
+                    "params": {
+                        "textDocument": {
+                            "uri": URI,
+                            "languageId": "plaintext",
+                            "version": 1,
+                            "text": "TODO: first diagnostic",
+                        }
+                    },
+                }
+            )
+        )
+        await process.stdin.drain()
+        await read_until(
+            process, lambda m: m.get("method") == "textDocument/publishDiagnostics"
+        )
+        first_diagnostic = time.perf_counter() - spawned
+
+        process.stdin.write(encode({"jsonrpc": "2.0", "id": 2, "method": "shutdown"}))
+        process.stdin.write(encode({"jsonrpc": "2.0", "method": "exit"}))
+        await process.stdin.drain()
+        await asyncio.wait_for(process.wait(), timeout=5.0)
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+    return initialized, first_diagnostic
+
+
+@pytest.mark.asyncio
+async def test_startup_time(pytestconfig, baseline):
+    runs = pytestconfig.getoption("startup_runs")
+
+    init_samples = []
+    diagnostic_samples = []
+    started = time.perf_counter()
+    for _ in range(runs):
+        initialized, first_diagnostic = await asyncio.wait_for(launch_once(), timeout=30.0)
+        init_samples.append(initialized)
+        diagnostic_samples.append(first_diagnostic)
+    elapsed = time.perf_counter() - started
+
+    regressions = []
+    for name, samples in (
+        ("startup/initialize", init_samples),
+        ("startup/firstDiagnostic", diagnostic_samples),
+    ):
+        stats = LatencyStats.from_samples(samples, elapsed)
+        print(f"\n{name}: {stats}")
+        regressions += baseline.check(name, 1, stats)
+    assert not regressions, "Startup regressed:\n" + "\n".join(regressions)
@@ -1,5 +1,8 @@
+import asyncio
 import os
+import re
 
+import pytest
 import pytest_lsp
 from lsprotocol.types import ClientCapabilities, InitializeParams
 from pytest_lsp import ClientServerConfig, LanguageClient
@@ -9,6 +12,11 @@ SERVER_PATH = os.path.join(
     os.path.dirname(__file__), "..", "..", ".lake", "build", "bin", "test"
 )
 
+# Serves sessions over TCP; built separately with `lake build test-tcp`
+TCP_SERVER_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "..", ".lake", "build", "bin", "test-tcp"
+)
+
 
 @pytest_lsp.fixture(
     config=ClientServerConfig(server_command=[SERVER_PATH]),
@@ -24,3 +32,86 @@ async def client(lsp_client: LanguageClient):
 
     # Teardown: Shutdown the LSP session
     await lsp_client.shutdown_session()
+
+
+@pytest_lsp.fixture(
+    config=ClientServerConfig(
+        server_command=[SERVER_PATH, "--output-queue-capacity", "0"]
+    ),
+)
+async def small_queue_client(lsp_client: LanguageClient):
+    """
+    Like `client`, but the server's output queue holds a single message.
+
+    The server is asked for capacity 0, which it clamps to 1, so every send
+    waits for the writer to drain the previous message.
+    """
+    await lsp_client.initialize_session(
+        InitializeParams(capabilities=ClientCapabilities())
+    )
+
+    yield
+
+    await lsp_client.shutdown_session()
+
+
+@pytest_lsp.fixture(
+    scope="session",
+    loop_scope="session",
+    config=ClientServerConfig(server_command=[SERVER_PATH]),
+)
+async def shared_client(lsp_client: LanguageClient):
+    """
+    One LSP session shared by every test that requests it.
+
+    Sessions are per process, so under pytest-xdist each worker gets its own
+    server. Spawning and initializing a server per test dominates suite time. Tests
+    that only touch their own documents can use this instead of `client`,
+    naming them with `unique_uri`. They must run on the session event loop:
+    mark them `@pytest.mark.asyncio(loop_scope="session")`.
+    """
+    await lsp_client.initialize_session(
+        InitializeParams(capabilities=ClientCapabilities())
+    )
+
+    yield
+
+    await lsp_client.shutdown_session()
+
+
+@pytest.fixture
+def unique_uri(request):
+    """Factory for document URIs private to the current test and xdist worker."""
+    # Set by pytest-xdist in its workers; the suite also runs without it
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    prefix = re.sub(r"[^A-Za-z0-9_.-]", "_", request.node.nodeid)
+
+    def make(name: str = "doc.txt") -> str:
+        return f"file:///{worker_id}/{prefix}/{name}"
+
+    return make
+
+
+@pytest.fixture
+async def tcp_port():
+    """Port of a server process hosting one session per TCP connection."""
+    if not os.path.exists(TCP_SERVER_PATH):
+        pytest.skip("TCP test server not built (lake build test-tcp)")
+    # The server binds port 0 and reports the port it got, so no other
+    # process (or xdist worker) can take it in between
+    process = await asyncio.create_subprocess_exec(
+        TCP_SERVER_PATH,
+        "0",
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    line = await asyncio.wait_for(process.stdout.readline(), timeout=10.0)
+    match = re.fullmatch(rb"listening on (\d+)\s*", line)
+    if match is None:
+        process.kill()
+        pytest.fail(f"TCP server did not report its port: {line!r}")
+
+    yield int(match.group(1))
+
+    process.kill()
+    await process.wait()
@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+from lsprotocol.types import (
+    TEXT_DOCUMENT_PUBLISH_DIAGNOSTICS,
+    DidOpenTextDocumentParams,
+    HoverParams,
+    Position,
+    TextDocumentIdentifier,
+    TextDocumentItem,
+)
+
+
+async def open_and_wait(client, uri: str, text: str):
+    """Open a document and wait until diagnostics for that URI arrive."""
+    client.text_document_did_open(
+        DidOpenTextDocumentParams(
+            text_document=TextDocumentItem(
+                uri=uri, language_id="plaintext", version=1, text=text
+            )
+        )
+    )
+
+    async def wait():
+        while uri not in client.diagnostics:
+            await client.wait_for_notification(TEXT_DOCUMENT_PUBLISH_DIAGNOSTICS)
+
+    try:
+        await asyncio.wait_for(wait(), timeout=5.0)
+    except asyncio.TimeoutError:
+        pytest.fail(f"Timed out waiting for diagnostics on {uri}")
+    return client.diagnostics[uri]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_shared_session_todo(shared_client, unique_uri):
+    """Diagnostics on a shared server only reflect this test's document."""
+    diagnostics = await open_and_wait(shared_client, unique_uri(), "TODO: shared")
+    assert [d.message for d in diagnostics] == ["TODO comment found"]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_shared_session_clean_document(shared_client, unique_uri):
+    """A second test on the same server starts from its own empty document."""
+    diagnostics = await open_and_wait(shared_client, unique_uri(), "nothing to report")
+    assert diagnostics == []
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_shared_session_hover(shared_client, unique_uri):
+    """Requests against a unique URI see only that document's content."""
+    uri = unique_uri("hover.txt")
+    await open_and_wait(shared_client, uri, "isolated words")
+
+    result = await shared_client.text_document_hover_async(
+        HoverParams(
+            text_document=TextDocumentIdentifier(uri=uri),
+            position=Position(line=0, character=2),
+        )
+    )
+
+    assert result is not None
+    assert "isolated" in result.contents.value
@@ -9,6 +9,7 @@ import asyncio
 
 import pytest
 from lsprotocol.types import (
+    TEXT_DOCUMENT_PUBLISH_DIAGNOSTICS,
     DidChangeTextDocumentParams,
     DidOpenTextDocumentParams,
     HoverParams,
@@ -19,6 +20,7 @@ from lsprotocol.types import (
 )
 from pytest_lsp import LanguageClient
 
+@pytest.mark.serial
 @pytest.mark.asyncio
 async def test_extreme_concurrent_requests(client: LanguageClient):
     """
@@ -61,3 +63,43 @@ async def test_extreme_concurrent_requests(client: LanguageClient):
 
     # If we get here, server didn't deadlock - all 75 requests completed
     assert len(results) == 75
+
+
+@pytest.mark.asyncio
+async def test_single_slot_output_queue(small_queue_client: LanguageClient):
+    """
+    A server whose output queue holds one message still answers everything.
+
+    The server is started with an output queue capacity of 0. Unclamped, the
+    first send would wait forever for room that never comes.
+    """
+    client = small_queue_client
+    uri = "file:///stress_small_queue.txt"
+
+    client.text_document_did_open(
+        DidOpenTextDocumentParams(
+            text_document=TextDocumentItem(
+                uri=uri,
+                language_id="plaintext",
+                version=1,
+                text="TODO\n" * 20,
+            )
+        )
+    )
+    await asyncio.wait_for(
+        client.wait_for_notification(TEXT_DOCUMENT_PUBLISH_DIAGNOSTICS), timeout=5.0
+    )
+    assert len(client.diagnostics.get(uri, [])) == 20
+
+    # Responses queue behind one another for the single slot
+    tasks = [
+        client.text_document_hover_async(
+            HoverParams(
+                text_document=TextDocumentIdentifier(uri=uri),
+                position=Position(line=i % 20, character=0),
+            )
+        )
+        for i in range(40)
+    ]
+    results = await asyncio.wait_for(asyncio.gather(*tasks), timeout=30.0)
+    assert len(results) == 40
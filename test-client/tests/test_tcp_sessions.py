@@ -0,0 +1,94 @@
+"""
+Sessions served over TCP by one server process (`test-tcp PORT`).
+
+pytest-lsp only drives servers over stdio, so these tests speak JSON-RPC
+over the socket directly.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+URI = "file:///tcp/doc.txt"
+
+
+class Connection:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.next_id = 1
+
+    def send(self, message: dict) -> None:
+        body = json.dumps({"jsonrpc": "2.0", **message}).encode()
+        self.writer.write(b"Content-Length: %d\r\n\r\n%s" % (len(body), body))
+
+    async def receive(self) -> dict:
+        length = None
+        while (line := (await self.reader.readline()).strip()):
+            name, _, value = line.partition(b":")
+            if name.lower() == b"content-length":
+                length = int(value)
+        return json.loads(await self.reader.readexactly(length))
+
+    async def request(self, method: str, params) -> dict:
+        request_id = self.next_id
+        self.next_id += 1
+        self.send({"id": request_id, "method": method, "params": params})
+        # Skip notifications such as publishDiagnostics
+        while (message := await self.receive()).get("id") != request_id:
+            pass
+        return message
+
+    async def open_session(self, text: str) -> None:
+        await self.request("initialize", {"processId": None, "rootUri": None, "capabilities": {}})
+        self.send({"method": "initialized", "params": {}})
+        self.send({
+            "method": "textDocument/didOpen",
+            "params": {"textDocument": {"uri": URI, "languageId": "plaintext", "version": 1, "text": text}},
+        })
+
+    async def hover(self) -> str:
+        response = await self.request(
+            "textDocument/hover",
+            {"textDocument": {"uri": URI}, "position": {"line": 0, "character": 1}},
+        )
+        return response["result"]["contents"]["value"]
+
+    async def close(self) -> None:
+        await self.request("shutdown", None)
+        self.send({"method": "exit", "params": None})
+        self.writer.close()
+
+
+async def connect(port: int) -> Connection:
+    return Connection(*await asyncio.open_connection("127.0.0.1", port))
+
+
+@pytest.mark.asyncio
+async def test_tcp_sessions_are_isolated(tcp_port):
+    """Two connections opening the same URI each see their own document and state."""
+    first, second = await connect(tcp_port), await connect(tcp_port)
+    await asyncio.gather(first.open_session("alpha"), second.open_session("bravo"))
+
+    first_hover, second_hover = await asyncio.gather(first.hover(), second.hover())
+    assert "`alpha`" in first_hover
+    assert "`bravo`" in second_hover
+    assert "Requests handled: 1" in first_hover
+    assert "Requests handled: 1" in second_hover
+
+    await first.close()
+    await second.close()
+
+
+@pytest.mark.asyncio
+async def test_tcp_host_outlives_sessions(tcp_port):
+    """A closed session does not stop the host from serving the next connection."""
+    first = await connect(tcp_port)
+    await first.open_session("first")
+    await first.close()
+
+    second = await connect(tcp_port)
+    await second.open_session("second")
+    assert "`second`" in await second.hover()
+    await second.close()
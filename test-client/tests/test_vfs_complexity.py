@@ -0,0 +1,147 @@
+"""
+Scaling tests for the VFS edit path.
+
+Random incremental edits are applied to documents whose sizes span three
+orders of magnitude. A Python reference model replays the same edits and
+the server's content is compared with it after every batch. The cost of a
+single edit is fitted against document size on a log-log scale: sublinear
+structures (finger tree splits, piece table inserts, line index updates)
+give an exponent near 0, a path that copies or rescans the document gives
+one near 1.
+
+Diagnostics are switched off through `test/configure`, because the test
+server's diagnostics rescan the whole document on every change.
+"""
+
+import math
+import random
+import statistics
+import time
+
+import pytest
+from lsprotocol.types import (
+    DidChangeTextDocumentParams,
+    DidOpenTextDocumentParams,
+    TextDocumentItem,
+    VersionedTextDocumentIdentifier,
+)
+
+SIZES = [2_000, 20_000, 200_000, 2_000_000]
+BATCHES = 5
+EDITS_PER_BATCH = 40
+
+# Exponent of the fitted cost ~ size^k above which edits count as linear
+MAX_GROWTH_EXPONENT = 0.5
+
+FILLER_LINE = "lorem ipsum dolor sit amet consectetur adipiscing elit\n"
+ALPHABET = "abcdefghijklmnopqrstuvwxyz      \n"
+
+
+class ReferenceDocument:
+    """Plain string model of a document; ASCII only, so UTF-16 offsets are indices."""
+
+    def __init__(self, text: str):
+        self.text = text
+
+    def position(self, offset: int) -> dict:
+        line = self.text.count("\n", 0, offset)
+        character = offset - (self.text.rfind("\n", 0, offset) + 1)
+        return {"line": line, "character": character}
+
+    def random_edit(self, rng: random.Random) -> dict:
+        """Apply a random insert, delete or replace and return it as an LSP change."""
+        start = rng.randrange(len(self.text) + 1)
+        kind = rng.choice(["insert", "delete", "replace"])
+        end = start if kind == "insert" else min(len(self.text), start + rng.randint(1, 20))
+        text = "" if kind == "delete" else "".join(rng.choices(ALPHABET, k=rng.randint(1, 8)))
+        change = {
+            "range": {"start": self.position(start), "end": self.position(end)},
+            "text": text,
+        }
+        self.text = self.text[:start] + text + self.text[end:]
+        return change
+
+
+def growth_exponent(sizes, costs) -> float:
+    """Least-squares slope of log(cost) against log(size)."""
+    xs = [math.log(s) for s in sizes]
+    ys = [math.log(c) for c in costs]
+    mean_x, mean_y = statistics.fmean(xs), statistics.fmean(ys)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    return covariance / variance
+
+
+async def measure_edit_cost(client, size: int, rng: random.Random) -> float:
+    """Median seconds per edit over several batches, checking content after each."""
+    uri = f"file:///vfs_complexity_{size}.txt"
+    model = ReferenceDocument(FILLER_LINE * (size // len(FILLER_LINE)))
+    client.text_document_did_open(
+        DidOpenTextDocumentParams(
+            text_document=TextDocumentItem(
+                uri=uri, language_id="plaintext", version=1, text=model.text
+            )
+        )
+    )
+
+    version = 1
+    per_edit = []
+    for _ in range(BATCHES):
+        changes = [model.random_edit(rng) for _ in range(EDITS_PER_BATCH)]
+        probe = model.position(rng.randrange(len(model.text) + 1))["line"]
+
+        started = time.perf_counter()
+        for change in changes:
+            version += 1
+            client.text_document_did_change(
+                DidChangeTextDocumentParams(
+                    text_document=VersionedTextDocumentIdentifier(uri=uri, version=version),
+                    content_changes=[change],
+                )
+            )
+        # Answered only after the VFS has applied every edit above
+        line = await client.protocol.send_request_async(
+            "test/documentLine", {"uri": uri, "line": probe}
+        )
+        per_edit.append((time.perf_counter() - started) / EDITS_PER_BATCH)
+
+        assert line.text == model.text.split("\n")[probe]
+        result = await client.protocol.send_request_async(
+            "test/documentContent", {"uri": uri}
+        )
+        assert result.content == model.text, f"content diverged at version {version}"
+
+    return statistics.median(per_edit)
+
+
+@pytest.mark.serial
+@pytest.mark.asyncio
+async def test_edit_cost_is_sublinear(client):
+    """Single-edit cost must not grow linearly with document size."""
+    await client.protocol.send_request_async("test/configure", {"diagnostics": False})
+    rng = random.Random(1234)
+
+    costs = [await measure_edit_cost(client, size, rng) for size in SIZES]
+    exponent = growth_exponent(SIZES, costs)
+
+    table = ", ".join(f"{s}B: {c * 1e6:.0f}us" for s, c in zip(SIZES, costs))
+    assert exponent < MAX_GROWTH_EXPONENT, (
+        f"Edit cost grows like size^{exponent:.2f} ({table})"
+    )
+
+
+def test_reference_document_edits():
+    """The reference model's positions and edits agree with each other."""
+    model = ReferenceDocument("ab\ncd\n")
+    assert model.position(0) == {"line": 0, "character": 0}
+    assert model.position(4) == {"line": 1, "character": 1}
+    assert model.position(6) == {"line": 2, "character": 0}
+
+    rng = random.Random(0)
+    for _ in range(200):
+        before = model.text
+        change = model.random_edit(rng)
+        start = change["range"]["start"]
+        lines = before.split("\n")
+        offset = sum(len(l) + 1 for l in lines[: start["line"]]) + start["character"]
+        assert model.text.startswith(before[:offset] + change["text"])
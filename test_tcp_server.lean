@@ -0,0 +1,15 @@
+import TestServer
+import LapisTcp
+
+open Lapis.Concurrent.Dispatcher
+
+/-- One session per connection, each with fresh state. Tests pass port 0 and
+    read the port picked from the first line of stdout. -/
+def main (args : List String) : IO Unit := do
+  let port := match args with
+    | [port] => port.toNat!.toUInt16
+    | _ => 0
+  runTcp testConfig (pure ({} : TestState)) port fun bound => do
+    let stdout ← IO.getStdout
+    stdout.putStrLn s!"listening on {bound}"
+    stdout.flush